@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""Measure SDK-side overhead per action against in-process stub APIs.
+
+Every provider is pointed at a stub from ``stub_apis.py`` through an
+``httpx.MockTransport``, so the numbers cover only the SDK's own work:
+
+* ``construct``: building an ``Integrations`` container for all ten providers.
+* ``session``: entering and leaving ``AuthManager.session`` with stored
+  credentials for every auth provider.
+* ``request:<provider>``: ``provider.request(...)`` (request building, retry,
+  limit, and cache plumbing) for one ``GET``.
+* ``parse:<provider>``: ``process_httpx_response`` on a canned response.
+* ``action:<provider>.<action>``: one representative action end to end.
+
+Each case reports throughput, latency percentiles, and tracemalloc peak and
+retained bytes per operation. Client-side rate limits are disabled so token
+buckets do not dominate the timings.
+
+Usage::
+
+    uv run python benchmarks/action_overhead.py --iterations 500 --output now.json
+    uv run python benchmarks/action_overhead.py --compare base.json --threshold 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from importlib import metadata
+from typing import Any
+
+import httpx
+from stub_apis import StubAPI, StubTransportPool, attach, build_stub_apis, stub_settings
+
+import integrations.auth_providers  # noqa: F401 - registers every auth provider
+from integrations import Integrations
+from integrations.auth import AuthManager
+
+SCHEMA_VERSION = 1
+
+AUTH_PROVIDERS = ("asana", "github", "google", "hubspot", "notion", "slack")
+
+# Provider -> (action, args, method, and path of the request it sends).
+ACTIONS: dict[str, tuple[str, tuple[Any, ...], str, str]] = {
+    "asana": ("find_task", ("1201",), "GET", "/tasks/1201"),
+    "github": ("find_repository", ("octo", "hello"), "GET", "/repos/octo/hello"),
+    "gmail": ("star_email", ("18c0",), "POST", "/users/me/messages/18c0/modify"),
+    "google_calendar": (
+        "retrieve_event_by_id",
+        ("evt1",),
+        "GET",
+        "/calendars/primary/events/evt1",
+    ),
+    "google_docs": ("get_document_content", ("doc1",), "GET", "/documents/doc1"),
+    "google_drive": (
+        "retrieve_file_or_folder_by_id",
+        ("file1",),
+        "GET",
+        "/files/file1",
+    ),
+    "google_sheets": ("get_spreadsheet_by_id", ("sheet1",), "GET", "/sheet1"),
+    "hubspot": ("get_contact", ("501",), "GET", "/crm/v3/objects/contacts/501"),
+    "notion": (
+        "retrieve_page",
+        ("59833787-2cf9-4fdf-8782-e53db20768a5",),
+        "GET",
+        "/pages/59833787-2cf9-4fdf-8782-e53db20768a5",
+    ),
+    "slack": (
+        "get_message_by_timestamp",
+        ("C1", "1.0"),
+        "GET",
+        "/conversations.history",
+    ),
+}
+
+
+@dataclass
+class CaseResult:
+    name: str
+    iterations: int
+    ops_per_s: float
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    peak_bytes: int
+    retained_bytes: int
+
+
+def _bench_settings(stubs: dict[str, StubAPI]) -> dict[str, dict[str, Any]]:
+    settings = stub_settings(stubs)
+    for options in settings.values():
+        options["rate_limits"] = False
+    return settings
+
+
+async def _time(
+    op: Callable[[], Awaitable[Any]], *, iterations: int, warmup: int
+) -> list[float]:
+    for _ in range(warmup):
+        await op()
+    samples: list[float] = []
+    gc.collect()
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        await op()
+        samples.append((time.perf_counter_ns() - started) / 1000)
+    return samples
+
+
+async def _allocations(
+    op: Callable[[], Awaitable[Any]], *, iterations: int
+) -> tuple[int, int]:
+    peaks: list[int] = []
+    retained: list[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            gc.collect()
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await op()
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            retained.append(current - before)
+    finally:
+        tracemalloc.stop()
+    return int(statistics.median(peaks)), int(statistics.median(retained))
+
+
+async def run_case(
+    name: str,
+    op: Callable[[], Awaitable[Any]],
+    *,
+    iterations: int,
+    warmup: int,
+    alloc_iterations: int,
+) -> CaseResult:
+    samples = await _time(op, iterations=iterations, warmup=warmup)
+    peak, retained = await _allocations(op, iterations=alloc_iterations)
+    quantiles = statistics.quantiles(samples, n=100)
+    total_s = sum(samples) / 1_000_000
+    return CaseResult(
+        name=name,
+        iterations=iterations,
+        ops_per_s=round(iterations / total_s, 1),
+        mean_us=round(statistics.fmean(samples), 2),
+        p50_us=round(quantiles[49], 2),
+        p95_us=round(quantiles[94], 2),
+        p99_us=round(quantiles[98], 2),
+        peak_bytes=peak,
+        retained_bytes=retained,
+    )
+
+
+def _canned_response(stub: StubAPI, method: str, path: str) -> httpx.Response:
+    request = httpx.Request(method, stub.base_url + path)
+    response = stub.handle(request)
+    response.request = request
+    response.read()
+    return response
+
+
+def _operations(
+    integrations: Integrations,
+    manager: AuthManager,
+    stubs: dict[str, StubAPI],
+    settings: dict[str, Any],
+) -> list[tuple[str, Callable[[], Awaitable[Any]]]]:
+    async def construct() -> None:
+        Integrations(auto_configure=False, **settings)
+
+    async def session() -> None:
+        async with manager.session(subject="bench-user"):
+            pass
+
+    operations: list[tuple[str, Callable[[], Awaitable[Any]]]] = [
+        ("construct", construct),
+        ("session", session),
+    ]
+    for name, (action_name, args, method, path) in ACTIONS.items():
+        provider = integrations[name]
+
+        async def request(
+            provider: Any = provider, method: str = method, path: str = path
+        ) -> Any:
+            return await provider.request(method, path)
+
+        canned = _canned_response(stubs[name], method, path)
+
+        async def parse(provider: Any = provider, canned: Any = canned) -> Any:
+            return provider.process_httpx_response(canned)
+
+        action = getattr(provider, action_name)
+
+        async def call(action: Any = action, args: tuple[Any, ...] = args) -> Any:
+            return await action(*args)
+
+        operations += [
+            (f"request:{name}", request),
+            (f"parse:{name}", parse),
+            (f"action:{name}.{action_name}", call),
+        ]
+    return operations
+
+
+async def run(
+    *, iterations: int, warmup: int, alloc_iterations: int, only: str | None
+) -> list[CaseResult]:
+    stubs = build_stub_apis()
+    pool = StubTransportPool(stubs)
+    settings = _bench_settings(stubs)
+    manager = AuthManager(
+        auto_configure=False,
+        **{
+            name: {
+                "client_id": "bench",
+                "client_secret": "bench",
+                "redirect_uri": "https://example.com/callback",
+            }
+            for name in AUTH_PROVIDERS
+        },
+    )
+    for name in AUTH_PROVIDERS:
+        await manager.store_credentials(
+            name, "bench-user", {"access_token": "bench-token", "token_type": "Bearer"}
+        )
+
+    results: list[CaseResult] = []
+    async with Integrations(
+        auto_configure=False, transport_pool=pool, **settings
+    ) as integrations:
+        for name in integrations:
+            attach(integrations[name], pool)
+        for name, op in _operations(integrations, manager, stubs, settings):
+            if only is not None and only not in name:
+                continue
+            results.append(
+                await run_case(
+                    name,
+                    op,
+                    iterations=iterations,
+                    warmup=warmup,
+                    alloc_iterations=alloc_iterations,
+                )
+            )
+    return results
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        version = metadata.version("integrations")
+    except metadata.PackageNotFoundError:
+        version = None
+    return {
+        "package_version": version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def compare(
+    results: Sequence[CaseResult], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return a line per case whose p50 or peak allocation regressed."""
+    previous = {case["name"]: case for case in baseline.get("results", [])}
+    regressions: list[str] = []
+    for result in results:
+        before = previous.get(result.name)
+        if before is None:
+            continue
+        for metric in ("p50_us", "peak_bytes"):
+            old, new = before[metric], getattr(result, metric)
+            if old and new > old * (1 + threshold):
+                regressions.append(
+                    f"{result.name}: {metric} {old} -> {new} "
+                    f"(+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def _print_table(results: Sequence[CaseResult]) -> None:
+    header = (
+        f"{'case':<48}{'ops/s':>10}{'p50 us':>10}{'p95 us':>10}"
+        f"{'p99 us':>10}{'peak KiB':>10}"
+    )
+    print(header)
+    for r in results:
+        print(
+            f"{r.name:<48}{r.ops_per_s:>10}{r.p50_us:>10}{r.p95_us:>10}"
+            f"{r.p99_us:>10}{r.peak_bytes / 1024:>10.1f}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--alloc-iterations", type=int, default=25)
+    parser.add_argument("--only", help="run cases whose name contains this text")
+    parser.add_argument("--output", help="write JSON results to this path")
+    parser.add_argument("--json", action="store_true", help="emit JSON to stdout")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed relative regression before --compare fails",
+    )
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(
+        run(
+            iterations=args.iterations,
+            warmup=args.warmup,
+            alloc_iterations=args.alloc_iterations,
+            only=args.only,
+        )
+    )
+    document = {
+        "schema": SCHEMA_VERSION,
+        "benchmark": "action_overhead",
+        "environment": _environment(),
+        "results": [asdict(result) for result in results],
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, indent=2)
+    if args.json:
+        print(json.dumps(document))
+    else:
+        _print_table(results)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Compare the sharded InMemoryCredentialStore with the previous implementation.
+
+The previous store (reproduced below as ``LegacyInMemoryCredentialStore``)
+serialized every call behind one ``asyncio.Lock``, deep-copied records on both
+``get`` and ``set``, and re-serialized mapping subjects with ``json.dumps`` on
+every call. Each scenario runs once per subject (``--subjects``):
+
+* ``get``/``get (mapping subject)``: one lookup.
+* ``set``: one write.
+* ``session get_many``: the six-provider batch an ``AuthManager.session`` loads.
+* ``mixed``: a read, a token refresh write, and another read.
+* ``mixed (concurrent)``: ``mixed`` with one task per subject, all in flight.
+
+Sequential scenarios isolate the store's own cost; the concurrent one adds
+task scheduling, which dominates once the store itself is cheap.
+
+Usage::
+
+    uv run python benchmarks/credential_store.py --subjects 20000
+    uv run python benchmarks/credential_store.py --json > credential_store.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from integrations.auth.storage import InMemoryCredentialStore, SubjectLike
+
+PROVIDERS = ("asana", "github", "google", "hubspot", "notion", "slack")
+RECORD = {
+    "access_token": "ya29.bench-token",
+    "refresh_token": "1//bench-refresh",
+    "token_type": "Bearer",
+    "expires_at": "2030-01-01T00:00:00Z",
+    "scope": ["openid", "email", "https://www.googleapis.com/auth/drive"],
+}
+
+
+class LegacyInMemoryCredentialStore:
+    """The single-lock, deep-copying store this benchmark replaces."""
+
+    def __init__(self) -> None:
+        self._records: dict[str, dict[str, dict[str, Any]]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, provider: str, subject: SubjectLike) -> Any:
+        key = _legacy_key(subject)
+        async with self._lock:
+            record = self._records.get(provider, {}).get(key)
+            return None if record is None else copy.deepcopy(record)
+
+    async def get_many(self, keys: Sequence[tuple[str, SubjectLike]]) -> list[Any]:
+        return [await self.get(provider, subject) for provider, subject in keys]
+
+    async def set(self, provider: str, subject: SubjectLike, data: Any) -> None:
+        key = _legacy_key(subject)
+        async with self._lock:
+            self._records.setdefault(provider, {})[key] = copy.deepcopy(dict(data))
+
+    async def delete(self, provider: str, subject: SubjectLike) -> None:
+        key = _legacy_key(subject)
+        async with self._lock:
+            self._records.get(provider, {}).pop(key, None)
+
+
+def _legacy_key(subject: SubjectLike) -> str:
+    if isinstance(subject, str):
+        return subject
+    return json.dumps(subject, sort_keys=True, separators=(",", ":"))
+
+
+async def _populate(store: Any, subjects: list[Any]) -> None:
+    for subject in subjects:
+        for provider in PROVIDERS:
+            await store.set(provider, subject, RECORD)
+
+
+async def _run_sequentially(
+    subjects: list[Any], op: Callable[[Any], Awaitable[Any]]
+) -> float:
+    started = time.perf_counter()
+    for subject in subjects:
+        await op(subject)
+    return time.perf_counter() - started
+
+
+async def _run_concurrently(
+    subjects: list[Any], op: Callable[[Any], Awaitable[Any]]
+) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(op(subject) for subject in subjects))
+    return time.perf_counter() - started
+
+
+def _scenarios(store: Any) -> dict[str, Callable[[Any], Awaitable[Any]]]:
+    async def get(subject: Any) -> Any:
+        return await store.get("google", subject)
+
+    async def set_(subject: Any) -> None:
+        await store.set("google", subject, RECORD)
+
+    async def get_many(subject: Any) -> Any:
+        return await store.get_many([(provider, subject) for provider in PROVIDERS])
+
+    async def mixed(subject: Any) -> None:
+        record = await store.get("google", subject)
+        await store.set("google", subject, {**record, "access_token": "rotated"})
+        await store.get("google", subject)
+
+    return {"get": get, "set": set_, "session get_many": get_many, "mixed": mixed}
+
+
+async def run(*, subjects: int, rounds: int) -> list[dict[str, Any]]:
+    string_subjects = [f"user-{index}" for index in range(subjects)]
+    mapping_subjects = [{"org": "acme", "user_id": index} for index in range(subjects)]
+    results: list[dict[str, Any]] = []
+    for label, factory in (
+        ("legacy", LegacyInMemoryCredentialStore),
+        ("sharded", InMemoryCredentialStore),
+    ):
+        store = factory()
+        await _populate(store, string_subjects)
+        await _populate(store, mapping_subjects)
+        scenarios = _scenarios(store)
+        cases = [
+            (name, string_subjects, op, _run_sequentially)
+            for name, op in scenarios.items()
+        ]
+        cases.insert(
+            1,
+            (
+                "get (mapping subject)",
+                mapping_subjects,
+                scenarios["get"],
+                _run_sequentially,
+            ),
+        )
+        cases.append(
+            (
+                "mixed (concurrent)",
+                string_subjects,
+                scenarios["mixed"],
+                _run_concurrently,
+            )
+        )
+        for name, population, op, runner in cases:
+            timings = [await runner(population, op) for _ in range(rounds)]
+            elapsed = statistics.median(timings)
+            results.append(
+                {
+                    "store": label,
+                    "scenario": name,
+                    "ops_per_s": round(len(population) / elapsed),
+                    "us_per_op": round(elapsed / len(population) * 1e6, 2),
+                }
+            )
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subjects", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="emit JSON")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(subjects=args.subjects, rounds=args.rounds))
+
+    if args.json:
+        print(json.dumps({"benchmark": "credential_store", "results": results}))
+        return
+
+    legacy = {r["scenario"]: r for r in results if r["store"] == "legacy"}
+    print(f"{'scenario':<24}{'legacy ops/s':>14}{'sharded ops/s':>15}{'speedup':>9}")
+    for r in results:
+        if r["store"] != "sharded":
+            continue
+        before = legacy[r["scenario"]]["ops_per_s"]
+        print(
+            f"{r['scenario']:<24}{before:>14}{r['ops_per_s']:>15}"
+            f"{r['ops_per_s'] / before:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Compare connection reuse strategies for the Google Workspace providers.
+
+Runs the five Google providers against a local stub server and reports how many
+TCP connections the server accepted plus request latency percentiles for:
+
+* ``per-request``: a fresh ``httpx.AsyncClient`` per call (the old behaviour).
+* ``per-provider``: each provider keeps its own pooled client.
+* ``shared``: providers inside one ``Integrations`` container share a
+  ``TransportPool``.
+
+Usage::
+
+    uv run python benchmarks/google_transport_pool.py --rounds 200 --concurrency 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from integrations import Integrations
+from integrations.core import BaseProvider, HttpxClientMixin
+from integrations.providers import (
+    GmailProvider,
+    GmailSettings,
+    GoogleCalendarProvider,
+    GoogleCalendarSettings,
+    GoogleDocsProvider,
+    GoogleDocsSettings,
+    GoogleDriveProvider,
+    GoogleDriveSettings,
+    GoogleSheetsProvider,
+    GoogleSheetsSettings,
+)
+
+GOOGLE_PROVIDERS: dict[str, tuple[type[BaseProvider[Any]], type[Any]]] = {
+    "gmail": (GmailProvider, GmailSettings),
+    "google_calendar": (GoogleCalendarProvider, GoogleCalendarSettings),
+    "google_docs": (GoogleDocsProvider, GoogleDocsSettings),
+    "google_drive": (GoogleDriveProvider, GoogleDriveSettings),
+    "google_sheets": (GoogleSheetsProvider, GoogleSheetsSettings),
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Buffer writes so headers and body leave in one segment (avoids Nagle stalls).
+    wbufsize = 64 * 1024
+    body = b'{"ok": true}'
+
+    def setup(self) -> None:
+        super().setup()
+        server = self.server
+        with server.lock:  # type: ignore[attr-defined]
+            server.connections += 1  # type: ignore[attr-defined]
+
+    def do_GET(self) -> None:  # http.server dispatches on this name
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *_: Any) -> None:
+        return None
+
+
+class StubServer:
+    """Threaded HTTP/1.1 server that counts accepted connections."""
+
+    def __init__(self) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.lock = threading.Lock()  # type: ignore[attr-defined]
+        self._server.connections = 0  # type: ignore[attr-defined]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections  # type: ignore[attr-defined]
+
+    def reset(self) -> None:
+        with self._server.lock:  # type: ignore[attr-defined]
+            self._server.connections = 0  # type: ignore[attr-defined]
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _settings_for(base_url: str) -> dict[str, dict[str, Any]]:
+    return {
+        name: {"token": "bench-token", "base_url": f"{base_url}/{name}"}
+        for name in GOOGLE_PROVIDERS
+    }
+
+
+async def _per_request_call(provider: HttpxClientMixin) -> None:
+    async with provider.httpx_client() as client:
+        response = await client.get("/ping")
+        response.raise_for_status()
+
+
+async def _pooled_call(provider: HttpxClientMixin) -> None:
+    response = await provider.request("GET", "/ping")
+    response.raise_for_status()
+
+
+async def _drive(
+    providers: Sequence[HttpxClientMixin],
+    call: Callable[[HttpxClientMixin], Awaitable[None]],
+    *,
+    rounds: int,
+    concurrency: int,
+) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def timed(provider: HttpxClientMixin) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await call(provider)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    for _ in range(rounds):
+        await asyncio.gather(*(timed(provider) for provider in providers))
+    return latencies
+
+
+async def run_mode(
+    mode: str, server: StubServer, *, rounds: int, concurrency: int
+) -> dict[str, Any]:
+    settings = _settings_for(server.base_url)
+    server.reset()
+    started = time.perf_counter()
+
+    if mode == "shared":
+        async with Integrations(auto_configure=False, **settings) as integrations:
+            providers = [integrations[name] for name in GOOGLE_PROVIDERS]
+            latencies = await _drive(
+                providers, _pooled_call, rounds=rounds, concurrency=concurrency
+            )
+    else:
+        providers = [
+            provider_cls(settings=settings_cls(**settings[name]))
+            for name, (provider_cls, settings_cls) in GOOGLE_PROVIDERS.items()
+        ]
+        call = _per_request_call if mode == "per-request" else _pooled_call
+        try:
+            latencies = await _drive(
+                providers, call, rounds=rounds, concurrency=concurrency
+            )
+        finally:
+            for provider in providers:
+                await provider.aclose()
+
+    elapsed = time.perf_counter() - started
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "connections": server.connections,
+        "elapsed_s": round(elapsed, 4),
+        "p50_ms": round(quantiles[49], 3),
+        "p95_ms": round(quantiles[94], 3),
+        "p99_ms": round(quantiles[98], 3),
+    }
+
+
+async def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="emit JSON lines")
+    args = parser.parse_args(argv)
+
+    with StubServer() as server:
+        results = [
+            await run_mode(
+                mode, server, rounds=args.rounds, concurrency=args.concurrency
+            )
+            for mode in ("per-request", "per-provider", "shared")
+        ]
+
+    if args.json:
+        for result in results:
+            print(json.dumps(result))
+        return
+
+    header = f"{'mode':<14}{'requests':>10}{'conns':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print(header)
+    for r in results:
+        print(
+            f"{r['mode']:<14}{r['requests']:>10}{r['connections']:>8}"
+            f"{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Measure cold import time for typical entry points in fresh interpreters.
+
+Each scenario runs in its own ``python -c`` subprocess so nothing is cached in
+``sys.modules``. ``eager`` resolves every registered provider, which is what
+``import integrations.providers`` cost before providers loaded lazily; the
+other scenarios show what a single-provider worker now pays. Expect a gap of
+about 10% (pydantic and httpx dominate every scenario) but far fewer modules.
+
+Usage::
+
+    uv run python benchmarks/import_time.py --runs 15
+    uv run python benchmarks/import_time.py --json > import_time.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections.abc import Sequence
+
+_PROBE = """
+import sys, time
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+modules = sum(1 for name in sys.modules if name.startswith("integrations"))
+print(elapsed, modules)
+"""
+
+SCENARIOS: dict[str, str] = {
+    "import integrations": "import integrations",
+    "slack only": (
+        "from integrations import Integrations\n"
+        "Integrations(auto_configure=False, slack={'token': 'x'}).slack"
+        ".send_channel_message"
+    ),
+    "slack class": "from integrations.providers import SlackProvider",
+    "auto-configure (no env)": "from integrations import Integrations\nIntegrations()",
+    "eager (all providers)": (
+        "import integrations\n"
+        "for name in integrations.provider_names():\n"
+        "    integrations.get_provider(name)"
+    ),
+}
+
+
+def measure(code: str, *, runs: int) -> dict[str, float | int]:
+    samples: list[float] = []
+    modules = 0
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(code=code)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        elapsed, modules_loaded = completed.stdout.split()
+        samples.append(float(elapsed) * 1000)
+        modules = int(modules_loaded)
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "max_ms": round(max(samples), 2),
+        "modules": modules,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="emit JSON")
+    args = parser.parse_args(argv)
+
+    results = [
+        {"scenario": name, **measure(code, runs=args.runs)}
+        for name, code in SCENARIOS.items()
+    ]
+
+    if args.json:
+        print(json.dumps({"benchmark": "import_time", "results": results}))
+        return
+
+    print(f"{'scenario':<26}{'median ms':>11}{'min ms':>10}{'modules':>9}")
+    for r in results:
+        print(
+            f"{r['scenario']:<26}{r['median_ms']:>11}{r['min_ms']:>10}{r['modules']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Compare ProviderSettings construction with and without the environment snapshot.
+
+Every ``AuthManager.session`` turns stored credentials into one settings object
+per container provider. This script times that work three ways:
+
+* ``per-class``: one settings object per provider, through the pydantic-settings
+  constructor and through ``build_settings`` (explicit-only and partial values).
+* ``bindings``: the ten settings objects a session builds, as one batch.
+* ``session``: entering and leaving ``AuthManager.session`` with stored
+  credentials for every auth provider, with the factory disabled and enabled.
+
+Usage::
+
+    uv run python benchmarks/settings_build.py --iterations 2000
+    uv run python benchmarks/settings_build.py --json > settings_build.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import partial
+from typing import Any
+
+import integrations.auth_providers  # noqa: F401 - registers every auth provider
+from integrations import build_settings, get_provider_settings, provider_names
+from integrations.auth import AuthManager
+from integrations.core import settings_factory
+
+AUTH_PROVIDERS = ("asana", "github", "google", "hubspot", "notion", "slack")
+
+
+@contextmanager
+def _constructor_only() -> Iterator[None]:
+    """Route ``build_settings`` through plain constructors (the old behaviour)."""
+    factory = settings_factory._FACTORY
+    factory.build = lambda cls, /, **values: cls(**values)  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        del factory.build
+
+
+def _payload(settings_cls: type[Any]) -> dict[str, Any]:
+    # What a binding passes: a token plus whatever the credentials carry.
+    payload: dict[str, Any] = {"token": "bench-token"}
+    if "authorization_scheme" in settings_cls.model_fields:
+        payload["authorization_scheme"] = "Bearer"
+    return payload
+
+
+def _time_sync(op: Callable[[], Any], *, iterations: int) -> float:
+    for _ in range(min(iterations, 50)):
+        op()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        op()
+        samples.append((time.perf_counter_ns() - started) / 1000)
+    return round(statistics.median(samples), 2)
+
+
+async def _time_async(op: Callable[[], Awaitable[Any]], *, iterations: int) -> float:
+    for _ in range(min(iterations, 50)):
+        await op()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        await op()
+        samples.append((time.perf_counter_ns() - started) / 1000)
+    return round(statistics.median(samples), 2)
+
+
+def _row(case: str, before: float, after: float) -> dict[str, Any]:
+    return {
+        "case": case,
+        "constructor_us": before,
+        "factory_us": after,
+        "speedup": round(before / after, 1) if after else None,
+    }
+
+
+async def run(*, iterations: int) -> list[dict[str, Any]]:
+    classes = {name: get_provider_settings(name) for name in provider_names()}
+    results: list[dict[str, Any]] = []
+
+    for name, settings_cls in classes.items():
+        payload = _payload(settings_cls)
+        full = settings_cls(**payload).model_dump()
+        results.append(
+            _row(
+                f"per-class:{name}",
+                _time_sync(partial(settings_cls, **payload), iterations=iterations),
+                _time_sync(
+                    partial(build_settings, settings_cls, **payload),
+                    iterations=iterations,
+                ),
+            )
+        )
+        results.append(
+            _row(
+                f"per-class:{name} (all explicit)",
+                _time_sync(partial(settings_cls, **full), iterations=iterations),
+                _time_sync(
+                    partial(build_settings, settings_cls, **full),
+                    iterations=iterations,
+                ),
+            )
+        )
+
+    def bindings() -> None:
+        for settings_cls in classes.values():
+            build_settings(settings_cls, **_payload(settings_cls))
+
+    with _constructor_only():
+        before = _time_sync(bindings, iterations=iterations)
+    results.append(
+        _row("bindings", before, _time_sync(bindings, iterations=iterations))
+    )
+
+    manager = AuthManager(
+        auto_configure=False,
+        **{
+            name: {
+                "client_id": "bench",
+                "client_secret": "bench",
+                "redirect_uri": "https://example.com/callback",
+            }
+            for name in AUTH_PROVIDERS
+        },
+    )
+    for name in AUTH_PROVIDERS:
+        await manager.store_credentials(
+            name, "bench-user", {"access_token": "bench-token", "token_type": "Bearer"}
+        )
+
+    async def session() -> None:
+        async with manager.session(subject="bench-user") as container:
+            for name in container:
+                container[name]
+
+    session_iterations = max(iterations // 10, 20)
+    with _constructor_only():
+        before = await _time_async(session, iterations=session_iterations)
+    after = await _time_async(session, iterations=session_iterations)
+    results.append(_row("session", before, after))
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--json", action="store_true", help="emit JSON")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(iterations=args.iterations))
+
+    if args.json:
+        print(json.dumps({"benchmark": "settings_build", "results": results}))
+        return
+
+    print(f"{'case':<44}{'ctor us':>10}{'factory us':>12}{'speedup':>9}")
+    for r in results:
+        print(
+            f"{r['case']:<44}{r['constructor_us']:>10}{r['factory_us']:>12}"
+            f"{r['speedup']:>8}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Measure SQLiteCredentialStore lookup latency at scale on local disk.
+
+Populates ``--subjects`` records through ``set_many`` and then reports latency
+percentiles for single lookups of random subjects, the six-provider
+``get_many`` batch an ``AuthManager.session`` issues, and throughput with
+``--concurrency`` lookups in flight. Latencies include the hop to the store's
+worker threads.
+
+Usage::
+
+    uv run python benchmarks/sqlite_credential_store.py --subjects 1000000
+    uv run python benchmarks/sqlite_credential_store.py --path /tmp/c.db --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from integrations.auth.storage import SQLiteCredentialStore
+
+PROVIDERS = ("asana", "github", "google", "hubspot", "notion", "slack")
+RECORD = {
+    "access_token": "ya29.bench-token",
+    "refresh_token": "1//bench-refresh",
+    "token_type": "Bearer",
+    "expires_at": "2030-01-01T00:00:00Z",
+}
+
+
+async def populate(store: SQLiteCredentialStore, subjects: int) -> float:
+    started = time.perf_counter()
+    batch: list[tuple[str, str, dict[str, Any]]] = []
+    for index in range(subjects):
+        batch.append((PROVIDERS[index % len(PROVIDERS)], f"user-{index}", RECORD))
+        if len(batch) == 10_000:
+            await store.set_many(batch)
+            batch = []
+    await store.set_many(batch)
+    return time.perf_counter() - started
+
+
+async def latencies(
+    op: Callable[[int], Awaitable[Any]], *, subjects: int, samples: int
+) -> dict[str, float]:
+    timings: list[float] = []
+    for _ in range(samples):
+        index = random.randrange(subjects)
+        started = time.perf_counter_ns()
+        await op(index)
+        timings.append((time.perf_counter_ns() - started) / 1000)
+    quantiles = statistics.quantiles(timings, n=100)
+    return {
+        "p50_us": round(quantiles[49], 1),
+        "p99_us": round(quantiles[98], 1),
+        "max_us": round(max(timings), 1),
+    }
+
+
+async def run(
+    path: Path, *, subjects: int, samples: int, concurrency: int
+) -> dict[str, Any]:
+    async with SQLiteCredentialStore(path) as store:
+        existing = await store.count()
+        load_s = 0.0
+        if existing < subjects:
+            load_s = await populate(store, subjects)
+
+        async def get(index: int) -> Any:
+            return await store.get(PROVIDERS[index % len(PROVIDERS)], f"user-{index}")
+
+        async def session(index: int) -> Any:
+            subject = f"user-{index}"
+            return await store.get_many([(provider, subject) for provider in PROVIDERS])
+
+        results = {
+            "get": await latencies(get, subjects=subjects, samples=samples),
+            "session get_many": await latencies(
+                session, subjects=subjects, samples=samples
+            ),
+        }
+
+        started = time.perf_counter()
+        queue = list(range(samples))
+        random.shuffle(queue)
+
+        async def worker() -> None:
+            while queue:
+                await get(queue.pop() % subjects)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        results[f"get x{concurrency} concurrent"] = {
+            "ops_per_s": round(samples / elapsed)
+        }
+        return {
+            "subjects": subjects,
+            "load_s": round(load_s, 2),
+            "results": results,
+        }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subjects", type=int, default=200_000)
+    parser.add_argument("--samples", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--path", help="database file to reuse between runs")
+    parser.add_argument("--json", action="store_true", help="emit JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        path = Path(args.path) if args.path else Path(scratch) / "credentials.db"
+        report = asyncio.run(
+            run(
+                path,
+                subjects=args.subjects,
+                samples=args.samples,
+                concurrency=args.concurrency,
+            )
+        )
+        report["db_bytes"] = path.stat().st_size
+
+    if args.json:
+        print(json.dumps({"benchmark": "sqlite_credential_store", **report}))
+        return
+
+    print(
+        f"{report['subjects']} subjects, loaded in {report['load_s']}s, "
+        f"{report['db_bytes'] / 1e6:.1f} MB"
+    )
+    for name, metrics in report["results"].items():
+        line = "  ".join(f"{key}={value}" for key, value in metrics.items())
+        print(f"{name:<24}{line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""In-process stand-ins for the ten provider APIs used by the benchmarks.
+
+Each ``StubAPI`` answers a handful of routes with canned JSON shaped like the
+real API, so actions run their full request-building and parsing paths while
+the transport itself costs next to nothing. ``StubTransportPool`` hands every
+provider an ``httpx.MockTransport`` that dispatches on the request URL.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+import integrations.providers  # noqa: F401 - registers every provider
+from integrations.core import HttpxClientMixin, TransportPool
+
+Payload = Mapping[str, Any] | Callable[[httpx.Request], Mapping[str, Any]]
+
+
+@dataclass
+class StubAPI:
+    """Canned responses for one provider host, matched by method and path regex."""
+
+    name: str
+    base_url: str
+    routes: list[tuple[str, str, Payload]]
+    requests: int = 0
+    _compiled: list[tuple[str, re.Pattern[str], Payload]] = field(
+        default_factory=list, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self._compiled = [
+            (method, re.compile(pattern), payload)
+            for method, pattern, payload in self.routes
+        ]
+
+    def serves(self, url: httpx.URL) -> bool:
+        return str(url).startswith(self.base_url)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        path = request.url.path
+        for method, pattern, payload in self._compiled:
+            if method == request.method and pattern.search(path):
+                body = payload(request) if callable(payload) else payload
+                return httpx.Response(
+                    200,
+                    content=json.dumps(body).encode(),
+                    headers={"Content-Type": "application/json"},
+                )
+        return httpx.Response(404, json={"error": f"no stub for {path}"})
+
+
+def _google_file(request: httpx.Request) -> Mapping[str, Any]:
+    file_id = request.url.path.rsplit("/", 1)[-1]
+    return {
+        "id": file_id,
+        "name": "Quarterly plan",
+        "mimeType": "application/vnd.google-apps.document",
+        "parents": ["root"],
+    }
+
+
+def build_stub_apis() -> dict[str, StubAPI]:
+    """Return a fresh stub for every provider, keyed by container name."""
+    stubs = [
+        StubAPI(
+            "asana",
+            "https://app.asana.com/api/1.0",
+            [
+                (
+                    "GET",
+                    r"/tasks/[^/]+$",
+                    {"data": {"gid": "1201", "name": "Ship it", "completed": False}},
+                ),
+            ],
+        ),
+        StubAPI(
+            "github",
+            "https://api.github.com",
+            [
+                (
+                    "GET",
+                    r"^/repos/[^/]+/[^/]+$",
+                    {"id": 1296269, "full_name": "octo/hello", "private": False},
+                ),
+            ],
+        ),
+        StubAPI(
+            "gmail",
+            "https://gmail.googleapis.com/gmail/v1",
+            [
+                (
+                    "POST",
+                    r"/messages/[^/]+/modify$",
+                    {"id": "18c0", "threadId": "18c0", "labelIds": ["STARRED"]},
+                ),
+            ],
+        ),
+        StubAPI(
+            "google_calendar",
+            "https://www.googleapis.com/calendar/v3",
+            [
+                (
+                    "GET",
+                    r"/events/[^/]+$",
+                    {
+                        "id": "evt1",
+                        "status": "confirmed",
+                        "summary": "Standup",
+                        "start": {"dateTime": "2024-01-01T09:00:00Z"},
+                        "end": {"dateTime": "2024-01-01T09:15:00Z"},
+                    },
+                ),
+            ],
+        ),
+        StubAPI(
+            "google_docs",
+            "https://docs.googleapis.com/v1",
+            [
+                (
+                    "GET",
+                    r"/documents/[^/]+$",
+                    {
+                        "documentId": "doc1",
+                        "title": "Notes",
+                        "body": {
+                            "content": [
+                                {
+                                    "endIndex": 7,
+                                    "paragraph": {
+                                        "elements": [
+                                            {"textRun": {"content": "Hello\n"}}
+                                        ]
+                                    },
+                                }
+                            ]
+                        },
+                    },
+                ),
+            ],
+        ),
+        StubAPI(
+            "google_drive",
+            "https://www.googleapis.com/drive/v3",
+            [("GET", r"/files/[^/]+$", _google_file)],
+        ),
+        StubAPI(
+            "google_sheets",
+            "https://sheets.googleapis.com/v4/spreadsheets",
+            [
+                (
+                    "GET",
+                    r"/spreadsheets/[^/:]+$",
+                    {
+                        "spreadsheetId": "sheet1",
+                        "properties": {"title": "Budget"},
+                        "sheets": [
+                            {
+                                "properties": {
+                                    "sheetId": 0,
+                                    "title": "Sheet1",
+                                    "gridProperties": {
+                                        "rowCount": 1000,
+                                        "columnCount": 26,
+                                    },
+                                }
+                            }
+                        ],
+                    },
+                ),
+            ],
+        ),
+        StubAPI(
+            "hubspot",
+            "https://api.hubapi.com",
+            [
+                (
+                    "GET",
+                    r"/crm/v3/objects/contacts/[^/]+$",
+                    {
+                        "id": "501",
+                        "properties": {"email": "ada@example.com"},
+                        "archived": False,
+                    },
+                ),
+            ],
+        ),
+        StubAPI(
+            "notion",
+            "https://api.notion.com/v1",
+            [
+                (
+                    "GET",
+                    r"/pages/[^/]+$",
+                    {
+                        "object": "page",
+                        "id": "59833787-2cf9-4fdf-8782-e53db20768a5",
+                        "properties": {},
+                    },
+                ),
+            ],
+        ),
+        StubAPI(
+            "slack",
+            "https://slack.com/api",
+            [
+                (
+                    "GET",
+                    r"/conversations\.(history|replies)$",
+                    {
+                        "ok": True,
+                        "messages": [{"type": "message", "ts": "1.0", "text": "hi"}],
+                    },
+                ),
+            ],
+        ),
+    ]
+    return {stub.name: stub for stub in stubs}
+
+
+class StubTransportPool(TransportPool):
+    """Transport pool that routes every request to the stub serving its URL."""
+
+    def __init__(self, stubs: Mapping[str, StubAPI]) -> None:
+        super().__init__()
+        # Calendar and Drive share a host, so match on the full base URL.
+        self._stubs = tuple(stubs.values())
+        self._transport = httpx.MockTransport(self._handle)
+
+    def transport_for(self, url: str | httpx.URL) -> httpx.AsyncBaseTransport:
+        return self._transport
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        for stub in self._stubs:
+            if stub.serves(request.url):
+                return stub.handle(request)
+        return httpx.Response(502, json={"error": f"no stub for {request.url}"})
+
+
+def stub_settings(stubs: Mapping[str, StubAPI]) -> dict[str, dict[str, Any]]:
+    """Return container settings pointing every provider at its stub."""
+    settings: dict[str, dict[str, Any]] = {}
+    for name, stub in stubs.items():
+        token_field = "access_token" if name == "hubspot" else "token"
+        settings[name] = {token_field: "bench-token", "base_url": stub.base_url}
+    return settings
+
+
+def attach(provider: Any, pool: StubTransportPool) -> None:
+    """Route ``provider``'s pooled clients through ``pool`` if not yet wired."""
+    if isinstance(provider, HttpxClientMixin) and provider.transport_pool is None:
+        provider.use_transport_pool(pool)
+
+
+__all__ = [
+    "StubAPI",
+    "StubTransportPool",
+    "attach",
+    "build_stub_apis",
+    "stub_settings",
+]
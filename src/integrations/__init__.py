@@ -11,10 +11,54 @@ from .core import (
     action,
     available_providers,
     get_provider,
+    get_provider_settings,
+    provider_names,
+    SettingsFactory,
+    build_settings,
+    refresh_settings_environment,
     provider_override,
     provider_key,
     register_provider,
+    RateLimit,
+    RateLimitProfile,
+    RateLimiter,
+    RetryPolicy,
+    TransportPool,
+    ConcurrencyLimits,
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyRegistry,
+    RequestCoalescer,
+    CacheRule,
+    CachedResponse,
+    InMemoryResponseCache,
+    ResponseCache,
+    ResponseCacheProfile,
+    PaginatedAction,
+    AfterPaginator,
+    CursorPaginator,
+    LinkHeaderPaginator,
+    OffsetPaginator,
+    Page,
+    PageNumberPaginator,
+    PageRequest,
+    PageTokenPaginator,
+    Paginator,
+    StartCursorPaginator,
+    paginate,
+    iter_pages,
+    ActionContext,
+    RequestContext,
+    InstrumentationHook,
+    HistogramHook,
+    LatencyHistogram,
+    SpanHook,
+    Span,
+    Tracer,
+    instrument,
+    register_hook,
+    unregister_hook,
 )
+from . import providers  # noqa: F401 - registers built-in providers by import path
 
 __all__ = [
     "Integrations",
@@ -25,9 +69,52 @@ __all__ = [
     "register_provider",
     "get_provider",
     "available_providers",
+    "get_provider_settings",
+    "provider_names",
+    "SettingsFactory",
+    "build_settings",
+    "refresh_settings_environment",
     "provider_override",
     "HttpxClientMixin",
     "ProviderIdentifier",
     "ProviderKey",
     "provider_key",
+    "TransportPool",
+    "RetryPolicy",
+    "RateLimit",
+    "RateLimitProfile",
+    "RateLimiter",
+    "ConcurrencyLimits",
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyRegistry",
+    "RequestCoalescer",
+    "CacheRule",
+    "CachedResponse",
+    "InMemoryResponseCache",
+    "ResponseCache",
+    "ResponseCacheProfile",
+    "PaginatedAction",
+    "AfterPaginator",
+    "CursorPaginator",
+    "LinkHeaderPaginator",
+    "OffsetPaginator",
+    "Page",
+    "PageNumberPaginator",
+    "PageRequest",
+    "PageTokenPaginator",
+    "Paginator",
+    "StartCursorPaginator",
+    "paginate",
+    "iter_pages",
+    "ActionContext",
+    "RequestContext",
+    "InstrumentationHook",
+    "HistogramHook",
+    "LatencyHistogram",
+    "SpanHook",
+    "Span",
+    "Tracer",
+    "instrument",
+    "register_hook",
+    "unregister_hook",
 ]
@@ -5,6 +5,7 @@ from .auth_provider import AuthProvider
 from .credentials import AppCredentials, UserCredentials
 from .flows import BaseAuthFlow, OAuth2AppCredentials, OAuth2Flow, OAuth2Token
 from .registration import flow
+from .token_refresh import TokenRefresher, TokenRefreshSweeper
 from .auth_registry import (
     available_auth_providers,
     get_auth_provider,
@@ -21,6 +22,8 @@ __all__ = [
     "OAuth2AppCredentials",
     "OAuth2Token",
     "flow",
+    "TokenRefresher",
+    "TokenRefreshSweeper",
     "available_auth_providers",
     "get_auth_provider",
     "register_auth_provider",
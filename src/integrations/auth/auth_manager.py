@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable, Iterator, Mapping
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, Dict
@@ -23,12 +24,16 @@ from .storage import (
     InMemoryCredentialStore,
     SubjectLike,
     StoredData,
+    load_many,
 )
+from .token_refresh import DEFAULT_REFRESH_SKEW, TokenRefresher, TokenRefreshSweeper
 from integrations.core.integrations import Integrations
 from integrations.core.provider_key import (
     ProviderIdentifier as ContainerProviderIdentifier,
     provider_key as container_provider_key,
 )
+from integrations.core.response_cache import InMemoryResponseCache, ResponseCache
+from integrations.core.transport_pool import TransportPool
 
 if TYPE_CHECKING:
     from integrations.auth_providers.asana import AsanaAuthProvider
@@ -57,6 +62,9 @@ class AuthManager:
         *,
         auto_configure: bool = True,
         credential_store: CredentialStore | None = None,
+        refresh_skew: float | None = DEFAULT_REFRESH_SKEW,
+        transport_pool: TransportPool | None = None,
+        response_cache: ResponseCache | None = None,
         **providers: ProviderAuthConfig,
     ) -> None:
         self._providers: Dict[str, ProviderInstance] = {}
@@ -66,6 +74,21 @@ class AuthManager:
             if credential_store is not None
             else InMemoryCredentialStore()
         )
+        self._token_refresher: TokenRefresher | None = (
+            TokenRefresher(self, skew=refresh_skew)
+            if refresh_skew is not None
+            else None
+        )
+        self._token_sweeper: TokenRefreshSweeper | None = None
+        # Every session container draws on these, so connections and cached
+        # responses outlive the session that created them.
+        self._owns_transport_pool = transport_pool is None
+        self._transport_pool = (
+            transport_pool if transport_pool is not None else TransportPool()
+        )
+        self._response_cache: ResponseCache = (
+            response_cache if response_cache is not None else InMemoryResponseCache()
+        )
 
         for name, config in providers.items():
             self.register(name, config)
@@ -98,6 +121,56 @@ class AuthManager:
         """Return the configured credential store."""
         return self._credential_store
 
+    @property
+    def transport_pool(self) -> TransportPool:
+        """Return the transport pool shared by every session's providers."""
+        return self._transport_pool
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        """Return the response cache shared by every session's providers."""
+        return self._response_cache
+
+    @property
+    def token_refresher(self) -> TokenRefresher | None:
+        """Return the refresher for expiring tokens, if enabled."""
+        return self._token_refresher
+
+    @property
+    def token_sweeper(self) -> TokenRefreshSweeper | None:
+        """Return the background refresh sweeper, if one was started."""
+        return self._token_sweeper
+
+    def start_token_sweeper(self, **options: Any) -> TokenRefreshSweeper:
+        """Start refreshing expiring tokens in the background.
+
+        ``options`` are passed to :class:`TokenRefreshSweeper`. The credential
+        store must support ``expiring`` queries.
+        """
+        if self._token_sweeper is not None and self._token_sweeper.running:
+            raise RuntimeError("The token sweeper is already running.")
+        store = self._credential_store
+        if not callable(getattr(store, "expiring", None)):
+            raise TypeError(f"{type(store).__name__} does not index credential expiry.")
+        sweeper = TokenRefreshSweeper(self, **options)
+        sweeper.start()
+        self._token_sweeper = sweeper
+        return sweeper
+
+    async def stop_token_sweeper(self, *, timeout: float | None = None) -> None:
+        """Stop the background sweeper started by ``start_token_sweeper``."""
+        if self._token_sweeper is not None:
+            await self._token_sweeper.stop(timeout=timeout)
+
+    async def aclose(self) -> None:
+        """Stop the sweeper and close the transport pool the manager created.
+
+        A ``transport_pool`` passed to the constructor is left open.
+        """
+        await self.stop_token_sweeper()
+        if self._owns_transport_pool:
+            await self._transport_pool.aclose()
+
     def get_provider(self, name: str) -> ProviderInstance:
         """Fetch a specific auth provider by identifier."""
         key = self._normalize_name(name)
@@ -145,6 +218,8 @@ class AuthManager:
         coerced = auth_provider.parse_user_credentials(raw)
         if coerced is None:
             return None
+        if self._token_refresher is not None:
+            coerced = await self._token_refresher.ensure_fresh(key, subject, coerced)
         return coerced
 
     async def store_credentials(
@@ -176,7 +251,13 @@ class AuthManager:
         | None = None,
         auto_load_credentials: bool = True,
     ) -> Integrations:
-        """Yield an ``Integrations`` container configured with stored credentials."""
+        """Yield an ``Integrations`` container configured with stored credentials.
+
+        The container's providers share the manager's transport pool and
+        response cache, so sessions reuse warm connections and cached
+        responses. Cache keys include the credential, so subjects never see
+        each other's entries.
+        """
 
         provider_filter: set[AuthProviderKey] | None = None
         if providers is not None:
@@ -193,8 +274,10 @@ class AuthManager:
             for identifier, value in (with_credentials or {}).items()
         }
 
+        plans: list[
+            tuple[ProviderInstance, bool, str, list[tuple[AuthProviderKey, Any]]]
+        ] = []
         for name, auth_provider in self._providers.items():
-            is_explicit = name in self._explicit_providers
             bindings = auth_provider.bindings()
             if not bindings:
                 continue
@@ -204,20 +287,82 @@ class AuthManager:
             except ValueError:
                 continue
 
-            store_key = self._normalize_name(name)
+            selected = [
+                (container_key, binding)
+                for container_key, binding in bindings.items()
+                if not provider_filter or container_key in provider_filter
+            ]
+            if selected:
+                plans.append(
+                    (
+                        auth_provider,
+                        name in self._explicit_providers,
+                        self._normalize_name(name),
+                        selected,
+                    )
+                )
+
+        manual_credentials: dict[AuthProviderKey, UserCredentials | None] = {
+            container_key: auth_provider.parse_user_credentials(
+                provided_credentials.get(container_key)
+            )
+            for auth_provider, _, _, selected in plans
+            for container_key, _ in selected
+        }
 
-            for container_key, binding in bindings.items():
-                if provider_filter and container_key not in provider_filter:
-                    continue
+        # One batched store round trip covers every auth provider that still
+        # needs stored credentials, including those whose manual credentials
+        # did not parse.
+        stored: dict[str, StoredData | None] = {}
+        if auto_load_credentials:
+            store_keys = list(
+                dict.fromkeys(
+                    store_key
+                    for _, _, store_key, selected in plans
+                    if any(
+                        manual_credentials[container_key] is None
+                        for container_key, _ in selected
+                    )
+                )
+            )
+            records = await load_many(
+                self._credential_store, [(key, subject) for key in store_keys]
+            )
+            stored = dict(zip(store_keys, records, strict=True))
+        # Each record is parsed once, however many container providers it
+        # binds, and tokens about to expire are refreshed concurrently before
+        # any binding sees them.
+        auth_providers = {store_key: provider for provider, _, store_key, _ in plans}
+        parsed: dict[str, UserCredentials | None] = {
+            store_key: auth_providers[store_key].parse_user_credentials(raw)
+            for store_key, raw in stored.items()
+            if raw is not None
+        }
+        refresher = self._token_refresher
+        if refresher is not None:
+            due = [
+                (store_key, credentials)
+                for store_key, credentials in parsed.items()
+                if credentials is not None and refresher.needs_refresh(credentials)
+            ]
+            if due:
+                fresh = await asyncio.gather(
+                    *(
+                        refresher.ensure_fresh(store_key, subject, credentials)
+                        for store_key, credentials in due
+                    )
+                )
+                for (store_key, _), credentials in zip(due, fresh, strict=True):
+                    parsed[store_key] = credentials
 
-                manual_source = provided_credentials.get(container_key)
-                user_credentials = auth_provider.parse_user_credentials(manual_source)
-                manual_supplied = manual_source is not None
-                stored_raw: StoredData | None = None
+        for auth_provider, is_explicit, store_key, selected in plans:
+            for container_key, binding in selected:
+                user_credentials = manual_credentials[container_key]
+                manual_supplied = provided_credentials.get(container_key) is not None
+                stored_raw = stored.get(store_key)
 
-                if user_credentials is None and auto_load_credentials:
-                    stored_raw = await self._credential_store.get(store_key, subject)
-                    user_credentials = auth_provider.parse_user_credentials(stored_raw)
+                if user_credentials is None and stored_raw is not None:
+                    user_credentials = parsed[store_key]
 
                 try:
                     settings = await binding.to_settings(
@@ -247,11 +392,16 @@ class AuthManager:
             for identifier, value in overrides.items():
                 config[container_provider_key(identifier)] = value
 
-        integrations = Integrations(auto_configure=True, **config)
+        integrations = Integrations(
+            auto_configure=True,
+            transport_pool=self._transport_pool,
+            response_cache=self._response_cache,
+            **config,
+        )
         try:
             yield integrations
         finally:
-            pass
+            await integrations.aclose()
 
     def _auto_configure_missing_providers(self) -> None:
         for name, provider_cls in available_auth_providers().items():
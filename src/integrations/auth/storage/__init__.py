@@ -1,4 +1,33 @@
-from .credential_store import CredentialStore, SubjectLike, StoredData
+from .caching import CachingCredentialStore
+from .credential_store import (
+    CredentialItem,
+    CredentialKey,
+    CredentialStore,
+    ExpiringCredentialStore,
+    SubjectLike,
+    StoredData,
+    find_expiring,
+    load_many,
+    record_expiry,
+    store_many,
+    subject_key,
+)
 from .in_memory import InMemoryCredentialStore
+from .sqlite import SQLiteCredentialStore
 
-__all__ = ["CredentialStore", "SubjectLike", "StoredData", "InMemoryCredentialStore"]
+__all__ = [
+    "CachingCredentialStore",
+    "CredentialItem",
+    "CredentialKey",
+    "CredentialStore",
+    "ExpiringCredentialStore",
+    "SubjectLike",
+    "StoredData",
+    "InMemoryCredentialStore",
+    "SQLiteCredentialStore",
+    "find_expiring",
+    "load_many",
+    "record_expiry",
+    "store_many",
+    "subject_key",
+]
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any
+
+from .credential_store import (
+    CredentialItem,
+    CredentialKey,
+    CredentialStore,
+    StoredData,
+    SubjectLike,
+    find_expiring,
+    load_many,
+    store_many,
+    subject_key,
+)
+from .in_memory import freeze_record
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL = 60.0
+DEFAULT_NEGATIVE_TTL = 10.0
+
+_CacheKey = tuple[str, str]
+
+
+class CachingCredentialStore(CredentialStore):
+    """Read-through LRU cache with TTLs in front of another credential store.
+
+    Records (and misses, for ``negative_ttl`` seconds) are kept for ``ttl``
+    seconds, up to ``max_entries``. Concurrent lookups of an uncached key share
+    a single backend fetch, and ``get_many`` fetches every uncached key in one
+    backend call. ``set`` and ``delete`` write through to the backend and drop
+    the cached entry; a fetch already in flight for that key still answers its
+    waiters but is not cached.
+
+    Cached records are frozen with :func:`freeze_record` (nested mappings
+    become read-only views, lists tuples and sets frozensets) and shared
+    between callers.
+    """
+
+    def __init__(
+        self,
+        store: CredentialStore,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float | None = DEFAULT_NEGATIVE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.store = store
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._entries: OrderedDict[_CacheKey, tuple[float, StoredData | None]] = (
+            OrderedDict()
+        )
+        self._in_flight: dict[_CacheKey, asyncio.Future[StoredData | None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, provider: str, subject: SubjectLike) -> StoredData | None:
+        return (await self.get_many([(provider, subject)]))[0]
+
+    async def get_many(self, keys: Sequence[CredentialKey]) -> list[StoredData | None]:
+        results: list[StoredData | None] = [None] * len(keys)
+        waiting: dict[_CacheKey, list[int]] = {}
+        to_load: dict[_CacheKey, CredentialKey] = {}
+        now = self._clock()
+        for index, (provider, subject) in enumerate(keys):
+            key = (provider, subject_key(subject))
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                results[index] = entry[1]
+                continue
+            if key not in waiting:
+                future = self._in_flight.get(key)
+                if (
+                    future is not None
+                    and future.get_loop() is asyncio.get_running_loop()
+                ):
+                    self.coalesced += 1
+                else:
+                    self.misses += 1
+                    to_load[key] = (provider, subject)
+            waiting.setdefault(key, []).append(index)
+
+        if not waiting:
+            return results
+        if to_load:
+            self._start_fetch(to_load)
+        futures = [self._in_flight[key] for key in waiting]
+        # Shielded so a cancelled caller does not cancel the fetch for others.
+        records = await asyncio.shield(asyncio.gather(*futures))
+        for indexes, record in zip(waiting.values(), records, strict=True):
+            for index in indexes:
+                results[index] = record
+        return results
+
+    async def set(
+        self,
+        provider: str,
+        subject: SubjectLike,
+        data: StoredData,
+    ) -> None:
+        try:
+            await self.store.set(provider, subject, data)
+        finally:
+            self._forget((provider, subject_key(subject)))
+
+    async def set_many(self, items: Sequence[CredentialItem]) -> None:
+        try:
+            await store_many(self.store, items)
+        finally:
+            for provider, subject, _ in items:
+                self._forget((provider, subject_key(subject)))
+
+    async def delete(self, provider: str, subject: SubjectLike) -> None:
+        try:
+            await self.store.delete(provider, subject)
+        finally:
+            self._forget((provider, subject_key(subject)))
+
+    def items(self, provider: str | None = None) -> AsyncIterator[CredentialItem]:
+        """Enumerate the wrapped store; results bypass the cache."""
+        items = getattr(self.store, "items", None)
+        if items is None:
+            raise TypeError(
+                f"{type(self.store).__name__} does not enumerate credentials."
+            )
+        return items(provider)
+
+    async def expiring(
+        self,
+        before: float,
+        *,
+        after: float | None = None,
+        after_key: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[CredentialItem]:
+        """Query the wrapped store's expiry index; results bypass the cache."""
+        return await find_expiring(
+            self.store, before, after=after, after_key=after_key, limit=limit
+        )
+
+    def invalidate(
+        self, provider: str | None = None, subject: SubjectLike | None = None
+    ) -> None:
+        """Drop cached entries for ``provider``/``subject`` (or everything)."""
+        wanted = None if subject is None else subject_key(subject)
+        for key in [*self._entries, *self._in_flight]:
+            if (provider is None or key[0] == provider) and (
+                wanted is None or key[1] == wanted
+            ):
+                self._forget(key)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _forget(self, key: _CacheKey) -> None:
+        self._entries.pop(key, None)
+        # Detach any in-flight fetch: its waiters still get the answer, but it
+        # is not cached and later readers start a fresh fetch.
+        self._in_flight.pop(key, None)
+
+    def _start_fetch(self, to_load: dict[_CacheKey, CredentialKey]) -> None:
+        loop = asyncio.get_running_loop()
+        futures: dict[_CacheKey, asyncio.Future[StoredData | None]] = {}
+        for key in to_load:
+            future: asyncio.Future[StoredData | None] = loop.create_future()
+            future.add_done_callback(_retrieve_exception)
+            self._in_flight[key] = futures[key] = future
+        task = loop.create_task(self._fetch(to_load, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(
+        self,
+        to_load: dict[_CacheKey, CredentialKey],
+        futures: dict[_CacheKey, asyncio.Future[StoredData | None]],
+    ) -> None:
+        try:
+            records = await load_many(self.store, list(to_load.values()))
+            if len(records) != len(futures):
+                raise ValueError(
+                    f"{type(self.store).__name__}.get_many returned "
+                    f"{len(records)} records for {len(futures)} keys"
+                )
+        except BaseException as exc:
+            for key, future in futures.items():
+                self._settle(key, future)
+                if isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                elif not future.done():
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        now = self._clock()
+        for (key, future), record in zip(futures.items(), records, strict=True):
+            frozen = None if record is None else freeze_record(record)
+            if self._settle(key, future):
+                self._remember(key, frozen, now)
+            if not future.done():
+                future.set_result(frozen)
+
+    def _settle(self, key: _CacheKey, future: asyncio.Future[Any]) -> bool:
+        """Stop tracking ``future``; return whether its result may be cached."""
+        if self._in_flight.get(key) is not future:
+            return False
+        del self._in_flight[key]
+        return True
+
+    def _remember(self, key: _CacheKey, record: StoredData | None, now: float) -> None:
+        ttl = self.ttl if record is not None else self.negative_ttl
+        if not ttl:
+            return
+        self._entries[key] = (now + ttl, record)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    # Mark the exception retrieved even if every waiter was cancelled.
+    if not future.cancelled():
+        future.exception()
+
+
+__all__ = ["CachingCredentialStore"]
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import asyncio
+import json
+from collections.abc import AsyncIterator, Mapping, Sequence
+from functools import lru_cache
 from typing import Any, Protocol
 
 SubjectLike = str | Mapping[str, Any]
 StoredData = Mapping[str, Any]
+CredentialKey = tuple[str, SubjectLike]
+CredentialItem = tuple[str, SubjectLike, StoredData]
 
 
 class CredentialStore(Protocol):
@@ -12,6 +17,14 @@ class CredentialStore(Protocol):
 
     async def get(self, provider: str, subject: SubjectLike) -> StoredData | None: ...
 
+    async def get_many(self, keys: Sequence[CredentialKey]) -> list[StoredData | None]:
+        """Return the record for each ``(provider, subject)`` pair, in order.
+
+        Stores that can batch lookups should override this; the default issues
+        the individual ``get`` calls concurrently.
+        """
+        return list(await asyncio.gather(*(self.get(p, s) for p, s in keys)))
+
     async def set(
         self,
         provider: str,
@@ -19,7 +32,139 @@ class CredentialStore(Protocol):
         data: StoredData,
     ) -> None: ...
 
+    async def set_many(self, items: Sequence[CredentialItem]) -> None:
+        """Persist every ``(provider, subject, data)`` item.
+
+        Stores that can batch writes should override this; the default issues
+        the individual ``set`` calls concurrently.
+        """
+        await asyncio.gather(*(self.set(p, s, data) for p, s, data in items))
+
     async def delete(self, provider: str, subject: SubjectLike) -> None: ...
 
 
-__all__ = ["CredentialStore", "SubjectLike", "StoredData"]
+class ExpiringCredentialStore(CredentialStore, Protocol):
+    """Store that can enumerate its records and index them by expiry.
+
+    Items yielded or returned by these methods carry the subject as its
+    canonical ``subject_key`` string, which addresses the same record.
+    """
+
+    def items(self, provider: str | None = None) -> AsyncIterator[CredentialItem]:
+        """Yield every stored item, optionally only those of ``provider``."""
+        ...
+
+    async def expiring(
+        self,
+        before: float,
+        *,
+        after: float | None = None,
+        after_key: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[CredentialItem]:
+        """Return items whose ``expires_at`` lies in ``[after, before]``.
+
+        Items are ordered by ``expires_at``, then provider and subject key;
+        records without a numeric ``expires_at`` are never returned. With
+        ``after_key``, items expiring exactly at ``after`` are returned only
+        when their ``(provider, subject)`` sorts after it, so the last item of
+        one page is the cursor for the next.
+        """
+        ...
+
+
+async def store_many(store: CredentialStore, items: Sequence[CredentialItem]) -> None:
+    """Persist ``items`` in one call, even on stores written before ``set_many``."""
+    if not items:
+        return
+    set_many = getattr(store, "set_many", None)
+    if set_many is not None:
+        await set_many(items)
+        return
+    await asyncio.gather(*(store.set(p, s, data) for p, s, data in items))
+
+
+def subject_key(subject: SubjectLike) -> str:
+    """Return the canonical string key for ``subject``.
+
+    Mapping subjects become sorted, compact JSON. Keys for mappings with
+    hashable values are memoized, so repeat lookups skip the serialization.
+    """
+    if isinstance(subject, str):
+        return subject
+    try:
+        # Value types are part of the memo key: 1, 1.0 and True serialize apart.
+        items = tuple(sorted((k, type(v), v) for k, v in subject.items()))
+        return _mapping_key(items)
+    except TypeError:
+        # Unhashable values or unorderable keys; serialize directly.
+        return _dump_subject(subject)
+
+
+@lru_cache(maxsize=65536)
+def _mapping_key(items: tuple[tuple[Any, type, Any], ...]) -> str:
+    return _dump_subject({key: value for key, _, value in items})
+
+
+def _dump_subject(subject: Mapping[str, Any]) -> str:
+    try:
+        return json.dumps(subject, sort_keys=True, separators=(",", ":"))
+    except TypeError as exc:  # pragma: no cover - defensive only
+        raise TypeError("Subject mappings must be JSON-serializable") from exc
+
+
+def record_expiry(data: StoredData) -> float | None:
+    """Return the numeric ``expires_at`` timestamp of ``data``, if any."""
+    value = data.get("expires_at")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+async def find_expiring(
+    store: CredentialStore,
+    before: float,
+    *,
+    after: float | None = None,
+    after_key: tuple[str, str] | None = None,
+    limit: int | None = None,
+) -> list[CredentialItem]:
+    """Return ``store``'s items expiring in ``[after, before]``, soonest first.
+
+    ``after_key`` resumes after the item with that ``(provider, subject)``
+    expiring at ``after`` (see ``ExpiringCredentialStore.expiring``). Raises
+    ``TypeError`` when the store keeps no expiry index.
+    """
+    expiring = getattr(store, "expiring", None)
+    if expiring is None:
+        raise TypeError(f"{type(store).__name__} does not index credential expiry.")
+    if after_key is None:
+        return list(await expiring(before, after=after, limit=limit))
+    return list(await expiring(before, after=after, after_key=after_key, limit=limit))
+
+
+async def load_many(
+    store: CredentialStore, keys: Sequence[CredentialKey]
+) -> list[StoredData | None]:
+    """Fetch ``keys`` in one call, even from stores written before ``get_many``."""
+    if not keys:
+        return []
+    get_many = getattr(store, "get_many", None)
+    if get_many is not None:
+        return list(await get_many(keys))
+    return list(await asyncio.gather(*(store.get(p, s) for p, s in keys)))
+
+
+__all__ = [
+    "CredentialItem",
+    "CredentialKey",
+    "CredentialStore",
+    "ExpiringCredentialStore",
+    "SubjectLike",
+    "StoredData",
+    "find_expiring",
+    "load_many",
+    "record_expiry",
+    "store_many",
+    "subject_key",
+]
@@ -1,30 +1,68 @@
 from __future__ import annotations
 
-import asyncio
-import copy
-import json
+import heapq
+import threading
+from collections.abc import AsyncIterator, Mapping, Sequence
+from types import MappingProxyType
 from typing import Any
 
-from .credential_store import CredentialStore, StoredData, SubjectLike
+from .credential_store import (
+    CredentialItem,
+    CredentialKey,
+    CredentialStore,
+    StoredData,
+    SubjectLike,
+    record_expiry,
+    subject_key,
+)
+
+DEFAULT_SHARDS = 16
+
+_RecordKey = tuple[str, str]
+_SCALARS = (str, int, float, bool, type(None))
 
 
 class InMemoryCredentialStore(CredentialStore):
-    """Async-safe in-memory store for development and tests."""
+    """Sharded in-memory store for development, tests, and load rigs.
+
+    Records are frozen on ``set`` (nested mappings become read-only views,
+    lists become tuples and sets frozensets) and then shared with every reader,
+    so ``get`` never copies. Callers that need a mutable record must copy it.
+
+    Reads take no lock. Each write holds its shard's lock, never across an
+    ``await``, while it updates both the shard and the expiry index, so the
+    store is safe to share between event loops and threads.
 
-    def __init__(self) -> None:
-        self._records: dict[str, dict[str, dict[str, Any]]] = {}
-        self._lock = asyncio.Lock()
+    Records with a numeric ``expires_at`` are also tracked in a min-heap, so
+    :meth:`expiring` visits only the entries it returns.
+    """
+
+    def __init__(self, *, shards: int = DEFAULT_SHARDS) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self._shards: tuple[dict[_RecordKey, StoredData], ...] = tuple(
+            {} for _ in range(shards)
+        )
+        self._locks = tuple(threading.Lock() for _ in range(shards))
+        # Superseded heap entries are skipped on read and dropped on rebuild.
+        self._expiry: dict[_RecordKey, float] = {}
+        self._expiry_heap: list[tuple[float, _RecordKey]] = []
+        self._expiry_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
 
     async def get(self, provider: str, subject: SubjectLike) -> StoredData | None:
-        key = _normalize_subject(subject)
-        async with self._lock:
-            provider_data = self._records.get(provider)
-            if not provider_data:
-                return None
-            record = provider_data.get(key)
-            if record is None:
-                return None
-            return copy.deepcopy(record)
+        key = (provider, subject_key(subject))
+        return self._shards[hash(key) % len(self._shards)].get(key)
+
+    async def get_many(self, keys: Sequence[CredentialKey]) -> list[StoredData | None]:
+        shards = self._shards
+        results: list[StoredData | None] = []
+        for provider, subject in keys:
+            key = (provider, subject_key(subject))
+            results.append(shards[hash(key) % len(shards)].get(key))
+        return results
 
     async def set(
         self,
@@ -32,29 +70,102 @@ class InMemoryCredentialStore(CredentialStore):
         subject: SubjectLike,
         data: StoredData,
     ) -> None:
-        key = _normalize_subject(subject)
-        async with self._lock:
-            provider_data = self._records.setdefault(provider, {})
-            provider_data[key] = copy.deepcopy(dict(data))
+        key = (provider, subject_key(subject))
+        record = freeze_record(data)
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            self._shards[index][key] = record
+            self._index_expiry(key, record_expiry(record))
 
     async def delete(self, provider: str, subject: SubjectLike) -> None:
-        key = _normalize_subject(subject)
-        async with self._lock:
-            provider_data = self._records.get(provider)
-            if not provider_data:
+        key = (provider, subject_key(subject))
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            self._shards[index].pop(key, None)
+            self._index_expiry(key, None)
+
+    async def items(self, provider: str | None = None) -> AsyncIterator[CredentialItem]:
+        for shard in self._shards:
+            for (record_provider, subject), record in list(shard.items()):
+                if provider is None or record_provider == provider:
+                    yield record_provider, subject, record
+
+    async def expiring(
+        self,
+        before: float,
+        *,
+        after: float | None = None,
+        after_key: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[CredentialItem]:
+        # Heap entries order by (expires_at, key), the same order as the cursor.
+        lower = (float("-inf") if after is None else after, after_key or ("", ""))
+        inclusive = after_key is None
+        keys: list[_RecordKey] = []
+        with self._expiry_lock:
+            heap = self._expiry_heap
+            # Walk the heap in order without popping it: a second heap holds
+            # the frontier of positions whose parents were already visited.
+            frontier = [(heap[0], 0)] if heap else []
+            seen: set[_RecordKey] = set()
+            while frontier and (limit is None or len(keys) < limit):
+                (expires_at, key), position = heapq.heappop(frontier)
+                if expires_at > before:
+                    break
+                position_key = (expires_at, key)
+                if (
+                    (position_key >= lower if inclusive else position_key > lower)
+                    and self._expiry.get(key) == expires_at
+                    and key not in seen
+                ):
+                    seen.add(key)
+                    keys.append(key)
+                for child in (2 * position + 1, 2 * position + 2):
+                    if child < len(heap):
+                        heapq.heappush(frontier, (heap[child], child))
+
+        shards = self._shards
+        found: list[CredentialItem] = []
+        for key in keys:
+            record = shards[hash(key) % len(shards)].get(key)
+            if record is not None:
+                found.append((key[0], key[1], record))
+        return found
+
+    def _index_expiry(self, key: _RecordKey, expires_at: float | None) -> None:
+        # Called with the key's shard lock held; locks nest shard then expiry.
+        with self._expiry_lock:
+            if expires_at is None:
+                self._expiry.pop(key, None)
                 return
-            provider_data.pop(key, None)
-            if not provider_data:
-                self._records.pop(provider, None)
+            if self._expiry.get(key) == expires_at:
+                return
+            self._expiry[key] = expires_at
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            if len(self._expiry_heap) > 2 * len(self._expiry) + 64:
+                self._expiry_heap = [(at, k) for k, at in self._expiry.items()]
+                heapq.heapify(self._expiry_heap)
+
+
+def freeze_record(data: StoredData) -> StoredData:
+    """Return an immutable deep copy of ``data`` that is safe to share.
+
+    Mappings become ``MappingProxyType`` views, lists and tuples become tuples
+    and sets become frozensets.
+    """
+    return MappingProxyType({key: _freeze(value) for key, value in data.items()})
 
 
-def _normalize_subject(subject: SubjectLike) -> str:
-    if isinstance(subject, str):
-        return subject
-    try:
-        return json.dumps(subject, sort_keys=True, separators=(",", ":"))
-    except TypeError as exc:  # pragma: no cover - defensive only
-        raise TypeError("Subject mappings must be JSON-serializable") from exc
+def _freeze(value: Any) -> Any:
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, Mapping):
+        return freeze_record(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
 
 
-__all__ = ["InMemoryCredentialStore"]
+__all__ = ["InMemoryCredentialStore", "freeze_record"]
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .credential_store import (
+    CredentialItem,
+    CredentialKey,
+    CredentialStore,
+    StoredData,
+    SubjectLike,
+    record_expiry,
+    subject_key,
+)
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_BUSY_TIMEOUT = 5.0
+DEFAULT_PAGE_SIZE = 1000
+_TABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class SQLiteCredentialStore(CredentialStore):
+    """Durable credential store backed by a local SQLite database.
+
+    Records live in one ``WITHOUT ROWID`` table keyed by ``(provider,
+    subject)``, so a lookup is a single primary-key probe. The database runs
+    in WAL mode, letting readers proceed while a write commits. Blocking
+    SQLite calls run on a dedicated thread pool, each worker borrowing one
+    connection from a pool of ``pool_size``; ``get_many`` and ``set_many``
+    handle a whole batch in one round trip to the pool. A partial index on
+    each record's ``(expires_at, provider, subject)`` serves :meth:`expiring`.
+
+    Call :meth:`aclose` (or use ``async with``) to close the connections.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        table: str = "credentials",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+    ) -> None:
+        if not _TABLE_NAME.match(table):
+            raise ValueError(f"Invalid table name '{table}'.")
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.path = os.fspath(path)
+        self.table = table
+        self.busy_timeout = busy_timeout
+        if self.path == ":memory:" or "mode=memory" in self.path:
+            # Every connection to an in-memory database would see its own copy.
+            pool_size = 1
+        self.pool_size = pool_size
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._connections: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._schema_ready = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="sqlite-credentials"
+        )
+        self._closed = False
+
+    async def __aenter__(self) -> "SQLiteCredentialStore":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
+    async def get(self, provider: str, subject: SubjectLike) -> StoredData | None:
+        key = subject_key(subject)
+        return await self._run(self._get, provider, key)
+
+    async def get_many(self, keys: Sequence[CredentialKey]) -> list[StoredData | None]:
+        if not keys:
+            return []
+        normalized = [(provider, subject_key(subject)) for provider, subject in keys]
+        found = await self._run(self._get_many, normalized)
+        return [found.get(key) for key in normalized]
+
+    async def set(
+        self,
+        provider: str,
+        subject: SubjectLike,
+        data: StoredData,
+    ) -> None:
+        await self.set_many([(provider, subject, data)])
+
+    async def set_many(self, items: Sequence[CredentialItem]) -> None:
+        """Upsert every ``(provider, subject, data)`` item in one transaction."""
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (provider, subject_key(subject), _dumps(data), now, record_expiry(data))
+            for provider, subject, data in items
+        ]
+        await self._run(self._set_many, rows)
+
+    async def delete(self, provider: str, subject: SubjectLike) -> None:
+        key = subject_key(subject)
+        await self._run(self._delete, provider, key)
+
+    async def items(
+        self, provider: str | None = None, *, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> AsyncIterator[CredentialItem]:
+        """Yield stored items in key order, reading ``page_size`` rows at a time."""
+        cursor: tuple[str, str] | None = None
+        while True:
+            rows = await self._run(self._page, provider, cursor, page_size)
+            for row_provider, subject, data in rows:
+                yield row_provider, subject, json.loads(data)
+            if len(rows) < page_size:
+                return
+            cursor = (rows[-1][0], rows[-1][1])
+
+    async def expiring(
+        self,
+        before: float,
+        *,
+        after: float | None = None,
+        after_key: tuple[str, str] | None = None,
+        limit: int | None = None,
+    ) -> list[CredentialItem]:
+        rows = await self._run(self._expiring, before, after, after_key, limit)
+        return [
+            (provider, subject, json.loads(data)) for provider, subject, data in rows
+        ]
+
+    async def count(self) -> int:
+        """Return the number of stored records."""
+        return await self._run(self._count)
+
+    async def aclose(self) -> None:
+        """Close pooled connections and stop the worker threads."""
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self) -> None:
+        """Blocking variant of :meth:`aclose`."""
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._pool_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+
+    async def _run(self, operation: Callable[..., T], *args: Any) -> T:
+        if self._closed:
+            raise RuntimeError("SQLiteCredentialStore is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._with_connection, operation, args
+        )
+
+    def _with_connection(self, operation: Callable[..., T], args: tuple[Any, ...]) -> T:
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            connection = self._connect()
+        try:
+            return operation(connection, *args)
+        finally:
+            self._pool.put(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            uri=self.path.startswith("file:"),
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with self._pool_lock:
+            if not self._schema_ready:
+                self._create_schema(connection)
+                self._schema_ready = True
+            self._connections.append(connection)
+        return connection
+
+    def _create_schema(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} ("
+            "provider TEXT NOT NULL, "
+            "subject TEXT NOT NULL, "
+            "data TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, "
+            "expires_at REAL, "
+            "PRIMARY KEY (provider, subject)"
+            ") WITHOUT ROWID"
+        )
+        # Serves the (expires_at, provider, subject) cursor ``expiring`` pages on.
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {self.table}_expiry_key "
+            f"ON {self.table} (expires_at, provider, subject) "
+            "WHERE expires_at IS NOT NULL"
+        )
+
+    def _get(
+        self, connection: sqlite3.Connection, provider: str, subject: str
+    ) -> StoredData | None:
+        row = connection.execute(
+            f"SELECT data FROM {self.table} WHERE provider = ? AND subject = ?",
+            (provider, subject),
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def _get_many(
+        self, connection: sqlite3.Connection, keys: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], StoredData]:
+        # Individual primary-key probes on one connection: SQLite answers each in
+        # microseconds, while row-value IN lists fall back to scanning the table.
+        query = f"SELECT data FROM {self.table} WHERE provider = ? AND subject = ?"
+        found: dict[tuple[str, str], StoredData] = {}
+        for key in dict.fromkeys(keys):
+            row = connection.execute(query, key).fetchone()
+            if row is not None:
+                found[key] = json.loads(row[0])
+        return found
+
+    def _set_many(
+        self,
+        connection: sqlite3.Connection,
+        rows: list[tuple[str, str, str, float, float | None]],
+    ) -> None:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                f"INSERT INTO {self.table} "
+                "(provider, subject, data, updated_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (provider, subject) DO UPDATE SET "
+                "data = excluded.data, updated_at = excluded.updated_at, "
+                "expires_at = excluded.expires_at",
+                rows,
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _delete(
+        self, connection: sqlite3.Connection, provider: str, subject: str
+    ) -> None:
+        connection.execute(
+            f"DELETE FROM {self.table} WHERE provider = ? AND subject = ?",
+            (provider, subject),
+        )
+
+    def _page(
+        self,
+        connection: sqlite3.Connection,
+        provider: str | None,
+        cursor: tuple[str, str] | None,
+        page_size: int,
+    ) -> list[tuple[str, str, str]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if provider is not None:
+            clauses.append("provider = ?")
+            params.append(provider)
+        if cursor is not None and provider is not None:
+            clauses.append("subject > ?")
+            params.append(cursor[1])
+        elif cursor is not None:
+            clauses.append("(provider, subject) > (?, ?)")
+            params.extend(cursor)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        return connection.execute(
+            f"SELECT provider, subject, data FROM {self.table} {where}"
+            "ORDER BY provider, subject LIMIT ?",
+            (*params, page_size),
+        ).fetchall()
+
+    def _expiring(
+        self,
+        connection: sqlite3.Connection,
+        before: float,
+        after: float | None,
+        after_key: tuple[str, str] | None,
+        limit: int | None,
+    ) -> list[tuple[str, str, str]]:
+        lower = float("-inf") if after is None else after
+        if after_key is None:
+            where, params = "expires_at >= ?", (lower,)
+        else:
+            where = "(expires_at, provider, subject) > (?, ?, ?)"
+            params = (lower, *after_key)
+        return connection.execute(
+            f"SELECT provider, subject, data FROM {self.table} "
+            f"WHERE expires_at <= ? AND {where} "
+            "ORDER BY expires_at, provider, subject LIMIT ?",
+            (before, *params, -1 if limit is None else limit),
+        ).fetchall()
+
+    def _count(self, connection: sqlite3.Connection) -> int:
+        return connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+def _dumps(data: StoredData) -> str:
+    return json.dumps(data, separators=(",", ":"), default=_json_default)
+
+
+def _json_default(value: Any) -> Any:
+    # Frozen records from other stores hold read-only mappings and frozensets;
+    # sets come back from ``get`` as lists.
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+__all__ = ["SQLiteCredentialStore"]
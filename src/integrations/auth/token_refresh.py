@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import ValidationError
+
+from integrations.core.rate_limit import RateLimit, RateLimiter
+from integrations.core.singleflight import RequestCoalescer
+
+from .auth_provider import AuthProvider
+from .credentials import UserCredentials
+from .flows.oauth2 import OAuth2Flow, OAuth2Token
+from .storage import (
+    CredentialItem,
+    SubjectLike,
+    find_expiring,
+    record_expiry,
+    subject_key,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .auth_manager import AuthManager
+
+CredentialsT = TypeVar("CredentialsT", bound=UserCredentials)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_SKEW = 300.0
+DEFAULT_SWEEP_INTERVAL = 60.0
+DEFAULT_SWEEP_HORIZON = 600.0
+DEFAULT_SWEEP_CONCURRENCY = 8
+DEFAULT_SWEEP_BATCH_SIZE = 500
+
+
+class TokenRefresher:
+    """Refresh OAuth2 tokens shortly before they expire.
+
+    A token with a refresh token is due once its ``expires_at`` falls within
+    ``skew`` seconds. The auth provider's :class:`OAuth2Flow` performs the
+    refresh and the new token is persisted through
+    ``AuthManager.store_credentials``. Concurrent refreshes for one provider
+    and subject share a single call to the token endpoint, and the store is
+    re-read first so a token another session (or process) already refreshed is
+    reused instead of refreshed again.
+    """
+
+    def __init__(
+        self,
+        manager: "AuthManager",
+        *,
+        skew: float = DEFAULT_REFRESH_SKEW,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._manager = manager
+        self.skew = skew
+        self._clock = clock
+        self._coalescer: RequestCoalescer[UserCredentials] = RequestCoalescer()
+        self.refreshed = 0
+        self.failed = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of refreshes that joined one already in flight."""
+        return self._coalescer.coalesced
+
+    def needs_refresh(self, credentials: UserCredentials | None) -> bool:
+        """Return whether ``credentials`` expire within the skew window."""
+        if not isinstance(credentials, OAuth2Token) or not credentials.refresh_token:
+            return False
+        if credentials.expires_at is None:
+            return False
+        return credentials.expires_at - self.skew <= self._clock()
+
+    async def ensure_fresh(
+        self, provider: str, subject: SubjectLike, credentials: CredentialsT
+    ) -> CredentialsT:
+        """Return ``credentials``, refreshed first when they are due.
+
+        A failed refresh is logged as a warning and the current credentials
+        are returned unchanged; the next call tries again.
+        """
+        if not self.needs_refresh(credentials):
+            return credentials
+        try:
+            return await self.refresh(provider, subject, credentials)
+        except Exception:
+            logger.warning(
+                "Token refresh failed for provider %r, subject %r; "
+                "using the current token",
+                provider,
+                subject_key(subject),
+                exc_info=True,
+            )
+            return credentials
+
+    async def refresh(
+        self, provider: str, subject: SubjectLike, credentials: CredentialsT
+    ) -> CredentialsT:
+        """Refresh ``credentials`` for ``subject`` and persist the result."""
+        key = (provider, subject_key(subject))
+        refreshed = await self._coalescer.do(
+            key, lambda: self._refresh(provider, subject, credentials)
+        )
+        return refreshed  # type: ignore[return-value]
+
+    async def _refresh(
+        self, provider: str, subject: SubjectLike, credentials: UserCredentials
+    ) -> UserCredentials:
+        manager = self._manager
+        auth_provider = manager.get_provider(provider)
+        flow = _oauth2_flow(auth_provider)
+        if flow is None:
+            return credentials
+
+        stored = auth_provider.parse_user_credentials(
+            await manager.credential_store.get(provider, subject)
+        )
+        if isinstance(stored, OAuth2Token):
+            if stored.access_token != getattr(
+                credentials, "access_token", None
+            ) and not self.needs_refresh(stored):
+                return stored
+            # The stored token carries the latest refresh token if it rotated.
+            credentials = stored
+
+        try:
+            token = await flow.refresh(subject=subject, credentials=credentials)
+        except Exception:
+            self.failed += 1
+            raise
+        token = self._complete(token, credentials)
+        await manager.store_credentials(provider, subject, token)
+        self.refreshed += 1
+        return token
+
+    def _complete(self, token: OAuth2Token, previous: Any) -> OAuth2Token:
+        update: dict[str, Any] = {}
+        # Token endpoints (Google's among them) usually omit an unchanged
+        # refresh token from the response.
+        if token.refresh_token is None:
+            update["refresh_token"] = getattr(previous, "refresh_token", None)
+        if token.expires_at is None and token.expires_in is not None:
+            update["expires_at"] = self._clock() + token.expires_in
+        return token.model_copy(update=update) if update else token
+
+
+class TokenRefreshSweeper:
+    """Background task that refreshes tokens before any session needs them.
+
+    Every ``interval`` seconds the sweeper asks the credential store for
+    tokens expiring within the next ``horizon`` seconds, reading
+    ``batch_size`` at a time, and refreshes them through a
+    :class:`TokenRefresher`: at most ``concurrency`` at once and, per auth
+    provider, no faster than ``rate_limits`` (or ``default_rate_limit``)
+    allows. Tokens that already expired are left to the session-time refresh,
+    so a revoked grant is not retried on every sweep.
+
+    The credential store must keep an expiry index (see
+    ``ExpiringCredentialStore``).
+    """
+
+    def __init__(
+        self,
+        manager: "AuthManager",
+        *,
+        refresher: TokenRefresher | None = None,
+        interval: float = DEFAULT_SWEEP_INTERVAL,
+        horizon: float = DEFAULT_SWEEP_HORIZON,
+        concurrency: int = DEFAULT_SWEEP_CONCURRENCY,
+        batch_size: int = DEFAULT_SWEEP_BATCH_SIZE,
+        rate_limits: Mapping[str, RateLimit] | None = None,
+        default_rate_limit: RateLimit | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._manager = manager
+        self.refresher = (
+            refresher or manager.token_refresher or TokenRefresher(manager, clock=clock)
+        )
+        self.interval = interval
+        self.horizon = horizon
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.rate_limits = dict(rate_limits or {})
+        self.default_rate_limit = default_rate_limit
+        self._clock = clock
+        self._limiter = RateLimiter()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping: asyncio.Event | None = None
+        self.sweeps = 0
+        self.scanned = 0
+        self.refreshed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.errors = 0
+        self.rate_limited_seconds = 0.0
+        self.last_sweep_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Return whether the background task is active."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sweeping on the running event loop."""
+        if self.running:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(), name="token-refresh-sweeper"
+        )
+
+    async def stop(self, *, timeout: float | None = None) -> None:
+        """Stop after the current sweep, cancelling it after ``timeout`` seconds."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        if self._stopping is not None:
+            self._stopping.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except TimeoutError:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def sweep(self) -> int:
+        """Refresh every token due within ``horizon``; return how many were."""
+        started = time.perf_counter()
+        now = self._clock()
+        before = now + self.horizon
+        after = now
+        after_key: tuple[str, str] | None = None
+        seen: set[tuple[str, str]] = set()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        refreshed = 0
+        while True:
+            page = await find_expiring(
+                self._manager.credential_store,
+                before,
+                after=after,
+                after_key=after_key,
+                limit=self.batch_size,
+            )
+            if not page:
+                break
+            # A token refreshed earlier in this sweep may expire again within
+            # the horizon; refresh it once per sweep.
+            items = [item for item in page if (item[0], item[1]) not in seen]
+            seen.update((provider, subject) for provider, subject, _ in items)
+            self.scanned += len(items)
+            results = await asyncio.gather(
+                *(self._refresh_item(item, semaphore) for item in items)
+            )
+            refreshed += sum(results)
+            if len(page) < self.batch_size:
+                break
+            # Page on (expires_at, provider, subject) so records sharing an
+            # expiry across a page boundary are neither skipped nor re-read.
+            provider, subject, data = page[-1]
+            after, after_key = record_expiry(data) or after, (provider, subject)
+        self.sweeps += 1
+        self.last_sweep_seconds = time.perf_counter() - started
+        return refreshed
+
+    async def _run(self) -> None:
+        stopping = self._stopping
+        assert stopping is not None
+        while not stopping.is_set():
+            try:
+                await self.sweep()
+            except Exception:
+                self.errors += 1
+                logger.warning("Token refresh sweep failed", exc_info=True)
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(stopping.wait(), self.interval)
+
+    async def _refresh_item(
+        self, item: CredentialItem, semaphore: asyncio.Semaphore
+    ) -> bool:
+        provider, subject, data = item
+        manager = self._manager
+        if provider not in manager:
+            self.skipped += 1
+            return False
+        auth_provider = manager.get_provider(provider)
+        try:
+            credentials = auth_provider.parse_user_credentials(data)
+        except (ValidationError, TypeError):
+            credentials = None
+        if (
+            not isinstance(credentials, OAuth2Token)
+            or not credentials.refresh_token
+            or _oauth2_flow(auth_provider) is None
+        ):
+            self.skipped += 1
+            return False
+
+        limit = self.rate_limits.get(provider, self.default_rate_limit)
+        if limit is not None:
+            self.rate_limited_seconds += await self._limiter.acquire((provider,), limit)
+        async with semaphore:
+            try:
+                await self.refresher.refresh(provider, subject, credentials)
+            except Exception:
+                self.failed += 1
+                logger.warning(
+                    "Background token refresh failed for provider %r, subject %r",
+                    provider,
+                    subject,
+                    exc_info=True,
+                )
+                return False
+        self.refreshed += 1
+        return True
+
+
+def _oauth2_flow(auth_provider: AuthProvider[Any, Any]) -> OAuth2Flow[Any, Any] | None:
+    for flow in auth_provider.flows().values():
+        if isinstance(flow, OAuth2Flow):
+            return flow
+    return None
+
+
+__all__ = ["DEFAULT_REFRESH_SKEW", "TokenRefreshSweeper", "TokenRefresher"]
@@ -6,6 +6,7 @@ from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 from integrations.auth.storage import SubjectLike
+from integrations.core.settings_factory import build_settings
 from integrations.providers.asana.asana_settings import AsanaSettings
 
 from .asana_credentials import AsanaAppCredentials, AsanaUserCredentials
@@ -50,7 +51,7 @@ class AsanaBinding:
                 " an app token."
             )
 
-        return AsanaSettings(token=token, workspace_gid=workspace_gid)
+        return build_settings(AsanaSettings, token=token, workspace_gid=workspace_gid)
 
 
 __all__ = ["AsanaBinding"]
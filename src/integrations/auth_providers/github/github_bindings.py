@@ -4,6 +4,7 @@ from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 from integrations.auth.storage import SubjectLike
+from integrations.core.settings_factory import build_settings
 from integrations.providers.github.github_settings import GithubSettings
 from .github_credentials import GithubAppCredentials, GithubUserCredentials
 
@@ -40,7 +41,9 @@ class GithubBinding:
                     "GitHub credentials missing token; store OAuth token or configure an app token."
                 )
 
-        return GithubSettings(token=token, authorization_scheme=scheme or "Bearer")
+        return build_settings(
+            GithubSettings, token=token, authorization_scheme=scheme or "Bearer"
+        )
 
 
 __all__ = ["GithubBinding"]
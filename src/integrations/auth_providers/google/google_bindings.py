@@ -6,6 +6,7 @@ from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from integrations.auth.storage import SubjectLike
+from integrations.core.settings_factory import build_settings
 from integrations.providers.gmail.gmail_settings import GmailSettings
 from integrations.providers.google_calendar.google_calendar_settings import (
     GoogleCalendarSettings,
@@ -90,7 +91,7 @@ class GoogleBinding(Generic[SettingsT]):
             if value is not None:
                 payload[field] = value
 
-        return self._settings_cls(**payload)
+        return build_settings(self._settings_cls, **payload)
 
     def _resolve_extra(
         self,
@@ -6,6 +6,7 @@ from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from integrations.auth.storage import SubjectLike
+from integrations.core.settings_factory import build_settings
 from integrations.providers.hubspot.hubspot_settings import HubspotSettings
 
 from .hubspot_credentials import HubspotAppCredentials, HubspotUserCredentials
@@ -73,7 +74,7 @@ class HubspotBinding:
         if isinstance(resolved_user_agent, str):
             payload["user_agent"] = resolved_user_agent
 
-        return HubspotSettings(**payload)
+        return build_settings(HubspotSettings, **payload)
 
 
 __all__ = ["HubspotBinding"]
@@ -6,6 +6,7 @@ from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from integrations.auth.storage import SubjectLike
+from integrations.core.settings_factory import build_settings
 from integrations.providers.notion.notion_settings import NotionSettings
 
 from .notion_credentials import NotionAppCredentials, NotionUserCredentials
@@ -64,7 +65,7 @@ class NotionBinding:
         if isinstance(base_url, str):
             payload["base_url"] = base_url
 
-        return NotionSettings(**payload)
+        return build_settings(NotionSettings, **payload)
 
     def _extract_value(
         self,
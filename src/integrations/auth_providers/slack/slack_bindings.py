@@ -6,6 +6,7 @@ from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from integrations.auth.storage import SubjectLike
+from integrations.core.settings_factory import build_settings
 from integrations.providers.slack.slack_settings import SlackSettings
 
 from .slack_credentials import SlackAppCredentials, SlackUserCredentials
@@ -51,7 +52,7 @@ class SlackBinding:
             if value is not None:
                 payload[field] = value
 
-        return SlackSettings(**payload)
+        return build_settings(SlackSettings, **payload)
 
     def _extract(
         self,
@@ -1,16 +1,71 @@
 """Core building blocks for the integrations SDK."""
 
-from .actions import BaseAction, action
+from .actions import BaseAction, PaginatedAction, action
 from .actions.raw_http_request import RawHttpRequestAction
+from .concurrency import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimits,
+    ConcurrencyRegistry,
+)
+from .instrumentation import (
+    ActionContext,
+    RequestContext,
+    InstrumentationHook,
+    HistogramHook,
+    LatencyHistogram,
+    SpanHook,
+    Span,
+    Tracer,
+    instrument,
+    register_hook,
+    unregister_hook,
+)
 from .integrations import Integrations, provider_override
 from .mixins.httpx import HttpxClientMixin
+from .pagination import (
+    AfterPaginator,
+    CursorPaginator,
+    LinkHeaderPaginator,
+    OffsetPaginator,
+    Page,
+    PageNumberPaginator,
+    PageRequest,
+    PageTokenPaginator,
+    Paginator,
+    StartCursorPaginator,
+    paginate,
+    iter_pages,
+)
 from .provider_key import ProviderIdentifier, ProviderKey, provider_key
 from .provider import BaseProvider, ProviderSettings
-from .registry import available_providers, get_provider, register_provider
+from .rate_limit import RateLimit, RateLimiter, RateLimitProfile
+from .registry import (
+    available_providers,
+    get_provider,
+    get_provider_settings,
+    provider_names,
+    register_provider,
+)
+from .response_cache import (
+    CacheRule,
+    CachedResponse,
+    InMemoryResponseCache,
+    ResponseCache,
+    ResponseCacheProfile,
+)
+from .retry import RetryPolicy
+from .settings_factory import (
+    SettingsFactory,
+    build_settings,
+    refresh_settings_environment,
+)
+from .singleflight import RequestCoalescer
+from .transport_pool import TransportPool
 
 __all__ = [
     "BaseAction",
     "action",
+    "PaginatedAction",
     "Integrations",
     "provider_override",
     "HttpxClientMixin",
@@ -23,4 +78,46 @@ __all__ = [
     "register_provider",
     "get_provider",
     "available_providers",
+    "get_provider_settings",
+    "provider_names",
+    "SettingsFactory",
+    "build_settings",
+    "refresh_settings_environment",
+    "TransportPool",
+    "RetryPolicy",
+    "RateLimit",
+    "RateLimitProfile",
+    "RateLimiter",
+    "ConcurrencyLimits",
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyRegistry",
+    "RequestCoalescer",
+    "CacheRule",
+    "CachedResponse",
+    "InMemoryResponseCache",
+    "ResponseCache",
+    "ResponseCacheProfile",
+    "AfterPaginator",
+    "CursorPaginator",
+    "LinkHeaderPaginator",
+    "OffsetPaginator",
+    "Page",
+    "PageNumberPaginator",
+    "PageRequest",
+    "PageTokenPaginator",
+    "Paginator",
+    "StartCursorPaginator",
+    "paginate",
+    "iter_pages",
+    "ActionContext",
+    "RequestContext",
+    "InstrumentationHook",
+    "HistogramHook",
+    "LatencyHistogram",
+    "SpanHook",
+    "Span",
+    "Tracer",
+    "instrument",
+    "register_hook",
+    "unregister_hook",
 ]
@@ -1,6 +1,7 @@
 """Base action primitives and registration helpers."""
 
 from .base_action import BaseAction
+from .paginated import PaginatedAction
 from .registration import ActionFactory, action
 
-__all__ = ["BaseAction", "ActionFactory", "action"]
+__all__ = ["BaseAction", "ActionFactory", "PaginatedAction", "action"]
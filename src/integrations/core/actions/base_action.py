@@ -5,6 +5,8 @@ from __future__ import annotations
 import inspect
 from typing import TYPE_CHECKING, Any, Callable, Literal
 
+from ..instrumentation import instrumented_call
+
 if TYPE_CHECKING:  # pragma: no cover
     from ..provider import BaseProvider
     from agents import AgentBase, FunctionTool, RunContextWrapper
@@ -16,6 +18,13 @@ if TYPE_CHECKING:  # pragma: no cover
 class BaseAction:
     """Base class for actions bound to a provider."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        call = cls.__dict__.get("__call__")
+        if call is not None and not getattr(call, "__instrumented__", False):
+            # Report every invocation to registered instrumentation hooks.
+            cls.__call__ = instrumented_call(call)
+
     def __init__(
         self,
         provider: "BaseProvider",
@@ -0,0 +1,87 @@
+"""Base class for actions backed by paginated list endpoints."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any, ClassVar
+
+from ..pagination import Page, PageRequest, Paginator, iter_pages, paginate
+from .base_action import BaseAction
+
+
+class PaginatedAction(BaseAction):
+    """Action whose results can be streamed page by page.
+
+    Subclasses set ``paginator`` and implement ``page_request`` with the same
+    arguments as ``__call__``; ``iter(...)`` and ``iter_pages(...)`` then follow
+    the provider's cursors until the listing (or ``max_items``) is exhausted,
+    keeping up to ``prefetch`` page requests in flight ahead of the consumer.
+    """
+
+    paginator: ClassVar[Paginator]
+    # Pages fetched ahead of the consumer when ``iter(prefetch=...)`` is omitted.
+    default_prefetch: ClassVar[int] = 0
+
+    def page_request(self, *args: Any, **kwargs: Any) -> PageRequest:
+        """Return the request for the first page."""
+        raise NotImplementedError
+
+    def parse_page(self, response: Any) -> Any:
+        """Decode a page response into the payload the paginator inspects."""
+        return self.provider.process_httpx_response(response)
+
+    async def fetch_page(self, request: PageRequest) -> Any:
+        """Fetch a single page and return its decoded payload."""
+        response = await self.provider.request(
+            request.method,
+            request.url,
+            params=request.params or None,
+            json=request.body,
+            retry=request.retry,
+        )
+        return self.parse_page(response)
+
+    def iter(
+        self,
+        *args: Any,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+        prefetch: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Stream items across pages: ``async for item in action.iter(...)``."""
+        return paginate(
+            self.provider,
+            self.page_request(*args, **kwargs),
+            self.paginator,
+            page_size=page_size,
+            max_items=max_items,
+            max_pages=max_pages,
+            prefetch=self.default_prefetch if prefetch is None else prefetch,
+            parse=self.parse_page,
+        )
+
+    def iter_pages(
+        self,
+        *args: Any,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        max_pages: int | None = None,
+        prefetch: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Page]:
+        """Stream whole pages, including each page's raw payload."""
+        return iter_pages(
+            self.provider,
+            self.page_request(*args, **kwargs),
+            self.paginator,
+            page_size=page_size,
+            max_items=max_items,
+            max_pages=max_pages,
+            prefetch=self.default_prefetch if prefetch is None else prefetch,
+            parse=self.parse_page,
+        )
+
+
+__all__ = ["PaginatedAction"]
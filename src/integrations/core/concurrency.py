@@ -0,0 +1,183 @@
+"""Adaptive (AIMD) concurrency limiting for provider requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Hashable
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+ConcurrencyKey = tuple[Hashable, ...]
+ConcurrencyOutcome = Literal["success", "overload", "ignore"]
+
+DEFAULT_MAX_LIMITERS = 10_000
+
+
+class ConcurrencyLimits(BaseModel):
+    """Bounds and step sizes for an additive-increase/multiplicative-decrease limit.
+
+    Each successful request grows the limit by ``increase / limit`` (roughly
+    ``increase`` per full window of requests); an overload signal multiplies it by
+    ``decrease_factor``. The limit always stays within ``[min_limit, max_limit]``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    initial_limit: float = Field(default=10.0, ge=1)
+    min_limit: float = Field(default=1.0, ge=1)
+    max_limit: float = Field(default=100.0, ge=1)
+    increase: float = Field(default=1.0, gt=0)
+    decrease_factor: float = Field(default=0.5, gt=0, lt=1)
+    overload_statuses: frozenset[int] = frozenset({429, 503})
+
+    @model_validator(mode="after")
+    def _check_bounds(self) -> "ConcurrencyLimits":
+        if not self.min_limit <= self.initial_limit <= self.max_limit:
+            raise ValueError("initial_limit must lie between min_limit and max_limit.")
+        return self
+
+
+class AdaptiveConcurrencyLimiter:
+    """Cap in-flight requests, adapting the cap to overload signals.
+
+    Callers ``acquire()`` a slot before sending and ``release()`` it with the
+    outcome. Waiters are admitted in FIFO order. A decrease only applies to
+    requests admitted since the previous decrease, so one burst of rejections
+    cuts the limit once rather than once per rejected request.
+    """
+
+    def __init__(self, limits: ConcurrencyLimits | None = None) -> None:
+        self.limits = limits or ConcurrencyLimits()
+        self._limit = self.limits.initial_limit
+        self._in_flight = 0
+        self._epoch = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Return the number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of callers waiting for a slot."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self) -> int:
+        """Wait for a free slot; return a token to pass back to ``release()``."""
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return self._epoch
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation; give it back.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._discard(waiter)
+            raise
+        return self._epoch
+
+    def release(self, token: int, outcome: ConcurrencyOutcome = "success") -> None:
+        """Free a slot and adjust the limit according to ``outcome``."""
+        limits = self.limits
+        if outcome == "success":
+            if self._in_flight * 2 >= self._limit:
+                # Only grow while the current limit is actually being used.
+                self._limit = min(
+                    limits.max_limit, self._limit + limits.increase / self._limit
+                )
+        elif outcome == "overload" and token == self._epoch:
+            self._limit = max(limits.min_limit, self._limit * limits.decrease_factor)
+            self._epoch += 1
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _discard(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+class ConcurrencyRegistry:
+    """Registry of adaptive limiters keyed by provider and host.
+
+    Limiters are created on first use and evicted least-recently-used once
+    ``max_limiters`` is exceeded.
+    """
+
+    def __init__(self, *, max_limiters: int = DEFAULT_MAX_LIMITERS) -> None:
+        self.max_limiters = max_limiters
+        self._limiters: OrderedDict[ConcurrencyKey, AdaptiveConcurrencyLimiter] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._limiters
+
+    def limiter(
+        self, key: ConcurrencyKey, limits: ConcurrencyLimits
+    ) -> AdaptiveConcurrencyLimiter:
+        """Return the limiter for ``key``, replacing it if ``limits`` changed."""
+        limiter = self._limiters.get(key)
+        if limiter is None or limiter.limits != limits:
+            limiter = AdaptiveConcurrencyLimiter(limits)
+            self._limiters[key] = limiter
+            while len(self._limiters) > self.max_limiters:
+                self._limiters.popitem(last=False)
+        else:
+            self._limiters.move_to_end(key)
+        return limiter
+
+    def snapshot(self) -> dict[ConcurrencyKey, dict[str, int]]:
+        """Return the current limit, in-flight count, and queue depth per key."""
+        return {
+            key: {
+                "limit": limiter.limit,
+                "in_flight": limiter.in_flight,
+                "queue_depth": limiter.queue_depth,
+            }
+            for key, limiter in self._limiters.items()
+        }
+
+    def clear(self) -> None:
+        """Drop every limiter."""
+        self._limiters.clear()
+
+
+_DEFAULT_CONCURRENCY_REGISTRY = ConcurrencyRegistry()
+
+
+def default_concurrency_registry() -> ConcurrencyRegistry:
+    """Return the process-wide registry shared by every provider instance."""
+    return _DEFAULT_CONCURRENCY_REGISTRY
+
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "ConcurrencyLimits",
+    "ConcurrencyRegistry",
+    "default_concurrency_registry",
+]
@@ -0,0 +1,463 @@
+"""Instrumentation hooks, latency histograms, and span adapters."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import re
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Protocol, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+_HOOKS: tuple["InstrumentationHook", ...] = ()
+_HOOKS_LOCK = threading.Lock()
+
+_CURRENT_ACTION: ContextVar["ActionContext | None"] = ContextVar(
+    "integrations_current_action", default=None
+)
+_CURRENT_REQUEST: ContextVar["RequestContext | None"] = ContextVar(
+    "integrations_current_request", default=None
+)
+
+# Path segments that look like identifiers collapse to ``{id}`` in route templates.
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[\w.@=-]+$|^[\w-]{20,}$|@")
+_VERSION_SEGMENT = re.compile(r"^v\d+(?:\.\d+)*$")
+
+
+class ActionContext:
+    """Measurements for one action invocation, shared with every hook."""
+
+    __slots__ = (
+        "action",
+        "error",
+        "instance",
+        "latency",
+        "provider",
+        "requests",
+        "started",
+    )
+
+    def __init__(self, provider: str, action: str, instance: Any = None) -> None:
+        self.provider = provider
+        self.action = action
+        self.instance = instance
+        self.started = time.perf_counter()
+        self.latency = 0.0
+        self.error: BaseException | None = None
+        self.requests = 0
+
+
+class RequestContext:
+    """Measurements for one ``HttpxClientMixin.request`` call.
+
+    ``retries`` counts attempts after the first, ``queue_wait`` is the time spent
+    waiting on client-side rate and concurrency limits, and ``cached`` marks
+    responses served from the response cache without a network round trip.
+    """
+
+    __slots__ = (
+        "action",
+        "cached",
+        "error",
+        "latency",
+        "method",
+        "provider",
+        "queue_wait",
+        "request_bytes",
+        "response_bytes",
+        "retries",
+        "route",
+        "started",
+        "status",
+        "url",
+    )
+
+    def __init__(
+        self,
+        provider: str,
+        action: str | None,
+        method: str,
+        route: str,
+        url: str,
+    ) -> None:
+        self.provider = provider
+        self.action = action
+        self.method = method
+        self.route = route
+        self.url = url
+        self.started = time.perf_counter()
+        self.status: int | None = None
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.queue_wait = 0.0
+        self.latency = 0.0
+        self.cached = False
+        self.error: BaseException | None = None
+
+
+class InstrumentationHook:
+    """Receive action and request lifecycle callbacks; override what you need.
+
+    Callbacks run inline on the event loop and must not block. An exception
+    raised by a callback is logged and never fails the call being observed.
+    """
+
+    def action_started(self, context: ActionContext) -> None:
+        return None
+
+    def action_finished(self, context: ActionContext) -> None:
+        return None
+
+    def request_started(self, context: RequestContext) -> None:
+        return None
+
+    def request_finished(self, context: RequestContext) -> None:
+        return None
+
+
+def register_hook(hook: InstrumentationHook) -> None:
+    """Start delivering lifecycle callbacks to ``hook``."""
+    global _HOOKS
+    with _HOOKS_LOCK:
+        if hook not in _HOOKS:
+            _HOOKS = (*_HOOKS, hook)
+
+
+def unregister_hook(hook: InstrumentationHook) -> None:
+    """Stop delivering callbacks to ``hook``; unknown hooks are ignored."""
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = tuple(existing for existing in _HOOKS if existing is not hook)
+
+
+def registered_hooks() -> tuple[InstrumentationHook, ...]:
+    return _HOOKS
+
+
+@contextmanager
+def instrument(*hooks: InstrumentationHook) -> Iterator[None]:
+    """Register ``hooks`` for the duration of a ``with`` block."""
+    for hook in hooks:
+        register_hook(hook)
+    try:
+        yield
+    finally:
+        for hook in hooks:
+            unregister_hook(hook)
+
+
+def current_request() -> RequestContext | None:
+    """Return the request being measured in this task, if any."""
+    return _CURRENT_REQUEST.get()
+
+
+def instrumented_call(
+    call: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Wrap an action ``__call__`` so hooks observe it; free when none are set."""
+
+    @functools.wraps(call)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+        if not _HOOKS:
+            return await call(self, *args, **kwargs)
+        current = _CURRENT_ACTION.get()
+        if current is not None and current.instance is self:
+            # A subclass delegating to ``super().__call__`` is one invocation.
+            return await call(self, *args, **kwargs)
+        context = ActionContext(_provider_name(self.provider), self.name, self)
+        hooks = _HOOKS
+        _notify(hooks, "action_started", context)
+        token = _CURRENT_ACTION.set(context)
+        try:
+            return await call(self, *args, **kwargs)
+        except BaseException as exc:
+            context.error = exc
+            raise
+        finally:
+            _CURRENT_ACTION.reset(token)
+            context.latency = time.perf_counter() - context.started
+            _notify(hooks, "action_finished", context)
+
+    wrapper.__instrumented__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+async def instrument_request(
+    provider: Any,
+    method: str,
+    url: str,
+    route: str,
+    send: Callable[[], Awaitable[T]],
+) -> T:
+    """Run ``send`` while measuring it as one provider request."""
+
+    action = _CURRENT_ACTION.get()
+    if action is not None:
+        action.requests += 1
+    context = RequestContext(
+        _provider_name(provider),
+        action.action if action is not None else None,
+        method,
+        route,
+        url,
+    )
+    hooks = _HOOKS
+    _notify(hooks, "request_started", context)
+    token = _CURRENT_REQUEST.set(context)
+    try:
+        response = await send()
+    except BaseException as exc:
+        context.error = exc
+        raise
+    else:
+        context.status = getattr(response, "status_code", None)
+        context.request_bytes = _request_size(response)
+        context.response_bytes = _response_size(response)
+        return response
+    finally:
+        _CURRENT_REQUEST.reset(token)
+        context.latency = time.perf_counter() - context.started
+        _notify(hooks, "request_finished", context)
+
+
+def templated_path(path: str) -> str:
+    """Collapse identifier-like path segments to ``{id}`` to bound cardinality."""
+    segments = path.split("/")
+    return "/".join(
+        "{id}"
+        if _ID_SEGMENT.search(segment) and not _VERSION_SEGMENT.match(segment)
+        else segment
+        for segment in segments
+    )
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded memory.
+
+    Buckets grow geometrically by ``2 ** (1 / 8)`` (about 9% relative error) from
+    ``min_value`` upward, so percentiles stay accurate from sub-millisecond calls
+    to multi-minute ones without storing samples.
+    """
+
+    _GROWTH = 2 ** (1 / 8)
+
+    def __init__(self, *, min_value: float = 1e-5) -> None:
+        self.min_value = min_value
+        self._log_growth = math.log(self._GROWTH)
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        index = self._bucket(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, quantile: float) -> float:
+        """Return the upper bound of the bucket holding ``quantile`` (0-1)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self.max, self._upper_bound(index))
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
+    def _bucket(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return 1 + int(math.log(value / self.min_value) / self._log_growth)
+
+    def _upper_bound(self, index: int) -> float:
+        return self.min_value * self._GROWTH**index
+
+
+class HistogramHook(InstrumentationHook):
+    """Aggregate latencies in process, keyed per action and per request route."""
+
+    def __init__(self) -> None:
+        self.actions: dict[tuple[str, str], LatencyHistogram] = {}
+        self.requests: dict[tuple[str, str, str], LatencyHistogram] = {}
+
+    def action_finished(self, context: ActionContext) -> None:
+        key = (context.provider, context.action)
+        histogram = self.actions.get(key)
+        if histogram is None:
+            histogram = self.actions[key] = LatencyHistogram()
+        histogram.record(context.latency)
+
+    def request_finished(self, context: RequestContext) -> None:
+        key = (context.provider, context.method, context.route)
+        histogram = self.requests.get(key)
+        if histogram is None:
+            histogram = self.requests[key] = LatencyHistogram()
+        histogram.record(context.latency)
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """Return p50/p95/p99 summaries per ``provider.action``."""
+        return {
+            f"{provider}.{action}": histogram.summary()
+            for (provider, action), histogram in sorted(self.actions.items())
+        }
+
+    def request_report(self) -> dict[str, dict[str, float]]:
+        """Return p50/p95/p99 summaries per ``provider METHOD route``."""
+        return {
+            f"{provider} {method} {route}": histogram.summary()
+            for (provider, method, route), histogram in sorted(self.requests.items())
+        }
+
+    def reset(self) -> None:
+        self.actions.clear()
+        self.requests.clear()
+
+
+class Span(Protocol):
+    """Subset of the OpenTelemetry ``Span`` API used by ``SpanHook``."""
+
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+    def record_exception(self, exception: BaseException) -> None: ...
+
+    def end(self) -> None: ...
+
+
+class Tracer(Protocol):
+    """Subset of the OpenTelemetry ``Tracer`` API used by ``SpanHook``."""
+
+    def start_span(
+        self, name: str, *, attributes: Mapping[str, Any] | None = None
+    ) -> Span: ...
+
+
+class SpanHook(InstrumentationHook):
+    """Emit a span per action and per request through an OpenTelemetry-style tracer.
+
+    Any object with ``start_span(name, attributes=...)`` returning spans that
+    support ``set_attribute``, ``record_exception``, and ``end`` works, including
+    ``opentelemetry.trace.get_tracer(...)``.
+    """
+
+    def __init__(self, tracer: Tracer) -> None:
+        self.tracer = tracer
+        self._spans: dict[int, Span] = {}
+
+    def action_started(self, context: ActionContext) -> None:
+        self._spans[id(context)] = self.tracer.start_span(
+            f"{context.provider}.{context.action}",
+            attributes={
+                "integrations.provider": context.provider,
+                "integrations.action": context.action,
+            },
+        )
+
+    def action_finished(self, context: ActionContext) -> None:
+        span = self._spans.pop(id(context), None)
+        if span is None:
+            return
+        span.set_attribute("integrations.requests", context.requests)
+        self._finish(span, context.error)
+
+    def request_started(self, context: RequestContext) -> None:
+        attributes: dict[str, Any] = {
+            "integrations.provider": context.provider,
+            "http.request.method": context.method,
+            "http.route": context.route,
+        }
+        if context.action is not None:
+            attributes["integrations.action"] = context.action
+        self._spans[id(context)] = self.tracer.start_span(
+            f"{context.method} {context.route}", attributes=attributes
+        )
+
+    def request_finished(self, context: RequestContext) -> None:
+        span = self._spans.pop(id(context), None)
+        if span is None:
+            return
+        if context.status is not None:
+            span.set_attribute("http.response.status_code", context.status)
+        span.set_attribute("http.request.resend_count", context.retries)
+        span.set_attribute("http.request.body.size", context.request_bytes)
+        span.set_attribute("http.response.body.size", context.response_bytes)
+        span.set_attribute("integrations.queue_wait", context.queue_wait)
+        span.set_attribute("integrations.cached", context.cached)
+        self._finish(span, context.error)
+
+    def _finish(self, span: Span, error: BaseException | None) -> None:
+        if error is not None:
+            span.record_exception(error)
+        span.end()
+
+
+def _notify(
+    hooks: tuple[InstrumentationHook, ...], callback: str, context: Any
+) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, callback)(context)
+        except Exception:
+            logger.warning(
+                "Instrumentation hook %r failed in %s", hook, callback, exc_info=True
+            )
+
+
+def _provider_name(provider: Any) -> str:
+    return type(provider).__name__
+
+
+def _request_size(response: Any) -> int:
+    try:
+        return len(response.request.content)
+    except (AttributeError, RuntimeError):  # no request, or an unread stream
+        return 0
+
+
+def _response_size(response: Any) -> int:
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return 0
+
+
+__all__ = [
+    "ActionContext",
+    "HistogramHook",
+    "InstrumentationHook",
+    "LatencyHistogram",
+    "RequestContext",
+    "Span",
+    "SpanHook",
+    "Tracer",
+    "current_request",
+    "instrument",
+    "instrument_request",
+    "instrumented_call",
+    "register_hook",
+    "registered_hooks",
+    "templated_path",
+    "unregister_hook",
+]
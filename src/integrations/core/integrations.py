@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import AbstractAsyncContextManager
 from typing import TYPE_CHECKING, Any, Dict, Iterator, Mapping, Optional
 
 from pydantic import BaseModel, ConfigDict, ValidationError
 from pydantic_settings import SettingsError
 
+from .mixins.httpx import HttpxClientMixin
 from .provider import BaseProvider, ProviderSettings
 from .provider_key import ProviderIdentifier, ProviderKey, provider_key
-from .registry import available_providers, get_provider
+from .registry import get_provider, get_provider_settings, provider_names
+from .response_cache import ResponseCache
+from .settings_factory import build_settings
+from .transport_pool import TransportPool
 
 if TYPE_CHECKING:
     from ..providers import (
@@ -67,42 +72,105 @@ class Integrations:
         self,
         *,
         auto_configure: bool = True,
+        transport_pool: TransportPool | None = None,
+        response_cache: ResponseCache | None = None,
         **providers: ProviderConfig,
     ) -> None:
+        self._owns_transport_pool = transport_pool is None
+        self._transport_pool = (
+            transport_pool if transport_pool is not None else TransportPool()
+        )
+        self._response_cache = response_cache
         self._providers: Dict[str, ProviderInstance] = {}
+        # Auto-configured providers awaiting first access, in registry order.
+        # ``None`` means the settings have not been validated yet; names whose
+        # settings fail validation are dropped, which caches the miss.
+        self._deferred: Dict[str, ProviderSettings | None] = {}
+        # Providers this container built; instances passed in stay the
+        # caller's to close.
+        self._owned: list[ProviderInstance] = []
+        # Closes scheduled by sync ``overrides`` scopes exited inside a loop.
+        self._closing: set[asyncio.Task[None]] = set()
         for name, config in providers.items():
-            self._providers[name] = self._instantiate_provider(name, config)
+            provider = self._instantiate_provider(name, config)
+            self._providers[name] = (
+                provider if provider is config else self._adopt(provider)
+            )
         if auto_configure:
             self._auto_configure_missing_providers()
 
     def __getattr__(self, name: str) -> ProviderInstance:
-        try:
-            return self._providers[name]
-        except KeyError as exc:  # pragma: no cover - defensive only
-            raise AttributeError(f"Provider '{name}' is not registered") from exc
+        if name.startswith("_"):
+            raise AttributeError(name)
+        provider = self._lookup(name)
+        if provider is None:
+            raise AttributeError(f"Provider '{name}' is not registered")
+        return provider
 
     def __getitem__(self, name: ProviderIdentifier) -> ProviderInstance:
-        return self._providers[provider_key(name)]
+        key = provider_key(name)
+        provider = self._lookup(key)
+        if provider is None:
+            raise KeyError(key)
+        return provider
 
     def __contains__(self, name: object) -> bool:
         if not isinstance(name, (ProviderKey, str)):
             return False
-        return provider_key(name) in self._providers
+        key = provider_key(name)
+        if key in self._providers:
+            return True
+        return key in self._deferred and self._probe(key) is not None
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._providers)
+        for name in list(self._deferred):
+            self._probe(name)
+        return iter([*self._providers, *self._deferred])
+
+    async def __aenter__(self) -> "Integrations":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
+    @property
+    def transport_pool(self) -> TransportPool:
+        """Return the transport pool shared by providers that opt into it."""
+        return self._transport_pool
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Return the response cache given to every provider, if one was passed."""
+        return self._response_cache
+
+    async def aclose(self) -> None:
+        """Close the providers the container built.
+
+        Provider instances passed to the container or to :meth:`register` are
+        left open for their owner to close.
+        """
+        if self._closing:
+            await asyncio.gather(*list(self._closing))
+        await _aclose_all(list(self._owned))
+        if self._owns_transport_pool:
+            await self._transport_pool.aclose()
 
     def register(self, name: ProviderIdentifier, provider: ProviderConfig) -> None:
         """Register or replace a provider under ``name``."""
         key = provider_key(name)
-        self._providers[key] = self._instantiate_provider(key, provider)
+        instance = self._instantiate_provider(key, provider)
+        self._providers[key] = (
+            instance if instance is provider else self._adopt(instance)
+        )
+        self._deferred.pop(key, None)
 
     def get(
         self,
         name: ProviderIdentifier,
         default: ProviderInstance | None = None,
     ) -> ProviderInstance | None:
-        return self._providers.get(provider_key(name), default)
+        provider = self._lookup(provider_key(name))
+        return default if provider is None else provider
 
     def overrides(
         self,
@@ -110,7 +178,12 @@ class Integrations:
         merge: bool | None = None,
         **overrides: ProviderConfig | ProviderOverrideConfig,
     ) -> AbstractAsyncContextManager["Integrations"]:
-        """Return an async-aware context manager that temporarily overrides providers."""
+        """Return an async-aware context manager that temporarily overrides providers.
+
+        Providers created for the scope are closed when it exits. A plain
+        ``with`` exited inside a running event loop closes them in the
+        background; ``aclose`` waits for those closes to finish.
+        """
 
         default_merge = True if merge is None else bool(merge)
         return _IntegrationsOverride(self, overrides, default_merge=default_merge)
@@ -133,16 +206,25 @@ class Integrations:
 
         if merge and current is not None:
             merged_settings = self._merge_settings(current, value)
-            return provider_cls(settings=merged_settings)
-
-        if isinstance(value, ProviderSettings):
-            return provider_cls(settings=value)
-        if isinstance(value, Mapping):
-            return provider_cls(**dict(value))
-        raise TypeError(
-            f"Unsupported configuration for provider '{name}'. "
-            "Expected Provider instance, ProviderSettings, or mapping of settings data."
-        )
+            provider = provider_cls(settings=merged_settings)
+        elif isinstance(value, ProviderSettings):
+            provider = provider_cls(settings=value)
+        elif isinstance(value, Mapping):
+            provider = provider_cls(**dict(value))
+        else:
+            raise TypeError(
+                f"Unsupported configuration for provider '{name}'. "
+                "Expected Provider instance, ProviderSettings, or mapping of settings data."
+            )
+        return self._share_resources(provider)
+
+    def _share_resources(self, provider: ProviderInstance) -> ProviderInstance:
+        if isinstance(provider, HttpxClientMixin):
+            if provider.shares_transport:
+                provider.use_transport_pool(self._transport_pool)
+            if self._response_cache is not None:
+                provider.use_response_cache(self._response_cache)
+        return provider
 
     @staticmethod
     def _merge_settings(
@@ -162,16 +244,41 @@ class Integrations:
         return base_settings.model_copy(update=update_data)
 
     def _auto_configure_missing_providers(self) -> None:
-        for name, provider_cls in available_providers().items():
-            if name in self._providers:
-                continue
-
-            try:
-                provider = provider_cls()
-            except (ValidationError, SettingsError):
-                continue
-
-            self._providers[name] = provider
+        # Settings are validated (and providers imported) on first access, so
+        # containers only pay for the providers they actually use.
+        for name in provider_names():
+            if name not in self._providers:
+                self._deferred[name] = None
+
+    def _lookup(self, name: str) -> ProviderInstance | None:
+        provider = self._providers.get(name)
+        if provider is not None or name not in self._deferred:
+            return provider
+        settings = self._probe(name)
+        if settings is None:
+            return None
+        del self._deferred[name]
+        provider = self._share_resources(get_provider(name)(settings=settings))
+        self._providers[name] = self._adopt(provider)
+        return provider
+
+    def _adopt(self, provider: ProviderInstance) -> ProviderInstance:
+        if not any(owned is provider for owned in self._owned):
+            self._owned.append(provider)
+        return provider
+
+    def _probe(self, name: str) -> ProviderSettings | None:
+        settings = self._deferred[name]
+        if settings is not None:
+            return settings
+        try:
+            # Validate settings first so unconfigured providers are never imported.
+            settings = build_settings(get_provider_settings(name))
+        except (ValidationError, SettingsError):
+            del self._deferred[name]
+            return None
+        self._deferred[name] = settings
+        return settings
 
 
 class _IntegrationsOverride(AbstractAsyncContextManager[Integrations]):
@@ -189,20 +296,38 @@ class _IntegrationsOverride(AbstractAsyncContextManager[Integrations]):
         self._default_merge = default_merge
         self._previous: Dict[str, ProviderInstance] = {}
         self._missing: set[str] = set()
+        self._created: list[ProviderInstance] = []
 
     async def __aenter__(self) -> Integrations:
         self._apply()
         return self._container
 
     async def __aexit__(self, *_: Any) -> None:
+        created = list(self._created)
         self._restore()
+        await _aclose_all(created)
 
     def __enter__(self) -> Integrations:
         self._apply()
         return self._container
 
     def __exit__(self, *_: Any) -> None:
+        created = list(self._created)
         self._restore()
+        if not created:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Any loop these providers sent requests on has already finished,
+            # and pooled connections cannot be closed from another loop.
+            return
+        # A sync scope inside a coroutine cannot await; close on this loop in
+        # the background and let the container's ``aclose`` wait for it.
+        closing = self._container._closing
+        task = loop.create_task(_aclose_all(created))
+        closing.add(task)
+        task.add_done_callback(closing.discard)
 
     def _apply(self) -> None:
         for name, override in self._overrides.items():
@@ -213,13 +338,15 @@ class _IntegrationsOverride(AbstractAsyncContextManager[Integrations]):
                 config = override
                 merge_flag = self._default_merge
 
-            current = self._container._providers.get(name)
+            current = self._container._lookup(name)
             provider = self._container._instantiate_provider(
                 name,
                 config,
                 current=current if merge_flag else None,
                 merge=merge_flag,
             )
+            if provider is not config:
+                self._created.append(provider)
 
             if name in self._container._providers:
                 self._previous[name] = self._container._providers[name]
@@ -235,3 +362,9 @@ class _IntegrationsOverride(AbstractAsyncContextManager[Integrations]):
                 self._container._providers[name] = self._previous[name]
         self._previous.clear()
         self._missing.clear()
+        self._created.clear()
+
+
+async def _aclose_all(providers: list[ProviderInstance]) -> None:
+    for provider in providers:
+        await provider.aclose()
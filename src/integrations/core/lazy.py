@@ -0,0 +1,46 @@
+"""Deferred imports for provider packages and their exports."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def import_target(target: str, *, package: str | None = None) -> Any:
+    """Import ``"module:attribute"`` and return the attribute.
+
+    A leading dot makes ``module`` relative to ``package``.
+    """
+    module_name, _, attribute = target.partition(":")
+    if not attribute:
+        raise ValueError(f"Import target '{target}' must look like 'module:name'.")
+    module = importlib.import_module(module_name, package)
+    return getattr(module, attribute)
+
+
+def lazy_exports(
+    module_name: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return module ``__getattr__``/``__dir__`` that import ``exports`` on use.
+
+    ``exports`` maps each public name to the (relative) submodule defining it.
+    Loaded values are stored on the module so later lookups skip the hook.
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+        value = import_target(f"{submodule}:{name}", package=module_name)
+        setattr(importlib.import_module(module_name), name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        namespace = vars(importlib.import_module(module_name))
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
+
+
+__all__ = ["import_target", "lazy_exports"]
@@ -2,22 +2,129 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any, Literal, Mapping
+import asyncio
+import hashlib
+import time
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Mapping
 
 import httpx
 
+from ..concurrency import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimits,
+    ConcurrencyRegistry,
+    default_concurrency_registry,
+)
+from ..instrumentation import (
+    current_request,
+    instrument_request,
+    registered_hooks,
+    templated_path,
+)
+from ..rate_limit import (
+    RateLimit,
+    RateLimiter,
+    RateLimitKey,
+    RateLimitProfile,
+    default_rate_limiter,
+)
+from ..response_cache import (
+    CachedResponse,
+    InMemoryResponseCache,
+    ResponseCache,
+    ResponseCacheProfile,
+    cache_key,
+)
+from ..retry import RetryPolicy
+from ..singleflight import COALESCIBLE_METHODS, RequestCoalescer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..transport_pool import TransportPool
+
 
 HttpMethod = Literal["DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"]
 
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
 
 class HttpxClientMixin:
     """Mixin that provides configured ``httpx`` clients for a provider."""
 
+    # Opt in to the container's host-keyed ``TransportPool``.
+    shares_transport: ClassVar[bool] = False
+    # Used when settings do not provide a ``retry_policy``.
+    default_retry_policy: ClassVar[RetryPolicy] = RetryPolicy()
+    # Client-side quotas used when settings do not provide ``rate_limits``.
+    default_rate_limits: ClassVar[RateLimitProfile | None] = None
+    # Adaptive in-flight cap used when settings do not provide ``concurrency``.
+    default_concurrency: ClassVar[ConcurrencyLimits | None] = ConcurrencyLimits()
+    # ``GET`` TTL rules used when settings do not provide ``cache_rules``.
+    default_cache_rules: ClassVar[ResponseCacheProfile | None] = None
+
     def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
         """Return a fresh ``httpx.AsyncClient`` configured from provider settings."""
         return self._build_httpx_async_client(**client_kwargs)
 
+    def pooled_httpx_client(self, *, base_url: str | None = None) -> httpx.AsyncClient:
+        """Return the provider's long-lived client, creating it on first use.
+
+        Clients are cached per event loop and ``base_url`` override, so
+        requests against a secondary host (for example Drive uploads) keep
+        their own warm pool and a provider reused across ``asyncio.run`` calls
+        never sends on connections opened by a loop that has since closed.
+        """
+
+        clients = self._httpx_client_cache()
+        client = clients.get(base_url)
+        if client is None:
+            client_kwargs: dict[str, Any] = {"limits": self.httpx_limits()}
+            if base_url is not None:
+                client_kwargs["base_url"] = base_url
+            pool = self.transport_pool
+            target = base_url if base_url is not None else self.httpx_base_url()
+            if pool is not None and target is not None:
+                client_kwargs["transport"] = pool.transport_for(target)
+            client = self.httpx_client(**client_kwargs)
+            clients[base_url] = client
+        return client
+
+    @property
+    def transport_pool(self) -> "TransportPool | None":
+        """Return the shared transport pool used by pooled clients, if any."""
+        return self.__dict__.get("_transport_pool")
+
+    def use_transport_pool(self, pool: "TransportPool | None") -> None:
+        """Route pooled clients through ``pool``; call before the first request."""
+        if any(self.__dict__.get("_httpx_clients", {}).values()):
+            raise RuntimeError(
+                "Cannot change the transport pool after pooled clients were created."
+            )
+        self.__dict__["_transport_pool"] = pool
+
+    def use_response_cache(self, cache: ResponseCache | None) -> None:
+        """Store cached responses in ``cache`` unless a setting names one."""
+        self.__dict__["_response_cache"] = cache
+
+    async def aclose(self) -> None:
+        """Close pooled clients and release their connections.
+
+        Clients opened on another event loop are dropped without closing;
+        their connections cannot be used from this one.
+        """
+
+        loop = _running_loop()
+        caches = self.__dict__.pop("_httpx_clients", None) or {}
+        for client_loop, clients in caches.items():
+            if client_loop is None or client_loop is loop:
+                for client in clients.values():
+                    await client.aclose()
+        parent_aclose = getattr(super(), "aclose", None)
+        if parent_aclose is not None:
+            await parent_aclose()
+
     def httpx_headers(self) -> Mapping[str, str]:
         """Return default headers for requests."""
         return {}
@@ -30,6 +137,167 @@ class HttpxClientMixin:
         """Return default timeout value for the client."""
         return getattr(self.settings, "timeout", None)
 
+    def httpx_retry_policy(self) -> RetryPolicy:
+        """Return the retry policy, preferring a ``retry_policy`` setting."""
+        configured = getattr(self.settings, "retry_policy", None)
+        if configured is None:
+            return self.default_retry_policy
+        if isinstance(configured, RetryPolicy):
+            return configured
+        if isinstance(configured, Mapping):
+            return RetryPolicy.model_validate(
+                {**self.default_retry_policy.model_dump(), **configured}
+            )
+        raise TypeError("retry_policy must be a RetryPolicy or mapping of options.")
+
+    def httpx_rate_limits(self) -> RateLimitProfile | None:
+        """Return the rate-limit profile; ``rate_limits=False`` disables it."""
+        configured = getattr(self.settings, "rate_limits", None)
+        if configured is None:
+            return self.default_rate_limits
+        if configured is False:
+            return None
+        if isinstance(configured, RateLimitProfile):
+            return configured
+        if isinstance(configured, RateLimit):
+            return RateLimitProfile(default=configured)
+        if isinstance(configured, Mapping):
+            return RateLimitProfile.model_validate(configured)
+        raise TypeError(
+            "rate_limits must be a RateLimitProfile, RateLimit, mapping, or False."
+        )
+
+    def rate_limit_class(self, method: str, url: str) -> str | None:
+        """Return the endpoint class used to pick a per-endpoint rate limit."""
+        return None
+
+    def rate_limit_bucket(self, method: str, url: str) -> Hashable:
+        """Return the bucket a request draws from; defaults to its endpoint class.
+
+        Override when the API meters each endpoint separately but shares a limit
+        between them, such as Slack's per-method tiers.
+        """
+        return self.rate_limit_class(method, url)
+
+    def route_template(self, method: str, url: str) -> str:
+        """Return the low-cardinality route reported to instrumentation hooks."""
+        return templated_path(httpx.URL(url).path)
+
+    def rate_limiter(self) -> RateLimiter:
+        """Return the limiter holding this provider's buckets."""
+        configured = getattr(self.settings, "rate_limiter", None)
+        if isinstance(configured, RateLimiter):
+            return configured
+        return default_rate_limiter()
+
+    def httpx_concurrency(self) -> ConcurrencyLimits | None:
+        """Return AIMD concurrency bounds; ``concurrency=False`` disables them."""
+        configured = getattr(self.settings, "concurrency", None)
+        if configured is None:
+            return self.default_concurrency
+        if configured is False:
+            return None
+        if isinstance(configured, ConcurrencyLimits):
+            return configured
+        if isinstance(configured, Mapping):
+            return ConcurrencyLimits.model_validate(configured)
+        raise TypeError("concurrency must be ConcurrencyLimits, a mapping, or False.")
+
+    def concurrency_registry(self) -> ConcurrencyRegistry:
+        """Return the registry holding this provider's concurrency limiters."""
+        configured = getattr(self.settings, "concurrency_registry", None)
+        if isinstance(configured, ConcurrencyRegistry):
+            return configured
+        return default_concurrency_registry()
+
+    def concurrency_limiter(
+        self, url: str = "", *, base_url: str | None = None
+    ) -> AdaptiveConcurrencyLimiter | None:
+        """Return the limiter for the host serving ``url``, e.g. to export metrics."""
+        limits = self.httpx_concurrency()
+        if limits is None:
+            return None
+        host = httpx.URL(url).host
+        if not host:
+            base = base_url if base_url is not None else self.httpx_base_url()
+            host = httpx.URL(base).host if base else ""
+        key = (type(self).__name__, host)
+        return self.concurrency_registry().limiter(key, limits)
+
+    def httpx_cache_rules(self) -> ResponseCacheProfile | None:
+        """Return response cache TTL rules; ``cache_rules=False`` disables caching."""
+        configured = getattr(self.settings, "cache_rules", None)
+        if configured is None:
+            return self.default_cache_rules
+        if configured is False:
+            return None
+        if isinstance(configured, ResponseCacheProfile):
+            return configured
+        if isinstance(configured, Mapping):
+            return ResponseCacheProfile.model_validate(configured)
+        raise TypeError(
+            "cache_rules must be a ResponseCacheProfile, mapping, or False."
+        )
+
+    def response_cache(self) -> ResponseCache:
+        """Return the cache backend, preferring a ``response_cache`` setting.
+
+        Otherwise the cache passed to :meth:`use_response_cache` (the
+        container's, when it has one) is used, falling back to a cache that
+        belongs to this instance and is dropped with it.
+        """
+        configured = getattr(self.settings, "response_cache", None)
+        if configured is not None:
+            return configured
+        cache = self.__dict__.get("_response_cache")
+        if cache is None:
+            cache = InMemoryResponseCache()
+            self.__dict__["_response_cache"] = cache
+        return cache
+
+    def request_coalescer(self) -> RequestCoalescer[httpx.Response]:
+        """Return the coalescer sharing identical in-flight reads on this instance."""
+        coalescer = self.__dict__.get("_request_coalescer")
+        if coalescer is None:
+            coalescer = RequestCoalescer()
+            self.__dict__["_request_coalescer"] = coalescer
+        return coalescer
+
+    def credential_identity(self) -> str:
+        """Return a stable, non-reversible identifier for the configured credential."""
+        cached = self.__dict__.get("_credential_identity")
+        if cached is not None:
+            return cached
+        try:
+            headers = self.httpx_headers()
+        except ValueError:
+            headers = {}
+        authorization = headers.get("Authorization")
+        if authorization is None:
+            material = repr(sorted(headers.items()))
+        else:
+            material = authorization
+        identity = hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+        self.__dict__["_credential_identity"] = identity
+        return identity
+
+    def httpx_limits(self) -> httpx.Limits:
+        """Return connection pool limits for the pooled client."""
+        settings = self.settings
+        return httpx.Limits(
+            max_connections=getattr(
+                settings, "max_connections", DEFAULT_MAX_CONNECTIONS
+            ),
+            max_keepalive_connections=getattr(
+                settings,
+                "max_keepalive_connections",
+                DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            keepalive_expiry=getattr(
+                settings, "keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY
+            ),
+        )
+
     async def request(
         self,
         method: HttpMethod | str,
@@ -37,31 +305,72 @@ class HttpxClientMixin:
         *,
         params: Mapping[str, Any] | None = None,
         json: Mapping[str, Any] | None = None,
-        data: Mapping[str, Any] | None = None,
+        data: Mapping[str, Any] | bytes | str | None = None,
         files: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
+        retry: bool | None = None,
+        coalesce: bool | None = None,
         **request_kwargs: Any,
     ) -> httpx.Response:
-        """Execute an HTTP request using a short-lived ``httpx.AsyncClient``."""
+        """Execute an HTTP request using the provider's pooled ``httpx`` client.
+
+        Transient failures are retried according to ``httpx_retry_policy()``.
+        Only idempotent methods are retried unless ``retry=True`` marks the call
+        as safe to repeat; ``retry=False`` disables retries for the call.
+
+        With ``coalesce=True`` (or a ``coalesce_requests`` setting), concurrent
+        identical ``GET``/``HEAD``/``OPTIONS`` requests share one upstream call
+        and receive the same response object.
+
+        ``GET`` requests matching a rule in ``httpx_cache_rules()`` are served
+        from ``response_cache()`` while fresh and revalidated with their
+        ``ETag``/``Last-Modified`` once stale. Successful writes invalidate
+        cached responses under the written path.
+
+        Registered instrumentation hooks observe each call with its
+        ``route_template()``, status, retries, sizes, queue wait, and latency.
+        """
 
         http_method = method.upper() if isinstance(method, str) else method
-        client_kwargs: dict[str, Any] = {}
         base_url = request_kwargs.pop("base_url", None)
-        if base_url is not None:
-            client_kwargs["base_url"] = base_url
+        client = self.pooled_httpx_client(base_url=base_url)
+        if isinstance(data, (bytes, str)):
+            request_kwargs["content"] = data
+            data = None
 
-        async with self.httpx_client(**client_kwargs) as client:
-            response = await client.request(
+        send_kwargs: dict[str, Any] = {
+            "params": dict(params) if params else None,
+            "json": dict(json) if json else None,
+            "data": dict(data) if data else None,
+            "files": files,
+            "headers": dict(headers) if headers else None,
+            **request_kwargs,
+        }
+        if not registered_hooks():
+            return await self._perform(
+                client,
                 http_method,
                 url,
-                params=dict(params) if params else None,
-                json=dict(json) if json else None,
-                data=dict(data) if data else None,
-                files=files,
-                headers=dict(headers) if headers else None,
-                **request_kwargs,
+                send_kwargs,
+                retry=retry,
+                base_url=base_url,
+                coalesce=coalesce,
             )
-        return response
+        return await instrument_request(
+            self,
+            http_method,
+            url,
+            self.route_template(http_method, url),
+            lambda: self._perform(
+                client,
+                http_method,
+                url,
+                send_kwargs,
+                retry=retry,
+                base_url=base_url,
+                coalesce=coalesce,
+            ),
+        )
 
     def parse_httpx_response(
         self,
@@ -103,6 +412,291 @@ class HttpxClientMixin:
 
     # Internal helpers -------------------------------------------------
 
+    async def _perform(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        send_kwargs: dict[str, Any],
+        *,
+        retry: bool | None,
+        base_url: str | None,
+        coalesce: bool | None,
+    ) -> httpx.Response:
+        cache_slot = self._response_cache_slot(method, url, base_url, send_kwargs)
+        if cache_slot is not None:
+            return await self._send_cached(
+                cache_slot,
+                client,
+                method,
+                url,
+                send_kwargs,
+                retry=retry,
+                base_url=base_url,
+                coalesce=coalesce,
+            )
+        response = await self._dispatch(
+            client,
+            method,
+            url,
+            send_kwargs,
+            retry=retry,
+            base_url=base_url,
+            coalesce=coalesce,
+        )
+        if method not in COALESCIBLE_METHODS:
+            await self._invalidate_cached(url, base_url, response)
+        return response
+
+    async def _dispatch(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        send_kwargs: dict[str, Any],
+        *,
+        retry: bool | None,
+        base_url: str | None,
+        coalesce: bool | None,
+    ) -> httpx.Response:
+        key = self._coalescing_key(method, url, base_url, send_kwargs, coalesce)
+        if key is None:
+            return await self._send_with_retries(
+                client, method, url, send_kwargs, retry=retry, base_url=base_url
+            )
+        return await self.request_coalescer().do(
+            key,
+            lambda: self._send_with_retries(
+                client, method, url, send_kwargs, retry=retry, base_url=base_url
+            ),
+        )
+
+    async def _send_cached(
+        self,
+        cache_slot: tuple[ResponseCache, str, float],
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        send_kwargs: dict[str, Any],
+        *,
+        retry: bool | None,
+        base_url: str | None,
+        coalesce: bool | None,
+    ) -> httpx.Response:
+        cache, key, ttl = cache_slot
+        entry = await cache.get(key)
+        if entry is not None and entry.is_fresh():
+            metrics = current_request()
+            if metrics is not None:
+                metrics.cached = True
+            return entry.to_response(method)
+        if entry is not None:
+            headers = {**(send_kwargs.get("headers") or {}), **entry.validators()}
+            send_kwargs = {**send_kwargs, "headers": headers}
+        response = await self._dispatch(
+            client,
+            method,
+            url,
+            send_kwargs,
+            retry=retry,
+            base_url=base_url,
+            coalesce=coalesce,
+        )
+        status = getattr(response, "status_code", None)
+        if entry is not None and status == 304:
+            entry = entry.revalidated(response, ttl=ttl)
+            await cache.set(key, entry)
+            return entry.to_response(method)
+        stored = CachedResponse.from_response(response, ttl=ttl)
+        if stored is not None:
+            await cache.set(key, stored)
+        elif entry is not None:
+            await cache.delete(key)
+        return response
+
+    async def _invalidate_cached(
+        self, url: str, base_url: str | None, response: Any
+    ) -> None:
+        if self.httpx_cache_rules() is None:
+            return
+        status = getattr(response, "status_code", None)
+        if isinstance(status, int) and 200 <= status < 400:
+            await self.response_cache().invalidate(self._cache_scope(url, base_url))
+
+    def _response_cache_slot(
+        self,
+        method: str,
+        url: str,
+        base_url: str | None,
+        send_kwargs: Mapping[str, Any],
+    ) -> tuple[ResponseCache, str, float] | None:
+        if method != "GET":
+            return None
+        profile = self.httpx_cache_rules()
+        if profile is None:
+            return None
+        ttl = profile.ttl_for(httpx.URL(url).path)
+        if ttl is None:
+            return None
+        for name, value in send_kwargs.items():
+            if name not in _COALESCING_KEY_FIELDS and value is not None:
+                return None
+        headers = send_kwargs.get("headers") or {}
+        if any(name.lower() in _CONDITIONAL_HEADERS for name in headers):
+            # Callers managing their own validators bypass the cache.
+            return None
+        key = cache_key(
+            self._cache_scope(url, base_url), send_kwargs.get("params"), headers
+        )
+        return self.response_cache(), key, ttl
+
+    def _cache_scope(self, url: str, base_url: str | None) -> str:
+        return (
+            f"{type(self).__name__}:{self.credential_identity()}:"
+            f"{base_url or ''}:{httpx.URL(url).path}"
+        )
+
+    async def _send_with_retries(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        send_kwargs: dict[str, Any],
+        *,
+        retry: bool | None,
+        base_url: str | None = None,
+    ) -> httpx.Response:
+        policy = self.httpx_retry_policy()
+        throttle = self._rate_limit_slot(method, url)
+        gate = self.concurrency_limiter(url, base_url=base_url)
+        deadline = (
+            time.monotonic() + policy.budget if policy.budget is not None else None
+        )
+        metrics = current_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            final = attempt >= policy.max_attempts
+            if metrics is not None:
+                metrics.retries = attempt - 1
+            if throttle is not None:
+                limiter, key, limit = throttle
+                if metrics is None:
+                    await limiter.acquire(key, limit)
+                else:
+                    started = time.perf_counter()
+                    await limiter.acquire(key, limit)
+                    metrics.queue_wait += time.perf_counter() - started
+            try:
+                response = await self._send_once(client, method, url, send_kwargs, gate)
+            except httpx.TransportError as exc:
+                if final or not policy.should_retry_exception(method, exc, retry=retry):
+                    raise
+                delay = policy.delay_for(attempt)
+                if not _within_budget(delay, deadline):
+                    raise
+            else:
+                if throttle is not None and self._is_unmetered(response):
+                    throttle[0].refund(throttle[1])
+                if final or not policy.should_retry_response(
+                    method, response, retry=retry
+                ):
+                    return response
+                delay = policy.delay_for(attempt, response)
+                if delay is None or not _within_budget(delay, deadline):
+                    return response
+                if throttle is not None and response.status_code == 429:
+                    # Hold other callers sharing the bucket until the server is ready.
+                    throttle[0].defer(throttle[1], delay)
+                close = getattr(response, "aclose", None)
+                if close is not None:
+                    await close()
+            await asyncio.sleep(delay)
+
+    async def _send_once(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        send_kwargs: dict[str, Any],
+        gate: AdaptiveConcurrencyLimiter | None,
+    ) -> httpx.Response:
+        if gate is None:
+            return await client.request(method, url, **send_kwargs)
+        metrics = current_request()
+        if metrics is None:
+            token = await gate.acquire()
+        else:
+            started = time.perf_counter()
+            token = await gate.acquire()
+            metrics.queue_wait += time.perf_counter() - started
+        try:
+            response = await client.request(method, url, **send_kwargs)
+        except httpx.TimeoutException:
+            gate.release(token, "overload")
+            raise
+        except BaseException:
+            gate.release(token, "ignore")
+            raise
+        status = getattr(response, "status_code", 200)
+        overloaded = status in gate.limits.overload_statuses
+        gate.release(token, "overload" if overloaded else "success")
+        return response
+
+    def _coalescing_key(
+        self,
+        method: str,
+        url: str,
+        base_url: str | None,
+        send_kwargs: Mapping[str, Any],
+        coalesce: bool | None,
+    ) -> tuple[Any, ...] | None:
+        if coalesce is None:
+            coalesce = bool(getattr(self.settings, "coalesce_requests", False))
+        if not coalesce or method not in COALESCIBLE_METHODS:
+            return None
+        for name, value in send_kwargs.items():
+            if name not in _COALESCING_KEY_FIELDS and value is not None:
+                # Bodies and per-call client options make requests distinct.
+                return None
+        params = send_kwargs.get("params")
+        headers = send_kwargs.get("headers") or {}
+        return (
+            method,
+            base_url,
+            url,
+            tuple(sorted(httpx.QueryParams(params).multi_items())) if params else (),
+            tuple(sorted((name.lower(), value) for name, value in headers.items())),
+            self.credential_identity(),
+        )
+
+    def _is_unmetered(self, response: Any) -> bool:
+        profile = self.httpx_rate_limits()
+        status = getattr(response, "status_code", None)
+        return profile is not None and status in profile.free_statuses
+
+    def _rate_limit_slot(
+        self, method: str, url: str
+    ) -> tuple[RateLimiter, RateLimitKey, RateLimit] | None:
+        profile = self.httpx_rate_limits()
+        if profile is None:
+            return None
+        endpoint_class = self.rate_limit_class(method, url)
+        limit = profile.limit_for(endpoint_class)
+        if limit is None:
+            return None
+        bucket = self.rate_limit_bucket(method, url)
+        key = (type(self).__name__, self.credential_identity(), bucket)
+        return self.rate_limiter(), key, limit
+
+    def _httpx_client_cache(self) -> dict[str | None, httpx.AsyncClient]:
+        caches: dict[
+            asyncio.AbstractEventLoop | None, dict[str | None, httpx.AsyncClient]
+        ] = self.__dict__.setdefault("_httpx_clients", {})
+        for stale in [key for key in caches if key is not None and key.is_closed()]:
+            del caches[stale]
+        return caches.setdefault(_running_loop(), {})
+
     def _build_httpx_async_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
         kwargs = self._apply_httpx_defaults(client_kwargs)
         return httpx.AsyncClient(**kwargs)
@@ -119,3 +713,18 @@ class HttpxClientMixin:
         if timeout is not None and "timeout" not in kwargs:
             kwargs["timeout"] = timeout
         return kwargs
+
+
+_COALESCING_KEY_FIELDS = frozenset({"params", "headers"})
+_CONDITIONAL_HEADERS = frozenset({"if-modified-since", "if-none-match"})
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _within_budget(delay: float, deadline: float | None) -> bool:
+    return deadline is None or time.monotonic() + delay <= deadline
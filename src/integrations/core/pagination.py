@@ -0,0 +1,523 @@
+"""Pagination strategies and async iterators over paged provider endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import TYPE_CHECKING, Any, Literal
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .mixins.httpx import HttpxClientMixin
+
+PayloadParser = Callable[[Any], Any]
+
+
+class PageRequest(BaseModel):
+    """Description of the request that fetches one page."""
+
+    model_config = ConfigDict(frozen=True)
+
+    method: str = "GET"
+    url: str
+    params: Mapping[str, Any] = Field(default_factory=dict)
+    body: Mapping[str, Any] | None = None
+    # Forwarded to ``request(retry=...)``; set for ``POST`` searches safe to repeat.
+    retry: bool | None = None
+
+    def with_values(
+        self,
+        values: Mapping[str, Any],
+        *,
+        location: Literal["params", "body"] = "params",
+    ) -> "PageRequest":
+        """Return a copy with ``values`` merged into the query or JSON body."""
+        if location == "body":
+            return self.model_copy(update={"body": {**(self.body or {}), **values}})
+        return self.model_copy(update={"params": {**self.params, **values}})
+
+    def value(
+        self, name: str, *, location: Literal["params", "body"] = "params"
+    ) -> Any:
+        source = (self.body or {}) if location == "body" else self.params
+        return source.get(name)
+
+
+class Page(BaseModel):
+    """One fetched page: its (possibly truncated) items and the raw payload."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    number: int
+    items: list[Any]
+    payload: Any = None
+
+
+class Paginator(BaseModel):
+    """Base strategy: where items live and how to request the next page.
+
+    ``items_path`` is a dotted path into the payload (``None`` when the payload is
+    the list itself). ``page_size_param`` and ``max_page_size`` let iterators ask
+    for the largest page the API allows, saving round trips.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    items_path: str | None = "data"
+    page_size_param: str | None = None
+    max_page_size: int | None = Field(default=None, ge=1)
+    location: Literal["params", "body"] = "params"
+
+    def items(self, payload: Any) -> list[Any]:
+        """Return the items contained in ``payload``."""
+        found = lookup(payload, self.items_path)
+        if isinstance(found, Sequence) and not isinstance(found, (str, bytes)):
+            return list(found)
+        return []
+
+    def page_size(self, requested: int | None, max_items: int | None) -> int | None:
+        """Return the page size to request given the caller's preferences."""
+        size = requested if requested is not None else self.max_page_size
+        if size is not None and self.max_page_size is not None:
+            size = min(size, self.max_page_size)
+        if max_items is not None:
+            size = max_items if size is None else min(size, max_items)
+        return size
+
+    def first_request(
+        self,
+        request: PageRequest,
+        *,
+        page_size: int | None = None,
+        override: bool = False,
+    ) -> PageRequest:
+        """Apply ``page_size`` unless the request already sets one."""
+        if page_size is None or self.page_size_param is None:
+            return request
+        current = request.value(self.page_size_param, location=self.location)
+        if current is not None and not override:
+            return request
+        return request.with_values(
+            {self.page_size_param: page_size}, location=self.location
+        )
+
+    def next_request(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> PageRequest | None:
+        """Return the request for the following page, or ``None`` when done."""
+        raise NotImplementedError
+
+    def plan(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> list[PageRequest] | None:
+        """Return every remaining page request when they are known up front.
+
+        Strategies that can address later pages without reading the earlier ones
+        (a known last page or total) return them here so iterators can fetch
+        them concurrently; ``None`` means pages must be followed one by one.
+        """
+        return None
+
+    def _page_size_of(self, request: PageRequest, fetched: int) -> int:
+        if self.page_size_param is not None:
+            size = request.value(self.page_size_param, location=self.location)
+            if size is not None:
+                return int(size)
+        return fetched
+
+
+class CursorPaginator(Paginator):
+    """Follow an opaque cursor found at ``cursor_path`` in each payload."""
+
+    cursor_path: str = "next_cursor"
+    cursor_param: str = "cursor"
+    # Optional boolean flag that must be truthy for another page to exist.
+    has_more_path: str | None = None
+
+    def next_request(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> PageRequest | None:
+        if self.has_more_path is not None and not lookup(payload, self.has_more_path):
+            return None
+        cursor = lookup(payload, self.cursor_path)
+        if not cursor:
+            return None
+        return request.with_values({self.cursor_param: cursor}, location=self.location)
+
+
+class PageTokenPaginator(CursorPaginator):
+    """Google-style ``nextPageToken`` / ``pageToken`` pagination."""
+
+    items_path: str | None = "items"
+    cursor_path: str = "nextPageToken"
+    cursor_param: str = "pageToken"
+
+
+class StartCursorPaginator(CursorPaginator):
+    """Notion-style ``next_cursor`` / ``start_cursor`` pagination."""
+
+    items_path: str | None = "results"
+    page_size_param: str | None = "page_size"
+    max_page_size: int | None = 100
+    cursor_path: str = "next_cursor"
+    cursor_param: str = "start_cursor"
+    has_more_path: str | None = "has_more"
+
+
+class AfterPaginator(CursorPaginator):
+    """HubSpot-style ``paging.next.after`` / ``after`` pagination."""
+
+    items_path: str | None = "results"
+    page_size_param: str | None = "limit"
+    max_page_size: int | None = 100
+    cursor_path: str = "paging.next.after"
+    cursor_param: str = "after"
+    # Set when ``after`` is a numeric offset (HubSpot search) so pages can be
+    # planned from ``total_path``; ``max_results`` caps how deep the API pages.
+    offset_cursor: bool = False
+    total_path: str | None = None
+    max_results: int | None = None
+
+    def plan(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> list[PageRequest] | None:
+        if not self.offset_cursor or self.total_path is None:
+            return None
+        total = _as_int(lookup(payload, self.total_path))
+        start = _as_int(lookup(payload, self.cursor_path))
+        size = self._page_size_of(request, len(self.items(payload)))
+        if total is None or start is None or size <= 0:
+            return None
+        if self.max_results is not None:
+            total = min(total, self.max_results)
+        return [
+            request.with_values({self.cursor_param: str(after)}, location=self.location)
+            for after in range(start, total, size)
+        ]
+
+
+class OffsetPaginator(Paginator):
+    """Numeric ``offset`` pagination; stops on a short or empty page."""
+
+    offset_param: str = "offset"
+    page_size_param: str | None = "limit"
+    # Dotted path to the total item count, enabling concurrent prefetching.
+    total_path: str | None = None
+
+    def next_request(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> PageRequest | None:
+        count = len(self.items(payload))
+        if not _is_full_page(self, request, count):
+            return None
+        offset = int(request.value(self.offset_param, location=self.location) or 0)
+        return request.with_values(
+            {self.offset_param: offset + count}, location=self.location
+        )
+
+    def plan(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> list[PageRequest] | None:
+        if self.total_path is None:
+            return None
+        total = _as_int(lookup(payload, self.total_path))
+        count = len(self.items(payload))
+        size = self._page_size_of(request, count)
+        if total is None or size <= 0:
+            return None
+        offset = int(request.value(self.offset_param, location=self.location) or 0)
+        return [
+            request.with_values({self.offset_param: value}, location=self.location)
+            for value in range(offset + count, total, size)
+        ]
+
+
+class PageNumberPaginator(Paginator):
+    """Numbered ``page`` pagination; stops on a short or empty page."""
+
+    page_param: str = "page"
+    first_page: int = 1
+    # Dotted paths to the total item or page count, enabling prefetching.
+    total_path: str | None = None
+    total_pages_path: str | None = None
+
+    def next_request(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> PageRequest | None:
+        if not _is_full_page(self, request, len(self.items(payload))):
+            return None
+        page = request.value(self.page_param, location=self.location)
+        current = self.first_page if page is None else int(page)
+        return request.with_values(
+            {self.page_param: current + 1}, location=self.location
+        )
+
+    def plan(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> list[PageRequest] | None:
+        last = self._last_page(request, payload)
+        if last is None:
+            return None
+        page = request.value(self.page_param, location=self.location)
+        current = self.first_page if page is None else int(page)
+        return [
+            request.with_values({self.page_param: number}, location=self.location)
+            for number in range(current + 1, last + 1)
+        ]
+
+    def _last_page(self, request: PageRequest, payload: Any) -> int | None:
+        if self.total_pages_path is not None:
+            pages = _as_int(lookup(payload, self.total_pages_path))
+            if pages is not None:
+                return self.first_page + pages - 1
+        if self.total_path is None:
+            return None
+        total = _as_int(lookup(payload, self.total_path))
+        size = self._page_size_of(request, len(self.items(payload)))
+        if total is None or size <= 0:
+            return None
+        return self.first_page + math.ceil(total / size) - 1
+
+
+class LinkHeaderPaginator(Paginator):
+    """Follow RFC 8288 ``Link: <...>; rel="next"`` headers (e.g. GitHub)."""
+
+    items_path: str | None = None
+    # Query parameter holding the page number in ``next``/``last`` links.
+    page_param: str = "page"
+
+    def next_request(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> PageRequest | None:
+        next_url = _link(response, "next")
+        if not next_url:
+            return None
+        # The next URL already carries every query parameter.
+        return request.model_copy(update={"url": next_url, "params": {}})
+
+    def plan(
+        self, request: PageRequest, response: Any, payload: Any
+    ) -> list[PageRequest] | None:
+        next_url = _link(response, "next")
+        last_url = _link(response, "last")
+        if not next_url or not last_url:
+            return None
+        template = httpx.URL(next_url)
+        first = _as_int(template.params.get(self.page_param))
+        last = _as_int(httpx.URL(last_url).params.get(self.page_param))
+        if first is None or last is None:
+            return None
+        return [
+            request.model_copy(
+                update={
+                    "url": str(template.copy_set_param(self.page_param, number)),
+                    "params": {},
+                }
+            )
+            for number in range(first, last + 1)
+        ]
+
+
+async def iter_pages(
+    provider: "HttpxClientMixin",
+    request: PageRequest,
+    paginator: Paginator,
+    *,
+    page_size: int | None = None,
+    max_items: int | None = None,
+    max_pages: int | None = None,
+    prefetch: int = 0,
+    parse: PayloadParser | None = None,
+) -> AsyncIterator[Page]:
+    """Yield pages in order, holding at most ``prefetch`` pages ahead in memory.
+
+    ``max_items`` truncates the final page and stops fetching once reached;
+    ``max_pages`` bounds the number of requests. With ``prefetch > 0``, pages
+    whose requests are known up front (see ``Paginator.plan``) are fetched
+    concurrently through a window of ``prefetch`` requests; cursor-driven pages
+    are pipelined, so the next request is in flight while the caller processes
+    the current page.
+    """
+
+    if (max_items is not None and max_items <= 0) or max_pages == 0:
+        return
+    parse_payload = parse or provider.process_httpx_response
+
+    async def fetch(page_request: PageRequest) -> tuple[Any, Any]:
+        response = await provider.request(
+            page_request.method,
+            page_request.url,
+            params=page_request.params or None,
+            json=page_request.body,
+            retry=page_request.retry,
+        )
+        return response, parse_payload(response)
+
+    current = paginator.first_request(
+        request,
+        page_size=paginator.page_size(page_size, max_items),
+        override=page_size is not None,
+    )
+    remaining = max_items
+    number = 0
+    pending: deque[asyncio.Future[tuple[Any, Any]]] = deque()
+    try:
+        response, payload = await fetch(current)
+        while True:
+            number += 1
+            items = paginator.items(payload)
+            fetched = len(items)
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            page = Page(number=number, items=items, payload=payload)
+            exhausted = (remaining is not None and remaining <= 0) or (
+                max_pages is not None and number >= max_pages
+            )
+            following = (
+                None
+                if exhausted
+                else paginator.next_request(current, response, payload)
+            )
+            if following is None:
+                yield page
+                return
+
+            planned = None
+            if prefetch > 0:
+                planned = paginator.plan(current, response, payload)
+            if planned:
+                needed = len(planned)
+                if remaining is not None and fetched:
+                    needed = min(needed, -(-remaining // fetched))
+                if max_pages is not None:
+                    needed = min(needed, max_pages - number)
+                queued = iter(planned[:needed])
+                _fill_window(pending, queued, fetch, prefetch)
+                yield page
+                while pending:
+                    response, payload = await pending.popleft()
+                    _fill_window(pending, queued, fetch, prefetch)
+                    number += 1
+                    items = paginator.items(payload)
+                    if remaining is not None:
+                        items = items[:remaining]
+                        remaining -= len(items)
+                    yield Page(number=number, items=items, payload=payload)
+                    if remaining is not None and remaining <= 0:
+                        return
+                return
+
+            if prefetch > 0:
+                pending.append(asyncio.ensure_future(fetch(following)))
+            yield page
+            if pending:
+                response, payload = await pending.popleft()
+            else:
+                response, payload = await fetch(following)
+            current = following
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def paginate(
+    provider: "HttpxClientMixin",
+    request: PageRequest,
+    paginator: Paginator,
+    *,
+    page_size: int | None = None,
+    max_items: int | None = None,
+    max_pages: int | None = None,
+    prefetch: int = 0,
+    parse: PayloadParser | None = None,
+) -> AsyncIterator[Any]:
+    """Yield individual items across every page of ``request``."""
+
+    pages = iter_pages(
+        provider,
+        request,
+        paginator,
+        page_size=page_size,
+        max_items=max_items,
+        max_pages=max_pages,
+        prefetch=prefetch,
+        parse=parse,
+    )
+    async for page in pages:
+        for item in page.items:
+            yield item
+
+
+def lookup(payload: Any, path: str | None) -> Any:
+    """Resolve a dotted ``path`` inside nested mappings."""
+    if path is None:
+        return payload
+    current = payload
+    for part in path.split("."):
+        if not isinstance(current, Mapping):
+            return None
+        current = current.get(part)
+    return current
+
+
+def _link(response: Any, rel: str) -> str | None:
+    links = getattr(response, "links", None) or {}
+    return (links.get(rel) or {}).get("url")
+
+
+def _as_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _fill_window(
+    pending: deque[asyncio.Future[tuple[Any, Any]]],
+    queued: Iterator[PageRequest],
+    fetch: Callable[[PageRequest], Awaitable[tuple[Any, Any]]],
+    size: int,
+) -> None:
+    while len(pending) < size:
+        page_request = next(queued, None)
+        if page_request is None:
+            return
+        pending.append(asyncio.ensure_future(fetch(page_request)))
+
+
+def _is_full_page(paginator: Paginator, request: PageRequest, count: int) -> bool:
+    if count == 0:
+        return False
+    if paginator.page_size_param is None:
+        return True
+    size = request.value(paginator.page_size_param, location=paginator.location)
+    return size is None or count >= int(size)
+
+
+__all__ = [
+    "AfterPaginator",
+    "CursorPaginator",
+    "LinkHeaderPaginator",
+    "OffsetPaginator",
+    "Page",
+    "PageNumberPaginator",
+    "PageRequest",
+    "PageTokenPaginator",
+    "Paginator",
+    "StartCursorPaginator",
+    "iter_pages",
+    "lookup",
+    "paginate",
+]
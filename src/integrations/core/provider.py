@@ -8,6 +8,7 @@ from typing import Any, Dict, Generic, TypeVar, cast
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .actions import ActionFactory, BaseAction
+from .settings_factory import build_settings
 
 SettingsT = TypeVar("SettingsT", bound="ProviderSettings")
 ActionT = TypeVar("ActionT", bound=BaseAction)
@@ -34,7 +35,7 @@ class BaseProvider(Generic[SettingsT]):
                 "Provide either a settings instance or keyword overrides, not both."
             )
         if settings is None:
-            settings = self.settings_class(**settings_data)
+            settings = build_settings(self.settings_class, **settings_data)
         self.settings = settings
         self._actions: Dict[str, BaseAction] = {}
 
@@ -49,6 +50,9 @@ class BaseProvider(Generic[SettingsT]):
         """Return the instantiated actions keyed by attribute name."""
         return dict(self._actions)
 
+    async def aclose(self) -> None:
+        """Release resources held by the provider (connections, buffers, ...)."""
+
     def get_action(self, name: str) -> BaseAction:
         return self._actions[name]
 
@@ -0,0 +1,208 @@
+"""Client-side token-bucket rate limiting for provider requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+
+from pydantic import BaseModel, ConfigDict, Field
+
+RateLimitKey = tuple[Hashable, ...]
+
+DEFAULT_MAX_BUCKETS = 10_000
+
+
+class RateLimit(BaseModel):
+    """Allow ``requests`` per ``period`` seconds with bursts up to ``burst``."""
+
+    model_config = ConfigDict(frozen=True)
+
+    requests: float = Field(gt=0)
+    period: float = Field(default=1.0, gt=0)
+    burst: float | None = Field(default=None, gt=0)
+
+    @classmethod
+    def per_second(cls, requests: float, *, burst: float | None = None) -> "RateLimit":
+        return cls(requests=requests, period=1.0, burst=burst)
+
+    @classmethod
+    def per_minute(cls, requests: float, *, burst: float | None = None) -> "RateLimit":
+        return cls(requests=requests, period=60.0, burst=burst)
+
+    @classmethod
+    def per_hour(cls, requests: float, *, burst: float | None = None) -> "RateLimit":
+        return cls(requests=requests, period=3600.0, burst=burst)
+
+    @property
+    def rate(self) -> float:
+        """Return the sustained refill rate in tokens per second."""
+        return self.requests / self.period
+
+    @property
+    def capacity(self) -> float:
+        """Return the bucket size, defaulting to one second of traffic."""
+        if self.burst is not None:
+            return self.burst
+        return max(1.0, self.rate)
+
+
+class RateLimitProfile(BaseModel):
+    """Default limit for a provider plus overrides per endpoint class."""
+
+    model_config = ConfigDict(frozen=True)
+
+    default: RateLimit | None = None
+    endpoints: Mapping[str, RateLimit] = Field(default_factory=dict)
+    # Statuses the API does not count against the quota (e.g. GitHub ``304``).
+    free_statuses: frozenset[int] = frozenset()
+
+    def limit_for(self, endpoint_class: str | None) -> RateLimit | None:
+        if endpoint_class is not None and endpoint_class in self.endpoints:
+            return self.endpoints[endpoint_class]
+        return self.default
+
+
+class TokenBucket:
+    """Async token bucket; waiters are served in FIFO order."""
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limit = limit
+        self._clock = clock
+        self._tokens = limit.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def tokens(self) -> float:
+        """Return the tokens currently available."""
+        self._refill(self._clock())
+        return self._tokens
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from the bucket, sleeping until they are available.
+
+        Returns the number of seconds spent waiting.
+        """
+
+        needed = min(tokens, self.limit.capacity)
+        waited = 0.0
+        async with self._get_lock():
+            while True:
+                now = self._clock()
+                self._refill(now)
+                delay = self._blocked_until - now
+                if delay <= 0:
+                    if self._tokens >= needed:
+                        self._tokens -= needed
+                        return waited
+                    delay = (needed - self._tokens) / self.limit.rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def defer(self, seconds: float) -> None:
+        """Hold every waiter for ``seconds`` (e.g. after a server ``Retry-After``)."""
+        now = self._clock()
+        self._refill(now)
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self._tokens = 0.0
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Return ``tokens`` taken for a request the server did not count."""
+        self._refill(self._clock())
+        self._tokens = min(self.limit.capacity, self._tokens + tokens)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(
+                self.limit.capacity, self._tokens + elapsed * self.limit.rate
+            )
+            self._updated = now
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+
+class RateLimiter:
+    """Registry of token buckets keyed by provider, credential, and endpoint class.
+
+    Buckets are created on first use and evicted least-recently-used once
+    ``max_buckets`` is exceeded, so fan-out across many credentials stays bounded.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_buckets = max_buckets
+        self._clock = clock
+        self._buckets: OrderedDict[RateLimitKey, TokenBucket] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def bucket(self, key: RateLimitKey, limit: RateLimit) -> TokenBucket:
+        """Return the bucket for ``key``, replacing it if ``limit`` changed."""
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.limit != limit:
+            bucket = TokenBucket(limit, clock=self._clock)
+            self._buckets[key] = bucket
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    async def acquire(
+        self, key: RateLimitKey, limit: RateLimit, tokens: float = 1.0
+    ) -> float:
+        """Wait for capacity on ``key``'s bucket and return the time waited."""
+        return await self.bucket(key, limit).acquire(tokens)
+
+    def defer(self, key: RateLimitKey, seconds: float) -> None:
+        """Pause an existing bucket, ignoring keys that have no bucket yet."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.defer(seconds)
+
+    def refund(self, key: RateLimitKey, tokens: float = 1.0) -> None:
+        """Return tokens to an existing bucket, ignoring unknown keys."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.refund(tokens)
+
+    def clear(self) -> None:
+        """Drop every bucket."""
+        self._buckets.clear()
+
+
+_DEFAULT_RATE_LIMITER = RateLimiter()
+
+
+def default_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter shared by every provider instance."""
+    return _DEFAULT_RATE_LIMITER
+
+
+__all__ = [
+    "RateLimit",
+    "RateLimitProfile",
+    "RateLimiter",
+    "TokenBucket",
+    "default_rate_limiter",
+]
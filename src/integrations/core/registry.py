@@ -2,33 +2,105 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Iterator, Mapping
 
+from .lazy import import_target
 from .provider_key import ProviderIdentifier, provider_key
-from .provider import BaseProvider
+from .provider import BaseProvider, ProviderSettings
 
-_REGISTRY: Dict[str, type[BaseProvider]] = {}
+_REGISTRY: Dict[str, type[BaseProvider] | str] = {}
+# Import paths of settings classes, so auto-configuration can skip importing
+# providers whose environment is not configured.
+_SETTINGS: Dict[str, type[ProviderSettings] | str] = {}
 
 
 def register_provider(
-    name: ProviderIdentifier, provider_cls: type[BaseProvider]
+    name: ProviderIdentifier,
+    provider_cls: type[BaseProvider] | str,
+    *,
+    settings: type[ProviderSettings] | str | None = None,
 ) -> None:
-    """Register a provider implementation under a canonical name."""
+    """Register a provider implementation under a canonical name.
+
+    ``provider_cls`` may be an import path such as
+    ``"package.module:ProviderClass"``; it is imported on first lookup. Pass the
+    settings class (or its import path) as ``settings`` to let ``Integrations``
+    auto-configure the provider without importing it.
+    """
     key = provider_key(name)
     existing = _REGISTRY.get(key)
     if existing is not None and existing is not provider_cls:
+        # Allow a lazy entry and its resolved class to be registered twice.
+        if (isinstance(existing, str) or isinstance(provider_cls, str)) and _resolve(
+            key
+        ) is _load(provider_cls):
+            return
         raise ValueError(f"Provider '{name}' is already registered")
     _REGISTRY[key] = provider_cls
+    if settings is not None:
+        _SETTINGS[key] = settings
 
 
 def get_provider(name: ProviderIdentifier) -> type[BaseProvider]:
     key = provider_key(name)
-    try:
-        return _REGISTRY[key]
-    except KeyError as exc:  # pragma: no cover - defensive only
-        raise KeyError(f"No provider registered as '{name}'") from exc
+    if key not in _REGISTRY:
+        raise KeyError(f"No provider registered as '{name}'")
+    return _resolve(key)
+
+
+def get_provider_settings(name: ProviderIdentifier) -> type[ProviderSettings]:
+    """Return the settings class for ``name`` without importing its actions."""
+    key = provider_key(name)
+    settings = _SETTINGS.get(key)
+    if settings is None:
+        return get_provider(key).settings_class
+    if isinstance(settings, str):
+        settings = import_target(settings)
+        _SETTINGS[key] = settings
+    return settings
+
+
+def provider_names() -> tuple[str, ...]:
+    """Return registered provider names without importing any provider."""
+    return tuple(_REGISTRY)
+
+
+def available_providers() -> Mapping[str, type[BaseProvider]]:
+    """Return a mapping of registered providers, importing each on access."""
+    return _ProviderMapping(tuple(_REGISTRY))
+
+
+class _ProviderMapping(Mapping[str, type[BaseProvider]]):
+    """Snapshot of registered names whose classes resolve lazily."""
+
+    def __init__(self, names: tuple[str, ...]) -> None:
+        self._names = names
+
+    def __getitem__(self, name: str) -> type[BaseProvider]:
+        if name not in self._names:
+            raise KeyError(name)
+        return _resolve(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __repr__(self) -> str:
+        return f"available_providers({list(self._names)!r})"
+
+
+def _resolve(key: str) -> type[BaseProvider]:
+    provider_cls = _load(_REGISTRY[key])
+    _REGISTRY[key] = provider_cls
+    return provider_cls
 
 
-def available_providers() -> Dict[str, type[BaseProvider]]:
-    """Return a copy of the registered providers mapping."""
-    return dict(_REGISTRY)
+def _load(provider_cls: type[BaseProvider] | str) -> type[BaseProvider]:
+    if isinstance(provider_cls, str):
+        return import_target(provider_cls)
+    return provider_cls
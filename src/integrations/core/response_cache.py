@@ -0,0 +1,228 @@
+"""Response caching with TTL rules and conditional revalidation."""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Protocol
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Response headers replaced by a ``304 Not Modified`` during revalidation.
+_REVALIDATED_HEADERS = frozenset(
+    {"cache-control", "date", "etag", "expires", "last-modified"}
+)
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CacheRule(BaseModel):
+    """Cache responses whose path matches ``pattern`` for ``ttl`` seconds.
+
+    A ``ttl`` of ``0`` stores the response only to revalidate it with
+    ``If-None-Match``/``If-Modified-Since`` on every request; ``None`` disables
+    caching for matching paths.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    pattern: str
+    ttl: float | None = Field(default=None, ge=0)
+
+    def matches(self, path: str) -> bool:
+        return re.search(self.pattern, path) is not None
+
+
+class ResponseCacheProfile(BaseModel):
+    """Ordered TTL rules for a provider; the first matching rule wins."""
+
+    model_config = ConfigDict(frozen=True)
+
+    default_ttl: float | None = Field(default=None, ge=0)
+    rules: tuple[CacheRule, ...] = ()
+
+    def ttl_for(self, path: str) -> float | None:
+        for rule in self.rules:
+            if rule.matches(path):
+                return rule.ttl
+        return self.default_ttl
+
+
+class CachedResponse(BaseModel):
+    """Serializable snapshot of a ``GET`` response and its validators."""
+
+    model_config = ConfigDict(frozen=True)
+
+    status_code: int
+    url: str
+    headers: tuple[tuple[str, str], ...] = ()
+    content: bytes = b""
+    expires_at: float = 0.0
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_response(
+        cls, response: Any, *, ttl: float, now: float | None = None
+    ) -> "CachedResponse | None":
+        """Snapshot ``response`` if it may be cached, otherwise return ``None``."""
+        if not isinstance(response, httpx.Response) or response.status_code != 200:
+            return None
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return None
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if ttl <= 0 and etag is None and last_modified is None:
+            return None
+        current = time.time() if now is None else now
+        try:
+            url = str(response.request.url)
+        except RuntimeError:
+            url = ""
+        return cls(
+            status_code=response.status_code,
+            url=url,
+            headers=tuple(response.headers.multi_items()),
+            content=response.content,
+            expires_at=current + ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (time.time() if now is None else now) < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for revalidation."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(
+        self, response: Any, *, ttl: float, now: float | None = None
+    ) -> "CachedResponse":
+        """Return a copy refreshed by a ``304 Not Modified`` response."""
+        current = time.time() if now is None else now
+        fresh = getattr(response, "headers", None) or {}
+        replaced = {
+            name.lower(): value
+            for name, value in fresh.items()
+            if name.lower() in _REVALIDATED_HEADERS
+        }
+        headers = [
+            (name, value)
+            for name, value in self.headers
+            if name.lower() not in replaced
+        ]
+        headers.extend(replaced.items())
+        return self.model_copy(
+            update={
+                "headers": tuple(headers),
+                "expires_at": current + ttl,
+                "etag": replaced.get("etag", self.etag),
+                "last_modified": replaced.get("last-modified", self.last_modified),
+            }
+        )
+
+    def to_response(self, method: str = "GET") -> httpx.Response:
+        """Rebuild an ``httpx.Response`` that can be parsed like the original."""
+        # The stored body is already decoded; drop headers describing the wire form.
+        headers = [
+            (name, value)
+            for name, value in self.headers
+            if name.lower() not in _WIRE_HEADERS
+        ]
+        return httpx.Response(
+            self.status_code,
+            headers=headers,
+            content=self.content,
+            request=httpx.Request(method, self.url or "http://cache.invalid/"),
+        )
+
+
+class ResponseCache(Protocol):
+    """Contract for response cache backends."""
+
+    async def get(self, key: str) -> CachedResponse | None: ...
+
+    async def set(self, key: str, entry: CachedResponse) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def invalidate(self, prefix: str) -> None:
+        """Drop every entry whose key starts with ``prefix``."""
+        ...
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Bounded LRU response cache held in process memory."""
+
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    async def get(self, key: str) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def invalidate(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def cache_key(
+    scope: str,
+    params: Mapping[str, Any] | None = None,
+    headers: Mapping[str, str] | None = None,
+) -> str:
+    """Build a cache key from ``scope`` (provider, credential, and URL) and request."""
+    query = ""
+    if params:
+        query = str(httpx.QueryParams(sorted(httpx.QueryParams(params).multi_items())))
+    varying = "&".join(
+        f"{name.lower()}={value}" for name, value in sorted((headers or {}).items())
+    )
+    return f"{scope}?{query}#{varying}"
+
+
+__all__ = [
+    "CacheRule",
+    "CachedResponse",
+    "InMemoryResponseCache",
+    "ResponseCache",
+    "ResponseCacheProfile",
+    "cache_key",
+]
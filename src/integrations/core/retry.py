@@ -0,0 +1,147 @@
+"""Retry policies for provider HTTP requests."""
+
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
+
+IDEMPOTENT_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT"})
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Values above this are treated as epoch timestamps rather than second deltas.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RetryPolicy(BaseModel):
+    """Capped exponential backoff with jitter and server-directed delays.
+
+    ``max_attempts`` counts the initial request. ``budget`` caps the total time
+    (requests plus sleeps) a single call may spend retrying, so bursts of
+    failures cannot amplify load indefinitely.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    max_attempts: int = Field(default=3, ge=1)
+    backoff_base: float = Field(default=0.5, ge=0)
+    backoff_max: float = Field(default=20.0, ge=0)
+    jitter: bool = True
+    budget: float | None = Field(default=60.0, ge=0)
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+    retry_on_transport_errors: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = Field(default=60.0, ge=0)
+    # Rejections the server did not act on; these are retried for any method.
+    unprocessed_statuses: frozenset[int] = frozenset({429})
+    # Retried only when the response carries rate-limit headers (e.g. GitHub 403).
+    rate_limit_statuses: frozenset[int] = frozenset()
+
+    def should_retry_response(
+        self, method: str, response: Any, *, retry: bool | None = None
+    ) -> bool:
+        """Return whether ``response`` to ``method`` signals a transient failure."""
+        if retry is False:
+            return False
+        status = getattr(response, "status_code", 200)
+        if status in self.unprocessed_statuses:
+            return True
+        if not self._method_allowed(method, retry):
+            return False
+        if status in self.retry_statuses:
+            return True
+        if status in self.rate_limit_statuses:
+            return (
+                _header(response, "X-RateLimit-Remaining") == "0"
+                or _header(response, "Retry-After") is not None
+            )
+        return False
+
+    def should_retry_exception(
+        self, method: str, exc: BaseException, *, retry: bool | None = None
+    ) -> bool:
+        """Return whether a transport error is worth another attempt."""
+        if retry is False or not self.retry_on_transport_errors:
+            return False
+        if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout)):
+            # The request never reached the server, so any method is safe.
+            return True
+        return self._method_allowed(method, retry) and isinstance(
+            exc, (httpx.TimeoutException, httpx.NetworkError)
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered exponential delay before retry number ``attempt``."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, ceiling)
+        return ceiling
+
+    def delay_for(self, attempt: int, response: Any | None = None) -> float | None:
+        """Return the delay before the next attempt, or ``None`` to give up.
+
+        Server hints (``Retry-After``, ``X-RateLimit-Reset``) take precedence over
+        computed backoff; hints longer than ``max_retry_after`` abort retries.
+        """
+
+        if response is not None and self.respect_retry_after:
+            hinted = server_retry_delay(response)
+            if hinted is not None:
+                return hinted if hinted <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+    def _method_allowed(self, method: str, retry: bool | None) -> bool:
+        return retry is True or method.upper() in self.retry_methods
+
+
+def server_retry_delay(response: Any, *, now: float | None = None) -> float | None:
+    """Extract the server-requested delay in seconds from rate-limit headers."""
+
+    current = time.time() if now is None else now
+    retry_after = _header(response, "Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                target = parsedate_to_datetime(retry_after).timestamp()
+            except (TypeError, ValueError):
+                return None
+            return max(0.0, target - current)
+
+    reset = _header(response, "X-RateLimit-Reset")
+    if reset:
+        try:
+            value = float(reset)
+        except ValueError:
+            return None
+        if value > _EPOCH_THRESHOLD:
+            return max(0.0, value - current)
+        return max(0.0, value)
+    return None
+
+
+def _header(response: Any, name: str) -> str | None:
+    headers = getattr(response, "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get(name)
+    if value is None and not isinstance(headers, httpx.Headers):
+        lowered = name.lower()
+        for key, candidate in headers.items():
+            if key.lower() == lowered:
+                return str(candidate)
+    return None if value is None else str(value)
+
+
+__all__ = [
+    "IDEMPOTENT_METHODS",
+    "RETRYABLE_STATUSES",
+    "RetryPolicy",
+    "server_retry_delay",
+]
@@ -0,0 +1,145 @@
+"""Build provider settings from a cached snapshot of their environment sources."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, TypeVar
+
+from pydantic import AliasChoices, AliasPath, BaseModel
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    EnvSettingsSource,
+    InitSettingsSource,
+    SecretsSettingsSource,
+)
+
+SettingsT = TypeVar("SettingsT", bound=BaseSettings)
+
+
+class SettingsFactory:
+    """Construct ``BaseSettings`` subclasses without re-reading the environment.
+
+    The first build of a settings class runs its environment, dotenv, and
+    secrets sources once and keeps the result, together with an index from
+    every accepted input name (field name, alias, or alias choice) to its
+    field. Later builds merge explicit values over that snapshot and validate
+    directly, skipping pydantic-settings' per-instance source scan. When the
+    explicit values cover every field the snapshot is not consulted at all.
+
+    Classes that override ``__init__`` are constructed normally, as are builds
+    passing ``BaseSettings`` init options such as ``_env_file`` or
+    ``_secrets_dir``, since those change which sources are read.
+
+    The snapshot does not track ``os.environ``. :func:`build_settings` uses one
+    process-global factory, so every container keeps seeing the environment as
+    it was at the first build until :func:`refresh_settings_environment` (or
+    :meth:`invalidate`) is called after changing the environment, ``.env``, or
+    secrets files at runtime.
+    """
+
+    def __init__(self) -> None:
+        self._environment: Dict[type[BaseSettings], Dict[str, Any]] = {}
+        self._fields: Dict[type[BaseSettings], Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def build(self, settings_cls: type[SettingsT], /, **values: Any) -> SettingsT:
+        """Return ``settings_cls(**values)`` using the cached environment."""
+        if settings_cls.__init__ is not BaseSettings.__init__ or any(
+            name.startswith("_") for name in values
+        ):
+            # Custom initialisers and ``_env_file``-style options need the
+            # normal source chain; validation alone would keep them as extras.
+            return settings_cls(**values)
+        fields = self._field_index(settings_cls)
+        explicit = {fields[name] for name in values if name in fields}
+        data = values
+        if len(explicit) < len(settings_cls.model_fields):
+            environment = self._environment_values(settings_cls)
+            if environment:
+                data = {
+                    name: value
+                    for name, value in environment.items()
+                    if fields.get(name) not in explicit
+                }
+                data.update(values)
+        settings = settings_cls.__new__(settings_cls)
+        # Validate as a plain model; BaseSettings.__init__ would scan sources again.
+        BaseModel.__init__(settings, **data)
+        return settings
+
+    def invalidate(self, settings_cls: type[BaseSettings] | None = None) -> None:
+        """Drop the snapshot for ``settings_cls``, or for every class."""
+        with self._lock:
+            if settings_cls is None:
+                self._environment.clear()
+            else:
+                self._environment.pop(settings_cls, None)
+
+    def _environment_values(self, settings_cls: type[BaseSettings]) -> Dict[str, Any]:
+        try:
+            return self._environment[settings_cls]
+        except KeyError:
+            pass
+        init_source = InitSettingsSource(settings_cls, init_kwargs={})
+        sources = settings_cls.settings_customise_sources(
+            settings_cls,
+            init_settings=init_source,
+            env_settings=EnvSettingsSource(settings_cls),
+            dotenv_settings=DotEnvSettingsSource(settings_cls),
+            file_secret_settings=SecretsSettingsSource(settings_cls),
+        )
+        values: Dict[str, Any] = {}
+        # Sources are ordered by priority; earlier ones win.
+        for source in reversed(sources):
+            if source is not init_source:
+                values.update(source())
+        with self._lock:
+            self._environment[settings_cls] = values
+        return values
+
+    def _field_index(self, settings_cls: type[BaseSettings]) -> Dict[str, str]:
+        try:
+            return self._fields[settings_cls]
+        except KeyError:
+            pass
+        index: Dict[str, str] = {}
+        for name, field in settings_cls.model_fields.items():
+            index[name] = name
+            if field.alias:
+                index[field.alias] = name
+            alias = field.validation_alias
+            choices = alias.choices if isinstance(alias, AliasChoices) else [alias]
+            for choice in choices:
+                if isinstance(choice, AliasPath):
+                    choice = choice.path[0]
+                if isinstance(choice, str):
+                    index[choice] = name
+        self._fields[settings_cls] = index
+        return index
+
+
+_FACTORY = SettingsFactory()
+
+
+def build_settings(settings_cls: type[SettingsT], /, **values: Any) -> SettingsT:
+    """Build ``settings_cls`` through the shared :class:`SettingsFactory`.
+
+    Environment changes made after the first build of ``settings_cls`` are not
+    seen until :func:`refresh_settings_environment` is called.
+    """
+    return _FACTORY.build(settings_cls, **values)
+
+
+def refresh_settings_environment(
+    settings_cls: type[BaseSettings] | None = None,
+) -> None:
+    """Re-read the environment on the next build of ``settings_cls`` (or all)."""
+    _FACTORY.invalidate(settings_cls)
+
+
+__all__ = [
+    "SettingsFactory",
+    "build_settings",
+    "refresh_settings_environment",
+]
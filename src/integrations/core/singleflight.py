@@ -0,0 +1,54 @@
+"""Coalescing of identical in-flight requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+COALESCIBLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RequestCoalescer(Generic[T]):
+    """Share one in-flight call between concurrent callers using the same key.
+
+    The first caller for a key starts the call; later callers await the same
+    result until it completes. Nothing is retained afterwards, so results are
+    never stale. A caller being cancelled does not cancel the shared call for
+    the others.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future[T]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._in_flight
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Return ``call()``'s result, joining an in-flight call for ``key``."""
+        future = self._in_flight.get(key)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            self.calls += 1
+            future = asyncio.ensure_future(call())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled.
+            future.exception()
+
+
+__all__ = ["COALESCIBLE_METHODS", "RequestCoalescer"]
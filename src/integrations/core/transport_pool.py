@@ -0,0 +1,96 @@
+"""Host-keyed registry of shared ``httpx`` transports."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict
+
+import httpx
+
+
+class TransportPool:
+    """Share connection pools between providers that talk to the same hosts.
+
+    Each host gets one ``httpx.AsyncHTTPTransport`` created on first use. Clients
+    receive a borrowed handle, so closing a provider's client leaves the shared
+    connections open; the pool owner closes them through ``aclose()``.
+
+    Transports are kept per event loop, since connections cannot move between
+    loops; those of a closed loop are dropped on the next lookup. The
+    inspection methods report the current loop's transports.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = False,
+        limits: httpx.Limits | None = None,
+    ) -> None:
+        self.http2 = http2
+        self.limits = limits
+        self._loops: Dict[
+            asyncio.AbstractEventLoop | None, Dict[str, httpx.AsyncHTTPTransport]
+        ] = {}
+
+    def __contains__(self, host: object) -> bool:
+        return host in self._transports()
+
+    def __len__(self) -> int:
+        return len(self._transports())
+
+    def hosts(self) -> tuple[str, ...]:
+        """Return the hosts that currently hold a transport."""
+        return tuple(self._transports())
+
+    def transport_for(self, url: str | httpx.URL) -> httpx.AsyncBaseTransport:
+        """Return a borrowed transport for the host of ``url``."""
+        host = httpx.URL(url).host
+        transports = self._transports()
+        transport = transports.get(host)
+        if transport is None:
+            transport = self._build_transport()
+            transports[host] = transport
+        return _BorrowedTransport(transport)
+
+    async def aclose(self) -> None:
+        """Close every shared transport opened on this loop (or outside one)."""
+        loop = _running_loop()
+        loops, self._loops = self._loops, {}
+        for transport_loop, transports in loops.items():
+            if transport_loop is None or transport_loop is loop:
+                for transport in transports.values():
+                    await transport.aclose()
+
+    def _transports(self) -> Dict[str, httpx.AsyncHTTPTransport]:
+        loops = self._loops
+        for stale in [key for key in loops if key is not None and key.is_closed()]:
+            del loops[stale]
+        return loops.setdefault(_running_loop(), {})
+
+    def _build_transport(self) -> httpx.AsyncHTTPTransport:
+        if self.limits is None:
+            return httpx.AsyncHTTPTransport(http2=self.http2)
+        return httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits)
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """Delegate to a shared transport without taking ownership of it."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+__all__ = ["TransportPool"]
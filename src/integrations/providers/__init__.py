@@ -1,5 +1,7 @@
 """Provider exports."""
 
+from typing import TYPE_CHECKING
+
 from ..core import (
     BaseProvider,
     HttpxClientMixin,
@@ -8,16 +10,60 @@ from ..core import (
     get_provider,
     register_provider,
 )
-from .asana import AsanaProvider, AsanaSettings
-from .github import GithubProvider, GithubSettings
-from .gmail import GmailProvider, GmailSettings
-from .google_calendar import GoogleCalendarProvider, GoogleCalendarSettings
-from .google_docs import GoogleDocsProvider, GoogleDocsSettings
-from .google_drive import GoogleDriveProvider, GoogleDriveSettings
-from .google_sheets import GoogleSheetsProvider, GoogleSheetsSettings
-from .hubspot import HubspotProvider, HubspotSettings
-from .notion import NotionProvider, NotionSettings
-from .slack import SlackProvider, SlackSettings
+from ..core.lazy import lazy_exports
+
+# Importing each package registers its provider by import path only; provider
+# classes and their actions load on first use.
+from . import (  # noqa: F401
+    asana,
+    github,
+    gmail,
+    google_calendar,
+    google_docs,
+    google_drive,
+    google_sheets,
+    hubspot,
+    notion,
+    slack,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .asana import AsanaProvider, AsanaSettings
+    from .github import GithubProvider, GithubSettings
+    from .gmail import GmailProvider, GmailSettings
+    from .google_calendar import GoogleCalendarProvider, GoogleCalendarSettings
+    from .google_docs import GoogleDocsProvider, GoogleDocsSettings
+    from .google_drive import GoogleDriveProvider, GoogleDriveSettings
+    from .google_sheets import GoogleSheetsProvider, GoogleSheetsSettings
+    from .hubspot import HubspotProvider, HubspotSettings
+    from .notion import NotionProvider, NotionSettings
+    from .slack import SlackProvider, SlackSettings
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsanaProvider": ".asana",
+        "AsanaSettings": ".asana",
+        "GithubProvider": ".github",
+        "GithubSettings": ".github",
+        "GmailProvider": ".gmail",
+        "GmailSettings": ".gmail",
+        "GoogleCalendarProvider": ".google_calendar",
+        "GoogleCalendarSettings": ".google_calendar",
+        "GoogleDocsProvider": ".google_docs",
+        "GoogleDocsSettings": ".google_docs",
+        "GoogleDriveProvider": ".google_drive",
+        "GoogleDriveSettings": ".google_drive",
+        "GoogleSheetsProvider": ".google_sheets",
+        "GoogleSheetsSettings": ".google_sheets",
+        "HubspotProvider": ".hubspot",
+        "HubspotSettings": ".hubspot",
+        "NotionProvider": ".notion",
+        "NotionSettings": ".notion",
+        "SlackProvider": ".slack",
+        "SlackSettings": ".slack",
+    },
+)
 
 __all__ = [
     "BaseProvider",
@@ -1,9 +1,22 @@
 """Asana provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .asana_provider import AsanaProvider
-from .asana_settings import AsanaSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .asana_provider import AsanaProvider
+    from .asana_settings import AsanaSettings
+
+register_provider(
+    ProviderKey.ASANA,
+    f"{__name__}.asana_provider:AsanaProvider",
+    settings=f"{__name__}.asana_settings:AsanaSettings",
+)
 
-register_provider(ProviderKey.ASANA, AsanaProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"AsanaProvider": ".asana_provider", "AsanaSettings": ".asana_settings"}
+)
 
 __all__ = ["AsanaProvider", "AsanaSettings"]
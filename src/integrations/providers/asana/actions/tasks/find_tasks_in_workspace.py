@@ -4,16 +4,22 @@ from __future__ import annotations
 
 from typing import Any, Iterable, TYPE_CHECKING
 
-from integrations.core import BaseAction
+from integrations.core import CursorPaginator, PageRequest, PaginatedAction
 
 if TYPE_CHECKING:  # pragma: no cover - avoids runtime import cycle
     from ...asana_provider import AsanaProvider
 
 
-class FindTasksInWorkspace(BaseAction):
+class FindTasksInWorkspace(PaginatedAction):
     """List tasks within a workspace, optionally fetching all pages."""
 
     provider: "AsanaProvider"
+    paginator = CursorPaginator(
+        cursor_path="next_page.offset",
+        cursor_param="offset",
+        page_size_param="limit",
+        max_page_size=100,
+    )
 
     async def __call__(
         self,
@@ -27,6 +33,31 @@ class FindTasksInWorkspace(BaseAction):
         opt_fields: Iterable[str] | None = None,
         fetch_all: bool = False,
     ) -> Any:
+        options: dict[str, Any] = {
+            "workspace_gid": workspace_gid,
+            "assignee": assignee,
+            "project_gid": project_gid,
+            "section_gid": section_gid,
+            "completed_since": completed_since,
+            "limit": limit,
+            "opt_fields": opt_fields,
+        }
+        if fetch_all:
+            return [task async for task in self.iter(**options)]
+        payload = await self.fetch_page(self.page_request(**options))
+        return payload.get("data", []) if isinstance(payload, dict) else payload
+
+    def page_request(
+        self,
+        *,
+        workspace_gid: str | None = None,
+        assignee: str | None = None,
+        project_gid: str | None = None,
+        section_gid: str | None = None,
+        completed_since: str | None = None,
+        limit: int | None = None,
+        opt_fields: Iterable[str] | None = None,
+    ) -> PageRequest:
         workspace = workspace_gid or self.provider.settings.workspace_gid
         if workspace is None:
             raise ValueError("workspace_gid is required to list tasks")
@@ -44,27 +75,8 @@ class FindTasksInWorkspace(BaseAction):
             params["limit"] = limit
         if opt_fields is not None:
             params["opt_fields"] = ",".join(opt_fields)
+        return PageRequest(url="/tasks", params=params)
 
-        tasks: list[Any] = []
-        next_params = params
-
-        while True:
-            response = await self.provider.request(
-                "GET",
-                "/tasks",
-                params=next_params,
-            )
-            payload = self.provider.parse_httpx_response(response, require_json=True)
-            data = payload.get("data", []) if isinstance(payload, dict) else payload
-
-            if not fetch_all:
-                return data
-
-            tasks.extend(data)
-            next_page = payload.get("next_page") if isinstance(payload, dict) else None
-            if not next_page or "offset" not in next_page:
-                break
-            next_params = dict(params)
-            next_params["offset"] = next_page["offset"]
-
-        return tasks
+    def parse_page(self, response: Any) -> Any:
+        # Keep the envelope so ``next_page`` survives Asana's ``data`` unwrapping.
+        return self.provider.parse_httpx_response(response, require_json=True)
@@ -5,7 +5,15 @@ from __future__ import annotations
 from typing import Any, Dict
 
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     AddTagToTask,
     AttachFile,
@@ -34,6 +42,10 @@ class AsanaProvider(HttpxClientMixin, BaseProvider[AsanaSettings]):
     """Provider exposing Asana REST API actions."""
 
     settings_class = AsanaSettings
+    default_retry_policy = RetryPolicy()
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_minute(1500, burst=50),
+    )
 
     create_task: CreateTask
     update_task: UpdateTask
@@ -1,9 +1,23 @@
 """Github provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .github_provider import GithubProvider
-from .github_settings import GithubSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .github_provider import GithubProvider
+    from .github_settings import GithubSettings
+
+register_provider(
+    ProviderKey.GITHUB,
+    f"{__name__}.github_provider:GithubProvider",
+    settings=f"{__name__}.github_settings:GithubSettings",
+)
 
-register_provider(ProviderKey.GITHUB, GithubProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {"GithubProvider": ".github_provider", "GithubSettings": ".github_settings"},
+)
 
 __all__ = ["GithubProvider", "GithubSettings"]
@@ -4,16 +4,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict
 
-from .....core import BaseAction
+from .....core import LinkHeaderPaginator, PageRequest, PaginatedAction
 
 if TYPE_CHECKING:  # pragma: no cover - avoids runtime import cycle
     from ...github_provider import GithubProvider
 
 
-class ListCodespaces(BaseAction):
+class ListCodespaces(PaginatedAction):
     """List codespaces owned by the authenticated user."""
 
     provider: "GithubProvider"
+    paginator = LinkHeaderPaginator(
+        items_path="codespaces", page_size_param="per_page", max_page_size=100
+    )
+    default_prefetch = 4
 
     async def __call__(
         self,
@@ -22,6 +26,17 @@ class ListCodespaces(BaseAction):
         page: int | None = None,
         repository_id: int | None = None,
     ) -> Any:
+        return await self.fetch_page(
+            self.page_request(per_page=per_page, page=page, repository_id=repository_id)
+        )
+
+    def page_request(
+        self,
+        *,
+        per_page: int | None = None,
+        page: int | None = None,
+        repository_id: int | None = None,
+    ) -> PageRequest:
         params: Dict[str, Any] = {}
         if per_page is not None:
             params["per_page"] = per_page
@@ -29,10 +44,4 @@ class ListCodespaces(BaseAction):
             params["page"] = page
         if repository_id is not None:
             params["repository_id"] = repository_id
-
-        response = await self.provider.request(
-            "GET",
-            "/user/codespaces",
-            params=params or None,
-        )
-        return self.provider.process_httpx_response(response)
+        return PageRequest(url="/user/codespaces", params=params)
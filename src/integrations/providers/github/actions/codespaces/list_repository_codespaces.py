@@ -4,16 +4,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict
 
-from .....core import BaseAction
+from .....core import LinkHeaderPaginator, PageRequest, PaginatedAction
 
 if TYPE_CHECKING:  # pragma: no cover - avoids runtime import cycle
     from ...github_provider import GithubProvider
 
 
-class ListRepositoryCodespaces(BaseAction):
+class ListRepositoryCodespaces(PaginatedAction):
     """List codespaces for a repository owned by the authenticated user."""
 
     provider: "GithubProvider"
+    paginator = LinkHeaderPaginator(
+        items_path="codespaces", page_size_param="per_page", max_page_size=100
+    )
+    default_prefetch = 4
 
     async def __call__(
         self,
@@ -23,15 +27,21 @@ class ListRepositoryCodespaces(BaseAction):
         per_page: int | None = None,
         page: int | None = None,
     ) -> Any:
+        return await self.fetch_page(
+            self.page_request(owner, repo, per_page=per_page, page=page)
+        )
+
+    def page_request(
+        self,
+        owner: str,
+        repo: str,
+        *,
+        per_page: int | None = None,
+        page: int | None = None,
+    ) -> PageRequest:
         params: Dict[str, Any] = {}
         if per_page is not None:
             params["per_page"] = per_page
         if page is not None:
             params["page"] = page
-
-        response = await self.provider.request(
-            "GET",
-            f"/repos/{owner}/{repo}/codespaces",
-            params=params or None,
-        )
-        return self.provider.process_httpx_response(response)
+        return PageRequest(url=f"/repos/{owner}/{repo}/codespaces", params=params)
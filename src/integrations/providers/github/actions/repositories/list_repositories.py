@@ -4,16 +4,18 @@ from __future__ import annotations
 
 from typing import Any, Dict, TYPE_CHECKING
 
-from .....core import BaseAction
+from .....core import LinkHeaderPaginator, PageRequest, PaginatedAction
 
 if TYPE_CHECKING:  # pragma: no cover - avoids runtime import cycle
     from ...github_provider import GithubProvider
 
 
-class ListRepositories(BaseAction):
+class ListRepositories(PaginatedAction):
     """List repositories accessible to the authenticated user."""
 
     provider: "GithubProvider"
+    paginator = LinkHeaderPaginator(page_size_param="per_page", max_page_size=100)
+    default_prefetch = 4
 
     async def __call__(
         self,
@@ -23,6 +25,23 @@ class ListRepositories(BaseAction):
         per_page: int | None = None,
         page: int | None = None,
     ) -> Any:
+        return await self.fetch_page(
+            self.page_request(
+                visibility=visibility,
+                affiliation=affiliation,
+                per_page=per_page,
+                page=page,
+            )
+        )
+
+    def page_request(
+        self,
+        *,
+        visibility: str | None = None,
+        affiliation: str | None = None,
+        per_page: int | None = None,
+        page: int | None = None,
+    ) -> PageRequest:
         params: Dict[str, Any] = {}
         if visibility:
             params["visibility"] = visibility
@@ -32,10 +51,4 @@ class ListRepositories(BaseAction):
             params["per_page"] = per_page
         if page is not None:
             params["page"] = page
-
-        response = await self.provider.request(
-            "GET",
-            "/user/repos",
-            params=params or None,
-        )
-        return self.provider.process_httpx_response(response)
+        return PageRequest(url="/user/repos", params=params)
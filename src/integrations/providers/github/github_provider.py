@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import re
 from typing import Dict
 
+import httpx
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    CacheRule,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    ResponseCacheProfile,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     CreateCodespace,
     AddLabelsToIssue,
@@ -43,10 +55,32 @@ from .actions import (
 from .github_settings import GithubSettings
 
 
+# Owner, repository, user, and organization names carry no digits to template on.
+_ROUTE_PREFIXES = (
+    (re.compile(r"^/?repos/[^/]+/[^/]+"), "/repos/{owner}/{repo}"),
+    (re.compile(r"^/?users/[^/]+"), "/users/{username}"),
+    (re.compile(r"^/?orgs/[^/]+"), "/orgs/{org}"),
+)
+
+
 class GithubProvider(HttpxClientMixin, BaseProvider[GithubSettings]):
     """Github provider exposing actions for common workflows."""
 
     settings_class = GithubSettings
+    default_retry_policy = RetryPolicy(rate_limit_statuses=frozenset({403}))
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_hour(5000, burst=100),
+        endpoints={"search": RateLimit.per_minute(30, burst=10)},
+        free_statuses=frozenset({304}),
+    )
+    # Conditional requests answered with 304 do not count against the quota, so
+    # metadata lookups are always revalidated instead of served stale.
+    default_cache_rules = ResponseCacheProfile(
+        rules=(
+            CacheRule(pattern=r"^/repos/[^/]+/[^/]+(/branches/[^/]+)?$", ttl=0),
+            CacheRule(pattern=r"^/(users|orgs)/[^/]+$", ttl=0),
+        ),
+    )
 
     # Repository, branch, and file actions
     list_repositories: ListRepositories
@@ -227,6 +261,20 @@ class GithubProvider(HttpxClientMixin, BaseProvider[GithubSettings]):
         description="Send a raw Github API request.",
     )
 
+    def rate_limit_class(self, method: str, url: str) -> str | None:
+        if url.lstrip("/").startswith("search/"):
+            return "search"
+        return None
+
+    def route_template(self, method: str, url: str) -> str:
+        path = httpx.URL(url).path
+        for pattern, prefix in _ROUTE_PREFIXES:
+            match = pattern.match(path)
+            if match is not None:
+                path = prefix + path[match.end() :]
+                break
+        return super().route_template(method, path)
+
     def httpx_headers(self) -> Dict[str, str]:
         settings = self.settings
         token = settings.token
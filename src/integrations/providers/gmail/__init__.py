@@ -1,9 +1,22 @@
 """Gmail provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .gmail_provider import GmailProvider
-from .gmail_settings import GmailSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .gmail_provider import GmailProvider
+    from .gmail_settings import GmailSettings
+
+register_provider(
+    ProviderKey.GMAIL,
+    f"{__name__}.gmail_provider:GmailProvider",
+    settings=f"{__name__}.gmail_settings:GmailSettings",
+)
 
-register_provider(ProviderKey.GMAIL, GmailProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"GmailProvider": ".gmail_provider", "GmailSettings": ".gmail_settings"}
+)
 
 __all__ = ["GmailProvider", "GmailSettings"]
@@ -4,7 +4,15 @@ from __future__ import annotations
 
 from typing import Dict
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     AddLabelToEmail,
     ArchiveEmail,
@@ -25,6 +33,14 @@ class GmailProvider(HttpxClientMixin, BaseProvider[GmailSettings]):
     """Provider exposing a set of high-level Gmail actions."""
 
     settings_class = GmailSettings
+    shares_transport = True
+    default_retry_policy = RetryPolicy(
+        max_attempts=5, backoff_base=1.0, backoff_max=32.0
+    )
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_second(50, burst=50),
+        endpoints={"send": RateLimit.per_second(2.5, burst=5)},
+    )
 
     send_email: SendEmail
     send_email_using_alias: SendEmailUsingAlias
@@ -89,6 +105,11 @@ class GmailProvider(HttpxClientMixin, BaseProvider[GmailSettings]):
         description="Execute an arbitrary Gmail API request.",
     )
 
+    def rate_limit_class(self, method: str, url: str) -> str | None:
+        if url.rstrip("/").endswith("/send"):
+            return "send"
+        return None
+
     def httpx_headers(self) -> Dict[str, str]:
         settings = self.settings
         token = settings.token
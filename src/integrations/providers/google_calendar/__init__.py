@@ -1,9 +1,26 @@
 """Google Calendar provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .google_calendar_provider import GoogleCalendarProvider
-from .google_calendar_settings import GoogleCalendarSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .google_calendar_provider import GoogleCalendarProvider
+    from .google_calendar_settings import GoogleCalendarSettings
+
+register_provider(
+    ProviderKey.GOOGLE_CALENDAR,
+    f"{__name__}.google_calendar_provider:GoogleCalendarProvider",
+    settings=f"{__name__}.google_calendar_settings:GoogleCalendarSettings",
+)
 
-register_provider(ProviderKey.GOOGLE_CALENDAR, GoogleCalendarProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GoogleCalendarProvider": ".google_calendar_provider",
+        "GoogleCalendarSettings": ".google_calendar_settings",
+    },
+)
 
 __all__ = ["GoogleCalendarProvider", "GoogleCalendarSettings"]
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 from typing import Any, Mapping, MutableMapping
 
+from integrations.core import PageRequest, PageTokenPaginator, PaginatedAction
+
 from ..google_calendar_base_action import GoogleCalendarBaseAction
 
 
-class FindEvents(GoogleCalendarBaseAction):
+class FindEvents(GoogleCalendarBaseAction, PaginatedAction):
     """Search for events on a Google Calendar."""
 
+    paginator = PageTokenPaginator(page_size_param="maxResults", max_page_size=2500)
+    default_prefetch = 4
+
     async def __call__(
         self,
         *,
@@ -29,7 +34,45 @@ class FindEvents(GoogleCalendarBaseAction):
         page_token: str | None = None,
         params_override: Mapping[str, Any] | None = None,
     ) -> MutableMapping[str, Any]:
-        provider = self.provider
+        return await self.fetch_page(
+            self.page_request(
+                calendar_id=calendar_id,
+                query=query,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                single_events=single_events,
+                order_by=order_by,
+                show_deleted=show_deleted,
+                show_hidden_invitees=show_hidden_invitees,
+                time_zone=time_zone,
+                updated_min=updated_min,
+                i_cal_uid=i_cal_uid,
+                sync_token=sync_token,
+                page_token=page_token,
+                params_override=params_override,
+            )
+        )
+
+    def page_request(
+        self,
+        *,
+        calendar_id: str | None = None,
+        query: str | None = None,
+        time_min: str | None = None,
+        time_max: str | None = None,
+        max_results: int | None = None,
+        single_events: bool | None = None,
+        order_by: str | None = None,
+        show_deleted: bool | None = None,
+        show_hidden_invitees: bool | None = None,
+        time_zone: str | None = None,
+        updated_min: str | None = None,
+        i_cal_uid: str | None = None,
+        sync_token: str | None = None,
+        page_token: str | None = None,
+        params_override: Mapping[str, Any] | None = None,
+    ) -> PageRequest:
         calendar = self.resolve_calendar_id(calendar_id)
         params: MutableMapping[str, Any] = {}
         if query is not None:
@@ -61,9 +104,4 @@ class FindEvents(GoogleCalendarBaseAction):
         if params_override is not None:
             params.update(dict(params_override))
 
-        response = await provider.request(
-            "GET",
-            f"/calendars/{calendar}/events",
-            params=params or None,
-        )
-        return provider.process_httpx_response(response)
+        return PageRequest(url=f"/calendars/{calendar}/events", params=params)
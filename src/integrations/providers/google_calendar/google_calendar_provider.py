@@ -6,7 +6,17 @@ from typing import Any, MutableMapping
 
 import httpx
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    CacheRule,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    ResponseCacheProfile,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     AddAttendeesToEvent,
     CreateCalendar,
@@ -29,6 +39,16 @@ class GoogleCalendarProvider(HttpxClientMixin, BaseProvider[GoogleCalendarSettin
     """Provider exposing Google Calendar scheduling operations."""
 
     settings_class = GoogleCalendarSettings
+    shares_transport = True
+    default_retry_policy = RetryPolicy(
+        max_attempts=5, backoff_base=1.0, backoff_max=32.0
+    )
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_minute(600, burst=20),
+    )
+    default_cache_rules = ResponseCacheProfile(
+        rules=(CacheRule(pattern=r"^/calendars/[^/]+$", ttl=0),),
+    )
 
     add_attendees_to_event: AddAttendeesToEvent
     delete_event: DeleteEvent
@@ -1,9 +1,26 @@
 """Google Docs provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .google_docs_provider import GoogleDocsProvider
-from .google_docs_settings import GoogleDocsSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .google_docs_provider import GoogleDocsProvider
+    from .google_docs_settings import GoogleDocsSettings
+
+register_provider(
+    ProviderKey.GOOGLE_DOCS,
+    f"{__name__}.google_docs_provider:GoogleDocsProvider",
+    settings=f"{__name__}.google_docs_settings:GoogleDocsSettings",
+)
 
-register_provider(ProviderKey.GOOGLE_DOCS, GoogleDocsProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GoogleDocsProvider": ".google_docs_provider",
+        "GoogleDocsSettings": ".google_docs_settings",
+    },
+)
 
 __all__ = ["GoogleDocsProvider", "GoogleDocsSettings"]
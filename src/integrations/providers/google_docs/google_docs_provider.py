@@ -6,7 +6,15 @@ from typing import Any, Mapping, MutableMapping
 
 import httpx
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     AppendTextToDocument,
     CreateDocumentFromText,
@@ -24,6 +32,14 @@ class GoogleDocsProvider(HttpxClientMixin, BaseProvider[GoogleDocsSettings]):
     """Provider exposing Google Docs document operations."""
 
     settings_class = GoogleDocsSettings
+    shares_transport = True
+    default_retry_policy = RetryPolicy(
+        max_attempts=5, backoff_base=1.0, backoff_max=32.0
+    )
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_minute(300, burst=10),
+        endpoints={"write": RateLimit.per_minute(60, burst=5)},
+    )
 
     append_text_to_document: AppendTextToDocument
     insert_text: InsertText
@@ -73,6 +89,9 @@ class GoogleDocsProvider(HttpxClientMixin, BaseProvider[GoogleDocsSettings]):
         description="Execute a raw Google Docs API request (beta).",
     )
 
+    def rate_limit_class(self, method: str, url: str) -> str | None:
+        return None if method.upper() == "GET" else "write"
+
     def httpx_headers(self) -> MutableMapping[str, str]:
         settings = self.settings
         token = settings.token
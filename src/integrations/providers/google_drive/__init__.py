@@ -1,9 +1,26 @@
 """Google Drive provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .google_drive_provider import GoogleDriveProvider
-from .google_drive_settings import GoogleDriveSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .google_drive_provider import GoogleDriveProvider
+    from .google_drive_settings import GoogleDriveSettings
+
+register_provider(
+    ProviderKey.GOOGLE_DRIVE,
+    f"{__name__}.google_drive_provider:GoogleDriveProvider",
+    settings=f"{__name__}.google_drive_settings:GoogleDriveSettings",
+)
 
-register_provider(ProviderKey.GOOGLE_DRIVE, GoogleDriveProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GoogleDriveProvider": ".google_drive_provider",
+        "GoogleDriveSettings": ".google_drive_settings",
+    },
+)
 
 __all__ = ["GoogleDriveProvider", "GoogleDriveSettings"]
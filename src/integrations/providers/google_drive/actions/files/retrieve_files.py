@@ -4,12 +4,19 @@ from __future__ import annotations
 
 from typing import Any, MutableMapping
 
+from integrations.core import PageRequest, PageTokenPaginator, PaginatedAction
+
 from ..google_drive_base_action import GoogleDriveBaseAction
 
 
-class RetrieveFiles(GoogleDriveBaseAction):
+class RetrieveFiles(GoogleDriveBaseAction, PaginatedAction):
     """Fetch files from Google Drive using the files.list endpoint."""
 
+    paginator = PageTokenPaginator(
+        items_path="files", page_size_param="pageSize", max_page_size=1000
+    )
+    default_prefetch = 4
+
     async def __call__(
         self,
         *,
@@ -24,6 +31,35 @@ class RetrieveFiles(GoogleDriveBaseAction):
         supports_all_drives: bool = True,
         fields: str | None = None,
     ) -> MutableMapping[str, Any]:
+        return await self.list_files(
+            self.page_request(
+                query=query,
+                page_size=page_size,
+                page_token=page_token,
+                order_by=order_by,
+                drive_id=drive_id,
+                corpora=corpora,
+                spaces=spaces,
+                include_items_from_all_drives=include_items_from_all_drives,
+                supports_all_drives=supports_all_drives,
+                fields=fields,
+            ).params
+        )
+
+    def page_request(
+        self,
+        *,
+        query: str | None = None,
+        page_size: int | None = None,
+        page_token: str | None = None,
+        order_by: str | None = None,
+        drive_id: str | None = None,
+        corpora: str | None = None,
+        spaces: str | None = None,
+        include_items_from_all_drives: bool = True,
+        supports_all_drives: bool = True,
+        fields: str | None = None,
+    ) -> PageRequest:
         params: dict[str, Any] = {
             "supportsAllDrives": supports_all_drives,
             "includeItemsFromAllDrives": include_items_from_all_drives,
@@ -47,4 +83,4 @@ class RetrieveFiles(GoogleDriveBaseAction):
         if fields is not None:
             params["fields"] = fields
 
-        return await self.list_files(params)
+        return PageRequest(url="/files", params=params)
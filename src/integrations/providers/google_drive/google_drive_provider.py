@@ -6,7 +6,15 @@ from typing import Any, Callable, Mapping, MutableMapping
 
 import httpx
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     AddFileSharingPreference,
     CopyFile,
@@ -42,6 +50,13 @@ class GoogleDriveProvider(HttpxClientMixin, BaseProvider[GoogleDriveSettings]):
     """Provider exposing Google Drive file and folder operations."""
 
     settings_class = GoogleDriveSettings
+    shares_transport = True
+    default_retry_policy = RetryPolicy(
+        max_attempts=5, backoff_base=1.0, backoff_max=32.0
+    )
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_minute(12000, burst=100),
+    )
 
     copy_file: CopyFile
     export_file: ExportFile
@@ -1,9 +1,26 @@
 """Google Sheets provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .google_sheets_provider import GoogleSheetsProvider
-from .google_sheets_settings import GoogleSheetsSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .google_sheets_provider import GoogleSheetsProvider
+    from .google_sheets_settings import GoogleSheetsSettings
+
+register_provider(
+    ProviderKey.GOOGLE_SHEETS,
+    f"{__name__}.google_sheets_provider:GoogleSheetsProvider",
+    settings=f"{__name__}.google_sheets_settings:GoogleSheetsSettings",
+)
 
-register_provider(ProviderKey.GOOGLE_SHEETS, GoogleSheetsProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GoogleSheetsProvider": ".google_sheets_provider",
+        "GoogleSheetsSettings": ".google_sheets_settings",
+    },
+)
 
 __all__ = ["GoogleSheetsProvider", "GoogleSheetsSettings"]
@@ -10,17 +10,23 @@ from .formatting import (
     SortRange,
 )
 from .rows import (
+    ClearDataRanges,
     ClearSpreadsheetRows,
     CreateMultipleSpreadsheetRows,
     CreateSpreadsheetRow,
     CreateSpreadsheetRowAtTop,
     DeleteSpreadsheetRows,
     FindOrCreateRow,
+    FindOrCreateRows,
     GetDataRange,
+    GetDataRanges,
     GetManySpreadsheetRows,
     GetRowById,
+    GetRowsById,
     LookupSpreadsheetRow,
     LookupSpreadsheetRows,
+    UpdateDataRanges,
+    UpdateRowsById,
     UpdateSpreadsheetRow,
     UpdateSpreadsheetRows,
 )
@@ -49,17 +55,23 @@ __all__ = [
     "FindOrCreateWorksheet",
     "FindWorksheet",
     "RenameSheet",
+    "ClearDataRanges",
     "ClearSpreadsheetRows",
     "CreateMultipleSpreadsheetRows",
     "CreateSpreadsheetRow",
     "CreateSpreadsheetRowAtTop",
     "DeleteSpreadsheetRows",
     "FindOrCreateRow",
+    "FindOrCreateRows",
     "GetDataRange",
+    "GetDataRanges",
     "GetManySpreadsheetRows",
     "GetRowById",
+    "GetRowsById",
     "LookupSpreadsheetRow",
     "LookupSpreadsheetRows",
+    "UpdateDataRanges",
+    "UpdateRowsById",
     "UpdateSpreadsheetRow",
     "UpdateSpreadsheetRows",
     "CreateConditionalFormattingRule",
@@ -7,11 +7,55 @@ from typing import TYPE_CHECKING, Any
 
 from integrations.core.actions import BaseAction
 
-from ..utils import encode_a1_range
+from ..column_index import ColumnIndex, find_header_column
+from ..utils import encode_a1_range, format_a1_range, parse_a1_range
+from ..worksheet_cache import WORKSHEET_FIELDS
 
 if TYPE_CHECKING:  # pragma: no cover - avoid circular imports at runtime
     from ..google_sheets_provider import GoogleSheetsProvider
 
+# batchUpdate requests that change a sheet's grid size.
+_GRID_RESIZING_REQUESTS = frozenset(
+    {
+        "appendCells",
+        "appendDimension",
+        "deleteDimension",
+        "deleteRange",
+        "insertDimension",
+        "insertRange",
+    }
+)
+
+# batchUpdate requests that never move or rewrite cell values; any other
+# request drops the spreadsheet's lookup-column indexes.
+_VALUE_PRESERVING_REQUESTS = frozenset(
+    {
+        "addConditionalFormatRule",
+        "addSheet",
+        "autoResizeDimensions",
+        "deleteConditionalFormatRule",
+        "mergeCells",
+        "repeatCell",
+        "setDataValidation",
+        "unmergeCells",
+        "updateBorders",
+        "updateConditionalFormatRule",
+        "updateDimensionProperties",
+    }
+)
+
+# ``updateSheetProperties`` fields that resize or rename a sheet. An update
+# touching any of them drops the spreadsheet's cached worksheets and indexes.
+_SHEET_SHAPE_FIELDS = frozenset(
+    {
+        "*",
+        "gridProperties",
+        "gridProperties.columnCount",
+        "gridProperties.rowCount",
+        "title",
+    }
+)
+
 
 class GoogleSheetsBaseAction(BaseAction):
     """Base class exposing common Google Sheets action helpers."""
@@ -33,17 +77,37 @@ class GoogleSheetsBaseAction(BaseAction):
         *,
         include_grid_data: bool | None = None,
         ranges: Sequence[str] | None = None,
+        fields: str | None = None,
     ) -> MutableMapping[str, Any]:
         params: dict[str, Any] = {}
         if include_grid_data is not None:
             params["includeGridData"] = include_grid_data
         if ranges is not None:
             params["ranges"] = list(ranges)
+        if fields is not None:
+            params["fields"] = fields
         response = await self.provider.request(
             "GET", f"/{spreadsheet_id}", params=params
         )
         return self.provider.process_httpx_response(response)
 
+    async def get_worksheets(
+        self,
+        spreadsheet_id: str,
+        *,
+        refresh: bool = False,
+    ) -> list[MutableMapping[str, Any]]:
+        """Return the ``properties`` of every worksheet, in tab order.
+
+        Served from the provider's worksheet cache, which loads only sheet
+        properties (titles, sheetIds, grid sizes) with a ``fields`` mask.
+        """
+        return await self.provider.worksheet_cache().worksheets(
+            spreadsheet_id,
+            lambda: self.get_spreadsheet(spreadsheet_id, fields=WORKSHEET_FIELDS),
+            refresh=refresh,
+        )
+
     async def fetch_worksheet_by_title(
         self,
         spreadsheet_id: str,
@@ -52,11 +116,15 @@ class GoogleSheetsBaseAction(BaseAction):
         case_sensitive: bool = False,
         include_grid_data: bool | None = None,
     ) -> MutableMapping[str, Any] | None:
-        spreadsheet = await self.get_spreadsheet(
-            spreadsheet_id,
-            include_grid_data=include_grid_data,
-        )
-        sheets = spreadsheet.get("sheets", [])
+        if include_grid_data:
+            sheets = (
+                await self.get_spreadsheet(spreadsheet_id, include_grid_data=True)
+            ).get("sheets", [])
+        else:
+            sheets = [
+                {"properties": properties}
+                for properties in await self.get_worksheets(spreadsheet_id)
+            ]
         if not isinstance(sheets, list):
             return None
         target = title if case_sensitive else title.casefold()
@@ -74,6 +142,113 @@ class GoogleSheetsBaseAction(BaseAction):
                 return sheet
         return None
 
+    async def column_index(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        *,
+        lookup_column: str | int,
+        case_sensitive: bool = False,
+        use_header_row: bool = True,
+        value_render_option: str | None = None,
+    ) -> ColumnIndex | None:
+        """Return the provider's index of ``lookup_column`` within ``range_name``.
+
+        A missing index is built from one read of the header row (when
+        ``use_header_row``) and one read of the lookup column alone. ``None``
+        means the range cannot be indexed (no header row yet, or a column
+        outside the range) and the caller should scan it instead.
+        """
+        key = (
+            spreadsheet_id,
+            range_name,
+            lookup_column,
+            case_sensitive,
+            use_header_row,
+            value_render_option,
+        )
+        return await self.provider.column_indexes().get(
+            key,
+            lambda: self._build_column_index(
+                spreadsheet_id,
+                range_name,
+                lookup_column=lookup_column,
+                case_sensitive=case_sensitive,
+                use_header_row=use_header_row,
+                value_render_option=value_render_option,
+            ),
+        )
+
+    async def _build_column_index(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        *,
+        lookup_column: str | int,
+        case_sensitive: bool,
+        use_header_row: bool,
+        value_render_option: str | None,
+    ) -> ColumnIndex | None:
+        try:
+            target = parse_a1_range(range_name)
+        except ValueError:
+            return None
+        header: list[Any] | None = None
+        if use_header_row:
+            payload = await self.values_get(
+                spreadsheet_id,
+                format_a1_range(
+                    target.sheet, None, target.first_row, None, target.first_row
+                ),
+                major_dimension="ROWS",
+                value_render_option=value_render_option,
+            )
+            rows = payload.get("values")
+            if not isinstance(rows, list) or not rows:
+                return None
+            header = target.slice_row(rows[0])
+
+        if isinstance(lookup_column, int):
+            position: int | None = lookup_column
+        else:
+            if header is None:
+                raise ValueError(
+                    "A header row is required when lookup_column is a string name"
+                )
+            position = find_header_column(
+                header, lookup_column, case_sensitive=case_sensitive
+            )
+            if position is None:
+                raise ValueError(
+                    f"Column '{lookup_column}' was not found in the header row"
+                )
+        column = target.first_column + position
+        if position < 0 or not target.contains_column(column):
+            return None
+
+        data_start_row = target.first_row + (1 if use_header_row else 0)
+        index = ColumnIndex(
+            spreadsheet_id,
+            target,
+            column,
+            header=header,
+            case_sensitive=case_sensitive,
+            data_start_row=data_start_row,
+        )
+        if target.end_row is None or data_start_row <= target.end_row:
+            payload = await self.values_get(
+                spreadsheet_id,
+                format_a1_range(
+                    target.sheet, column, data_start_row, column, target.end_row
+                ),
+                major_dimension="COLUMNS",
+                value_render_option=value_render_option,
+            )
+            columns = payload.get("values")
+            if isinstance(columns, list) and columns and isinstance(columns[0], list):
+                index.load(columns[0])
+        return index
+
     def _values_path(
         self,
         spreadsheet_id: str,
@@ -108,7 +283,51 @@ class GoogleSheetsBaseAction(BaseAction):
             f"/{spreadsheet_id}:batchUpdate",
             json=payload,
         )
-        return self.provider.process_httpx_response(response)
+        result = self.provider.process_httpx_response(response)
+        self._sync_worksheet_cache(spreadsheet_id, payload["requests"], result)
+        if not all(_preserves_values(request) for request in payload["requests"]):
+            self.provider.column_indexes().invalidate(spreadsheet_id)
+        return result
+
+    def _sync_worksheet_cache(
+        self,
+        spreadsheet_id: str,
+        requests: Sequence[Mapping[str, Any]],
+        response: Mapping[str, Any],
+    ) -> None:
+        """Apply the sheet changes made by a ``batchUpdate`` to the cache."""
+        cache = self.provider.worksheet_cache()
+        replies = response.get("replies")
+        if not isinstance(replies, list):
+            replies = []
+        for position, request in enumerate(requests):
+            reply = replies[position] if position < len(replies) else None
+            if not isinstance(reply, Mapping):
+                reply = {}
+            if "addSheet" in request or "duplicateSheet" in request:
+                kind = "addSheet" if "addSheet" in request else "duplicateSheet"
+                added = reply.get(kind)
+                properties = (
+                    added.get("properties") if isinstance(added, Mapping) else None
+                )
+                if isinstance(properties, Mapping):
+                    cache.add(spreadsheet_id, properties)
+                else:
+                    cache.invalidate(spreadsheet_id)
+            elif "deleteSheet" in request:
+                cache.remove(spreadsheet_id, request["deleteSheet"].get("sheetId", 0))
+            elif "updateSheetProperties" in request:
+                update = request["updateSheetProperties"]
+                if _changes_sheet_shape(update):
+                    cache.invalidate(spreadsheet_id)
+                    continue
+                cache.update(
+                    spreadsheet_id,
+                    update.get("properties", {}),
+                    update.get("fields") or "*",
+                )
+            elif not _GRID_RESIZING_REQUESTS.isdisjoint(request):
+                cache.invalidate(spreadsheet_id)
 
     async def values_append(
         self,
@@ -129,7 +348,13 @@ class GoogleSheetsBaseAction(BaseAction):
             params=params,
             json={"values": [list(row) for row in values]},
         )
-        return self.provider.process_httpx_response(response)
+        result = self.provider.process_httpx_response(response)
+        updates = result.get("updates")
+        updated_range = (
+            updates.get("updatedRange") if isinstance(updates, Mapping) else None
+        )
+        self._sync_column_indexes(spreadsheet_id, updated_range, values, appended=True)
+        return result
 
     async def values_update(
         self,
@@ -150,7 +375,109 @@ class GoogleSheetsBaseAction(BaseAction):
             params=params,
             json={"values": [list(row) for row in values]},
         )
-        return self.provider.process_httpx_response(response)
+        result = self.provider.process_httpx_response(response)
+        self._sync_column_indexes(
+            spreadsheet_id, result.get("updatedRange") or range_name, values
+        )
+        return result
+
+    async def values_batch_update(
+        self,
+        spreadsheet_id: str,
+        data: Sequence[Mapping[str, Any]],
+        *,
+        value_input_option: str = "USER_ENTERED",
+        include_values_in_response: bool | None = None,
+        response_value_render_option: str | None = None,
+    ) -> MutableMapping[str, Any]:
+        """Write several ranges in one ``values:batchUpdate`` call.
+
+        ``data`` holds ``{"range": ..., "values": [...]}`` entries, optionally
+        with a ``majorDimension``.
+        """
+        payload = self._batch_update_payload(
+            data,
+            value_input_option=value_input_option,
+            include_values_in_response=include_values_in_response,
+            response_value_render_option=response_value_render_option,
+        )
+        response = await self.provider.request(
+            "POST",
+            f"/{spreadsheet_id}/values:batchUpdate",
+            json=payload,
+        )
+        result = self.provider.process_httpx_response(response)
+        for item in payload["data"]:
+            if item.get("majorDimension", "ROWS") != "ROWS":
+                self.provider.column_indexes().invalidate(spreadsheet_id)
+                break
+            self._sync_column_indexes(spreadsheet_id, item["range"], item["values"])
+        return result
+
+    async def values_batch_update_by_data_filter(
+        self,
+        spreadsheet_id: str,
+        data: Sequence[Mapping[str, Any]],
+        *,
+        value_input_option: str = "USER_ENTERED",
+        include_values_in_response: bool | None = None,
+        response_value_render_option: str | None = None,
+    ) -> MutableMapping[str, Any]:
+        """Write ``{"dataFilter": ..., "values": [...]}`` entries in one call."""
+        payload = self._batch_update_payload(
+            data,
+            value_input_option=value_input_option,
+            include_values_in_response=include_values_in_response,
+            response_value_render_option=response_value_render_option,
+        )
+        response = await self.provider.request(
+            "POST",
+            f"/{spreadsheet_id}/values:batchUpdateByDataFilter",
+            json=payload,
+        )
+        result = self.provider.process_httpx_response(response)
+        # The ranges a data filter resolves to are not known here.
+        self.provider.column_indexes().invalidate(spreadsheet_id)
+        return result
+
+    def _batch_update_payload(
+        self,
+        data: Sequence[Mapping[str, Any]],
+        *,
+        value_input_option: str,
+        include_values_in_response: bool | None,
+        response_value_render_option: str | None,
+    ) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "valueInputOption": value_input_option,
+            "data": [
+                {**item, "values": [list(row) for row in item["values"]]}
+                for item in data
+            ],
+        }
+        if include_values_in_response is not None:
+            payload["includeValuesInResponse"] = include_values_in_response
+        if response_value_render_option is not None:
+            payload["responseValueRenderOption"] = response_value_render_option
+        return payload
+
+    def _sync_column_indexes(
+        self,
+        spreadsheet_id: str,
+        written_range: Any,
+        values: Sequence[Sequence[Any]],
+        *,
+        appended: bool = False,
+    ) -> None:
+        """Apply a values write to the spreadsheet's lookup-column indexes."""
+        indexes = self.provider.column_indexes()
+        try:
+            written = parse_a1_range(written_range)
+        except (AttributeError, ValueError):
+            # No usable range in the response: the rows written are unknown.
+            indexes.invalidate(spreadsheet_id)
+            return
+        indexes.record_write(spreadsheet_id, written, values, appended=appended)
 
     async def values_clear(
         self,
@@ -169,7 +496,39 @@ class GoogleSheetsBaseAction(BaseAction):
             params=params,
             json={},
         )
-        return self.provider.process_httpx_response(response)
+        result = self.provider.process_httpx_response(response)
+        self.provider.column_indexes().invalidate(spreadsheet_id)
+        return result
+
+    async def values_batch_clear(
+        self,
+        spreadsheet_id: str,
+        ranges: Sequence[str],
+    ) -> MutableMapping[str, Any]:
+        """Clear several ranges in one ``values:batchClear`` call."""
+        response = await self.provider.request(
+            "POST",
+            f"/{spreadsheet_id}/values:batchClear",
+            json={"ranges": list(ranges)},
+        )
+        result = self.provider.process_httpx_response(response)
+        self.provider.column_indexes().invalidate(spreadsheet_id)
+        return result
+
+    async def values_batch_clear_by_data_filter(
+        self,
+        spreadsheet_id: str,
+        data_filters: Sequence[Mapping[str, Any]],
+    ) -> MutableMapping[str, Any]:
+        """Clear every range matched by ``data_filters`` in one call."""
+        response = await self.provider.request(
+            "POST",
+            f"/{spreadsheet_id}/values:batchClearByDataFilter",
+            json={"dataFilters": [dict(item) for item in data_filters]},
+        )
+        result = self.provider.process_httpx_response(response)
+        self.provider.column_indexes().invalidate(spreadsheet_id)
+        return result
 
     async def values_get(
         self,
@@ -194,3 +553,73 @@ class GoogleSheetsBaseAction(BaseAction):
             params=params,
         )
         return self.provider.process_httpx_response(response)
+
+    async def values_batch_get(
+        self,
+        spreadsheet_id: str,
+        ranges: Sequence[str],
+        *,
+        major_dimension: str | None = None,
+        value_render_option: str | None = None,
+        date_time_render_option: str | None = None,
+    ) -> MutableMapping[str, Any]:
+        """Read several ranges in one ``values:batchGet`` call.
+
+        ``valueRanges`` in the response follows the order of ``ranges``.
+        """
+        params: dict[str, Any] = {"ranges": list(ranges)}
+        if major_dimension is not None:
+            params["majorDimension"] = major_dimension
+        if value_render_option is not None:
+            params["valueRenderOption"] = value_render_option
+        if date_time_render_option is not None:
+            params["dateTimeRenderOption"] = date_time_render_option
+
+        response = await self.provider.request(
+            "GET",
+            f"/{spreadsheet_id}/values:batchGet",
+            params=params,
+        )
+        return self.provider.process_httpx_response(response)
+
+    async def values_batch_get_by_data_filter(
+        self,
+        spreadsheet_id: str,
+        data_filters: Sequence[Mapping[str, Any]],
+        *,
+        major_dimension: str | None = None,
+        value_render_option: str | None = None,
+        date_time_render_option: str | None = None,
+    ) -> MutableMapping[str, Any]:
+        """Read every range matched by ``data_filters`` in one call."""
+        payload: dict[str, Any] = {"dataFilters": [dict(item) for item in data_filters]}
+        if major_dimension is not None:
+            payload["majorDimension"] = major_dimension
+        if value_render_option is not None:
+            payload["valueRenderOption"] = value_render_option
+        if date_time_render_option is not None:
+            payload["dateTimeRenderOption"] = date_time_render_option
+
+        # A read sent as POST: safe to retry like the GET it stands in for.
+        response = await self.provider.request(
+            "POST",
+            f"/{spreadsheet_id}/values:batchGetByDataFilter",
+            json=payload,
+            retry=True,
+        )
+        return self.provider.process_httpx_response(response)
+
+
+def _preserves_values(request: Mapping[str, Any]) -> bool:
+    """Return whether a ``batchUpdate`` request leaves every cell in place."""
+    if "updateSheetProperties" in request:
+        return not _changes_sheet_shape(request["updateSheetProperties"])
+    return not _VALUE_PRESERVING_REQUESTS.isdisjoint(request)
+
+
+def _changes_sheet_shape(update: Mapping[str, Any]) -> bool:
+    """Return whether ``updateSheetProperties`` resizes or renames the sheet."""
+    fields = update.get("fields") or "*"
+    return not _SHEET_SHAPE_FIELDS.isdisjoint(
+        field.strip() for field in str(fields).split(",")
+    )
@@ -1,31 +1,43 @@
 """Row and value operations."""
 
+from .clear_data_ranges import ClearDataRanges
 from .clear_spreadsheet_rows import ClearSpreadsheetRows
 from .create_multiple_spreadsheet_rows import CreateMultipleSpreadsheetRows
 from .create_spreadsheet_row import CreateSpreadsheetRow
 from .create_spreadsheet_row_at_top import CreateSpreadsheetRowAtTop
 from .delete_spreadsheet_rows import DeleteSpreadsheetRows
 from .find_or_create_row import FindOrCreateRow
+from .find_or_create_rows import FindOrCreateRows
 from .get_data_range import GetDataRange
+from .get_data_ranges import GetDataRanges
 from .get_many_spreadsheet_rows import GetManySpreadsheetRows
 from .get_row_by_id import GetRowById
+from .get_rows_by_id import GetRowsById
 from .lookup_spreadsheet_row import LookupSpreadsheetRow
 from .lookup_spreadsheet_rows import LookupSpreadsheetRows
+from .update_data_ranges import UpdateDataRanges
+from .update_rows_by_id import UpdateRowsById
 from .update_spreadsheet_row import UpdateSpreadsheetRow
 from .update_spreadsheet_rows import UpdateSpreadsheetRows
 
 __all__ = [
+    "ClearDataRanges",
     "ClearSpreadsheetRows",
     "CreateMultipleSpreadsheetRows",
     "CreateSpreadsheetRow",
     "CreateSpreadsheetRowAtTop",
     "DeleteSpreadsheetRows",
     "FindOrCreateRow",
+    "FindOrCreateRows",
     "GetDataRange",
+    "GetDataRanges",
     "GetManySpreadsheetRows",
     "GetRowById",
+    "GetRowsById",
     "LookupSpreadsheetRow",
     "LookupSpreadsheetRows",
+    "UpdateDataRanges",
+    "UpdateRowsById",
     "UpdateSpreadsheetRow",
     "UpdateSpreadsheetRows",
 ]
@@ -0,0 +1,30 @@
+"""Action for clearing several ranges in one request."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, MutableMapping, Sequence
+
+from ..google_sheets_base_action import GoogleSheetsBaseAction
+
+
+class ClearDataRanges(GoogleSheetsBaseAction):
+    """Clear several A1 ranges, or every range matched by data filters, at once."""
+
+    async def __call__(
+        self,
+        spreadsheet_id: str,
+        ranges: Sequence[str] | None = None,
+        *,
+        data_filters: Sequence[Mapping[str, Any]] | None = None,
+    ) -> MutableMapping[str, Any]:
+        if (ranges is None) == (data_filters is None):
+            raise ValueError("Provide either ranges or data_filters")
+        if data_filters is not None:
+            if not data_filters:
+                raise ValueError("data_filters must contain at least one filter")
+            return await self.values_batch_clear_by_data_filter(
+                spreadsheet_id, data_filters
+            )
+        if isinstance(ranges, str) or not ranges:
+            raise ValueError("ranges must be a non-empty sequence of A1 ranges")
+        return await self.values_batch_clear(spreadsheet_id, ranges)
@@ -8,7 +8,12 @@ from ..google_sheets_base_action import GoogleSheetsBaseAction
 
 
 class CreateSpreadsheetRow(GoogleSheetsBaseAction):
-    """Append a single row to the end of a worksheet."""
+    """Append a single row to the end of a worksheet.
+
+    With ``buffered`` the row goes through the provider's append buffer and is
+    sent together with other rows for the same range; the result describes
+    this row alone.
+    """
 
     async def __call__(
         self,
@@ -18,7 +23,16 @@ class CreateSpreadsheetRow(GoogleSheetsBaseAction):
         *,
         value_input_option: str = "USER_ENTERED",
         insert_data_option: str | None = None,
+        buffered: bool = False,
     ) -> MutableMapping[str, Any]:
+        if buffered:
+            return await self.provider.append_buffer().append(
+                spreadsheet_id,
+                range_name,
+                row,
+                value_input_option=value_input_option,
+                insert_data_option=insert_data_option,
+            )
         return await self.values_append(
             spreadsheet_id,
             range_name,
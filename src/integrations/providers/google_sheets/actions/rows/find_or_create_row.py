@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 from itertools import zip_longest
 from typing import Any, MutableMapping, Sequence
 
@@ -11,7 +12,15 @@ from .lookup_spreadsheet_rows import LookupSpreadsheetRows
 
 
 class FindOrCreateRow(GoogleSheetsBaseAction):
-    """Find a row matching the lookup criteria or append a new one."""
+    """Find a row matching the lookup criteria or append a new one.
+
+    With ``use_index`` the lookup is served by the provider's column index and
+    calls for the same index are serialised, so concurrent callers of this
+    provider looking up one new key append it once. The appended row is added
+    to the index. Rows appended by other writers are noticed before a miss,
+    but a row edited elsewhere to hold the key is only seen once the index
+    expires, and until then the key can be appended again.
+    """
 
     async def __call__(
         self,
@@ -25,6 +34,45 @@ class FindOrCreateRow(GoogleSheetsBaseAction):
         case_sensitive: bool = False,
         use_header_row: bool = True,
         return_as_object: bool | None = None,
+        use_index: bool = False,
+    ) -> MutableMapping[str, Any]:
+        index = None
+        if use_index and lookup_value not in (None, ""):
+            index = await self.column_index(
+                spreadsheet_id,
+                range_name,
+                lookup_column=lookup_column,
+                case_sensitive=case_sensitive,
+                use_header_row=use_header_row,
+            )
+        lock = index.lock if index is not None else contextlib.nullcontext()
+        async with lock:
+            return await self._find_or_create(
+                spreadsheet_id,
+                range_name,
+                lookup_column=lookup_column,
+                lookup_value=lookup_value,
+                row=row,
+                value_input_option=value_input_option,
+                case_sensitive=case_sensitive,
+                use_header_row=use_header_row,
+                return_as_object=return_as_object,
+                use_index=use_index,
+            )
+
+    async def _find_or_create(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        *,
+        lookup_column: str | int,
+        lookup_value: Any,
+        row: Sequence[Any],
+        value_input_option: str,
+        case_sensitive: bool,
+        use_header_row: bool,
+        return_as_object: bool | None,
+        use_index: bool,
     ) -> MutableMapping[str, Any]:
         lookup_action = LookupSpreadsheetRows(self.provider)
         lookup_result = await lookup_action(
@@ -36,6 +84,7 @@ class FindOrCreateRow(GoogleSheetsBaseAction):
             case_sensitive=case_sensitive,
             use_header_row=use_header_row,
             return_as_objects=return_as_object,
+            use_index=use_index,
         )
         matches = lookup_result.get("matches", [])
         if matches:
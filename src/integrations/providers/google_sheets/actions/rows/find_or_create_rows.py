@@ -0,0 +1,271 @@
+"""Action for finding or creating many rows in one pass."""
+
+from __future__ import annotations
+
+import contextlib
+from itertools import zip_longest
+from typing import Any, Iterable, Mapping, MutableMapping, Sequence
+
+from ...column_index import (
+    ColumnIndex,
+    find_header_column,
+    normalize_lookup_value,
+)
+from ...utils import A1Range, format_a1_range, parse_a1_range
+from ..google_sheets_base_action import GoogleSheetsBaseAction
+
+
+class FindOrCreateRows(GoogleSheetsBaseAction):
+    """Upsert many rows keyed by the value in a lookup column.
+
+    The lookup column is read once. Keys already present are rewritten with
+    their new row in a single ``values:batchUpdate`` (unless
+    ``update_existing`` is false) and missing keys are appended in a single
+    ``values:append``. When a key appears more than once in ``rows`` the last
+    row wins; when it matches several sheet rows the first one is updated.
+
+    An integer ``lookup_column`` outside the range, or a range that is not
+    valid A1 notation, raises :class:`ValueError`. Every row is appended only
+    when the range holds no data at all.
+
+    Each entry of ``results`` reports a key's ``status`` (``"created"``,
+    ``"updated"`` or ``"found"``) and its 1-based ``row_number`` within
+    ``range_name``, counting the header row as row 1.
+    """
+
+    async def __call__(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        rows: Mapping[Any, Sequence[Any]] | Iterable[tuple[Any, Sequence[Any]]],
+        *,
+        lookup_column: str | int,
+        value_input_option: str = "USER_ENTERED",
+        case_sensitive: bool = False,
+        use_header_row: bool = True,
+        update_existing: bool = True,
+        return_as_objects: bool | None = None,
+        use_index: bool = False,
+    ) -> MutableMapping[str, Any]:
+        items = rows.items() if isinstance(rows, Mapping) else rows
+        index = await self._load_index(
+            spreadsheet_id,
+            range_name,
+            lookup_column=lookup_column,
+            case_sensitive=case_sensitive,
+            use_header_row=use_header_row,
+            use_index=use_index,
+        )
+        lock = index.lock if use_index and index is not None else None
+        async with lock or contextlib.nullcontext():
+            return await self._upsert(
+                spreadsheet_id,
+                range_name,
+                index,
+                items,
+                case_sensitive=case_sensitive,
+                value_input_option=value_input_option,
+                update_existing=update_existing,
+                return_as_objects=return_as_objects,
+            )
+
+    async def _load_index(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        *,
+        lookup_column: str | int,
+        case_sensitive: bool,
+        use_header_row: bool,
+        use_index: bool,
+    ) -> ColumnIndex | None:
+        """Return the lookup-column index, or ``None`` when the range is empty."""
+        target = parse_a1_range(range_name)
+        if isinstance(lookup_column, int) and (
+            lookup_column < 0
+            or not target.contains_column(target.first_column + lookup_column)
+        ):
+            raise ValueError(
+                f"lookup_column {lookup_column} is outside the range '{range_name}'"
+            )
+        options = {
+            "lookup_column": lookup_column,
+            "case_sensitive": case_sensitive,
+            "use_header_row": use_header_row,
+        }
+        if use_index:
+            index = await self.column_index(spreadsheet_id, range_name, **options)
+        else:
+            index = await self._build_column_index(
+                spreadsheet_id, range_name, value_render_option=None, **options
+            )
+        if index is not None:
+            return index
+
+        # The header row is blank: scan the range to tell an empty sheet from
+        # one whose data starts further down.
+        payload = await self.values_get(
+            spreadsheet_id, range_name, major_dimension="ROWS"
+        )
+        values = payload.get("values")
+        if not isinstance(values, list) or not any(values):
+            return None
+        return _index_from_rows(spreadsheet_id, target, values, **options)
+
+    async def _upsert(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        index: ColumnIndex | None,
+        items: Iterable[tuple[Any, Sequence[Any]]],
+        *,
+        case_sensitive: bool,
+        value_input_option: str,
+        update_existing: bool,
+        return_as_objects: bool | None,
+    ) -> MutableMapping[str, Any]:
+        target = index.range if index is not None else parse_a1_range(range_name)
+        header = index.header if index is not None else None
+        if return_as_objects is None:
+            return_as_objects = header is not None
+
+        # Normalized key -> (key, row), keeping first-seen order.
+        batch: dict[str, tuple[Any, list[Any]]] = {}
+        for key, row in items:
+            normalized = normalize_lookup_value(key, case_sensitive=case_sensitive)
+            first = batch.get(normalized)
+            batch[normalized] = (first[0] if first else key, list(row))
+        if not batch:
+            raise ValueError("rows must contain at least one row")
+
+        row_numbers: dict[str, int | None] = {}
+        statuses: dict[str, str] = {}
+        updates: list[dict[str, Any]] = []
+        inserts: list[str] = []
+        for normalized, (key, row) in batch.items():
+            matches = index.lookup(key) if index is not None and normalized else []
+            if not matches:
+                inserts.append(normalized)
+                continue
+            row_numbers[normalized] = matches[0]
+            if not update_existing:
+                statuses[normalized] = "found"
+                continue
+            statuses[normalized] = "updated"
+            sheet_row = target.first_row + matches[0] - 1
+            updates.append(
+                {
+                    "range": _row_range(target, sheet_row, len(row)),
+                    "values": [row],
+                }
+            )
+
+        update_result = None
+        if updates:
+            update_result = await self.values_batch_update(
+                spreadsheet_id, updates, value_input_option=value_input_option
+            )
+        append_result = None
+        if inserts:
+            append_result = await self.values_append(
+                spreadsheet_id,
+                range_name,
+                [batch[normalized][1] for normalized in inserts],
+                value_input_option=value_input_option,
+            )
+            first_row = _appended_first_row(append_result)
+            for offset, normalized in enumerate(inserts):
+                statuses[normalized] = "created"
+                row_numbers[normalized] = (
+                    first_row + offset - target.first_row + 1
+                    if first_row is not None
+                    else None
+                )
+
+        results = [
+            {
+                "key": key,
+                "status": statuses[normalized],
+                "row_number": row_numbers[normalized],
+                "row": _convert(row, header, return_as_objects=return_as_objects),
+            }
+            for normalized, (key, row) in batch.items()
+        ]
+        counts = {"created": 0, "updated": 0, "found": 0}
+        for status in statuses.values():
+            counts[status] += 1
+        return {
+            "results": results,
+            **counts,
+            "update_result": update_result,
+            "append_result": append_result,
+        }
+
+
+def _index_from_rows(
+    spreadsheet_id: str,
+    target: A1Range,
+    values: Sequence[Sequence[Any]],
+    *,
+    lookup_column: str | int,
+    case_sensitive: bool,
+    use_header_row: bool,
+) -> ColumnIndex:
+    header = (list(values[0]) or None) if use_header_row else None
+    if isinstance(lookup_column, int):
+        position = lookup_column
+    else:
+        if header is None:
+            raise ValueError(
+                "A header row is required when lookup_column is a string name"
+            )
+        found = find_header_column(header, lookup_column, case_sensitive=case_sensitive)
+        if found is None:
+            raise ValueError(
+                f"Column '{lookup_column}' was not found in the header row"
+            )
+        position = found
+    index = ColumnIndex(
+        spreadsheet_id,
+        target,
+        target.first_column + position,
+        header=header,
+        case_sensitive=case_sensitive,
+        data_start_row=target.first_row + (1 if use_header_row else 0),
+    )
+    data = values[1:] if use_header_row else values
+    index.load([row[position] if position < len(row) else "" for row in data])
+    return index
+
+
+def _row_range(target: A1Range, sheet_row: int, width: int) -> str:
+    first_column = target.first_column
+    return format_a1_range(
+        target.sheet,
+        first_column,
+        sheet_row,
+        first_column + max(width, 1) - 1,
+        sheet_row,
+    )
+
+
+def _appended_first_row(append_result: Mapping[str, Any]) -> int | None:
+    updates = append_result.get("updates")
+    updated_range = (
+        updates.get("updatedRange") if isinstance(updates, Mapping) else None
+    )
+    if not isinstance(updated_range, str):
+        return None
+    try:
+        return parse_a1_range(updated_range).start_row
+    except ValueError:
+        return None
+
+
+def _convert(
+    row: Sequence[Any], header: Sequence[Any] | None, *, return_as_objects: bool
+) -> Any:
+    if return_as_objects and header is not None:
+        keys = [str(key) if key is not None else "" for key in header]
+        return {key: value for key, value in zip_longest(keys, row, fillvalue=None)}
+    return list(row)
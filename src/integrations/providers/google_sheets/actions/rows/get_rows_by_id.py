@@ -0,0 +1,70 @@
+"""Action for fetching many rows by their numeric identifiers."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, MutableMapping
+
+from ...utils import consecutive_runs
+from ..google_sheets_base_action import GoogleSheetsBaseAction
+
+
+class GetRowsById(GoogleSheetsBaseAction):
+    """Retrieve many rows by row number (1-indexed) in one request.
+
+    Consecutive row numbers are read as a single range of a
+    ``values:batchGet``. ``rows`` follows the order of ``row_numbers``. A
+    response without one value range per requested range raises
+    :class:`ValueError`.
+    """
+
+    async def __call__(
+        self,
+        spreadsheet_id: str,
+        sheet_title: str,
+        row_numbers: Iterable[int],
+        *,
+        value_render_option: str | None = None,
+        date_time_render_option: str | None = None,
+    ) -> MutableMapping[str, Any]:
+        numbers = list(row_numbers)
+        if not numbers:
+            raise ValueError("row_numbers must contain at least one row number")
+        if any(number <= 0 for number in numbers):
+            raise ValueError("row numbers must be greater than zero")
+
+        runs = consecutive_runs(numbers)
+        payload = await self.values_batch_get(
+            spreadsheet_id,
+            [f"{sheet_title}!{first}:{last}" for first, last in runs],
+            major_dimension="ROWS",
+            value_render_option=value_render_option,
+            date_time_render_option=date_time_render_option,
+        )
+        value_ranges = payload.get("valueRanges")
+        if not isinstance(value_ranges, list) or len(value_ranges) != len(runs):
+            count = len(value_ranges) if isinstance(value_ranges, list) else 0
+            raise ValueError(
+                f"values:batchGet returned {count} value ranges for "
+                f"{len(runs)} requested ranges"
+            )
+
+        found: dict[int, list[Any]] = {}
+        for (first, last), value_range in zip(runs, value_ranges, strict=True):
+            values = (
+                value_range.get("values") if isinstance(value_range, Mapping) else None
+            )
+            if not isinstance(values, list):
+                values = []
+            for offset in range(last - first + 1):
+                found[first + offset] = values[offset] if offset < len(values) else []
+        return {
+            "spreadsheetId": payload.get("spreadsheetId", spreadsheet_id),
+            "rows": [
+                {
+                    "row_number": number,
+                    "range": f"{sheet_title}!{number}:{number}",
+                    "values": found.get(number, []),
+                }
+                for number in numbers
+            ],
+        }
@@ -22,6 +22,7 @@ class LookupSpreadsheetRow(GoogleSheetsBaseAction):
         case_sensitive: bool = False,
         use_header_row: bool = True,
         return_as_object: bool | None = None,
+        use_index: bool = False,
     ) -> Mapping[str, Any] | Any | None:
         rows_action = LookupSpreadsheetRows(self.provider)
         result = await rows_action(
@@ -33,6 +34,7 @@ class LookupSpreadsheetRow(GoogleSheetsBaseAction):
             case_sensitive=case_sensitive,
             use_header_row=use_header_row,
             return_as_objects=return_as_object,
+            use_index=use_index,
         )
         matches = result.get("matches", [])
         return matches[0] if matches else None
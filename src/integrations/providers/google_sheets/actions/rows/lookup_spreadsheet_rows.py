@@ -5,14 +5,12 @@ from __future__ import annotations
 from itertools import zip_longest
 from typing import Any, Iterable, MutableMapping, Sequence
 
+from ...column_index import ColumnIndex, find_header_column
+from ...column_index import normalize_lookup_value as _normalize
+from ...utils import format_a1_range
 from ..google_sheets_base_action import GoogleSheetsBaseAction
 
 
-def _normalize(value: Any, *, case_sensitive: bool) -> str:
-    text = "" if value is None else str(value)
-    return text if case_sensitive else text.casefold()
-
-
 def _coerce_match_row(
     row: Sequence[Any],
     header: Sequence[Any] | None,
@@ -26,7 +24,16 @@ def _coerce_match_row(
 
 
 class LookupSpreadsheetRows(GoogleSheetsBaseAction):
-    """Find rows whose values match the provided lookup criteria."""
+    """Find rows whose values match the provided lookup criteria.
+
+    With ``use_index`` the lookup column is answered from the provider's
+    column index (see :meth:`GoogleSheetsBaseAction.column_index`) and only the
+    matching rows are read; a match that no longer holds the lookup value
+    drops the index and falls back to scanning the range. A miss first reads
+    the lookup column below the last row the index has seen, so rows appended
+    by someone else are found. Existing rows edited outside the provider to
+    hold the value are not, until the index expires (five minutes by default).
+    """
 
     async def __call__(
         self,
@@ -39,7 +46,28 @@ class LookupSpreadsheetRows(GoogleSheetsBaseAction):
         case_sensitive: bool = False,
         use_header_row: bool = True,
         return_as_objects: bool | None = None,
+        use_index: bool = False,
     ) -> MutableMapping[str, Any]:
+        if use_index and _normalize(lookup_value, case_sensitive=case_sensitive):
+            index = await self.column_index(
+                spreadsheet_id,
+                range_name,
+                lookup_column=lookup_column,
+                case_sensitive=case_sensitive,
+                use_header_row=use_header_row,
+                value_render_option=value_render_option,
+            )
+            if index is not None:
+                result = await self._indexed_lookup(
+                    spreadsheet_id,
+                    index,
+                    lookup_value,
+                    value_render_option=value_render_option,
+                    return_as_objects=return_as_objects,
+                )
+                if result is not None:
+                    return result
+
         payload = await self.values_get(
             spreadsheet_id,
             range_name,
@@ -72,16 +100,9 @@ class LookupSpreadsheetRows(GoogleSheetsBaseAction):
                 raise ValueError(
                     "A header row is required when lookup_column is a string name"
                 )
-            comparison = lookup_column if case_sensitive else lookup_column.casefold()
-            column_index = None
-            for idx, name in enumerate(header):
-                if name is None:
-                    continue
-                candidate = str(name)
-                candidate = candidate if case_sensitive else candidate.casefold()
-                if candidate == comparison:
-                    column_index = idx
-                    break
+            column_index = find_header_column(
+                header, lookup_column, case_sensitive=case_sensitive
+            )
             if column_index is None:
                 raise ValueError(
                     f"Column '{lookup_column}' was not found in the header row"
@@ -118,3 +139,90 @@ class LookupSpreadsheetRows(GoogleSheetsBaseAction):
             "range": payload.get("range"),
             "majorDimension": payload.get("majorDimension"),
         }
+
+    async def _indexed_lookup(
+        self,
+        spreadsheet_id: str,
+        index: ColumnIndex,
+        lookup_value: Any,
+        *,
+        value_render_option: str | None,
+        return_as_objects: bool | None,
+    ) -> MutableMapping[str, Any] | None:
+        header = index.header
+        if return_as_objects is None:
+            return_as_objects = header is not None
+        row_numbers = index.lookup(lookup_value)
+        if not row_numbers and await self._rows_added_below(
+            spreadsheet_id, index, value_render_option=value_render_option
+        ):
+            # Someone else appended rows since the build; rescan the range.
+            self.provider.column_indexes().discard(index)
+            return None
+        matches: list[Any] = []
+        if row_numbers:
+            # One read spanning every match: whole rows, cut to the range.
+            first = index.sheet_row(row_numbers[0])
+            payload = await self.values_get(
+                spreadsheet_id,
+                format_a1_range(
+                    index.range.sheet,
+                    None,
+                    first,
+                    None,
+                    index.sheet_row(row_numbers[-1]),
+                ),
+                major_dimension="ROWS",
+                value_render_option=value_render_option,
+            )
+            rows = payload.get("values")
+            if not isinstance(rows, list):
+                rows = []
+            target = index.normalize(lookup_value)
+            position = index.column - index.range.first_column
+            for number in row_numbers:
+                offset = index.sheet_row(number) - first
+                row = index.range.slice_row(rows[offset]) if offset < len(rows) else []
+                if position >= len(row) or index.normalize(row[position]) != target:
+                    # The sheet changed outside this provider since the build.
+                    self.provider.column_indexes().discard(index)
+                    return None
+                matches.append(
+                    _coerce_match_row(row, header, return_as_objects=return_as_objects)
+                )
+        return {
+            "matches": matches,
+            "header": list(header) if header is not None else None,
+            "matched_row_numbers": row_numbers,
+            "range": index.range.to_a1(),
+            "majorDimension": "ROWS",
+        }
+
+    async def _rows_added_below(
+        self,
+        spreadsheet_id: str,
+        index: ColumnIndex,
+        *,
+        value_render_option: str | None,
+    ) -> bool:
+        """Return whether the lookup column has values below ``index.last_row``."""
+        end_row = index.range.end_row
+        if end_row is not None and index.last_row >= end_row:
+            return False
+        payload = await self.values_get(
+            spreadsheet_id,
+            format_a1_range(
+                index.range.sheet,
+                index.column,
+                index.last_row + 1,
+                index.column,
+                end_row,
+            ),
+            major_dimension="COLUMNS",
+            value_render_option=value_render_option,
+        )
+        columns = payload.get("values")
+        return isinstance(columns, list) and any(
+            isinstance(column, list) and any(index.normalize(cell) for cell in column)
+            for column in columns
+        )
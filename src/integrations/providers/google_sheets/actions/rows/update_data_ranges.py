@@ -0,0 +1,49 @@
+"""Action for updating several ranges in one request."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, MutableMapping, Sequence
+
+from ..google_sheets_base_action import GoogleSheetsBaseAction
+
+
+class UpdateDataRanges(GoogleSheetsBaseAction):
+    """Write values to several ranges at once.
+
+    ``data`` maps A1 ranges to rows, or lists ``{"range": ..., "values": ...}``
+    entries. Entries keyed by ``"dataFilter"`` instead of ``"range"`` are sent
+    to ``values:batchUpdateByDataFilter``; the two kinds cannot be mixed.
+    """
+
+    async def __call__(
+        self,
+        spreadsheet_id: str,
+        data: Mapping[str, Sequence[Sequence[Any]]] | Sequence[Mapping[str, Any]],
+        *,
+        value_input_option: str = "USER_ENTERED",
+        include_values_in_response: bool | None = None,
+        response_value_render_option: str | None = None,
+    ) -> MutableMapping[str, Any]:
+        if isinstance(data, Mapping):
+            entries = [
+                {"range": range_name, "values": values}
+                for range_name, values in data.items()
+            ]
+        else:
+            entries = [dict(item) for item in data]
+        if not entries:
+            raise ValueError("data must contain at least one range")
+
+        filtered = ["dataFilter" in entry for entry in entries]
+        if any(filtered) and not all(filtered):
+            raise ValueError("Cannot mix A1 ranges and data filters in one update")
+        options = {
+            "value_input_option": value_input_option,
+            "include_values_in_response": include_values_in_response,
+            "response_value_render_option": response_value_render_option,
+        }
+        if all(filtered):
+            return await self.values_batch_update_by_data_filter(
+                spreadsheet_id, entries, **options
+            )
+        return await self.values_batch_update(spreadsheet_id, entries, **options)
@@ -0,0 +1,47 @@
+"""Action for updating many rows by their numeric identifiers."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Mapping, MutableMapping, Sequence
+
+from ...utils import consecutive_runs
+from ..google_sheets_base_action import GoogleSheetsBaseAction
+
+
+class UpdateRowsById(GoogleSheetsBaseAction):
+    """Overwrite many rows, addressed by row number (1-indexed), in one request.
+
+    Each row is written from column A. Consecutive rows are sent as a single
+    range of one ``values:batchUpdate``; a row number given twice keeps its
+    last values.
+    """
+
+    async def __call__(
+        self,
+        spreadsheet_id: str,
+        sheet_title: str,
+        rows: Mapping[int, Sequence[Any]] | Iterable[tuple[int, Sequence[Any]]],
+        *,
+        value_input_option: str = "USER_ENTERED",
+        include_values_in_response: bool | None = None,
+    ) -> MutableMapping[str, Any]:
+        items = rows.items() if isinstance(rows, Mapping) else rows
+        by_number = {number: list(row) for number, row in items}
+        if not by_number:
+            raise ValueError("rows must contain at least one row")
+        if any(number <= 0 for number in by_number):
+            raise ValueError("row numbers must be greater than zero")
+
+        data = [
+            {
+                "range": f"{sheet_title}!{first}:{last}",
+                "values": [by_number[number] for number in range(first, last + 1)],
+            }
+            for first, last in consecutive_runs(by_number)
+        ]
+        return await self.values_batch_update(
+            spreadsheet_id,
+            data,
+            value_input_option=value_input_option,
+            include_values_in_response=include_values_in_response,
+        )
@@ -24,6 +24,7 @@ class CopyWorksheet(GoogleSheetsBaseAction):
             json={"destinationSpreadsheetId": destination_spreadsheet_id},
         )
         copied = self.provider.process_httpx_response(response)
+        self.provider.worksheet_cache().add(destination_spreadsheet_id, copied)
 
         if new_sheet_name:
             new_sheet_id = copied.get("sheetId")
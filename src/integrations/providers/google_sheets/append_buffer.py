@@ -0,0 +1,232 @@
+"""Write-coalescing buffer for single-row appends."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, MutableMapping, Sequence
+from typing import Any
+
+from .utils import format_a1_range, parse_a1_range
+
+DEFAULT_MAX_ROWS = 500
+DEFAULT_MAX_DELAY = 1.0
+
+# (spreadsheet_id, range_name, value_input_option, insert_data_option)
+BufferKey = tuple[str, str, str, str | None]
+
+
+class _Batch:
+    __slots__ = ("futures", "rows", "timer")
+
+    def __init__(self) -> None:
+        self.rows: list[list[Any]] = []
+        self.futures: list[asyncio.Future[MutableMapping[str, Any]]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class AppendBuffer:
+    """Collect appended rows and send them as one ``values:append`` per batch.
+
+    ``append`` is called as ``append(spreadsheet_id, range_name, rows, *,
+    value_input_option, insert_data_option)`` and returns the API response.
+
+    Rows are buffered per spreadsheet, range and input options. A batch is
+    sent once it holds ``max_rows`` rows, ``max_delay`` seconds after its first
+    row arrived, on :meth:`flush`, or on :meth:`aclose`. Batches for the same
+    range are sent one after another, so rows land in the order they were
+    submitted.
+
+    Every row gets its own future, resolved with an append response shaped
+    like the API's but describing only that row (its ``updates.updatedRange``
+    is the row's own range). A failed batch fails every future in it.
+    """
+
+    def __init__(
+        self,
+        append: Callable[..., Awaitable[Mapping[str, Any]]],
+        *,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ) -> None:
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1")
+        self._append = append
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self._batches: dict[BufferKey, _Batch] = {}
+        self._locks: dict[BufferKey, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self.rows = 0
+        self.flushes = 0
+        self.failed = 0
+
+    def __len__(self) -> int:
+        """Return the number of rows waiting to be sent."""
+        return sum(len(batch.rows) for batch in self._batches.values())
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        row: Sequence[Any],
+        *,
+        value_input_option: str = "USER_ENTERED",
+        insert_data_option: str | None = None,
+    ) -> asyncio.Future[MutableMapping[str, Any]]:
+        """Buffer ``row`` and return a future for its append response."""
+        if self._closed:
+            raise RuntimeError("AppendBuffer is closed")
+        loop = asyncio.get_running_loop()
+        key = (spreadsheet_id, range_name, value_input_option, insert_data_option)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch()
+            batch.timer = loop.call_later(self.max_delay, self._flush_soon, key, batch)
+        future: asyncio.Future[MutableMapping[str, Any]] = loop.create_future()
+        future.add_done_callback(_retrieve_exception)
+        batch.rows.append(list(row))
+        batch.futures.append(future)
+        if len(batch.rows) >= self.max_rows:
+            self._flush_soon(key, batch)
+        return future
+
+    async def append(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        row: Sequence[Any],
+        *,
+        value_input_option: str = "USER_ENTERED",
+        insert_data_option: str | None = None,
+    ) -> MutableMapping[str, Any]:
+        """Buffer ``row`` and wait for the batch holding it to be sent."""
+        future = self.submit(
+            spreadsheet_id,
+            range_name,
+            row,
+            value_input_option=value_input_option,
+            insert_data_option=insert_data_option,
+        )
+        # Shielded: a cancelled caller does not pull its row out of the batch.
+        return await asyncio.shield(future)
+
+    async def flush(self) -> int:
+        """Send every buffered row now; return how many rows were pending.
+
+        Waits for batches already being sent as well. Failures are reported
+        through the rows' futures, not raised here.
+        """
+        pending = len(self)
+        sends = [self._send(key, batch) for key, batch in self._take_all()]
+        await asyncio.gather(*sends, *list(self._tasks))
+        return pending
+
+    async def aclose(self) -> None:
+        """Stop accepting rows and flush what is buffered."""
+        self._closed = True
+        await self.flush()
+
+    def _flush_soon(self, key: BufferKey, batch: _Batch) -> None:
+        if self._batches.get(key) is not batch:
+            return
+        self._take(key)
+        task = asyncio.get_running_loop().create_task(self._send(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _take(self, key: BufferKey) -> _Batch:
+        batch = self._batches.pop(key)
+        if batch.timer is not None:
+            batch.timer.cancel()
+        return batch
+
+    def _take_all(self) -> list[tuple[BufferKey, _Batch]]:
+        return [(key, self._take(key)) for key in list(self._batches)]
+
+    async def _send(self, key: BufferKey, batch: _Batch) -> None:
+        spreadsheet_id, range_name, value_input_option, insert_data_option = key
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            try:
+                result = await self._append(
+                    spreadsheet_id,
+                    range_name,
+                    batch.rows,
+                    value_input_option=value_input_option,
+                    insert_data_option=insert_data_option,
+                )
+                responses = split_append_result(result, batch.rows)
+            except BaseException as exc:
+                self.failed += len(batch.rows)
+                for future in batch.futures:
+                    if future.done():
+                        continue
+                    if isinstance(exc, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(exc)
+                if not isinstance(exc, Exception):
+                    raise
+                return
+        self.flushes += 1
+        self.rows += len(batch.rows)
+        for future, response in zip(batch.futures, responses, strict=True):
+            if not future.done():
+                future.set_result(response)
+
+
+def split_append_result(
+    result: Mapping[str, Any], rows: Sequence[Sequence[Any]]
+) -> list[MutableMapping[str, Any]]:
+    """Split a ``values:append`` response into one response per appended row."""
+    updates = result.get("updates")
+    if not isinstance(updates, Mapping):
+        updates = {}
+    try:
+        written = parse_a1_range(updates["updatedRange"])
+    except (KeyError, AttributeError, ValueError):
+        written = None
+
+    responses: list[MutableMapping[str, Any]] = []
+    for offset, row in enumerate(rows):
+        row_updates: dict[str, Any] = {}
+        if "spreadsheetId" in updates:
+            row_updates["spreadsheetId"] = updates["spreadsheetId"]
+        if written is not None and written.start_row is not None:
+            sheet_row = written.start_row + offset
+            first_column = written.first_column
+            row_updates["updatedRange"] = format_a1_range(
+                written.sheet,
+                first_column,
+                sheet_row,
+                first_column + max(len(row), 1) - 1,
+                sheet_row,
+            )
+        row_updates.update(
+            updatedRows=1, updatedColumns=len(row), updatedCells=len(row)
+        )
+        response: dict[str, Any] = {
+            key: result[key] for key in ("spreadsheetId", "tableRange") if key in result
+        }
+        response["updates"] = row_updates
+        responses.append(response)
+    return responses
+
+
+def _retrieve_exception(future: asyncio.Future[Any]) -> None:
+    # Mark the exception retrieved even if the caller never awaits the future.
+    if not future.cancelled():
+        future.exception()
+
+
+__all__ = [
+    "DEFAULT_MAX_DELAY",
+    "DEFAULT_MAX_ROWS",
+    "AppendBuffer",
+    "split_append_result",
+]
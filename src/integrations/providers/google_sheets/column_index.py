@@ -0,0 +1,276 @@
+"""Opt-in hash indexes over one column of a worksheet range."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any
+
+from ...core.singleflight import RequestCoalescer
+from .utils import A1Range
+
+DEFAULT_COLUMN_INDEX_TTL = 300.0
+DEFAULT_MAX_INDEXES = 64
+
+# (spreadsheet_id, range_name, lookup_column, case_sensitive, use_header_row,
+#  value_render_option)
+ColumnIndexKey = tuple[str, str, Hashable, bool, bool, str | None]
+
+
+def normalize_lookup_value(value: Any, *, case_sensitive: bool) -> str:
+    """Return the form lookups compare: ``str(value)``, casefolded unless asked."""
+    text = "" if value is None else str(value)
+    return text if case_sensitive else text.casefold()
+
+
+def find_header_column(
+    header: Sequence[Any], name: str, *, case_sensitive: bool
+) -> int | None:
+    """Return the position of column ``name`` in ``header``, if present."""
+    comparison = name if case_sensitive else name.casefold()
+    for position, cell in enumerate(header):
+        if cell is None:
+            continue
+        candidate = str(cell) if case_sensitive else str(cell).casefold()
+        if candidate == comparison:
+            return position
+    return None
+
+
+class ColumnIndex:
+    """Rows of a worksheet range grouped by the value in one lookup column.
+
+    ``column`` is the sheet's 1-based column number and rows are kept as sheet
+    row numbers; :meth:`lookup` converts them to the 1-based positions within
+    ``range`` that ``LookupSpreadsheetRows`` reports (the header, when used,
+    is row 1). ``last_row`` is the last row the index has seen, used to notice
+    rows appended by someone else.
+
+    ``lock`` serialises find-or-create on this index so concurrent callers
+    cannot both miss and append the same key.
+    """
+
+    def __init__(
+        self,
+        spreadsheet_id: str,
+        range_: A1Range,
+        column: int,
+        *,
+        header: list[Any] | None,
+        case_sensitive: bool,
+        data_start_row: int,
+    ) -> None:
+        self.spreadsheet_id = spreadsheet_id
+        self.range = range_
+        self.column = column
+        self.header = header
+        self.case_sensitive = case_sensitive
+        self.data_start_row = data_start_row
+        self.last_row = data_start_row - 1
+        self.lock = asyncio.Lock()
+        self._rows: dict[str, list[int]] = {}
+        self._values: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def normalize(self, value: Any) -> str:
+        return normalize_lookup_value(value, case_sensitive=self.case_sensitive)
+
+    def lookup(self, value: Any) -> list[int]:
+        """Return the range-relative row numbers holding ``value``, in order."""
+        first_row = self.range.first_row
+        rows = self._rows.get(self.normalize(value), ())
+        return [row - first_row + 1 for row in sorted(rows)]
+
+    def sheet_row(self, row_number: int) -> int:
+        """Convert a range-relative row number back to the sheet's row number."""
+        return self.range.first_row + row_number - 1
+
+    def load(self, values: Sequence[Any]) -> None:
+        """Index ``values``, the lookup column read from ``data_start_row`` down."""
+        for offset, value in enumerate(values):
+            self.record(self.data_start_row + offset, value)
+        self.last_row = max(self.last_row, self.data_start_row + len(values) - 1)
+
+    def record(self, row: int, value: Any) -> None:
+        """Set the lookup cell of sheet row ``row`` to ``value``."""
+        previous = self._values.pop(row, None)
+        if previous is not None:
+            rows = self._rows[previous]
+            rows.remove(row)
+            if not rows:
+                del self._rows[previous]
+        normalized = self.normalize(value)
+        if normalized:
+            self._values[row] = normalized
+            self._rows.setdefault(normalized, []).append(row)
+
+    def apply_write(
+        self,
+        written: A1Range,
+        values: Sequence[Sequence[Any]],
+        *,
+        appended: bool,
+    ) -> bool:
+        """Apply rows written at ``written``; return False if the index is stale.
+
+        The index goes stale when an append lands below a gap (rows were
+        added by someone else since it was built), when the write's sheet is
+        ambiguous, or when a formula is written to the lookup column.
+        """
+        if not _same_sheet(written.sheet, self.range.sheet):
+            return written.sheet is not None and self.range.sheet is not None
+        start_row = written.first_row
+        if appended and start_row > self.last_row + 1:
+            return False
+        offset = self.column - written.first_column
+        for position, row in enumerate(values):
+            sheet_row = start_row + position
+            if (
+                not self.range.contains_row(sheet_row)
+                or sheet_row < self.data_start_row
+            ):
+                continue
+            if appended:
+                self.last_row = max(self.last_row, sheet_row)
+            if not 0 <= offset < len(row):
+                # Cells past the end of a written row are left unchanged.
+                continue
+            value = row[offset]
+            if isinstance(value, str) and value.startswith("="):
+                return False
+            self.record(sheet_row, value)
+        return True
+
+
+class ColumnIndexCache:
+    """Registry of the :class:`ColumnIndex` objects built for a provider.
+
+    Indexes are keyed by spreadsheet, range, lookup column and comparison
+    options, expire ``ttl`` seconds after they are built and are capped at
+    ``max_indexes`` (least recently used first out). Concurrent builds of the
+    same index share one load. Writes made through the provider are applied
+    with :meth:`record_write`; anything that may have moved or rewritten rows
+    calls :meth:`invalidate`.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_COLUMN_INDEX_TTL,
+        max_indexes: int = DEFAULT_MAX_INDEXES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_indexes = max_indexes
+        self._clock = clock
+        self._entries: OrderedDict[ColumnIndexKey, tuple[float, ColumnIndex]] = (
+            OrderedDict()
+        )
+        # Marker per build in flight; a write to the spreadsheet removes it so
+        # an index that may have missed the write is not cached.
+        self._pending: dict[ColumnIndexKey, object] = {}
+        self._builds: RequestCoalescer[ColumnIndex | None] = RequestCoalescer()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    async def get(
+        self,
+        key: ColumnIndexKey,
+        build: Callable[[], Awaitable[ColumnIndex | None]],
+    ) -> ColumnIndex | None:
+        """Return the index for ``key``, calling ``build`` when it is missing.
+
+        ``build`` may return ``None`` when the range cannot be indexed; that
+        answer is not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+        self.misses += 1
+
+        async def load() -> ColumnIndex | None:
+            marker = self._pending[key] = object()
+            try:
+                index = await build()
+            finally:
+                current = self._pending.pop(key, None)
+            if index is not None and current is marker:
+                self._store(key, index)
+            return index
+
+        return await self._builds.do(key, load)
+
+    def record_write(
+        self,
+        spreadsheet_id: str,
+        written: A1Range,
+        values: Sequence[Sequence[Any]],
+        *,
+        appended: bool = False,
+    ) -> None:
+        """Apply values written to ``spreadsheet_id`` at ``written``."""
+        self._drop_pending(spreadsheet_id)
+        for key, (_, index) in list(self._entries.items()):
+            if key[0] != spreadsheet_id:
+                continue
+            if not index.apply_write(written, values, appended=appended):
+                del self._entries[key]
+
+    def invalidate(self, spreadsheet_id: str | None = None) -> None:
+        """Drop the indexes of ``spreadsheet_id``, or every index."""
+        if spreadsheet_id is None:
+            self._entries.clear()
+            self._pending.clear()
+            return
+        self._drop_pending(spreadsheet_id)
+        for key in [key for key in self._entries if key[0] == spreadsheet_id]:
+            del self._entries[key]
+
+    def discard(self, index: ColumnIndex) -> None:
+        """Drop ``index`` after it was found to disagree with the sheet."""
+        for key, (_, cached) in list(self._entries.items()):
+            if cached is index:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _drop_pending(self, spreadsheet_id: str) -> None:
+        for key in [key for key in self._pending if key[0] == spreadsheet_id]:
+            del self._pending[key]
+
+    def _store(self, key: ColumnIndexKey, index: ColumnIndex) -> None:
+        if not self.ttl:
+            return
+        self._entries[key] = (self._clock() + self.ttl, index)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_indexes:
+            self._entries.popitem(last=False)
+
+
+def _same_sheet(first: str | None, second: str | None) -> bool:
+    if first is None or second is None:
+        return first is second
+    return first.casefold() == second.casefold()
+
+
+__all__ = [
+    "DEFAULT_COLUMN_INDEX_TTL",
+    "DEFAULT_MAX_INDEXES",
+    "ColumnIndex",
+    "ColumnIndexCache",
+    "find_header_column",
+    "normalize_lookup_value",
+]
@@ -6,9 +6,18 @@ from typing import Any, Callable, Dict, Mapping, MutableMapping
 
 import httpx
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     ChangeSheetProperties,
+    ClearDataRanges,
     ClearSpreadsheetRows,
     CopyRange,
     CopyWorksheet,
@@ -22,29 +31,44 @@ from .actions import (
     DeleteSheet,
     DeleteSpreadsheetRows,
     FindOrCreateRow,
+    FindOrCreateRows,
     FindOrCreateWorksheet,
     FindWorksheet,
     FormatCellRange,
     FormatSpreadsheetRow,
     GetDataRange,
+    GetDataRanges,
     GetManySpreadsheetRows,
     GetRowById,
+    GetRowsById,
     GetSpreadsheetById,
     LookupSpreadsheetRow,
     LookupSpreadsheetRows,
     RenameSheet,
     SetDataValidation,
     SortRange,
+    UpdateDataRanges,
+    UpdateRowsById,
     UpdateSpreadsheetRow,
     UpdateSpreadsheetRows,
 )
+from .append_buffer import AppendBuffer
+from .column_index import ColumnIndexCache
 from .google_sheets_settings import GoogleSheetsSettings
+from .worksheet_cache import WorksheetCache
 
 
 class GoogleSheetsProvider(HttpxClientMixin, BaseProvider[GoogleSheetsSettings]):
     """Provider exposing common Google Sheets operations."""
 
     settings_class = GoogleSheetsSettings
+    shares_transport = True
+    default_retry_policy = RetryPolicy(
+        max_attempts=5, backoff_base=1.0, backoff_max=32.0
+    )
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_minute(60, burst=10),
+    )
 
     create_spreadsheet: CreateSpreadsheet
     create_spreadsheet_column: CreateSpreadsheetColumn
@@ -74,8 +98,14 @@ class GoogleSheetsProvider(HttpxClientMixin, BaseProvider[GoogleSheetsSettings])
     lookup_spreadsheet_rows: LookupSpreadsheetRows
     lookup_spreadsheet_row: LookupSpreadsheetRow
     find_or_create_row: FindOrCreateRow
+    find_or_create_rows: FindOrCreateRows
     get_data_range: GetDataRange
     get_row_by_id: GetRowById
+    get_rows_by_id: GetRowsById
+    update_rows_by_id: UpdateRowsById
+    get_data_ranges: GetDataRanges
+    update_data_ranges: UpdateDataRanges
+    clear_data_ranges: ClearDataRanges
 
     create_spreadsheet = action(
         CreateSpreadsheet,
@@ -190,6 +220,10 @@ class GoogleSheetsProvider(HttpxClientMixin, BaseProvider[GoogleSheetsSettings])
         FindOrCreateRow,
         description="Find a row or create it if none exists.",
     )
+    find_or_create_rows = action(
+        FindOrCreateRows,
+        description="Update or append many rows keyed by a lookup column.",
+    )
     get_data_range = action(
         GetDataRange,
         description="Get the values for a specific range.",
@@ -198,6 +232,74 @@ class GoogleSheetsProvider(HttpxClientMixin, BaseProvider[GoogleSheetsSettings])
         GetRowById,
         description="Retrieve a row by its row number.",
     )
+    get_rows_by_id = action(
+        GetRowsById,
+        description="Retrieve many rows by row number in one request.",
+    )
+    update_rows_by_id = action(
+        UpdateRowsById,
+        description="Overwrite many rows by row number in one request.",
+    )
+    get_data_ranges = action(
+        GetDataRanges,
+        description="Get the values for several ranges or data filters at once.",
+    )
+    update_data_ranges = action(
+        UpdateDataRanges,
+        description="Write values to several ranges or data filters at once.",
+    )
+    clear_data_ranges = action(
+        ClearDataRanges,
+        description="Clear several ranges or data filters at once.",
+    )
+
+    def worksheet_cache(self) -> WorksheetCache:
+        """Return the worksheet metadata cache shared by this provider's actions.
+
+        ``worksheet_cache_ttl`` sets how long entries live; ``0`` or ``None``
+        disables caching.
+        """
+        cache = self.__dict__.get("_worksheet_cache")
+        if cache is None:
+            cache = WorksheetCache(ttl=self.settings.worksheet_cache_ttl or 0)
+            self.__dict__["_worksheet_cache"] = cache
+        return cache
+
+    def column_indexes(self) -> ColumnIndexCache:
+        """Return the lookup-column indexes built by ``use_index`` lookups.
+
+        ``column_index_ttl`` bounds how long an index is trusted without being
+        rebuilt; ``0`` or ``None`` rebuilds it on every lookup.
+        """
+        cache = self.__dict__.get("_column_indexes")
+        if cache is None:
+            cache = ColumnIndexCache(ttl=self.settings.column_index_ttl or 0)
+            self.__dict__["_column_indexes"] = cache
+        return cache
+
+    def append_buffer(self) -> AppendBuffer:
+        """Return the buffer batching ``create_spreadsheet_row(..., buffered=True)``.
+
+        Batches are sent at ``append_buffer_max_rows`` rows or
+        ``append_buffer_max_delay`` seconds, whichever comes first, and when
+        the provider is closed.
+        """
+        buffer = self.__dict__.get("_append_buffer")
+        if buffer is None or buffer.closed:
+            buffer = AppendBuffer(
+                self.create_multiple_spreadsheet_rows,
+                max_rows=self.settings.append_buffer_max_rows,
+                max_delay=self.settings.append_buffer_max_delay,
+            )
+            self.__dict__["_append_buffer"] = buffer
+        return buffer
+
+    async def aclose(self) -> None:
+        """Flush buffered appends, then close pooled clients."""
+        buffer = self.__dict__.pop("_append_buffer", None)
+        if buffer is not None:
+            await buffer.aclose()
+        await super().aclose()
 
     def httpx_headers(self) -> Dict[str, str]:
         settings = self.settings
@@ -45,3 +45,23 @@ class GoogleSheetsSettings(ProviderSettings):
             "GOOGLE_SHEETS_SPREADSHEET_ID",
         ),
     )
+    worksheet_cache_ttl: float | None = Field(
+        default=300.0,
+        ge=0,
+        validation_alias="GOOGLE_SHEETS_WORKSHEET_CACHE_TTL",
+    )
+    column_index_ttl: float | None = Field(
+        default=300.0,
+        ge=0,
+        validation_alias="GOOGLE_SHEETS_COLUMN_INDEX_TTL",
+    )
+    append_buffer_max_rows: int = Field(
+        default=500,
+        ge=1,
+        validation_alias="GOOGLE_SHEETS_APPEND_BUFFER_MAX_ROWS",
+    )
+    append_buffer_max_delay: float = Field(
+        default=1.0,
+        ge=0,
+        validation_alias="GOOGLE_SHEETS_APPEND_BUFFER_MAX_DELAY",
+    )
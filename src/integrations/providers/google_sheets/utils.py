@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable, Sequence
+from typing import Any
 from urllib.parse import quote
 
 
@@ -10,3 +13,152 @@ def encode_a1_range(range_name: str) -> str:
 
     safe_chars = "!:'$,-ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_"
     return quote(range_name, safe=safe_chars)
+
+
+_CELL = re.compile(r"^\$?([A-Za-z]{0,3})\$?(\d*)$")
+
+
+class A1Range:
+    """Parsed A1 range: sheet title plus 1-based column and row bounds.
+
+    Missing bounds are ``None`` (``A:C`` has no rows, ``2:5`` no columns, and
+    a bare sheet title covers the whole grid).
+    """
+
+    __slots__ = ("end_column", "end_row", "sheet", "start_column", "start_row")
+
+    def __init__(
+        self,
+        sheet: str | None,
+        start_column: int | None = None,
+        start_row: int | None = None,
+        end_column: int | None = None,
+        end_row: int | None = None,
+    ) -> None:
+        self.sheet = sheet
+        self.start_column = start_column
+        self.start_row = start_row
+        self.end_column = end_column
+        self.end_row = end_row
+
+    def __repr__(self) -> str:
+        return f"A1Range({self.to_a1()!r})"
+
+    @property
+    def first_column(self) -> int:
+        return self.start_column or 1
+
+    @property
+    def first_row(self) -> int:
+        return self.start_row or 1
+
+    def contains_row(self, row: int) -> bool:
+        return self.first_row <= row and (self.end_row is None or row <= self.end_row)
+
+    def contains_column(self, column: int) -> bool:
+        return self.first_column <= column and (
+            self.end_column is None or column <= self.end_column
+        )
+
+    def slice_row(self, row: Sequence[Any]) -> list[Any]:
+        """Return the cells of a whole sheet row that fall within the range.
+
+        Trailing empty cells are dropped, as the API does for range reads.
+        """
+        cells = list(row[self.first_column - 1 : self.end_column])
+        while cells and cells[-1] in ("", None):
+            cells.pop()
+        return cells
+
+    def to_a1(self) -> str:
+        return format_a1_range(
+            self.sheet,
+            self.start_column,
+            self.start_row,
+            self.end_column,
+            self.end_row,
+        )
+
+
+def parse_a1_range(range_name: str) -> A1Range:
+    """Parse ``range_name`` (e.g. ``'My Sheet'!B2:D``) into an :class:`A1Range`."""
+    sheet: str | None
+    sheet, separator, cells = range_name.rpartition("!")
+    if not separator:
+        if _CELL.match(range_name.split(":")[0]) and any(
+            char.isdigit() for char in range_name
+        ):
+            sheet, cells = None, range_name
+        else:
+            return A1Range(_unquote_sheet(range_name))
+    else:
+        sheet = _unquote_sheet(sheet)
+
+    start, _, end = cells.partition(":")
+    start_match = _CELL.match(start)
+    end_match = _CELL.match(end or start)
+    if start_match is None or end_match is None:
+        raise ValueError(f"Unsupported A1 range '{range_name}'")
+    start_column = column_number(start_match.group(1)) or None
+    start_row = int(start_match.group(2)) if start_match.group(2) else None
+    end_column = column_number(end_match.group(1)) or None
+    end_row = int(end_match.group(2)) if end_match.group(2) else None
+    if not end:
+        # A single cell is its own end.
+        end_column, end_row = start_column, start_row
+    return A1Range(sheet, start_column, start_row, end_column, end_row)
+
+
+def format_a1_range(
+    sheet: str | None,
+    start_column: int | None,
+    start_row: int | None,
+    end_column: int | None = None,
+    end_row: int | None = None,
+) -> str:
+    """Build an A1 range; ``None`` bounds are left open."""
+    start = f"{column_letter(start_column) if start_column else ''}{start_row or ''}"
+    end = f"{column_letter(end_column) if end_column else ''}{end_row or ''}"
+    single_cell = end == start and bool(start_column and start_row)
+    cells = f"{start}:{end}" if end and not single_cell else start
+    if sheet is None:
+        return cells
+    quoted = "'" + sheet.replace("'", "''") + "'"
+    prefix = sheet if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", sheet) else quoted
+    return f"{prefix}!{cells}" if cells else prefix
+
+
+def column_number(letters: str) -> int:
+    """Return the 1-based index of column ``letters`` (``A`` -> 1); ``''`` -> 0."""
+    number = 0
+    for char in letters.upper():
+        number = number * 26 + (ord(char) - 64)
+    return number
+
+
+def column_letter(number: int) -> str:
+    """Return the column letters for 1-based ``number`` (1 -> ``A``)."""
+    if number < 1:
+        raise ValueError("column numbers start at 1")
+    letters = ""
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def consecutive_runs(numbers: Iterable[int]) -> list[tuple[int, int]]:
+    """Group ``numbers`` into sorted ``(first, last)`` runs of consecutive values."""
+    runs: list[tuple[int, int]] = []
+    for number in sorted(set(numbers)):
+        if runs and number == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], number)
+        else:
+            runs.append((number, number))
+    return runs
+
+
+def _unquote_sheet(sheet: str) -> str:
+    if len(sheet) >= 2 and sheet[0] == sheet[-1] == "'":
+        return sheet[1:-1].replace("''", "'")
+    return sheet
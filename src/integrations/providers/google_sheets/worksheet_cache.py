@@ -0,0 +1,220 @@
+"""Per-spreadsheet cache of worksheet metadata."""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+from ...core.singleflight import RequestCoalescer
+
+DEFAULT_WORKSHEET_TTL = 300.0
+DEFAULT_MAX_SPREADSHEETS = 256
+
+# Partial response mask for ``spreadsheets.get``: sheet properties only (title,
+# sheetId, index, grid size, ...), never cell data or formatting rules.
+WORKSHEET_FIELDS = "sheets.properties"
+
+SheetProperties = dict[str, Any]
+
+
+class WorksheetCache:
+    """Cache the worksheet properties of recently used spreadsheets.
+
+    Entries hold each sheet's ``properties`` as returned for
+    :data:`WORKSHEET_FIELDS` and expire after ``ttl`` seconds; at most
+    ``max_spreadsheets`` spreadsheets are kept, least recently used first out.
+    Concurrent loads of one spreadsheet share a single request. Writes made
+    through the provider patch the cached entry (:meth:`add`, :meth:`update`,
+    :meth:`remove`) or drop it (:meth:`invalidate`); a load that was in
+    flight during such a write is returned to its callers but not cached.
+
+    Lookups return copies, so callers may modify what they receive.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_WORKSHEET_TTL,
+        max_spreadsheets: int = DEFAULT_MAX_SPREADSHEETS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_spreadsheets = max_spreadsheets
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, list[SheetProperties]]] = (
+            OrderedDict()
+        )
+        # Marker per load in flight; a write removes it so the load's (possibly
+        # older) result is not cached.
+        self._pending: dict[str, object] = {}
+        self._loads: RequestCoalescer[list[SheetProperties]] = RequestCoalescer()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, spreadsheet_id: object) -> bool:
+        return spreadsheet_id in self._entries
+
+    async def worksheets(
+        self,
+        spreadsheet_id: str,
+        load: Callable[[], Awaitable[Mapping[str, Any]]],
+        *,
+        refresh: bool = False,
+    ) -> list[SheetProperties]:
+        """Return the spreadsheet's sheet properties, calling ``load`` on a miss.
+
+        ``load`` must return a ``spreadsheets.get`` payload; only its
+        ``sheets[].properties`` are kept.
+        """
+        entry = self._entries.get(spreadsheet_id)
+        if entry is not None and not refresh and entry[0] > self._clock():
+            self.hits += 1
+            self._entries.move_to_end(spreadsheet_id)
+            return copy.deepcopy(entry[1])
+        self.misses += 1
+
+        async def fetch() -> list[SheetProperties]:
+            marker = self._pending[spreadsheet_id] = object()
+            try:
+                sheets = _sheet_properties(await load())
+            finally:
+                current = self._pending.pop(spreadsheet_id, None)
+            if current is marker:
+                self._store(spreadsheet_id, sheets)
+            return sheets
+
+        sheets = await self._loads.do(spreadsheet_id, fetch)
+        return copy.deepcopy(sheets)
+
+    def add(self, spreadsheet_id: str, properties: Mapping[str, Any]) -> None:
+        """Record a sheet created by ``addSheet``, ``duplicateSheet`` or ``copyTo``."""
+        sheets = self._mutate(spreadsheet_id)
+        if sheets is None:
+            return
+        # The API omits zero values, so a missing sheetId or index means 0.
+        sheet_id = properties.get("sheetId", 0)
+        index = properties.get("index", len(sheets))
+        sheets[:] = [item for item in sheets if item.get("sheetId", 0) != sheet_id]
+        for item in sheets:
+            if item.get("index", 0) >= index:
+                item["index"] = item.get("index", 0) + 1
+        sheets.append(copy.deepcopy(dict(properties)))
+        sheets[-1]["index"] = index
+        sheets.sort(key=lambda item: item.get("index", 0))
+
+    def update(
+        self,
+        spreadsheet_id: str,
+        properties: Mapping[str, Any],
+        fields: str,
+    ) -> None:
+        """Apply an ``updateSheetProperties`` request to the cached sheet."""
+        sheets = self._mutate(spreadsheet_id)
+        if sheets is None:
+            return
+        sheet_id = properties.get("sheetId", 0)
+        for item in sheets:
+            if item.get("sheetId", 0) != sheet_id:
+                continue
+            if fields.strip() == "*":
+                item.clear()
+                item.update(copy.deepcopy(dict(properties)))
+                item.setdefault("sheetId", sheet_id)
+            elif not _merge_fields(item, properties, fields):
+                self.invalidate(spreadsheet_id)
+            if "index" in fields or fields.strip() == "*":
+                # Moving one sheet shifts the others; reload to get them right.
+                self.invalidate(spreadsheet_id)
+            return
+        self.invalidate(spreadsheet_id)
+
+    def remove(self, spreadsheet_id: str, sheet_id: int) -> None:
+        """Forget a sheet removed by ``deleteSheet``."""
+        sheets = self._mutate(spreadsheet_id)
+        if sheets is None:
+            return
+        removed = [item for item in sheets if item.get("sheetId", 0) == sheet_id]
+        if not removed:
+            return
+        index = removed[0].get("index", 0)
+        sheets[:] = [item for item in sheets if item.get("sheetId", 0) != sheet_id]
+        for item in sheets:
+            if item.get("index", 0) > index:
+                item["index"] = item.get("index", 0) - 1
+
+    def invalidate(self, spreadsheet_id: str | None = None) -> None:
+        """Drop the entry for ``spreadsheet_id``, or every entry."""
+        if spreadsheet_id is None:
+            self._entries.clear()
+            self._pending.clear()
+            return
+        self._entries.pop(spreadsheet_id, None)
+        self._pending.pop(spreadsheet_id, None)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _mutate(self, spreadsheet_id: str) -> list[SheetProperties] | None:
+        self._pending.pop(spreadsheet_id, None)
+        entry = self._entries.get(spreadsheet_id)
+        return None if entry is None else entry[1]
+
+    def _store(self, spreadsheet_id: str, sheets: list[SheetProperties]) -> None:
+        if not self.ttl:
+            return
+        self._entries[spreadsheet_id] = (self._clock() + self.ttl, sheets)
+        self._entries.move_to_end(spreadsheet_id)
+        while len(self._entries) > self.max_spreadsheets:
+            self._entries.popitem(last=False)
+
+
+def _sheet_properties(spreadsheet: Mapping[str, Any]) -> list[SheetProperties]:
+    sheets = spreadsheet.get("sheets")
+    if not isinstance(sheets, Sequence):
+        return []
+    found: list[SheetProperties] = []
+    for sheet in sheets:
+        if not isinstance(sheet, Mapping):
+            continue
+        properties = sheet.get("properties")
+        if isinstance(properties, Mapping):
+            found.append(copy.deepcopy(dict(properties)))
+    return found
+
+
+def _merge_fields(
+    target: SheetProperties, source: Mapping[str, Any], fields: str
+) -> bool:
+    """Copy each dotted ``fields`` path from ``source``; False if one is unknown."""
+    for path in filter(None, (part.strip() for part in fields.split(","))):
+        *parents, leaf = path.split(".")
+        src: Any = source
+        dst = target
+        for name in parents:
+            src = src.get(name) if isinstance(src, Mapping) else None
+            child = dst.get(name)
+            if not isinstance(child, dict):
+                child = dst[name] = {}
+            dst = child
+        if leaf == "*":
+            return False
+        if isinstance(src, Mapping) and leaf in src:
+            dst[leaf] = copy.deepcopy(src[leaf])
+        else:
+            # Named in the mask but absent from the body: the API clears it.
+            dst.pop(leaf, None)
+    return True
+
+
+__all__ = [
+    "DEFAULT_MAX_SPREADSHEETS",
+    "DEFAULT_WORKSHEET_TTL",
+    "WORKSHEET_FIELDS",
+    "WorksheetCache",
+]
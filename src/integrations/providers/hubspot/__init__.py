@@ -1,9 +1,23 @@
 """HubSpot provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .hubspot_provider import HubspotProvider
-from .hubspot_settings import HubspotSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .hubspot_provider import HubspotProvider
+    from .hubspot_settings import HubspotSettings
+
+register_provider(
+    ProviderKey.HUBSPOT,
+    f"{__name__}.hubspot_provider:HubspotProvider",
+    settings=f"{__name__}.hubspot_settings:HubspotSettings",
+)
 
-register_provider(ProviderKey.HUBSPOT, HubspotProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {"HubspotProvider": ".hubspot_provider", "HubspotSettings": ".hubspot_settings"},
+)
 
 __all__ = ["HubspotProvider", "HubspotSettings"]
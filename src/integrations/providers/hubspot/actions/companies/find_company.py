@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from typing import Any, Iterable, Mapping, Sequence
 
-from ..hubspot_base_action import HubspotBaseAction
+from ..hubspot_base_action import HubspotSearchAction
 
 
-class FindCompany(HubspotBaseAction):
+class FindCompany(HubspotSearchAction):
     """Search for HubSpot companies."""
 
+    object_type = "companies"
+
     async def __call__(
         self,
         *,
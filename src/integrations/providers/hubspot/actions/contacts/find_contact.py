@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from typing import Any, Iterable, Mapping, Sequence
 
-from ..hubspot_base_action import HubspotBaseAction
+from ..hubspot_base_action import HubspotSearchAction
 
 
-class FindContact(HubspotBaseAction):
+class FindContact(HubspotSearchAction):
     """Search for HubSpot contacts using CRM search."""
 
+    object_type = "contacts"
+
     async def __call__(
         self,
         *,
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Iterable, Mapping, Sequence
 
-from ..hubspot_base_action import HubspotBaseAction
+from integrations.core import PageRequest
 
+from ..hubspot_base_action import HubspotSearchAction
 
-class FindCustomObject(HubspotBaseAction):
+
+class FindCustomObject(HubspotSearchAction):
     """Search for HubSpot custom objects."""
 
     async def __call__(
@@ -32,3 +34,26 @@ class FindCustomObject(HubspotBaseAction):
             after=after,
             sorts=sorts,
         )
+
+    def page_request(  # type: ignore[override]
+        self,
+        object_type: str,
+        *,
+        filters: Sequence[Mapping[str, Any]] | None = None,
+        filter_groups: Sequence[Mapping[str, Any]] | None = None,
+        query: str | None = None,
+        properties: Iterable[str] | None = None,
+        limit: int | None = None,
+        after: str | None = None,
+        sorts: Sequence[Mapping[str, Any]] | None = None,
+    ) -> PageRequest:
+        return self.search_request(
+            object_type,
+            filters=filters,
+            filter_groups=filter_groups,
+            query=query,
+            properties=properties,
+            limit=limit,
+            after=after,
+            sorts=sorts,
+        )
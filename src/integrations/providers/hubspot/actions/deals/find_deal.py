@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from typing import Any, Iterable, Mapping, Sequence
 
-from ..hubspot_base_action import HubspotBaseAction
+from ..hubspot_base_action import HubspotSearchAction
 
 
-class FindDeal(HubspotBaseAction):
+class FindDeal(HubspotSearchAction):
     """Search for HubSpot deals."""
 
+    object_type = "deals"
+
     async def __call__(
         self,
         *,
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 from collections.abc import Iterable, Mapping, Sequence
-from typing import Any, TYPE_CHECKING
+from typing import Any, ClassVar, TYPE_CHECKING
 
-from integrations.core.actions import BaseAction
+from integrations.core.actions import BaseAction, PaginatedAction
+from integrations.core.pagination import AfterPaginator, PageRequest
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..hubspot_provider import HubspotProvider
@@ -49,7 +50,7 @@ class HubspotBaseAction(BaseAction):
             path = f"{path}/{object_id}"
         return path
 
-    async def search_objects(
+    def search_request(
         self,
         object_type: str,
         *,
@@ -60,7 +61,7 @@ class HubspotBaseAction(BaseAction):
         limit: int | None = None,
         after: str | None = None,
         sorts: Sequence[Mapping[str, Any]] | None = None,
-    ) -> Any:
+    ) -> PageRequest:
         payload: dict[str, Any] = {}
         if filter_groups:
             payload["filterGroups"] = [dict(group) for group in filter_groups]
@@ -76,10 +77,40 @@ class HubspotBaseAction(BaseAction):
             payload["after"] = after
         if sorts:
             payload["sorts"] = [dict(sort) for sort in sorts]
+        return PageRequest(
+            method="POST",
+            url=f"{self.crm_object_path(object_type)}/search",
+            body=payload,
+            retry=True,
+        )
+
+    async def search_objects(
+        self,
+        object_type: str,
+        *,
+        filters: Sequence[Mapping[str, Any]] | None = None,
+        filter_groups: Sequence[Mapping[str, Any]] | None = None,
+        query: str | None = None,
+        properties: Iterable[str] | None = None,
+        limit: int | None = None,
+        after: str | None = None,
+        sorts: Sequence[Mapping[str, Any]] | None = None,
+    ) -> Any:
+        request = self.search_request(
+            object_type,
+            filters=filters,
+            filter_groups=filter_groups,
+            query=query,
+            properties=properties,
+            limit=limit,
+            after=after,
+            sorts=sorts,
+        )
         response = await self.provider.request(
-            "POST",
-            f"{self.crm_object_path(object_type)}/search",
-            json=payload,
+            request.method,
+            request.url,
+            json=request.body,
+            retry=request.retry,
         )
         return self.provider.process_httpx_response(response)
 
@@ -120,3 +151,41 @@ class HubspotBaseAction(BaseAction):
 
     def encode_json(self, payload: Mapping[str, Any]) -> str:
         return json.dumps(payload)
+
+
+class HubspotSearchAction(HubspotBaseAction, PaginatedAction):
+    """CRM search action whose results can be streamed via ``paging.next.after``."""
+
+    object_type: ClassVar[str]
+    # Search ``after`` cursors are result offsets, so pages can be planned from
+    # ``total``; the API stops paging at 10,000 results.
+    paginator = AfterPaginator(
+        location="body",
+        max_page_size=200,
+        offset_cursor=True,
+        total_path="total",
+        max_results=10_000,
+    )
+    default_prefetch = 2
+
+    def page_request(
+        self,
+        *,
+        filters: Sequence[Mapping[str, Any]] | None = None,
+        filter_groups: Sequence[Mapping[str, Any]] | None = None,
+        query: str | None = None,
+        properties: Iterable[str] | None = None,
+        limit: int | None = None,
+        after: str | None = None,
+        sorts: Sequence[Mapping[str, Any]] | None = None,
+    ) -> PageRequest:
+        return self.search_request(
+            self.object_type,
+            filters=filters,
+            filter_groups=filter_groups,
+            query=query,
+            properties=properties,
+            limit=limit,
+            after=after,
+            sorts=sorts,
+        )
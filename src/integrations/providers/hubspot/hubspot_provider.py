@@ -8,7 +8,17 @@ from typing import Any
 import httpx
 
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    CacheRule,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    ResponseCacheProfile,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     CreateCompany,
     CreateContact,
@@ -53,6 +63,14 @@ class HubspotProvider(HttpxClientMixin, BaseProvider[HubspotSettings]):
     """Provider exposing HubSpot CRM and CMS operations."""
 
     settings_class = HubspotSettings
+    default_retry_policy = RetryPolicy(backoff_base=1.0, backoff_max=10.0)
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit(requests=100, period=10.0, burst=10),
+        endpoints={"search": RateLimit.per_second(5, burst=5)},
+    )
+    default_cache_rules = ResponseCacheProfile(
+        rules=(CacheRule(pattern=r"^/crm/v3/owners/[^/]+$", ttl=0),),
+    )
 
     create_contact: CreateContact
     update_contact: UpdateContact
@@ -268,6 +286,11 @@ class HubspotProvider(HttpxClientMixin, BaseProvider[HubspotSettings]):
             return dict(payload)
         return {"value": payload}
 
+    def rate_limit_class(self, method: str, url: str) -> str | None:
+        if url.rstrip("/").endswith("/search"):
+            return "search"
+        return None
+
     def httpx_headers(self) -> Mapping[str, str]:
         headers: dict[str, str] = {}
         token = self.settings.access_token
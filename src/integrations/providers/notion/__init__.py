@@ -1,13 +1,23 @@
 """Notion provider exports."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .notion_provider import NotionProvider
+    from .notion_settings import NotionSettings
 
-from .notion_provider import NotionProvider
-from .notion_settings import NotionSettings
+register_provider(
+    ProviderKey.NOTION,
+    f"{__name__}.notion_provider:NotionProvider",
+    settings=f"{__name__}.notion_settings:NotionSettings",
+)
 
-register_provider(ProviderKey.NOTION, NotionProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {"NotionProvider": ".notion_provider", "NotionSettings": ".notion_settings"},
+)
 
-__all__ = [
-    "NotionProvider",
-    "NotionSettings",
-]
+__all__ = ["NotionProvider", "NotionSettings"]
@@ -6,7 +6,17 @@ from typing import Any, Dict
 
 import httpx
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    CacheRule,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    ResponseCacheProfile,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     AddComment,
     AddContentToPage,
@@ -26,6 +36,13 @@ class NotionProvider(HttpxClientMixin, BaseProvider[NotionSettings]):
     """Provider exposing Notion REST API operations."""
 
     settings_class = NotionSettings
+    default_retry_policy = RetryPolicy()
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_second(3, burst=6),
+    )
+    default_cache_rules = ResponseCacheProfile(
+        rules=(CacheRule(pattern=r"^/?databases/[^/]+$", ttl=0),),
+    )
 
     archive_database_item: ArchiveDatabaseItem
     create_database_item: CreateDatabaseItem
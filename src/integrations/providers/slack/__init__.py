@@ -1,9 +1,22 @@
 """Slack provider package."""
 
+from typing import TYPE_CHECKING
+
 from ...core import ProviderKey, register_provider
-from .slack_provider import SlackProvider
-from .slack_settings import SlackSettings
+from ...core.lazy import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .slack_provider import SlackProvider
+    from .slack_settings import SlackSettings
+
+register_provider(
+    ProviderKey.SLACK,
+    f"{__name__}.slack_provider:SlackProvider",
+    settings=f"{__name__}.slack_settings:SlackSettings",
+)
 
-register_provider(ProviderKey.SLACK, SlackProvider)
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"SlackProvider": ".slack_provider", "SlackSettings": ".slack_settings"}
+)
 
 __all__ = ["SlackProvider", "SlackSettings"]
@@ -4,16 +4,22 @@ from __future__ import annotations
 
 from typing import Any, TYPE_CHECKING
 
-from integrations.core import BaseAction
+from integrations.core import CursorPaginator, PageRequest, PaginatedAction
 
 if TYPE_CHECKING:  # pragma: no cover - avoids runtime import cycle
     from ...slack_provider import SlackProvider
 
 
-class RetrieveThreadMessages(BaseAction):
+class RetrieveThreadMessages(PaginatedAction):
     """Retrieve messages that belong to a Slack thread."""
 
     provider: "SlackProvider"
+    paginator = CursorPaginator(
+        items_path="messages",
+        cursor_path="response_metadata.next_cursor",
+        page_size_param="limit",
+        max_page_size=200,
+    )
 
     async def __call__(
         self,
@@ -23,6 +29,21 @@ class RetrieveThreadMessages(BaseAction):
         limit: int | None = None,
         cursor: str | None = None,
     ) -> Any:
+        payload = await self.fetch_page(
+            self.page_request(channel_id, thread_ts, limit=limit, cursor=cursor)
+        )
+        if isinstance(payload, dict):
+            return payload.get("messages", [])
+        return payload
+
+    def page_request(
+        self,
+        channel_id: str,
+        thread_ts: str,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> PageRequest:
         params: dict[str, Any] = {
             "channel": channel_id,
             "ts": thread_ts,
@@ -31,13 +52,4 @@ class RetrieveThreadMessages(BaseAction):
             params["limit"] = limit
         if cursor is not None:
             params["cursor"] = cursor
-
-        response = await self.provider.request(
-            "GET",
-            "/conversations.replies",
-            params=params,
-        )
-        payload = self.provider.process_httpx_response(response)
-        if isinstance(payload, dict):
-            return payload.get("messages", [])
-        return payload
+        return PageRequest(url="/conversations.replies", params=params)
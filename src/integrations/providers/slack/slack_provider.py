@@ -6,7 +6,15 @@ from typing import Any, Dict
 
 import httpx
 
-from ...core import BaseProvider, HttpxClientMixin, RawHttpRequestAction, action
+from ...core import (
+    BaseProvider,
+    HttpxClientMixin,
+    RateLimit,
+    RateLimitProfile,
+    RawHttpRequestAction,
+    RetryPolicy,
+    action,
+)
 from .actions import (
     AddReminder,
     ArchiveChannel,
@@ -26,11 +34,41 @@ from .actions import (
 )
 from .slack_settings import SlackSettings
 
+# Web API rate-limit tiers for the methods used by the bundled actions. Each
+# method has its own budget at its tier's rate.
+SLACK_METHOD_TIERS: Dict[str, str] = {
+    "chat.postMessage": "post_message",
+    "chat.delete": "tier3",
+    "conversations.archive": "tier2",
+    "conversations.create": "tier2",
+    "conversations.history": "tier3",
+    "conversations.invite": "tier3",
+    "conversations.leave": "tier3",
+    "conversations.members": "tier4",
+    "conversations.open": "tier3",
+    "conversations.replies": "tier3",
+    "reminders.add": "tier2",
+    "reminders.delete": "tier2",
+    "users.profile.set": "tier3",
+    "users.search": "tier2",
+}
+
 
 class SlackProvider(HttpxClientMixin, BaseProvider[SlackSettings]):
     """Provider exposing Slack Web API operations."""
 
     settings_class = SlackSettings
+    default_retry_policy = RetryPolicy(backoff_base=1.0)
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_minute(50, burst=10),
+        endpoints={
+            "tier1": RateLimit.per_minute(1, burst=1),
+            "tier2": RateLimit.per_minute(20, burst=5),
+            "tier3": RateLimit.per_minute(50, burst=10),
+            "tier4": RateLimit.per_minute(100, burst=20),
+            "post_message": RateLimit.per_second(1, burst=3),
+        },
+    )
 
     send_channel_message: SendChannelMessage
     send_direct_message: SendDirectMessage
@@ -115,6 +153,13 @@ class SlackProvider(HttpxClientMixin, BaseProvider[SlackSettings]):
         description="Send a raw Slack API request.",
     )
 
+    def rate_limit_class(self, method: str, url: str) -> str | None:
+        return SLACK_METHOD_TIERS.get(url.strip("/"))
+
+    def rate_limit_bucket(self, method: str, url: str) -> str:
+        # Slack meters each method on its own; the tier only sets the limit.
+        return url.strip("/")
+
     def httpx_headers(self) -> Dict[str, str]:
         token = self.settings.token
         if not token:
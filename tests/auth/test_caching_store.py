@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from integrations.auth.storage import CachingCredentialStore, InMemoryCredentialStore
+
+
+class SlowStore(InMemoryCredentialStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def get_many(self, keys):  # type: ignore[no-untyped-def]
+        self.batches.append([subject for _, subject in keys])
+        await self.release.wait()
+        return await super().get_many(keys)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_read_through_with_ttl_and_counters() -> None:
+    backend, clock = SlowStore(), Clock()
+    store = CachingCredentialStore(backend, ttl=30, clock=clock)
+    await backend.set("github", "user-1", {"access_token": "a"})
+
+    assert await store.get("github", "user-1") == {"access_token": "a"}
+    assert await store.get("github", "user-1") == {"access_token": "a"}
+    assert (store.hits, store.misses, len(backend.batches)) == (1, 1, 1)
+
+    clock.now = 31
+    await store.get("github", "user-1")
+    assert (store.hits, store.misses, len(backend.batches)) == (1, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_missing_subjects_are_negative_cached() -> None:
+    backend, clock = SlowStore(), Clock()
+    store = CachingCredentialStore(backend, negative_ttl=5, clock=clock)
+
+    assert await store.get("github", "ghost") is None
+    assert await store.get("github", "ghost") is None
+    assert len(backend.batches) == 1
+
+    clock.now = 6
+    assert await store.get("github", "ghost") is None
+    assert len(backend.batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_entries() -> None:
+    backend = SlowStore()
+    store = CachingCredentialStore(backend)
+
+    assert await store.get("github", "user-1") is None
+    await store.set("github", "user-1", {"access_token": "new"})
+    assert await store.get("github", "user-1") == {"access_token": "new"}
+
+    await store.delete("github", "user-1")
+    assert await store.get("github", "user-1") is None
+    assert await backend.get("github", "user-1") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_fetch() -> None:
+    backend = SlowStore()
+    await backend.set("google", "user-1", {"access_token": "g"})
+    backend.release.clear()
+    store = CachingCredentialStore(backend)
+
+    waiters = [asyncio.ensure_future(store.get("google", "user-1")) for _ in range(10)]
+    await asyncio.sleep(0)
+    backend.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert results == [{"access_token": "g"}] * 10
+    assert backend.batches == [["user-1"]]
+    assert (store.misses, store.coalesced) == (1, 9)
+
+
+@pytest.mark.asyncio
+async def test_write_during_fetch_is_not_cached() -> None:
+    backend = SlowStore()
+    await backend.set("github", "user-1", {"access_token": "old"})
+    backend.release.clear()
+    store = CachingCredentialStore(backend)
+
+    pending = asyncio.ensure_future(store.get("github", "user-1"))
+    await asyncio.sleep(0)
+    await store.set("github", "user-1", {"access_token": "new"})
+    backend.release.set()
+    await pending
+
+    assert await store.get("github", "user-1") == {"access_token": "new"}
+
+
+@pytest.mark.asyncio
+async def test_get_many_batches_only_uncached_keys() -> None:
+    backend = SlowStore()
+    await backend.set("github", "user-1", {"access_token": "gh"})
+    store = CachingCredentialStore(backend, max_entries=2)
+    await store.get("github", "user-1")
+
+    records = await store.get_many(
+        [("github", "user-1"), ("slack", "user-1"), ("google", "user-1")]
+    )
+
+    assert records == [{"access_token": "gh"}, None, None]
+    assert backend.batches == [["user-1"], ["user-1", "user-1"]]
+    assert len(store) == 2
+
+
+@pytest.mark.asyncio
+async def test_backend_errors_reach_every_waiter_and_are_not_cached() -> None:
+    class FailingStore(SlowStore):
+        async def get_many(self, keys):  # type: ignore[no-untyped-def]
+            await super().get_many(keys)
+            raise RuntimeError("db down")
+
+    backend = FailingStore()
+    store = CachingCredentialStore(backend)
+
+    results = await asyncio.gather(
+        store.get("github", "user-1"),
+        store.get("github", "user-1"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(backend.batches) == 1
+    with pytest.raises(RuntimeError):
+        await store.get("github", "user-1")
+    assert len(backend.batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_only_the_named_subject() -> None:
+    backend = SlowStore()
+    store = CachingCredentialStore(backend)
+    for provider, subject in [("github", "u"), ("github", "v"), ("slack", "u")]:
+        await backend.set(provider, subject, {"access_token": subject})
+        await store.get(provider, subject)
+    assert len(store) == 3
+
+    store.invalidate("github", "u")
+
+    assert len(store) == 2
+    await store.get("github", "v")
+    await store.get("slack", "u")
+    assert len(backend.batches) == 3
+    await store.get("github", "u")
+    assert len(backend.batches) == 4
+
+
+@pytest.mark.asyncio
+async def test_short_backend_batch_fails_every_waiter() -> None:
+    class ShortStore(InMemoryCredentialStore):
+        async def get_many(self, keys):  # type: ignore[no-untyped-def]
+            return (await super().get_many(keys))[:-1]
+
+    store = CachingCredentialStore(ShortStore())
+
+    with pytest.raises(ValueError, match="returned 1 records for 2 keys"):
+        await asyncio.wait_for(
+            store.get_many([("github", "user-1"), ("github", "user-2")]), 1
+        )
+
+
+@pytest.mark.asyncio
+async def test_cached_records_are_frozen_all_the_way_down() -> None:
+    class PlainStore(InMemoryCredentialStore):
+        async def get_many(self, keys):  # type: ignore[no-untyped-def]
+            return [{"access_token": "a", "extra": {"scopes": ["repo"]}} for _ in keys]
+
+    store = CachingCredentialStore(PlainStore())
+    record = await store.get("github", "user-1")
+
+    assert record["extra"]["scopes"] == ("repo",)
+    with pytest.raises(TypeError):
+        record["extra"]["team"] = "x"  # type: ignore[index]
+    assert await store.get("github", "user-1") is record
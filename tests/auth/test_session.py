@@ -58,3 +58,85 @@ async def test_session_accepts_manual_credentials() -> None:
     ) as integrations:
         assert integrations.github.settings.token == "manual"
         assert integrations.github.settings.authorization_scheme == "token-type"
+
+
+class CountingStore(InMemoryCredentialStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    async def get(self, provider, subject):  # type: ignore[no-untyped-def]
+        raise AssertionError("session should load credentials in one batch")
+
+    async def get_many(self, keys):  # type: ignore[no-untyped-def]
+        self.batches.append([provider for provider, _ in keys])
+        return await super().get_many(keys)
+
+
+@pytest.mark.asyncio
+async def test_session_loads_credentials_in_one_batch() -> None:
+    import integrations.auth_providers  # registers google
+
+    store = CountingStore()
+    manager = AuthManager(
+        auto_configure=False,
+        credential_store=store,
+        github={"token": "app-token"},
+        google={"client_id": "id", "client_secret": "secret"},
+    )
+    await manager.store_credentials(
+        "google", "user-5", {"access_token": "google-token", "token_type": "Bearer"}
+    )
+
+    async with manager.session(subject="user-5") as integrations:
+        assert integrations.github.settings.token == "app-token"
+        assert integrations.gmail.settings.token == "google-token"
+        assert integrations.google_sheets.settings.token == "google-token"
+
+    assert store.batches == [["github", "google"]]
+
+
+@pytest.mark.asyncio
+async def test_session_loads_stored_credentials_when_manual_ones_do_not_parse(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = AuthManager(github={"token": "app-token"})
+    await manager.store_credentials(
+        "github",
+        "user-6",
+        GithubUserCredentials(access_token="stored-token", token_type="Bearer"),
+    )
+    auth_provider = manager._providers["github"]
+    parse = auth_provider.parse_user_credentials
+    monkeypatch.setattr(
+        auth_provider,
+        "parse_user_credentials",
+        lambda data: None if data == {} else parse(data),
+    )
+
+    async with manager.session(
+        subject="user-6", with_credentials={AuthProviderKey.GITHUB: {}}
+    ) as integrations:
+        assert integrations.github.settings.token == "stored-token"
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_the_manager_pool_and_response_cache() -> None:
+    manager = AuthManager(
+        auto_configure=False,
+        github={"token": "app-token"},
+        google={"client_id": "id", "client_secret": "secret"},
+    )
+    sessions = []
+    for subject in ("user-7", "user-8"):
+        await manager.store_credentials("google", subject, {"access_token": subject})
+        async with manager.session(subject=subject) as integrations:
+            assert integrations.transport_pool is manager.transport_pool
+            assert integrations.github.response_cache() is manager.response_cache
+            sessions.append(integrations.gmail)
+
+    assert [gmail.transport_pool for gmail in sessions] == [
+        manager.transport_pool,
+        manager.transport_pool,
+    ]
+    await manager.aclose()
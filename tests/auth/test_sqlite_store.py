@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from integrations.auth import AuthManager
+from integrations.auth.storage import (
+    CachingCredentialStore,
+    InMemoryCredentialStore,
+    SQLiteCredentialStore,
+)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_roundtrip_and_durability(tmp_path: Path) -> None:
+    path = tmp_path / "credentials.db"
+    async with SQLiteCredentialStore(path) as store:
+        await store.set("github", "user-1", {"access_token": "abc", "scope": ["repo"]})
+        await store.set("github", {"org": "acme", "id": 7}, {"access_token": "org"})
+        await store.set("github", "user-1", {"access_token": "rotated"})
+        assert await store.get("github", "user-1") == {"access_token": "rotated"}
+
+    async with SQLiteCredentialStore(path) as reopened:
+        assert await reopened.get("github", {"id": 7, "org": "acme"}) == {
+            "access_token": "org"
+        }
+        assert await reopened.count() == 2
+        await reopened.delete("github", "user-1")
+        assert await reopened.get("github", "user-1") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_uses_wal_and_primary_key(tmp_path: Path) -> None:
+    path = tmp_path / "credentials.db"
+    async with SQLiteCredentialStore(path) as store:
+        await store.set("slack", "user-1", {"access_token": "x"})
+
+    connection = sqlite3.connect(path)
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM credentials "
+            "WHERE provider = 'slack' AND subject = 'user-1'"
+        ).fetchall()
+        assert "PRIMARY KEY" in plan[0][-1]
+    finally:
+        connection.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_batches(tmp_path: Path) -> None:
+    async with SQLiteCredentialStore(tmp_path / "c.db", pool_size=2) as store:
+        items = [
+            ("google", f"user-{n}", {"access_token": f"t{n}"}) for n in range(1000)
+        ]
+        await store.set_many(items)
+
+        keys = [("google", "user-999"), ("slack", "user-1"), ("google", "user-0")]
+        keys += [("google", f"user-{n}") for n in range(900)]
+        records = await store.get_many(keys)
+
+        assert records[:3] == [{"access_token": "t999"}, None, {"access_token": "t0"}]
+        assert records[503] == {"access_token": "t500"}
+        assert await store.count() == 1000
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_handles_concurrent_sessions(tmp_path: Path) -> None:
+    async with SQLiteCredentialStore(tmp_path / "c.db") as store:
+        await asyncio.gather(
+            *(
+                store.set("github", f"user-{n}", {"access_token": str(n)})
+                for n in range(50)
+            )
+        )
+        records = await asyncio.gather(
+            *(store.get("github", f"user-{n}") for n in range(50))
+        )
+        assert [record["access_token"] for record in records] == [
+            str(n) for n in range(50)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_accepts_frozen_records_and_feeds_sessions(
+    tmp_path: Path,
+) -> None:
+    import integrations.auth_providers  # registers github
+
+    memory = InMemoryCredentialStore()
+    await memory.set(
+        "github",
+        "user-1",
+        {"access_token": "gh", "scope": ["repo"], "extra": {"teams": {"core"}}},
+    )
+
+    async with SQLiteCredentialStore(tmp_path / "c.db") as store:
+        await store.set("github", "user-1", await memory.get("github", "user-1"))
+        assert await store.get("github", "user-1") == {
+            "access_token": "gh",
+            "scope": ["repo"],
+            "extra": {"teams": ["core"]},
+        }
+        manager = AuthManager(
+            credential_store=CachingCredentialStore(store), github={"token": "app"}
+        )
+        async with manager.session(subject="user-1") as integrations:
+            assert integrations.github.settings.token == "gh"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_rejects_use_after_close(tmp_path: Path) -> None:
+    store = SQLiteCredentialStore(tmp_path / "c.db")
+    await store.aclose()
+
+    with pytest.raises(RuntimeError):
+        await store.get("github", "user-1")
+    with pytest.raises(ValueError):
+        SQLiteCredentialStore(tmp_path / "c.db", table="bad name")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_expiry_index_and_pages(tmp_path: Path) -> None:
+    path = tmp_path / "credentials.db"
+
+    async with SQLiteCredentialStore(path) as store:
+        await store.set_many(
+            [("google", "old", {"expires_at": 50})]
+            + [
+                ("google", f"user-{index}", {"expires_at": 100 + index})
+                for index in range(5)
+            ]
+            + [("slack", "user-0", {"access_token": "x"})]
+        )
+        assert [s for _, s, _ in await store.expiring(102)] == [
+            "old",
+            "user-0",
+            "user-1",
+            "user-2",
+        ]
+        assert await store.expiring(200, after=103, limit=1) == [
+            ("google", "user-3", {"expires_at": 103})
+        ]
+
+        items = [item async for item in store.items(page_size=2)]
+        assert len(items) == 7
+        google = [subject async for _, subject, _ in store.items("google", page_size=2)]
+        assert google == ["old", *(f"user-{index}" for index in range(5))]
+
+        assert await store.expiring(200, after=103, after_key=("google", "user-3")) == [
+            ("google", "user-4", {"expires_at": 104})
+        ]
+
+        plan = (
+            sqlite3.connect(path)
+            .execute(
+                "EXPLAIN QUERY PLAN SELECT provider FROM credentials "
+                "WHERE expires_at <= 1 AND (expires_at, provider, subject) > "
+                "(0, 'a', 'b') ORDER BY expires_at, provider, subject"
+            )
+            .fetchall()
+        )
+        assert len(plan) == 1
+        assert "credentials_expiry_key" in plan[0][3]
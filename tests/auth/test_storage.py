@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+
 import pytest
 
 from integrations.auth import AuthManager
-from integrations.auth.storage import InMemoryCredentialStore
+from integrations.auth.storage import (
+    InMemoryCredentialStore,
+    find_expiring,
+    load_many,
+    subject_key,
+)
 from integrations.auth_providers.github import GithubUserCredentials
 
 
@@ -55,3 +63,106 @@ async def test_auth_manager_store_and_load_credentials() -> None:
 
     await manager.delete_credentials("github", "user-xyz")
     assert await manager.load_credentials("github", "user-xyz") is None
+
+
+@pytest.mark.asyncio
+async def test_get_many_preserves_order_and_misses() -> None:
+    store = InMemoryCredentialStore()
+    await store.set("github", "user-1", {"access_token": "gh"})
+    await store.set("google", {"id": 1}, {"access_token": "g"})
+
+    keys = [("google", {"id": 1}), ("slack", "user-1"), ("github", "user-1")]
+    assert await store.get_many(keys) == [
+        {"access_token": "g"},
+        None,
+        {"access_token": "gh"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_many_falls_back_to_get() -> None:
+    class MinimalStore:
+        def __init__(self) -> None:
+            self.records = {("github", "user-1"): {"access_token": "gh"}}
+
+        async def get(self, provider, subject):  # type: ignore[no-untyped-def]
+            return self.records.get((provider, subject))
+
+    keys = [("github", "user-1"), ("github", "user-2")]
+    assert await load_many(MinimalStore(), keys) == [{"access_token": "gh"}, None]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_records_are_frozen_and_shared() -> None:
+    store = InMemoryCredentialStore(shards=4)
+    data = {"access_token": "abc", "scope": ["repo"], "extra": {"team": "core"}}
+
+    await store.set("github", "user-1", data)
+    data["access_token"] = "mutated"
+    first = await store.get("github", "user-1")
+    second = await store.get("github", "user-1")
+
+    assert first is second
+    assert first["access_token"] == "abc"
+    assert first["scope"] == ("repo",)
+    with pytest.raises(TypeError):
+        first["access_token"] = "x"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        first["extra"]["team"] = "x"  # type: ignore[index]
+
+
+def test_subject_key_is_canonical_and_type_aware() -> None:
+    assert subject_key("user-1") == "user-1"
+    assert subject_key({"b": 1, "a": "x"}) == '{"a":"x","b":1}'
+    assert subject_key({"id": True}) == '{"id":true}'
+    assert subject_key({"id": 1}) == '{"id":1}'
+    assert subject_key({"ids": [1, 2]}) == '{"ids":[1,2]}'
+
+
+@pytest.mark.asyncio
+async def test_in_memory_expiry_index_and_enumeration() -> None:
+    store = InMemoryCredentialStore(shards=4)
+    for index in range(20):
+        await store.set("google", f"user-{index}", {"expires_at": 1000 - index})
+    await store.set("slack", {"team": "T1"}, {"access_token": "no-expiry"})
+    await store.set("google", "user-0", {"expires_at": 5000})
+    await store.delete("google", "user-19")
+
+    due = await store.expiring(990, after=985, limit=3)
+    assert [subject for _, subject, _ in due] == ["user-15", "user-14", "user-13"]
+    assert [item[1] for item in await store.expiring(1000)][-1] == "user-1"
+    assert await find_expiring(store, 5000, after=1001) == [
+        ("google", "user-0", {"expires_at": 5000})
+    ]
+
+    items = [item async for item in store.items()]
+    assert len(items) == 20
+    assert [item async for item in store.items("slack")] == [
+        ("slack", '{"team":"T1"}', {"access_token": "no-expiry"})
+    ]
+
+
+def test_in_memory_expiry_index_matches_records_across_threads() -> None:
+    store = InMemoryCredentialStore(shards=2)
+    start = threading.Barrier(4)
+
+    def writer(offset: int) -> None:
+        async def run() -> None:
+            for step in range(300):
+                record = {"expires_at": offset * 1000 + step}
+                await store.set("google", "shared", record)
+                if step % 3 == 0:
+                    await store.delete("google", "shared")
+
+        start.wait()
+        asyncio.run(run())
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    record = asyncio.run(store.get("google", "shared"))
+    due = asyncio.run(store.expiring(10_000))
+    assert due == ([] if record is None else [("google", "shared", record)])
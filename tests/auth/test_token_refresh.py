@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from integrations.auth import AuthManager, TokenRefreshSweeper
+from integrations.auth.storage import InMemoryCredentialStore
+from integrations.auth_providers.google import GoogleUserCredentials
+from integrations.core.rate_limit import RateLimit
+
+from .fixtures import DummyOAuthClient
+
+
+class RefreshingClient(DummyOAuthClient):
+    calls = 0
+    fail = False
+
+    async def refresh_token(
+        self, url: str, refresh_token: str | None = None, **kwargs: Any
+    ) -> Mapping[str, Any]:
+        type(self).calls += 1
+        await asyncio.sleep(0)
+        if type(self).fail:
+            raise RuntimeError("token endpoint unavailable")
+        return {
+            "access_token": f"fresh-{type(self).calls}",
+            "token_type": "Bearer",
+            "expires_in": 3600,
+        }
+
+
+@pytest.fixture
+def oauth_client(monkeypatch: pytest.MonkeyPatch) -> type[RefreshingClient]:
+    RefreshingClient.calls = 0
+    RefreshingClient.fail = False
+    monkeypatch.setattr(
+        "integrations.auth.flows.oauth2.AsyncOAuth2Client", RefreshingClient
+    )
+    return RefreshingClient
+
+
+async def _manager_with_token(expires_in: float) -> AuthManager:
+    manager = AuthManager(
+        auto_configure=False,
+        credential_store=InMemoryCredentialStore(),
+        google={"client_id": "client", "client_secret": "secret"},
+    )
+    await manager.store_credentials(
+        "google",
+        "user-1",
+        GoogleUserCredentials(
+            access_token="stale",
+            refresh_token="refresh-1",
+            expires_at=time.time() + expires_in,
+        ),
+    )
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_session_refreshes_token_inside_skew_window(
+    oauth_client: type[RefreshingClient],
+) -> None:
+    manager = await _manager_with_token(expires_in=60)
+
+    async with manager.session(subject="user-1") as integrations:
+        assert integrations.gmail.settings.token == "fresh-1"
+
+    stored = await manager.credential_store.get("google", "user-1")
+    assert stored["access_token"] == "fresh-1"
+    assert stored["refresh_token"] == "refresh-1"
+    assert stored["expires_at"] > time.time() + 3000
+    assert oauth_client.calls == 1
+    assert manager.token_refresher.refreshed == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_share_one_refresh(
+    oauth_client: type[RefreshingClient],
+) -> None:
+    manager = await _manager_with_token(expires_in=-10)
+
+    async def token() -> str:
+        async with manager.session(subject="user-1") as integrations:
+            return integrations.google_sheets.settings.token
+
+    tokens = await asyncio.gather(*(token() for _ in range(5)))
+
+    assert tokens == ["fresh-1"] * 5
+    assert oauth_client.calls == 1
+    assert manager.token_refresher.coalesced == 4
+
+    # A caller still holding the stale token reuses the stored refresh.
+    stale = GoogleUserCredentials(
+        access_token="stale", refresh_token="refresh-1", expires_at=0
+    )
+    again = await manager.token_refresher.refresh("google", "user-1", stale)
+    assert again.access_token == "fresh-1"
+    assert oauth_client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_tokens_outside_window_are_left_alone(
+    oauth_client: type[RefreshingClient],
+) -> None:
+    manager = await _manager_with_token(expires_in=3600)
+
+    credentials = await manager.load_credentials("google", "user-1")
+
+    assert credentials.access_token == "stale"
+    assert oauth_client.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_current_token(
+    oauth_client: type[RefreshingClient],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    manager = await _manager_with_token(expires_in=60)
+    oauth_client.fail = True
+
+    with caplog.at_level(logging.WARNING, logger="integrations.auth.token_refresh"):
+        credentials = await manager.load_credentials("google", "user-1")
+
+    assert credentials.access_token == "stale"
+    assert manager.token_refresher.failed == 1
+    [record] = caplog.records
+    assert "'google'" in record.getMessage()
+    assert "'user-1'" in record.getMessage()
+    assert record.exc_info is not None
+
+
+@pytest.mark.asyncio
+async def test_refresh_can_be_disabled(oauth_client: type[RefreshingClient]) -> None:
+    manager = AuthManager(
+        auto_configure=False,
+        refresh_skew=None,
+        google={"client_id": "client", "client_secret": "secret"},
+    )
+    await manager.store_credentials(
+        "google",
+        "user-1",
+        GoogleUserCredentials(access_token="stale", refresh_token="r", expires_at=0),
+    )
+
+    async with manager.session(subject="user-1") as integrations:
+        assert integrations.gmail.settings.token == "stale"
+    assert manager.token_refresher is None
+    assert oauth_client.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_sweeper_refreshes_tokens_due_within_horizon(
+    oauth_client: type[RefreshingClient],
+) -> None:
+    now = time.time()
+    manager = AuthManager(
+        auto_configure=False,
+        google={"client_id": "client", "client_secret": "secret"},
+    )
+    store = manager.credential_store
+    for index in range(5):
+        await store.set(
+            "google",
+            f"due-{index}",
+            {"access_token": "old", "refresh_token": "r", "expires_at": now + 60},
+        )
+    await store.set(
+        "google",
+        "later",
+        {"access_token": "old", "refresh_token": "r", "expires_at": now + 7200},
+    )
+    await store.set(
+        "google",
+        "expired",
+        {"access_token": "old", "refresh_token": "r", "expires_at": now - 60},
+    )
+    await store.set(
+        "google", "no-refresh", {"access_token": "old", "expires_at": now + 60}
+    )
+    await store.set("slack", "unknown", {"access_token": "old", "expires_at": now + 60})
+
+    sweeper = TokenRefreshSweeper(
+        manager,
+        concurrency=2,
+        batch_size=2,
+        rate_limits={"google": RateLimit.per_second(200, burst=1)},
+    )
+    assert await sweeper.sweep() == 5
+
+    assert oauth_client.calls == 5
+    assert sweeper.scanned == 7
+    assert (sweeper.refreshed, sweeper.skipped, sweeper.failed) == (5, 2, 0)
+    assert sweeper.rate_limited_seconds > 0
+    refreshed = await store.get("google", "due-3")
+    assert refreshed["access_token"].startswith("fresh-")
+    assert (await store.get("google", "later"))["access_token"] == "old"
+    assert (await store.get("google", "expired"))["access_token"] == "old"
+
+    assert await sweeper.sweep() == 0
+    assert oauth_client.calls == 5
+
+
+@pytest.mark.asyncio
+async def test_sweeper_pages_past_a_full_batch_of_equal_expiries(
+    oauth_client: type[RefreshingClient],
+) -> None:
+    expires_at = time.time() + 60
+    manager = AuthManager(
+        auto_configure=False,
+        google={"client_id": "client", "client_secret": "secret"},
+    )
+    store = manager.credential_store
+    # Tokens without a refresh token stay in the index after the sweep skips
+    # them, and they sort before the tokens that are due.
+    for index in range(5):
+        await store.set(
+            "google",
+            f"a-skip-{index}",
+            {"access_token": "old", "expires_at": expires_at},
+        )
+    for index in range(2):
+        await store.set(
+            "google",
+            f"b-due-{index}",
+            {"access_token": "old", "refresh_token": "r", "expires_at": expires_at},
+        )
+
+    sweeper = TokenRefreshSweeper(manager, batch_size=2)
+    assert await sweeper.sweep() == 2
+
+    assert oauth_client.calls == 2
+    assert (sweeper.scanned, sweeper.skipped) == (7, 5)
+
+
+@pytest.mark.asyncio
+async def test_manager_runs_and_stops_background_sweeper(
+    oauth_client: type[RefreshingClient],
+) -> None:
+    manager = await _manager_with_token(expires_in=120)
+
+    sweeper = manager.start_token_sweeper(interval=0.01)
+    with pytest.raises(RuntimeError):
+        manager.start_token_sweeper()
+    for _ in range(100):
+        if sweeper.refreshed:
+            break
+        await asyncio.sleep(0.01)
+    await manager.stop_token_sweeper(timeout=1)
+
+    assert not sweeper.running
+    assert sweeper.sweeps >= 1
+    assert (await manager.load_credentials("google", "user-1")).access_token == (
+        "fresh-1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_sweeper_logs_failed_refreshes_and_sweeps(
+    oauth_client: type[RefreshingClient],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    manager = await _manager_with_token(expires_in=120)
+    oauth_client.fail = True
+    sweeper = TokenRefreshSweeper(manager, interval=60)
+
+    with caplog.at_level(logging.WARNING, logger="integrations.auth.token_refresh"):
+        assert await sweeper.sweep() == 0
+        failed_sweep = asyncio.Event()
+
+        async def broken_sweep() -> int:
+            failed_sweep.set()
+            raise RuntimeError("store unavailable")
+
+        sweeper.sweep = broken_sweep  # type: ignore[method-assign]
+        sweeper.start()
+        await asyncio.wait_for(failed_sweep.wait(), 1)
+        await sweeper.stop(timeout=1)
+
+    assert (sweeper.failed, sweeper.errors) == (1, 1)
+    refresh, sweep = caplog.records
+    assert "'google'" in refresh.getMessage()
+    assert "'user-1'" in refresh.getMessage()
+    assert refresh.exc_info is not None
+    assert sweep.exc_info is not None
@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import pytest
+
+from integrations import refresh_settings_environment
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings_environment() -> None:
+    # Tests patch os.environ freely; never reuse another test's snapshot.
+    refresh_settings_environment()
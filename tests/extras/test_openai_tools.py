@@ -43,6 +43,7 @@ async def test_actions_convert_to_openai_tools(monkeypatch: pytest.MonkeyPatch)
     result = await tool.on_invoke_tool(ctx, json.dumps({"per_page": 5}))
 
     assert result == payload
+    await container.aclose()
     assert clients and clients[0].closed is True
 
     with pytest.raises(NotImplementedError):
@@ -113,6 +114,9 @@ class StubAsyncClient:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         self.closed = True
 
+    async def aclose(self) -> None:
+        self.closed = True
+
     async def request(self, method: str, path: str, *, params=None, **_):
         key = (method.upper(), path, tuple(sorted((params or {}).items())))
         try:
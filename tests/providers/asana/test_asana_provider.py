@@ -42,6 +42,9 @@ class StubAsyncClient:
     async def __aexit__(self, *_: Any) -> None:
         self.closed = True
 
+    async def aclose(self) -> None:
+        self.closed = True
+
     async def request(
         self,
         method: str,
@@ -104,6 +107,7 @@ async def test_create_task_uses_workspace_default(
 
     assert result == {"gid": "task"}
     assert stub.calls[0]["json"] == {"data": {"name": "Test Task", "workspace": "123"}}
+    await provider.aclose()
     assert stub.closed is True
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 from typing import Any, Dict, Mapping, Tuple
 
+import httpx
 import pytest
 
 from integrations import Integrations
@@ -81,6 +82,9 @@ class StubAsyncClient:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         self.closed = True
 
+    async def aclose(self) -> None:
+        self.closed = True
+
     def _next_response(
         self, method: str, path: str, params: Tuple[Tuple[str, Any], ...]
     ) -> StubResponse:
@@ -219,9 +223,45 @@ async def test_list_repositories_uses_client_and_returns_payload(
     assert client_kwargs[0].get("timeout") is None
     assert calls[0]["method"] == "GET"
     assert calls[0]["path"] == "/user/repos"
+    await provider.aclose()
     assert clients[0].closed is True
 
 
+@pytest.mark.asyncio
+async def test_list_repositories_iter_follows_link_headers(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GithubSettings,
+) -> None:
+    provider = GithubProvider(settings=settings)
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        page = int(request.url.params.get("page", 1))
+        headers = {}
+        if page == 1:
+            headers["Link"] = (
+                '<https://api.github.com/user/repos?per_page=100&page=2>; rel="next", '
+                '<https://api.github.com/user/repos?per_page=100&page=2>; rel="last"'
+            )
+        return httpx.Response(200, json=[{"name": f"repo-{page}"}], headers=headers)
+
+    def fake_client(**kwargs: Any) -> httpx.AsyncClient:
+        kwargs["transport"] = httpx.MockTransport(handler)
+        return httpx.AsyncClient(base_url="https://api.github.com", **kwargs)
+
+    monkeypatch.setattr(provider, "httpx_client", fake_client)
+
+    names = [repo["name"] async for repo in provider.list_repositories.iter()]
+
+    assert names == ["repo-1", "repo-2"]
+    assert requested == [
+        "https://api.github.com/user/repos?per_page=100",
+        "https://api.github.com/user/repos?per_page=100&page=2",
+    ]
+    await provider.aclose()
+
+
 @pytest.mark.asyncio
 async def test_list_codespaces(
     monkeypatch: pytest.MonkeyPatch, settings: GithubSettings
@@ -538,4 +578,6 @@ async def test_container_end_to_end(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert [repo["name"] for repo in repos] == ["repo-1", "repo-2"]
     assert user["login"] == "octocat"
+    await container.aclose()
+    assert len(clients) == 1
     assert all(client.closed for client in clients)
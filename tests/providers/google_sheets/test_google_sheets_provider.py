@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any, Mapping
 
 import pytest
 
+from integrations.providers.google_sheets.append_buffer import AppendBuffer
 from integrations.providers.google_sheets.google_sheets_provider import (
     GoogleSheetsProvider,
 )
@@ -191,3 +193,671 @@ async def test_raw_request_action(monkeypatch: pytest.MonkeyPatch) -> None:
     assert method == "GET"
     assert slug == "/custom"
     assert kwargs["params"] == {"alt": "json"}
+
+
+def _sheet(sheet_id: int, title: str, index: int) -> dict[str, Any]:
+    return {
+        "properties": {
+            "sheetId": sheet_id,
+            "title": title,
+            "index": index,
+            "gridProperties": {"rowCount": 1000, "columnCount": 26},
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_worksheet_lookups_share_cached_metadata(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123"): [
+                StubResponse(
+                    {"sheets": [_sheet(0, "Sheet1", 0), _sheet(7, "Data", 1)]}
+                ),
+                StubResponse(
+                    {
+                        "sheets": [
+                            _sheet(0, "Sheet1", 0),
+                            _sheet(7, "Archive", 1),
+                            _sheet(9, "Log", 2),
+                        ]
+                    }
+                ),
+                StubResponse({"sheets": [_sheet(0, "Sheet1", 0)]}),
+            ],
+            ("POST", "/spreadsheet123:batchUpdate"): [
+                StubResponse(
+                    {
+                        "replies": [
+                            {
+                                "addSheet": {
+                                    "properties": _sheet(9, "Log", 2)["properties"]
+                                }
+                            }
+                        ]
+                    }
+                ),
+                StubResponse({"replies": [{}]}),
+                StubResponse({"replies": [{}]}),
+            ],
+            ("POST", "/other/sheets/7:copyTo"): StubResponse(
+                {"sheetId": 3, "title": "Copy of Data", "index": 1}
+            ),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    found = await provider.find_worksheet("spreadsheet123", "data")
+    assert found["properties"]["sheetId"] == 7
+    assert found["properties"]["gridProperties"]["rowCount"] == 1000
+    assert await provider.find_worksheet("spreadsheet123", "missing") is None
+    created = await provider.find_or_create_worksheet("spreadsheet123", "Log")
+    assert created["sheetId"] == 9
+    assert (await provider.find_worksheet("spreadsheet123", "LOG")) is not None
+
+    # Renames and resizes drop the cached metadata instead of patching it.
+    await provider.rename_sheet("spreadsheet123", 7, "Archive")
+    assert "spreadsheet123" not in provider.worksheet_cache()
+    assert await provider.find_worksheet("spreadsheet123", "Data") is None
+    assert (await provider.find_worksheet("spreadsheet123", "Archive"))["properties"][
+        "index"
+    ] == 1
+    await provider.delete_sheet("spreadsheet123", 7)
+    assert await provider.find_worksheet("spreadsheet123", "Archive") is None
+    log = await provider.find_worksheet("spreadsheet123", "Log")
+    assert log["properties"]["index"] == 1
+
+    gets = [call for call in recorder.calls if call[0] == "GET"]
+    assert len(gets) == 2
+    assert gets[0][2]["params"] == {"fields": "sheets.properties"}
+
+    # Copies only land in destinations already cached; others load lazily.
+    await provider.copy_worksheet(
+        "other", 7, destination_spreadsheet_id="spreadsheet123"
+    )
+    assert (await provider.find_worksheet("spreadsheet123", "Copy of Data")) is not None
+
+    provider.worksheet_cache().invalidate("spreadsheet123")
+    assert await provider.find_worksheet("spreadsheet123", "Log") is None
+    assert len([call for call in recorder.calls if call[0] == "GET"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_sheet_property_updates_keep_indexes_unless_they_reshape(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values/Sheet1!1:1"): StubResponse(
+                {"values": [["Name", "Status"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!A2:A10"): StubResponse(
+                {"values": [["Widget"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!2:2"): StubResponse(
+                {"values": [["Widget", "Ready"]]}
+            ),
+            ("POST", "/spreadsheet123:batchUpdate"): [
+                StubResponse({"replies": [{}]}),
+                StubResponse({"replies": [{}]}),
+            ],
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    await provider.lookup_spreadsheet_rows(
+        "spreadsheet123",
+        "Sheet1!A1:B10",
+        lookup_column="Name",
+        lookup_value="Widget",
+        use_index=True,
+    )
+    assert len(provider.column_indexes()) == 1
+
+    await provider.change_sheet_properties(
+        "spreadsheet123", 0, {"tabColor": {"red": 1.0}}
+    )
+    assert len(provider.column_indexes()) == 1
+
+    await provider.change_sheet_properties(
+        "spreadsheet123",
+        0,
+        {"gridProperties": {"rowCount": 5}},
+        fields="gridProperties.rowCount",
+    )
+    assert len(provider.column_indexes()) == 0
+
+
+@pytest.mark.asyncio
+async def test_worksheet_cache_expires_and_skips_stale_loads() -> None:
+    from integrations.providers.google_sheets.worksheet_cache import WorksheetCache
+
+    now = [0.0]
+    cache = WorksheetCache(ttl=10, clock=lambda: now[0])
+    loads: list[int] = []
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def load() -> dict[str, Any]:
+        loads.append(1)
+        started.set()
+        await release.wait()
+        return {"sheets": [_sheet(0, f"v{len(loads)}", 0)]}
+
+    gathered = asyncio.gather(cache.worksheets("s", load), cache.worksheets("s", load))
+    await started.wait()
+    release.set()
+    first, second = await gathered
+    assert first == second == [_sheet(0, "v1", 0)["properties"]]
+    assert len(loads) == 1
+
+    now[0] = 11
+    started.clear()
+    release.clear()
+    pending = asyncio.ensure_future(cache.worksheets("s", load))
+    await started.wait()
+    cache.remove("s", 0)  # a write lands while the reload is in flight
+    release.set()
+    assert (await pending)[0]["title"] == "v2"
+    assert (await cache.worksheets("s", load))[0]["title"] == "v3"
+
+
+@pytest.mark.asyncio
+async def test_indexed_lookup_reads_only_matching_rows(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values/Sheet1!1:1"): StubResponse(
+                {"values": [["Name", "Status", "Count", "Notes"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!A2:A10"): StubResponse(
+                {"values": [["Widget", "Cog", "Widget"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!2:4"): StubResponse(
+                {
+                    "values": [
+                        ["Widget", "Ready", "5", "x"],
+                        ["Cog", "Ready", "2"],
+                        ["Widget", "Backlog", "1"],
+                    ]
+                }
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!3:3"): [
+                StubResponse({"values": [["Cog", "Ready", "2"]]}),
+                StubResponse({"values": [["Gear", "Ready", "2"]]}),
+            ],
+            ("GET", "/spreadsheet123/values/Sheet1!A1:C10"): StubResponse(
+                {"values": [["Name", "Status", "Count"], ["Widget"], ["Gear"]]}
+            ),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+    lookup = {"lookup_column": "Name", "use_index": True}
+
+    widgets = await provider.lookup_spreadsheet_rows(
+        "spreadsheet123", "Sheet1!A1:C10", lookup_value="widget", **lookup
+    )
+    assert widgets["matched_row_numbers"] == [2, 4]
+    assert widgets["matches"][0] == {"Name": "Widget", "Status": "Ready", "Count": "5"}
+    assert recorder.calls[1][2]["params"] == {"majorDimension": "COLUMNS"}
+
+    cog = await provider.lookup_spreadsheet_row(
+        "spreadsheet123", "Sheet1!A1:C10", lookup_value="Cog", **lookup
+    )
+    assert cog == {"Name": "Cog", "Status": "Ready", "Count": "2"}
+    assert len(recorder.calls) == 4
+    assert provider.column_indexes().hits == 1
+
+    # Row 3 was changed outside the provider: the index is dropped and the
+    # lookup falls back to scanning the range.
+    missing = await provider.lookup_spreadsheet_rows(
+        "spreadsheet123", "Sheet1!A1:C10", lookup_value="Cog", **lookup
+    )
+    assert missing["matches"] == []
+    assert recorder.calls[-1][1] == "/spreadsheet123/values/Sheet1!A1:C10"
+    assert len(provider.column_indexes()) == 0
+
+
+@pytest.mark.asyncio
+async def test_indexed_miss_finds_rows_appended_elsewhere(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values/Sheet1!1:1"): StubResponse(
+                {"values": [["Name", "Count"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!A2:A"): StubResponse(
+                {"values": [["Gadget"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!A3:A"): StubResponse(
+                {"values": [["Widget"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!A:B"): StubResponse(
+                {"values": [["Name", "Count"], ["Gadget", "2"], ["Widget", "1"]]}
+            ),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    found = await provider.lookup_spreadsheet_rows(
+        "spreadsheet123",
+        "Sheet1!A:B",
+        lookup_column="Name",
+        lookup_value="Widget",
+        use_index=True,
+    )
+
+    assert found["matched_row_numbers"] == [3]
+    assert recorder.calls[2][2]["params"] == {"majorDimension": "COLUMNS"}
+    assert len(provider.column_indexes()) == 0
+
+
+@pytest.mark.asyncio
+async def test_indexed_find_or_create_appends_a_new_key_once(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values/Sheet1!1:1"): StubResponse(
+                {"values": [["Name", "Count"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!A2:A"): StubResponse(
+                {"values": [["Gadget"]]}
+            ),
+            # The miss checks for rows appended below the index: none.
+            ("GET", "/spreadsheet123/values/Sheet1!A3:A"): StubResponse({}),
+            ("POST", "/spreadsheet123/values/Sheet1!A:B:append"): StubResponse(
+                {"updates": {"updatedRange": "Sheet1!A3:B3", "updatedRows": 1}}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!3:3"): StubResponse(
+                {"values": [["Widget", "1"]]}
+            ),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    results = await asyncio.gather(
+        *(
+            provider.find_or_create_row(
+                "spreadsheet123",
+                "Sheet1!A:B",
+                lookup_column="Name",
+                lookup_value="Widget",
+                row=["Widget", "1"],
+                use_index=True,
+            )
+            for _ in range(2)
+        )
+    )
+
+    assert [result["created"] for result in results] == [True, False]
+    assert results[1]["row_number"] == 3
+    assert results[1]["row"] == {"Name": "Widget", "Count": "1"}
+    methods = [method for method, _, _ in recorder.calls]
+    assert methods.count("POST") == 1
+
+    # An append that lands below rows the index never saw invalidates it.
+    indexes = provider.column_indexes()
+    assert len(indexes) == 1
+    recorder._responses[("POST", "/spreadsheet123/values/Sheet1!A:B:append")] = [
+        StubResponse({"updates": {"updatedRange": "Sheet1!A9:B9"}})
+    ]
+    await provider.create_spreadsheet_row("spreadsheet123", "Sheet1!A:B", ["Cog"])
+    assert len(indexes) == 0
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_rows_reads_once_and_writes_in_two_calls(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values/Sheet1!1:1"): StubResponse(
+                {"values": [["SKU", "Stock"]]}
+            ),
+            ("GET", "/spreadsheet123/values/Sheet1!A2:A"): StubResponse(
+                {"values": [["a-1", "b-2", "c-3"]]}
+            ),
+            ("POST", "/spreadsheet123/values:batchUpdate"): StubResponse(
+                {"totalUpdatedRows": 2}
+            ),
+            ("POST", "/spreadsheet123/values/Sheet1!A:B:append"): StubResponse(
+                {"updates": {"updatedRange": "Sheet1!A5:B6", "updatedRows": 2}}
+            ),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    result = await provider.find_or_create_rows(
+        "spreadsheet123",
+        "Sheet1!A:B",
+        [
+            ("C-3", ["c-3", "7"]),
+            ("d-4", ["d-4", "1"]),
+            ("a-1", ["a-1", "0"]),
+            ("e-5", ["e-5", "2"]),
+            ("d-4", ["d-4", "3"]),
+        ],
+        lookup_column="SKU",
+        value_input_option="RAW",
+    )
+
+    assert [
+        (item["key"], item["status"], item["row_number"]) for item in result["results"]
+    ] == [
+        ("C-3", "updated", 4),
+        ("d-4", "created", 5),
+        ("a-1", "updated", 2),
+        ("e-5", "created", 6),
+    ]
+    assert result["results"][1]["row"] == {"SKU": "d-4", "Stock": "3"}
+    assert (result["created"], result["updated"], result["found"]) == (2, 2, 0)
+    assert len(recorder.calls) == 4
+    assert recorder.calls[2][2]["json"] == {
+        "valueInputOption": "RAW",
+        "data": [
+            {"range": "Sheet1!A4:B4", "values": [["c-3", "7"]]},
+            {"range": "Sheet1!A2:B2", "values": [["a-1", "0"]]},
+        ],
+    }
+    assert recorder.calls[3][2]["json"] == {"values": [["d-4", "3"], ["e-5", "2"]]}
+
+
+@pytest.mark.asyncio
+async def test_buffered_appends_share_one_request(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    provider = GoogleSheetsProvider(
+        settings=GoogleSheetsSettings(
+            token="token", append_buffer_max_rows=3, append_buffer_max_delay=60
+        )
+    )
+    recorder = RecordingRequest(
+        {
+            ("POST", "/spreadsheet123/values/Events!A:C:append"): [
+                StubResponse(
+                    {
+                        "spreadsheetId": "spreadsheet123",
+                        "tableRange": "Events!A1:C9",
+                        "updates": {"updatedRange": "Events!A10:C12"},
+                    }
+                ),
+                StubResponse({"updates": {"updatedRange": "Events!A13:B13"}}),
+            ]
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    results = await asyncio.gather(
+        *(
+            provider.create_spreadsheet_row(
+                "spreadsheet123", "Events!A:C", [f"event-{n}", n, "ok"], buffered=True
+            )
+            for n in range(3)
+        )
+    )
+
+    assert [result["updates"]["updatedRange"] for result in results] == [
+        "Events!A10:C10",
+        "Events!A11:C11",
+        "Events!A12:C12",
+    ]
+    assert results[0]["tableRange"] == "Events!A1:C9"
+    assert len(recorder.calls) == 1
+    assert recorder.calls[0][2]["json"] == {
+        "values": [["event-0", 0, "ok"], ["event-1", 1, "ok"], ["event-2", 2, "ok"]]
+    }
+
+    buffer = provider.append_buffer()
+    pending = buffer.submit("spreadsheet123", "Events!A:C", ["late", 3])
+    assert len(buffer) == 1
+    await provider.aclose()
+    assert (await pending)["updates"]["updatedRange"] == "Events!A13:B13"
+    assert (buffer.flushes, buffer.rows) == (2, 4)
+    with pytest.raises(RuntimeError):
+        buffer.submit("spreadsheet123", "Events!A:C", ["closed"])
+
+
+@pytest.mark.asyncio
+async def test_append_buffer_flushes_after_delay_and_fails_whole_batch() -> None:
+    batches: list[list[list[Any]]] = []
+
+    async def append(spreadsheet_id: str, range_name: str, rows: Any, **_: Any):
+        batches.append(rows)
+        if len(batches) == 2:
+            raise ValueError("quota exceeded")
+        return {"updates": {"updatedRange": f"{range_name}!A2:A3"}}
+
+    buffer = AppendBuffer(append, max_rows=100, max_delay=0.01)
+    first = await asyncio.gather(
+        buffer.append("s", "Log", ["a"]), buffer.append("s", "Log", ["b"])
+    )
+    assert [row["updates"]["updatedRange"] for row in first] == ["Log!A2", "Log!A3"]
+
+    failing = [buffer.submit("s", "Log", [value]) for value in "cd"]
+    await buffer.flush()
+    for future in failing:
+        with pytest.raises(ValueError, match="quota"):
+            await future
+    assert batches == [[["a"], ["b"]], [["c"], ["d"]]]
+    assert buffer.failed == 2
+
+
+@pytest.mark.asyncio
+async def test_rows_by_id_use_one_batch_request(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values:batchGet"): StubResponse(
+                {
+                    "spreadsheetId": "spreadsheet123",
+                    "valueRanges": [
+                        {"range": "Sheet1!A2:C3", "values": [["a", "1"], ["b", "2"]]},
+                        {"range": "Sheet1!A7:C7"},
+                    ],
+                }
+            ),
+            ("POST", "/spreadsheet123/values:batchUpdate"): StubResponse(
+                {"totalUpdatedRows": 3}
+            ),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    fetched = await provider.get_rows_by_id("spreadsheet123", "Sheet1", [7, 2, 3])
+    assert [(row["row_number"], row["values"]) for row in fetched["rows"]] == [
+        (7, []),
+        (2, ["a", "1"]),
+        (3, ["b", "2"]),
+    ]
+    assert recorder.calls[0][2]["params"] == {
+        "ranges": ["Sheet1!2:3", "Sheet1!7:7"],
+        "majorDimension": "ROWS",
+    }
+
+    await provider.update_rows_by_id(
+        "spreadsheet123", "Sheet1", {3: ["c", "3"], 2: ["a", "9"], 9: ["z"]}
+    )
+    assert recorder.calls[1][2]["json"] == {
+        "valueInputOption": "USER_ENTERED",
+        "data": [
+            {"range": "Sheet1!2:3", "values": [["a", "9"], ["c", "3"]]},
+            {"range": "Sheet1!9:9", "values": [["z"]]},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_rows_by_id_rejects_missing_value_ranges(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values:batchGet"): StubResponse(
+                {"valueRanges": [{"range": "Sheet1!A2:C2", "values": [["a"]]}]}
+            ),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    with pytest.raises(ValueError, match="1 value ranges for 2 requested"):
+        await provider.get_rows_by_id("spreadsheet123", "Sheet1", [2, 7])
+
+
+@pytest.mark.asyncio
+async def test_data_range_actions_route_to_batch_endpoints(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("POST", "/spreadsheet123/values:batchGetByDataFilter"): StubResponse(
+                {"valueRanges": []}
+            ),
+            ("POST", "/spreadsheet123/values:batchUpdate"): StubResponse({}),
+            ("POST", "/spreadsheet123/values:batchUpdateByDataFilter"): StubResponse(
+                {}
+            ),
+            ("POST", "/spreadsheet123/values:batchClear"): StubResponse({}),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+    data_filter = {"developerMetadataLookup": {"metadataKey": "totals"}}
+
+    await provider.get_data_ranges(
+        "spreadsheet123", data_filters=[data_filter], major_dimension="COLUMNS"
+    )
+    await provider.update_data_ranges(
+        "spreadsheet123", {"Sheet1!A1": [["x"]], "Sheet2!B2:C2": [[1, 2]]}
+    )
+    await provider.update_data_ranges(
+        "spreadsheet123",
+        [{"dataFilter": data_filter, "values": [[3]]}],
+        value_input_option="RAW",
+    )
+    await provider.clear_data_ranges("spreadsheet123", ["Sheet1!A:A", "Sheet2"])
+
+    assert recorder.calls[0][2]["json"] == {
+        "dataFilters": [data_filter],
+        "majorDimension": "COLUMNS",
+    }
+    assert recorder.calls[0][2]["retry"] is True
+    assert "retry" not in recorder.calls[1][2]
+    assert [item["range"] for item in recorder.calls[1][2]["json"]["data"]] == [
+        "Sheet1!A1",
+        "Sheet2!B2:C2",
+    ]
+    assert recorder.calls[2][2]["json"] == {
+        "valueInputOption": "RAW",
+        "data": [{"dataFilter": data_filter, "values": [[3]]}],
+    }
+    assert recorder.calls[3][2]["json"] == {"ranges": ["Sheet1!A:A", "Sheet2"]}
+
+    with pytest.raises(ValueError):
+        await provider.update_data_ranges(
+            "spreadsheet123",
+            [
+                {"range": "Sheet1!A1", "values": [[1]]},
+                {"dataFilter": data_filter, "values": [[2]]},
+            ],
+        )
+    with pytest.raises(ValueError):
+        await provider.get_data_ranges("spreadsheet123")
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_rows_rejects_unindexable_ranges(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest({})
+    monkeypatch.setattr(provider, "request", recorder)
+
+    with pytest.raises(ValueError, match="outside the range"):
+        await provider.find_or_create_rows(
+            "spreadsheet123", "Sheet1!A:B", {"a-1": ["a-1"]}, lookup_column=2
+        )
+    with pytest.raises(ValueError, match="Unsupported A1 range"):
+        await provider.find_or_create_rows(
+            "spreadsheet123", "Sheet1!A1:??", {"a-1": ["a-1"]}, lookup_column=0
+        )
+    assert recorder.calls == []
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_rows_scans_when_header_row_is_blank(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values/Sheet1!1:1"): StubResponse({}),
+            ("GET", "/spreadsheet123/values/Sheet1!A:B"): StubResponse(
+                {"values": [[], ["a-1", "5"]]}
+            ),
+            ("POST", "/spreadsheet123/values:batchUpdate"): StubResponse({}),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    result = await provider.find_or_create_rows(
+        "spreadsheet123", "Sheet1!A:B", {"a-1": ["a-1", "6"]}, lookup_column=0
+    )
+
+    assert result["results"][0]["status"] == "updated"
+    assert result["results"][0]["row_number"] == 2
+    assert result["append_result"] is None
+    assert recorder.calls[-1][2]["json"]["data"] == [
+        {"range": "Sheet1!A2:B2", "values": [["a-1", "6"]]}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_rows_appends_everything_to_an_empty_sheet(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: GoogleSheetsSettings,
+) -> None:
+    provider = GoogleSheetsProvider(settings=settings)
+    recorder = RecordingRequest(
+        {
+            ("GET", "/spreadsheet123/values/Sheet1!1:1"): StubResponse({}),
+            ("GET", "/spreadsheet123/values/Sheet1!A:B"): StubResponse({}),
+            ("POST", "/spreadsheet123/values/Sheet1!A:B:append"): StubResponse(
+                {"updates": {"updatedRange": "Sheet1!A1:B2"}}
+            ),
+        }
+    )
+    monkeypatch.setattr(provider, "request", recorder)
+
+    result = await provider.find_or_create_rows(
+        "spreadsheet123",
+        "Sheet1!A:B",
+        [("a-1", ["a-1", "1"]), ("b-2", ["b-2", "2"])],
+        lookup_column="SKU",
+    )
+
+    assert [item["status"] for item in result["results"]] == ["created", "created"]
+    assert [item["row_number"] for item in result["results"]] == [1, 2]
@@ -80,6 +80,9 @@ class StubAsyncClient:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         self.closed = True
 
+    async def aclose(self) -> None:
+        self.closed = True
+
     def _next_response(self, method: str, path: str) -> StubResponse:
         key = (method.upper(), path)
         try:
@@ -152,6 +155,7 @@ async def test_create_contact(
     assert params is None
     assert data is None
     assert files is None
+    await provider.aclose()
     assert stub_client.closed is True
 
 
@@ -212,6 +216,38 @@ async def test_find_or_create_contact_existing(
     assert path.endswith("/search")
 
 
+@pytest.mark.asyncio
+async def test_find_contact_iter_follows_paging_after(
+    monkeypatch: pytest.MonkeyPatch, settings: HubspotSettings
+) -> None:
+    provider = HubspotProvider(settings=settings)
+    stub_client = StubAsyncClient(
+        responses={
+            ("POST", "/crm/v3/objects/contacts/search"): [
+                StubResponse(
+                    {
+                        "results": [{"id": "1"}, {"id": "2"}],
+                        "paging": {"next": {"after": "2"}},
+                    }
+                ),
+                StubResponse({"results": [{"id": "3"}]}),
+            ],
+        }
+    )
+    monkeypatch.setattr(provider, "httpx_client", lambda **_: stub_client)
+
+    contacts = [
+        contact async for contact in provider.find_contact.iter(query="example.com")
+    ]
+
+    assert [contact["id"] for contact in contacts] == ["1", "2", "3"]
+    bodies = [call[3] for call in stub_client.calls]
+    assert bodies == [
+        {"query": "example.com", "limit": 200},
+        {"query": "example.com", "limit": 200, "after": "2"},
+    ]
+
+
 @pytest.mark.asyncio
 async def test_find_or_create_contact_creates(
     monkeypatch: pytest.MonkeyPatch, settings: HubspotSettings
@@ -287,4 +323,5 @@ async def test_container_end_to_end(monkeypatch: pytest.MonkeyPatch) -> None:
     )
 
     assert result["id"] == "42"
+    await container.aclose()
     assert stub_client.closed is True
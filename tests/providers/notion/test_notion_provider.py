@@ -55,6 +55,9 @@ class StubAsyncClient:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         self.closed = True
 
+    async def aclose(self) -> None:
+        self.closed = True
+
     async def request(self, method: str, url: str, **kwargs: Any) -> StubResponse:
         key = (
             method.upper(),
@@ -180,6 +183,7 @@ async def test_request_uses_httpx_client(
     assert client_kwargs[0]["base_url"] == "https://api.notion.com/v1"
     assert client_kwargs[0]["timeout"] == 5.0
     assert "Authorization" in client_kwargs[0]["headers"]
+    await provider.aclose()
     assert clients[0].closed is True
 
 
@@ -84,6 +84,9 @@ class StubAsyncClient:
     async def __aexit__(self, exc_type, exc, tb) -> None:
         self.closed = True
 
+    async def aclose(self) -> None:
+        self.closed = True
+
     def _next_response(self, method: str, path: str) -> StubResponse:
         key = (method.upper(), path)
         try:
@@ -195,6 +198,7 @@ async def test_send_channel_message(
     assert json_body == {"channel": "C123", "text": "hello"}
     assert data is None
     assert headers is None
+    await provider.aclose()
     assert stub_client.closed is True
 
 
@@ -356,4 +360,5 @@ async def test_integrations_end_to_end(monkeypatch: pytest.MonkeyPatch) -> None:
     payload = await container.slack.send_channel_message(channel_id="C1", text="Hello")
 
     assert payload["ts"] == "1.0"
+    await container.aclose()
     assert stub_client.closed is True
@@ -0,0 +1,137 @@
+"""Tests for adaptive concurrency limiting."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from integrations import (
+    AdaptiveConcurrencyLimiter,
+    BaseProvider,
+    ConcurrencyLimits,
+    ConcurrencyRegistry,
+    HttpxClientMixin,
+    ProviderSettings,
+)
+
+
+class GatedSettings(ProviderSettings):
+    base_url: str = "https://api.gated.test"
+
+
+class GatedProvider(HttpxClientMixin, BaseProvider[GatedSettings]):
+    settings_class = GatedSettings
+    status_code = 200
+
+    def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(self.status_code)
+        )
+        client_kwargs.setdefault("transport", transport)
+        return super().httpx_client(**client_kwargs)
+
+
+@pytest.mark.asyncio
+async def test_success_grows_limit_while_saturated() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        ConcurrencyLimits(initial_limit=2, max_limit=3)
+    )
+    held = await limiter.acquire()
+
+    for _ in range(10):
+        limiter.release(await limiter.acquire(), "success")
+
+    assert limiter.limit == 3
+    limiter.release(held, "ignore")
+
+
+@pytest.mark.asyncio
+async def test_idle_limiter_does_not_grow() -> None:
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimits(initial_limit=4))
+
+    for _ in range(10):
+        limiter.release(await limiter.acquire(), "success")
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_overload_cuts_limit_once_per_window() -> None:
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimits(initial_limit=8))
+    tokens = [await limiter.acquire() for _ in range(4)]
+
+    for token in tokens:
+        limiter.release(token, "overload")
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+    limiter.release(await limiter.acquire(), "overload")
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_waiters_queue_until_a_slot_is_released() -> None:
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimits(initial_limit=1))
+    token = await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    assert not waiter.done()
+
+    limiter.release(token, "ignore")
+    await waiter
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue() -> None:
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyLimits(initial_limit=1))
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_requests_adapt_per_host() -> None:
+    registry = ConcurrencyRegistry()
+    provider = GatedProvider(
+        concurrency_registry=registry, concurrency={"initial_limit": 4}
+    )
+    provider.status_code = 503
+
+    await provider.request("GET", "/items", retry=False)
+    await provider.request("GET", "https://uploads.gated.test/files", retry=False)
+    await provider.request("GET", "/items", retry=False)
+
+    snapshot = registry.snapshot()
+    assert snapshot[("GatedProvider", "api.gated.test")] == {
+        "limit": 1,
+        "in_flight": 0,
+        "queue_depth": 0,
+    }
+    assert snapshot[("GatedProvider", "uploads.gated.test")]["limit"] == 2
+    assert provider.concurrency_limiter().limit == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_can_be_disabled() -> None:
+    registry = ConcurrencyRegistry()
+    provider = GatedProvider(concurrency_registry=registry, concurrency=False)
+
+    await provider.request("GET", "/items")
+
+    assert provider.concurrency_limiter() is None
+    assert len(registry) == 0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 import pytest
 
 from integrations import (
@@ -136,3 +138,124 @@ async def test_container_override_replacement(container: Integrations) -> None:
         assert dummy.settings.nickname is None
 
     assert await container.dummy.ident() == "default-dummy"
+
+
+class CountingSettings(ProviderSettings):
+    model_config = SettingsConfigDict(env_prefix="COUNTING_")
+
+    token: str
+
+    validations: ClassVar[int] = 0
+
+    def __init__(self, **data: object) -> None:
+        CountingSettings.validations += 1
+        super().__init__(**data)
+
+
+class CountingProvider(BaseProvider[CountingSettings]):
+    settings_class = CountingSettings
+
+
+register_provider("counting", CountingProvider)
+
+
+@pytest.fixture
+def counting(monkeypatch: pytest.MonkeyPatch) -> type[CountingSettings]:
+    monkeypatch.setattr(CountingSettings, "validations", 0)
+    return CountingSettings
+
+
+def test_auto_configure_defers_providers_until_access(
+    monkeypatch: pytest.MonkeyPatch, counting: type[CountingSettings]
+) -> None:
+    monkeypatch.setenv("COUNTING_TOKEN", "lazy")
+
+    container = Integrations()
+
+    assert counting.validations == 0
+    provider = container.counting
+    assert container["counting"] is provider
+    assert container.get("counting") is provider
+    assert provider.settings.token == "lazy"
+    assert counting.validations == 1
+
+
+def test_auto_configure_caches_unconfigured_providers(
+    monkeypatch: pytest.MonkeyPatch, counting: type[CountingSettings]
+) -> None:
+    monkeypatch.delenv("COUNTING_TOKEN", raising=False)
+
+    container = Integrations()
+
+    assert "counting" not in container
+    with pytest.raises(AttributeError):
+        _ = container.counting
+    with pytest.raises(KeyError):
+        _ = container["counting"]
+    assert container.get("counting") is None
+    assert counting.validations == 1
+
+
+def test_lazy_iteration_matches_configured_providers(
+    monkeypatch: pytest.MonkeyPatch, counting: type[CountingSettings]
+) -> None:
+    monkeypatch.setenv("COUNTING_TOKEN", "lazy")
+    monkeypatch.delenv("DUMMY_NAME", raising=False)
+
+    container = Integrations()
+
+    assert "counting" in container
+    assert "counting" in list(container)
+    assert "dummy" not in container
+    assert "dummy" not in list(container)
+    assert counting.validations == 1
+
+
+@pytest.mark.asyncio
+async def test_override_merges_into_deferred_provider(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("DUMMY_NAME", "env-dummy")
+    monkeypatch.setenv("DUMMY_NICKNAME", "env-nick")
+
+    container = Integrations()
+
+    async with container.overrides(dummy={"name": "override"}):
+        assert container.dummy.settings.nickname == "env-nick"
+        assert await container.dummy.ident() == "override"
+
+    assert await container.dummy.ident() == "env-dummy"
+
+
+class ClosingProvider(BaseProvider[DummySettings]):
+    settings_class = DummySettings
+    closed: ClassVar[list[str]] = []
+
+    async def aclose(self) -> None:
+        self.closed.append(self.settings.name)
+        await super().aclose()
+
+
+register_provider("closing", ClosingProvider)
+
+
+def test_sync_override_without_a_loop_does_not_close_on_a_new_loop() -> None:
+    ClosingProvider.closed.clear()
+    container = Integrations(auto_configure=False, closing={"name": "base"})
+
+    with container.overrides(merge=False, closing={"name": "override"}):
+        assert container.closing.settings.name == "override"
+
+    assert ClosingProvider.closed == []
+
+
+@pytest.mark.asyncio
+async def test_sync_override_inside_a_loop_closes_before_container_aclose() -> None:
+    ClosingProvider.closed.clear()
+    container = Integrations(auto_configure=False, closing={"name": "base"})
+
+    with container.overrides(merge=False, closing={"name": "override"}):
+        pass
+    await container.aclose()
+
+    assert ClosingProvider.closed == ["override", "base"]
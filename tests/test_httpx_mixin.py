@@ -0,0 +1,147 @@
+"""Tests for the pooled client lifecycle provided by ``HttpxClientMixin``."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+import pytest
+
+from integrations import (
+    BaseProvider,
+    HttpxClientMixin,
+    Integrations,
+    ProviderSettings,
+    register_provider,
+)
+
+
+class PooledSettings(ProviderSettings):
+    base_url: str = "https://api.pooled.test"
+
+
+class PooledProvider(HttpxClientMixin, BaseProvider[PooledSettings]):
+    settings_class = PooledSettings
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.seen: list[str] = []
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.seen.append(str(request.url))
+        return httpx.Response(200, json={"ok": True})
+
+    def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
+        client_kwargs.setdefault("transport", self.transport)
+        return super().httpx_client(**client_kwargs)
+
+
+@pytest.mark.asyncio
+async def test_request_reuses_pooled_client() -> None:
+    provider = PooledProvider()
+
+    await provider.request("GET", "/one")
+    client = provider.pooled_httpx_client()
+    await provider.request("GET", "/two")
+
+    assert provider.pooled_httpx_client() is client
+    assert client.is_closed is False
+    assert provider.seen == [
+        "https://api.pooled.test/one",
+        "https://api.pooled.test/two",
+    ]
+
+    await provider.aclose()
+    assert client.is_closed is True
+
+
+@pytest.mark.asyncio
+async def test_base_url_override_uses_dedicated_client() -> None:
+    provider = PooledProvider()
+
+    await provider.request("POST", "/files", base_url="https://upload.pooled.test")
+    await provider.request("GET", "/files")
+
+    upload_client = provider.pooled_httpx_client(base_url="https://upload.pooled.test")
+    assert upload_client is not provider.pooled_httpx_client()
+    assert provider.seen == [
+        "https://upload.pooled.test/files",
+        "https://api.pooled.test/files",
+    ]
+    await provider.aclose()
+
+
+def test_limits_read_from_settings() -> None:
+    provider = PooledProvider(max_connections=7, keepalive_expiry=30.0)
+
+    limits = provider.httpx_limits()
+
+    assert limits.max_connections == 7
+    assert limits.keepalive_expiry == 30.0
+
+
+class OwnedSettings(PooledSettings):
+    token: str
+
+
+class OwnedProvider(PooledProvider):
+    settings_class = OwnedSettings  # type: ignore[assignment]
+
+
+register_provider("pooled_owned", OwnedProvider)
+
+
+@pytest.mark.asyncio
+async def test_container_context_closes_only_providers_it_built() -> None:
+    external = PooledProvider()
+
+    async with Integrations(
+        auto_configure=False, pooled=external, pooled_owned={"token": "t"}
+    ) as integrations:
+        await integrations.pooled.request("GET", "/ping")
+        await integrations.pooled_owned.request("GET", "/ping")
+        external_client = external.pooled_httpx_client()
+        owned_client = integrations.pooled_owned.pooled_httpx_client()
+
+    assert owned_client.is_closed is True
+    assert external_client.is_closed is False
+    await external.aclose()
+
+
+def test_provider_survives_separate_event_loops() -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    provider = PooledProvider(base_url=f"http://127.0.0.1:{server.server_port}")
+    provider.transport = None  # type: ignore[assignment]
+
+    async def call() -> httpx.AsyncClient:
+        response = await provider.request("GET", "/ping")
+        assert response.json() == {"ok": True}
+        return provider.pooled_httpx_client()
+
+    try:
+        first = asyncio.run(call())
+        second = asyncio.run(call())
+        assert second is not first
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,269 @@
+"""Tests for action and request instrumentation hooks."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import httpx
+import pytest
+
+from integrations import (
+    ActionContext,
+    BaseAction,
+    BaseProvider,
+    HistogramHook,
+    HttpxClientMixin,
+    InstrumentationHook,
+    LatencyHistogram,
+    ProviderSettings,
+    RateLimit,
+    RateLimiter,
+    RequestContext,
+    RetryPolicy,
+    SpanHook,
+    action,
+    instrument,
+)
+from integrations.core.instrumentation import registered_hooks, templated_path
+from integrations.providers.github import GithubProvider
+
+
+class MeteredSettings(ProviderSettings):
+    base_url: str = "https://api.metered.test"
+
+
+class FetchItem(BaseAction):
+    async def __call__(self, item_id: str) -> Any:
+        """Fetch one item."""
+        response = await self.provider.request("GET", f"/items/{item_id}")
+        return self.provider.process_httpx_response(response)
+
+
+class FetchItemTwice(FetchItem):
+    async def __call__(self, item_id: str) -> Any:
+        await super().__call__(item_id)
+        return await super().__call__(item_id)
+
+
+class Explode(BaseAction):
+    async def __call__(self) -> Any:
+        raise RuntimeError("boom")
+
+
+class MeteredProvider(HttpxClientMixin, BaseProvider[MeteredSettings]):
+    settings_class = MeteredSettings
+    default_retry_policy = RetryPolicy(backoff_base=0, max_attempts=3)
+
+    fetch_item = action(FetchItem)
+    fetch_item_twice = action(FetchItemTwice)
+    explode = action(Explode)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.statuses: list[int] = []
+
+    def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            status = self.statuses.pop(0) if self.statuses else 200
+            return httpx.Response(status, json={"path": request.url.path})
+
+        client_kwargs.setdefault("transport", httpx.MockTransport(handler))
+        return super().httpx_client(**client_kwargs)
+
+
+class RecordingHook(InstrumentationHook):
+    def __init__(self) -> None:
+        self.actions: list[ActionContext] = []
+        self.requests: list[RequestContext] = []
+
+    def action_finished(self, context: ActionContext) -> None:
+        self.actions.append(context)
+
+    def request_finished(self, context: RequestContext) -> None:
+        self.requests.append(context)
+
+
+class FakeSpan:
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.exceptions: list[BaseException] = []
+        self.ended = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions.append(exception)
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self) -> None:
+        self.spans: list[FakeSpan] = []
+
+    def start_span(self, name: str, *, attributes: Any = None) -> FakeSpan:
+        span = FakeSpan(name, dict(attributes or {}))
+        self.spans.append(span)
+        return span
+
+
+@pytest.mark.asyncio
+async def test_hooks_receive_action_and_request_measurements() -> None:
+    provider = MeteredProvider()
+    provider.statuses = [503, 200]
+    hook = RecordingHook()
+
+    with instrument(hook):
+        assert await provider.fetch_item("42") == {"path": "/items/42"}
+
+    assert registered_hooks() == ()
+    (request,) = hook.requests
+    assert request.provider == "MeteredProvider"
+    assert request.action == "fetch_item"
+    assert request.method == "GET"
+    assert request.route == "/items/{id}"
+    assert request.status == 200
+    assert request.retries == 1
+    assert request.response_bytes == len(b'{"path":"/items/42"}')
+    assert request.latency > 0
+    (call,) = hook.actions
+    assert call.action == "fetch_item"
+    assert call.requests == 1
+    assert call.error is None
+    assert call.latency >= request.latency
+
+
+@pytest.mark.asyncio
+async def test_super_call_is_reported_as_one_action() -> None:
+    provider = MeteredProvider()
+    hook = RecordingHook()
+
+    with instrument(hook):
+        await provider.fetch_item_twice("7")
+
+    assert [call.action for call in hook.actions] == ["fetch_item_twice"]
+    assert hook.actions[0].requests == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_includes_rate_limit_delay() -> None:
+    provider = MeteredProvider(
+        rate_limits=RateLimit(requests=100, burst=1), rate_limiter=RateLimiter()
+    )
+    hook = RecordingHook()
+
+    with instrument(hook):
+        await provider.request("GET", "/a")
+        await provider.request("GET", "/b")
+
+    assert hook.requests[0].queue_wait < 0.005
+    assert hook.requests[1].queue_wait > 0.005
+
+
+@pytest.mark.asyncio
+async def test_no_hooks_leaves_calls_unobserved() -> None:
+    provider = MeteredProvider()
+    hook = RecordingHook()
+
+    with instrument(hook):
+        pass
+    await provider.fetch_item("1")
+
+    assert hook.actions == []
+    assert hook.requests == []
+
+
+class BrokenHook(InstrumentationHook):
+    def action_started(self, context: ActionContext) -> None:
+        raise RuntimeError("hook bug")
+
+    def request_finished(self, context: RequestContext) -> None:
+        raise RuntimeError("hook bug")
+
+
+@pytest.mark.asyncio
+async def test_failing_hooks_are_logged_and_do_not_fail_calls(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    provider = MeteredProvider()
+    recording = RecordingHook()
+
+    with (
+        caplog.at_level(logging.WARNING, logger="integrations.core.instrumentation"),
+        instrument(BrokenHook(), recording),
+    ):
+        assert await provider.fetch_item("9") == {"path": "/items/9"}
+
+    assert len(recording.requests) == 1
+    assert len(recording.actions) == 1
+    failures = [record for record in caplog.records if record.exc_info]
+    assert len(failures) == 2
+    assert "action_started" in failures[0].getMessage()
+
+
+@pytest.mark.asyncio
+async def test_histogram_hook_reports_percentiles_per_action() -> None:
+    provider = MeteredProvider()
+    hook = HistogramHook()
+
+    with instrument(hook):
+        for item_id in range(20):
+            await provider.fetch_item(str(item_id))
+
+    report = hook.report()
+    summary = report["MeteredProvider.fetch_item"]
+    assert summary["count"] == 20
+    assert 0 < summary["p50"] <= summary["p95"] <= summary["p99"] <= summary["max"]
+    assert list(hook.request_report()) == ["MeteredProvider GET /items/{id}"]
+
+
+def test_latency_histogram_percentiles_are_within_bucket_error() -> None:
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.percentile(0.5) == pytest.approx(0.5, rel=0.1)
+    assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.1)
+    assert histogram.percentile(1.0) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_span_hook_emits_nested_spans_and_errors() -> None:
+    provider = MeteredProvider()
+    tracer = FakeTracer()
+
+    with instrument(SpanHook(tracer)):
+        await provider.fetch_item("9")
+        with pytest.raises(RuntimeError):
+            await provider.explode()
+
+    names = [span.name for span in tracer.spans]
+    assert names == [
+        "MeteredProvider.fetch_item",
+        "GET /items/{id}",
+        "MeteredProvider.explode",
+    ]
+    assert all(span.ended for span in tracer.spans)
+    request_span = tracer.spans[1]
+    assert request_span.attributes["http.response.status_code"] == 200
+    assert request_span.attributes["integrations.action"] == "fetch_item"
+    assert isinstance(tracer.spans[2].exceptions[0], RuntimeError)
+
+
+def test_route_templates_collapse_identifiers() -> None:
+    assert templated_path("/v1/objects/contacts/12345") == "/v1/objects/contacts/{id}"
+    assert templated_path("/users/me@example.com") == "/users/{id}"
+    assert templated_path("/files/1a2B3c4D5e6F7g8H9i0J/export") == (
+        "/files/{id}/export"
+    )
+
+    github = GithubProvider(token="t")
+    assert github.route_template("GET", "/repos/octo/hello/issues/12") == (
+        "/repos/{owner}/{repo}/issues/{id}"
+    )
+    assert github.route_template("GET", "/users/octocat") == "/users/{username}"
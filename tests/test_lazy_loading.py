@@ -0,0 +1,80 @@
+"""Tests for deferred provider imports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from integrations import (
+    get_provider,
+    get_provider_settings,
+    provider_names,
+    register_provider,
+)
+from integrations.core.lazy import import_target
+
+
+def _loaded_modules(code: str) -> set[str]:
+    probe = textwrap.dedent(code) + textwrap.dedent(
+        """
+        import sys
+        print("\\n".join(name for name in sys.modules if name.startswith("integrations")))
+        """
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    return set(completed.stdout.split())
+
+
+def test_import_does_not_load_providers() -> None:
+    modules = _loaded_modules("import integrations")
+
+    assert "integrations.providers.slack" in modules
+    assert not any(name.endswith("_provider") for name in modules)
+    assert not any(".actions." in name for name in modules if ".providers." in name)
+
+
+def test_first_use_loads_only_that_provider() -> None:
+    modules = _loaded_modules(
+        """
+        from integrations import Integrations
+        Integrations(auto_configure=False, slack={"token": "x"}).slack
+        """
+    )
+
+    assert "integrations.providers.slack.slack_provider" in modules
+    assert "integrations.providers.slack.actions.messages" in modules
+    assert "integrations.providers.github.github_provider" not in modules
+    assert not any(
+        name.startswith("integrations.providers.hubspot.") for name in modules
+    )
+
+
+def test_registry_knows_names_before_import() -> None:
+    assert {"slack", "github", "google_sheets"} <= set(provider_names())
+
+    settings_cls = get_provider_settings("notion")
+    provider_cls = get_provider("notion")
+
+    assert provider_cls.settings_class is settings_cls
+    assert provider_cls.__name__ == "NotionProvider"
+
+
+def test_lazy_and_resolved_registrations_agree() -> None:
+    from integrations.providers import SlackProvider
+
+    register_provider("slack", SlackProvider)
+    register_provider(
+        "slack", "integrations.providers.slack.slack_provider:SlackProvider"
+    )
+    with pytest.raises(ValueError):
+        register_provider("slack", "integrations.providers.github:GithubProvider")
+
+
+def test_import_target_requires_attribute() -> None:
+    with pytest.raises(ValueError):
+        import_target("integrations.providers.slack")
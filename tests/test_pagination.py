@@ -0,0 +1,344 @@
+"""Tests for pagination strategies and async iterators."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from integrations import (
+    AfterPaginator,
+    BaseProvider,
+    CursorPaginator,
+    HttpxClientMixin,
+    LinkHeaderPaginator,
+    OffsetPaginator,
+    PageNumberPaginator,
+    PageRequest,
+    PageTokenPaginator,
+    PaginatedAction,
+    ProviderSettings,
+    StartCursorPaginator,
+    action,
+    iter_pages,
+    paginate,
+)
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class PagedSettings(ProviderSettings):
+    base_url: str = "https://api.paged.test"
+
+
+class PagedProvider(HttpxClientMixin, BaseProvider[PagedSettings]):
+    settings_class = PagedSettings
+
+    def __init__(self, handler: Handler) -> None:
+        super().__init__()
+        self.handler = handler
+        self.sent: list[httpx.Request] = []
+
+    def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
+        def record(request: httpx.Request) -> httpx.Response:
+            self.sent.append(request)
+            return self.handler(request)
+
+        client_kwargs.setdefault("transport", httpx.MockTransport(record))
+        return super().httpx_client(**client_kwargs)
+
+
+ITEMS = list(range(10))
+
+
+def token_pages(request: httpx.Request) -> httpx.Response:
+    size = int(request.url.params.get("pageSize", 3))
+    start = int(request.url.params.get("pageToken", 0))
+    payload: dict[str, Any] = {"items": ITEMS[start : start + size]}
+    if start + size < len(ITEMS):
+        payload["nextPageToken"] = str(start + size)
+    return httpx.Response(200, json=payload)
+
+
+@pytest.mark.asyncio
+async def test_page_token_iteration_streams_every_item() -> None:
+    provider = PagedProvider(token_pages)
+    paginator = PageTokenPaginator(page_size_param="pageSize", max_page_size=4)
+
+    items = [
+        item async for item in paginate(provider, PageRequest(url="/items"), paginator)
+    ]
+
+    assert items == ITEMS
+    assert [request.url.params["pageSize"] for request in provider.sent] == [
+        "4",
+        "4",
+        "4",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_max_items_caps_requests_and_shrinks_page_size() -> None:
+    provider = PagedProvider(token_pages)
+    paginator = PageTokenPaginator(page_size_param="pageSize", max_page_size=4)
+
+    items = [
+        item
+        async for item in paginate(
+            provider, PageRequest(url="/items"), paginator, max_items=2
+        )
+    ]
+
+    assert items == [0, 1]
+    assert len(provider.sent) == 1
+    assert provider.sent[0].url.params["pageSize"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_explicit_page_size_overrides_request_value() -> None:
+    provider = PagedProvider(token_pages)
+    paginator = PageTokenPaginator(page_size_param="pageSize", max_page_size=4)
+    request = PageRequest(url="/items", params={"pageSize": 1})
+
+    pages = [
+        page
+        async for page in iter_pages(
+            provider, request, paginator, page_size=5, max_pages=2
+        )
+    ]
+
+    assert [page.items for page in pages] == [[0, 1, 2, 3], [4, 5, 6, 7]]
+    assert [page.number for page in pages] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_link_header_pagination_follows_next_url() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        headers = {}
+        if page < 3:
+            headers["Link"] = (
+                f'<https://api.paged.test/repos?per_page=2&page={page + 1}>; rel="next"'
+            )
+        return httpx.Response(200, json=[page * 10, page * 10 + 1], headers=headers)
+
+    provider = PagedProvider(handler)
+    paginator = LinkHeaderPaginator(page_size_param="per_page", max_page_size=2)
+
+    items = [
+        item async for item in paginate(provider, PageRequest(url="/repos"), paginator)
+    ]
+
+    assert items == [10, 11, 20, 21, 30, 31]
+    assert (
+        str(provider.sent[-1].url) == "https://api.paged.test/repos?per_page=2&page=3"
+    )
+
+
+@pytest.mark.asyncio
+async def test_start_cursor_pagination_in_request_body() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if "start_cursor" not in body:
+            return httpx.Response(
+                200, json={"results": ["a"], "has_more": True, "next_cursor": "c1"}
+            )
+        return httpx.Response(
+            200, json={"results": ["b"], "has_more": False, "next_cursor": "c2"}
+        )
+
+    provider = PagedProvider(handler)
+    paginator = StartCursorPaginator(location="body")
+    request = PageRequest(method="POST", url="/query", body={"filter": {}})
+
+    items = [item async for item in paginate(provider, request, paginator)]
+
+    assert items == ["a", "b"]
+    bodies = [json.loads(sent.content) for sent in provider.sent]
+    assert bodies == [
+        {"filter": {}, "page_size": 100},
+        {"filter": {}, "page_size": 100, "start_cursor": "c1"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_offset_and_page_number_stop_on_short_page() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        if "offset" in request.url.params or "page" not in request.url.params:
+            start = int(request.url.params.get("offset", 0))
+        else:
+            start = (int(request.url.params["page"]) - 1) * limit
+        return httpx.Response(200, json={"data": ITEMS[start : start + limit]})
+
+    offset = PagedProvider(handler)
+    items = [
+        item
+        async for item in paginate(
+            offset,
+            PageRequest(url="/items"),
+            OffsetPaginator(max_page_size=4),
+        )
+    ]
+    assert items == ITEMS
+    assert [request.url.params.get("offset") for request in offset.sent] == [
+        None,
+        "4",
+        "8",
+    ]
+
+    numbered = PagedProvider(handler)
+    items = [
+        item
+        async for item in paginate(
+            numbered,
+            PageRequest(url="/items"),
+            PageNumberPaginator(page_size_param="limit", max_page_size=5),
+        )
+    ]
+    assert items == ITEMS
+    assert len(numbered.sent) == 3
+
+
+class ListThings(PaginatedAction):
+    paginator = CursorPaginator(
+        items_path="things",
+        cursor_path="meta.next",
+        page_size_param="limit",
+        max_page_size=3,
+    )
+
+    async def __call__(self, *, kind: str) -> Any:
+        return await self.fetch_page(self.page_request(kind=kind))
+
+    def page_request(self, *, kind: str) -> PageRequest:
+        return PageRequest(url="/things", params={"kind": kind})
+
+
+class ThingsProvider(PagedProvider):
+    list_things = action(ListThings)
+
+
+@pytest.mark.asyncio
+async def test_paginated_action_exposes_iter() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = int(request.url.params.get("cursor", 0))
+        payload: dict[str, Any] = {"things": ITEMS[cursor : cursor + 3], "meta": {}}
+        if cursor + 3 < len(ITEMS):
+            payload["meta"]["next"] = str(cursor + 3)
+        return httpx.Response(200, json=payload)
+
+    provider = ThingsProvider(handler)
+
+    first = await provider.list_things(kind="x")
+    streamed = [item async for item in provider.list_things.iter(kind="x")]
+
+    assert first["things"] == [0, 1, 2]
+    assert streamed == ITEMS
+    assert all(request.url.params["kind"] == "x" for request in provider.sent)
+
+
+def numbered_pages(pages: int, delay: float = 0.01) -> tuple[Any, dict[str, int]]:
+    stats = {"in_flight": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        await asyncio.sleep(delay)
+        stats["in_flight"] -= 1
+        page = int(request.url.params.get("page", 1))
+        links = []
+        if page < pages:
+            links.append(f'<https://api.paged.test/items?page={page + 1}>; rel="next"')
+            links.append(f'<https://api.paged.test/items?page={pages}>; rel="last"')
+        headers = {"Link": ", ".join(links)} if links else {}
+        return httpx.Response(200, json=[page], headers=headers)
+
+    return handler, stats
+
+
+@pytest.mark.asyncio
+async def test_known_page_counts_are_prefetched_through_a_window() -> None:
+    handler, stats = numbered_pages(8)
+    provider = PagedProvider(handler)
+
+    items = [
+        item
+        async for item in paginate(
+            provider, PageRequest(url="/items"), LinkHeaderPaginator(), prefetch=3
+        )
+    ]
+
+    assert items == list(range(1, 9))
+    assert stats["peak"] == 3
+    assert len(provider.sent) == 8
+
+
+@pytest.mark.asyncio
+async def test_prefetch_respects_max_items_and_cancels_on_break() -> None:
+    handler, _ = numbered_pages(20)
+    provider = PagedProvider(handler)
+
+    items = [
+        item
+        async for item in paginate(
+            provider,
+            PageRequest(url="/items"),
+            LinkHeaderPaginator(),
+            prefetch=4,
+            max_items=3,
+        )
+    ]
+    assert items == [1, 2, 3]
+    assert len(provider.sent) == 3
+
+    provider.sent.clear()
+    pages = iter_pages(
+        provider, PageRequest(url="/items"), LinkHeaderPaginator(), prefetch=4
+    )
+    async for page in pages:
+        if page.number == 2:
+            break
+    await pages.aclose()
+    assert len(provider.sent) <= 6
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_are_pipelined_while_consumer_works() -> None:
+    provider = PagedProvider(token_pages)
+    paginator = PageTokenPaginator(page_size_param="pageSize", max_page_size=4)
+    observed: list[tuple[int, int]] = []
+
+    async for page in iter_pages(
+        provider, PageRequest(url="/items"), paginator, prefetch=1
+    ):
+        await asyncio.sleep(0.01)
+        observed.append((page.number, len(provider.sent)))
+
+    assert observed == [(1, 2), (2, 3), (3, 3)]
+
+
+def test_offset_style_strategies_plan_remaining_pages() -> None:
+    request = PageRequest(method="POST", url="/search", body={"limit": 2})
+    hubspot = AfterPaginator(
+        location="body", offset_cursor=True, total_path="total", max_results=6
+    )
+    payload = {"results": [1, 2], "total": 9, "paging": {"next": {"after": "2"}}}
+
+    planned = hubspot.plan(request, None, payload)
+
+    assert planned is not None
+    assert [page.body["after"] for page in planned] == ["2", "4"]
+
+    numbered = PageNumberPaginator(page_size_param="per_page", total_path="total")
+    planned = numbered.plan(
+        PageRequest(url="/items", params={"per_page": 10}),
+        None,
+        {"data": list(range(10)), "total": 35},
+    )
+    assert planned is not None
+    assert [page.params["page"] for page in planned] == [2, 3, 4]
+    assert AfterPaginator().plan(request, None, payload) is None
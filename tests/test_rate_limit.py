@@ -0,0 +1,136 @@
+"""Tests for client-side token-bucket rate limiting."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from integrations import (
+    BaseProvider,
+    HttpxClientMixin,
+    ProviderSettings,
+    RateLimit,
+    RateLimiter,
+    RateLimitProfile,
+)
+from integrations.core.rate_limit import TokenBucket
+from integrations.providers.slack.slack_provider import SlackProvider
+from integrations.providers.slack.slack_settings import SlackSettings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class LimitedSettings(ProviderSettings):
+    token: str
+    base_url: str = "https://api.limited.test"
+
+
+class LimitedProvider(HttpxClientMixin, BaseProvider[LimitedSettings]):
+    settings_class = LimitedSettings
+    default_rate_limits = RateLimitProfile(
+        default=RateLimit.per_second(1000, burst=1),
+        endpoints={"bulk": RateLimit.per_second(1000, burst=1)},
+    )
+
+    def httpx_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.settings.token}"}
+
+    def rate_limit_class(self, method: str, url: str) -> str | None:
+        return "bulk" if url.startswith("/bulk") else None
+
+    def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        client_kwargs.setdefault("transport", transport)
+        return super().httpx_client(**client_kwargs)
+
+
+def test_bucket_refills_at_configured_rate() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(RateLimit.per_second(2, burst=4), clock=clock)
+
+    assert bucket.tokens == 4
+    bucket.defer(0)
+    clock.now += 1.0
+    assert bucket.tokens == 2
+    clock.now += 10.0
+    assert bucket.tokens == 4
+
+
+@pytest.mark.asyncio
+async def test_bucket_waits_when_empty() -> None:
+    bucket = TokenBucket(RateLimit.per_second(100, burst=1))
+
+    assert await bucket.acquire() == 0
+    waited = await bucket.acquire()
+
+    assert waited == pytest.approx(0.01, rel=0.5)
+
+
+@pytest.mark.asyncio
+async def test_buckets_are_keyed_by_credential_and_endpoint_class() -> None:
+    limiter = RateLimiter()
+    first = LimitedProvider(token="one", rate_limiter=limiter)
+    second = LimitedProvider(token="two", rate_limiter=limiter)
+
+    await first.request("GET", "/items")
+    await first.request("GET", "/bulk/items")
+    await second.request("GET", "/items")
+
+    assert len(limiter) == 3
+    assert first.credential_identity() != second.credential_identity()
+    assert "one" not in first.credential_identity()
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_can_be_disabled_per_instance() -> None:
+    limiter = RateLimiter()
+    provider = LimitedProvider(token="one", rate_limiter=limiter, rate_limits=False)
+
+    await provider.request("GET", "/items")
+
+    assert provider.httpx_rate_limits() is None
+    assert len(limiter) == 0
+
+
+def test_limiter_evicts_least_recently_used_buckets() -> None:
+    limiter = RateLimiter(max_buckets=2)
+    limit = RateLimit.per_second(1)
+
+    limiter.bucket(("a",), limit)
+    limiter.bucket(("b",), limit)
+    limiter.bucket(("a",), limit)
+    limiter.bucket(("c",), limit)
+
+    assert len(limiter) == 2
+    assert limiter.bucket(("a",), limit).tokens == 1
+
+
+def test_slack_methods_map_to_tiers() -> None:
+    provider = SlackProvider(settings=SlackSettings(token="xoxb-test"))
+    profile = provider.httpx_rate_limits()
+    assert profile is not None
+
+    assert provider.rate_limit_class("POST", "/chat.postMessage") == "post_message"
+    assert provider.rate_limit_class("GET", "/conversations.members") == "tier4"
+    assert profile.limit_for("tier2") == RateLimit.per_minute(20, burst=5)
+    assert profile.limit_for(None) == profile.default
+
+
+def test_slack_methods_in_one_tier_keep_separate_buckets() -> None:
+    provider = SlackProvider(settings=SlackSettings(token="xoxb-test"))
+
+    history = provider._rate_limit_slot("GET", "/conversations.history")
+    replies = provider._rate_limit_slot("GET", "/conversations.replies")
+    assert history is not None and replies is not None
+
+    assert history[2] == replies[2]
+    assert history[1] != replies[1]
+    assert history[1][-1] == "conversations.history"
@@ -0,0 +1,212 @@
+"""Tests for the GET response cache."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import httpx
+import pytest
+
+from integrations import (
+    BaseProvider,
+    CachedResponse,
+    CacheRule,
+    HttpxClientMixin,
+    InMemoryResponseCache,
+    ProviderSettings,
+    RateLimiter,
+    ResponseCacheProfile,
+)
+from integrations.providers.github.github_provider import GithubProvider
+from integrations.providers.github.github_settings import GithubSettings
+
+
+class CachedSettings(ProviderSettings):
+    token: str = "secret"
+    base_url: str = "https://api.cached.test"
+
+
+class CachedProvider(HttpxClientMixin, BaseProvider[CachedSettings]):
+    settings_class = CachedSettings
+    default_cache_rules = ResponseCacheProfile(
+        rules=(
+            CacheRule(pattern=r"^/items/[^/]+$", ttl=60),
+            CacheRule(pattern=r"^/revalidated/", ttl=0),
+        ),
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.sent: list[httpx.Request] = []
+        self.version = 1
+
+    def httpx_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.settings.token}"}
+
+    def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.sent.append(request)
+            etag = f'"v{self.version}"'
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304, headers={"ETag": etag})
+            return httpx.Response(
+                200 if request.method == "GET" else 204,
+                json={"version": self.version},
+                headers={"ETag": etag},
+            )
+
+        client_kwargs.setdefault("transport", httpx.MockTransport(handler))
+        return super().httpx_client(**client_kwargs)
+
+
+@pytest.mark.asyncio
+async def test_fresh_entries_are_served_without_a_request() -> None:
+    provider = CachedProvider()
+
+    first = await provider.request("GET", "/items/1")
+    second = await provider.request("GET", "/items/1")
+
+    assert len(provider.sent) == 1
+    assert second.json() == first.json() == {"version": 1}
+    assert second.headers["ETag"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_uncached_paths_and_params_are_distinct() -> None:
+    provider = CachedProvider()
+
+    await provider.request("GET", "/other")
+    await provider.request("GET", "/other")
+    await provider.request("GET", "/items/1", params={"expand": "a"})
+    await provider.request("GET", "/items/1", params={"expand": "b"})
+
+    assert len(provider.sent) == 4
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_revalidate_with_etag() -> None:
+    provider = CachedProvider()
+
+    await provider.request("GET", "/revalidated/1")
+    cached = await provider.request("GET", "/revalidated/1")
+    assert provider.sent[-1].headers["If-None-Match"] == '"v1"'
+    assert cached.status_code == 200
+    assert cached.json() == {"version": 1}
+
+    provider.version = 2
+    changed = await provider.request("GET", "/revalidated/1")
+    assert changed.json() == {"version": 2}
+    assert len(provider.sent) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_keys_include_credential_identity() -> None:
+    cache = InMemoryResponseCache()
+    first = CachedProvider(token="one", response_cache=cache)
+    second = CachedProvider(token="two", response_cache=cache)
+
+    await first.request("GET", "/items/1")
+    await second.request("GET", "/items/1")
+
+    assert len(first.sent) == len(second.sent) == 1
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_paths() -> None:
+    provider = CachedProvider()
+
+    await provider.request("GET", "/items/1")
+    await provider.request("GET", "/items/2")
+    await provider.request("PATCH", "/items/1", json={"name": "new"})
+    provider.version = 2
+    updated = await provider.request("GET", "/items/1")
+    await provider.request("GET", "/items/2")
+
+    assert updated.json() == {"version": 2}
+    assert [request.url.path for request in provider.sent] == [
+        "/items/1",
+        "/items/2",
+        "/items/1",
+        "/items/1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_can_be_disabled() -> None:
+    provider = CachedProvider(cache_rules=False)
+
+    await provider.request("GET", "/items/1")
+    await provider.request("GET", "/items/1")
+
+    assert len(provider.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_least_recently_used() -> None:
+    cache = InMemoryResponseCache(max_entries=2)
+    entry = CachedResponse(status_code=200, url="https://example.test/")
+
+    await cache.set("a", entry)
+    await cache.set("b", entry)
+    await cache.get("a")
+    await cache.set("c", entry)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+
+def test_no_store_responses_are_not_cached() -> None:
+    response = httpx.Response(
+        200,
+        headers={"Cache-Control": "no-store"},
+        request=httpx.Request("GET", "https://example.test/"),
+    )
+
+    assert CachedResponse.from_response(response, ttl=60) is None
+
+
+@pytest.mark.asyncio
+async def test_github_not_modified_responses_do_not_spend_quota() -> None:
+    limiter = RateLimiter()
+    provider = GithubProvider(
+        settings=GithubSettings(token="ghp_test", rate_limiter=limiter)
+    )
+    etag = '"abc"'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json={"name": "repo"}, headers={"ETag": etag})
+
+    client = provider.httpx_client(transport=httpx.MockTransport(handler))
+    provider.pooled_httpx_client = lambda **_: client  # type: ignore[method-assign]
+
+    await provider.request("GET", "/repos/octo/repo")
+    (bucket,) = limiter._buckets.values()
+    tokens = bucket.tokens
+    response = await provider.request("GET", "/repos/octo/repo")
+
+    assert response.json() == {"name": "repo"}
+    assert bucket.tokens >= tokens
+
+
+@pytest.mark.parametrize(
+    "provider_class",
+    [
+        "integrations.providers.github.github_provider:GithubProvider",
+        (
+            "integrations.providers.google_calendar.google_calendar_provider:"
+            "GoogleCalendarProvider"
+        ),
+        "integrations.providers.hubspot.hubspot_provider:HubspotProvider",
+        "integrations.providers.notion.notion_provider:NotionProvider",
+    ],
+)
+def test_default_rules_only_revalidate(provider_class: str) -> None:
+    module, name = provider_class.split(":")
+    profile = getattr(importlib.import_module(module), name).default_cache_rules
+
+    assert profile.default_ttl in (None, 0)
+    assert all(rule.ttl in (None, 0) for rule in profile.rules)
@@ -0,0 +1,107 @@
+"""Tests for retry policies applied by ``HttpxClientMixin.request``."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+
+from integrations import BaseProvider, HttpxClientMixin, ProviderSettings, RetryPolicy
+
+
+class RetrySettings(ProviderSettings):
+    base_url: str = "https://api.retry.test"
+
+
+class RetryProvider(HttpxClientMixin, BaseProvider[RetrySettings]):
+    settings_class = RetrySettings
+    default_retry_policy = RetryPolicy(backoff_base=0, max_attempts=3)
+
+    def __init__(self, statuses: list[int], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        return httpx.Response(status, json={"status": status})
+
+    def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
+        client_kwargs.setdefault("transport", httpx.MockTransport(self._handle))
+        return super().httpx_client(**client_kwargs)
+
+
+@pytest.mark.asyncio
+async def test_idempotent_request_retries_until_success() -> None:
+    provider = RetryProvider([503, 502])
+
+    response = await provider.request("GET", "/items")
+
+    assert response.status_code == 200
+    assert provider.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_unless_opted_in() -> None:
+    provider = RetryProvider([503, 503])
+
+    response = await provider.request("POST", "/items", json={"a": 1})
+    assert response.status_code == 503
+    assert provider.calls == 1
+
+    response = await provider.request("POST", "/items", json={"a": 1}, retry=True)
+    assert response.status_code == 200
+    assert provider.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_post_is_retried() -> None:
+    provider = RetryProvider([429])
+
+    response = await provider.request("POST", "/items", json={"a": 1})
+
+    assert response.status_code == 200
+    assert provider.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_false_and_settings_override() -> None:
+    provider = RetryProvider([503])
+    response = await provider.request("GET", "/items", retry=False)
+    assert response.status_code == 503
+
+    provider = RetryProvider([503, 503], retry_policy={"max_attempts": 2})
+    response = await provider.request("GET", "/items")
+    assert response.status_code == 503
+    assert provider.calls == 2
+
+
+def test_retry_after_and_reset_headers() -> None:
+    policy = RetryPolicy(max_retry_after=10)
+
+    seconds = httpx.Response(429, headers={"Retry-After": "3"})
+    assert policy.delay_for(1, seconds) == 3.0
+
+    reset = httpx.Response(403, headers={"X-RateLimit-Reset": "5"})
+    assert policy.delay_for(1, reset) == 5.0
+
+    too_long = httpx.Response(429, headers={"Retry-After": "120"})
+    assert policy.delay_for(1, too_long) is None
+
+
+def test_backoff_is_capped() -> None:
+    policy = RetryPolicy(backoff_base=1, backoff_max=4, jitter=False)
+
+    assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1, 2, 4, 4]
+
+
+def test_rate_limit_statuses_require_headers() -> None:
+    policy = RetryPolicy(rate_limit_statuses=frozenset({403}))
+
+    forbidden = httpx.Response(403)
+    limited = httpx.Response(403, headers={"X-RateLimit-Remaining": "0"})
+
+    assert policy.should_retry_response("GET", forbidden) is False
+    assert policy.should_retry_response("GET", limited) is True
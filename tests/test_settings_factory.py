@@ -0,0 +1,105 @@
+"""Tests for snapshot-based settings construction."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pydantic import AliasChoices, Field, ValidationError
+from pydantic_settings import SettingsConfigDict
+
+from integrations import ProviderSettings, SettingsFactory
+
+
+class SnapshotSettings(ProviderSettings):
+    model_config = SettingsConfigDict(extra="allow", populate_by_name=True)
+
+    token: str = Field(
+        validation_alias=AliasChoices("SNAPSHOT_TOKEN", "SNAPSHOT_ACCESS_TOKEN")
+    )
+    timeout: float = Field(default=10.0, validation_alias="SNAPSHOT_TIMEOUT")
+
+
+@pytest.fixture
+def factory() -> SettingsFactory:
+    return SettingsFactory()
+
+
+def test_build_matches_constructor(
+    monkeypatch: pytest.MonkeyPatch, factory: SettingsFactory
+) -> None:
+    monkeypatch.setenv("SNAPSHOT_ACCESS_TOKEN", "env-token")
+    monkeypatch.setenv("SNAPSHOT_TIMEOUT", "3")
+
+    for values in ({}, {"token": "explicit"}, {"SNAPSHOT_TOKEN": "alias"}):
+        built = factory.build(SnapshotSettings, **values)
+        expected = SnapshotSettings(**values)
+        assert built == expected
+        assert built.model_fields_set == expected.model_fields_set
+
+
+def test_explicit_values_skip_environment(
+    monkeypatch: pytest.MonkeyPatch, factory: SettingsFactory
+) -> None:
+    monkeypatch.setenv("SNAPSHOT_TOKEN", "env-token")
+    monkeypatch.setattr(
+        SettingsFactory,
+        "_environment_values",
+        lambda *_: pytest.fail("environment read for fully explicit settings"),
+    )
+
+    settings = factory.build(SnapshotSettings, token="explicit", timeout=1.5)
+
+    assert settings.token == "explicit"
+    assert settings.timeout == 1.5
+
+
+def test_snapshot_is_reused_until_invalidated(
+    monkeypatch: pytest.MonkeyPatch, factory: SettingsFactory
+) -> None:
+    monkeypatch.setenv("SNAPSHOT_TOKEN", "first")
+    assert factory.build(SnapshotSettings).token == "first"
+
+    monkeypatch.setenv("SNAPSHOT_TOKEN", "second")
+    assert factory.build(SnapshotSettings).token == "first"
+
+    factory.invalidate(SnapshotSettings)
+    assert factory.build(SnapshotSettings).token == "second"
+
+
+def test_missing_values_still_fail_validation(
+    monkeypatch: pytest.MonkeyPatch, factory: SettingsFactory
+) -> None:
+    monkeypatch.delenv("SNAPSHOT_TOKEN", raising=False)
+    monkeypatch.delenv("SNAPSHOT_ACCESS_TOKEN", raising=False)
+
+    with pytest.raises(ValidationError):
+        factory.build(SnapshotSettings)
+
+
+def test_custom_initialisers_use_constructor(factory: SettingsFactory) -> None:
+    calls: list[dict[str, object]] = []
+
+    class TracedSettings(SnapshotSettings):
+        def __init__(self, **data: object) -> None:
+            calls.append(data)
+            super().__init__(**data)
+
+    settings = factory.build(TracedSettings, token="explicit")
+
+    assert settings.token == "explicit"
+    assert calls == [{"token": "explicit"}]
+
+
+def test_settings_init_options_use_constructor(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, factory: SettingsFactory
+) -> None:
+    monkeypatch.delenv("SNAPSHOT_TOKEN", raising=False)
+    monkeypatch.delenv("SNAPSHOT_ACCESS_TOKEN", raising=False)
+    env_file = tmp_path / "snapshot.env"
+    env_file.write_text("SNAPSHOT_TOKEN=from-file\n")
+
+    settings = factory.build(SnapshotSettings, _env_file=env_file)
+
+    assert settings.token == "from-file"
+    assert "_env_file" not in (settings.model_extra or {})
@@ -0,0 +1,114 @@
+"""Tests for coalescing identical in-flight requests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from integrations import (
+    BaseProvider,
+    HttpxClientMixin,
+    ProviderSettings,
+    RequestCoalescer,
+)
+
+
+class CoalescingSettings(ProviderSettings):
+    token: str = "secret"
+    base_url: str = "https://api.coalesce.test"
+
+
+class CoalescingProvider(HttpxClientMixin, BaseProvider[CoalescingSettings]):
+    settings_class = CoalescingSettings
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.sent: list[httpx.Request] = []
+
+    def httpx_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.settings.token}"}
+
+    def httpx_client(self, **client_kwargs: Any) -> httpx.AsyncClient:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.sent.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        client_kwargs.setdefault("transport", httpx.MockTransport(handler))
+        return super().httpx_client(**client_kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_call() -> None:
+    provider = CoalescingProvider(coalesce_requests=True)
+
+    responses = await asyncio.gather(
+        *(provider.request("GET", "/items", params={"b": 2, "a": 1}) for _ in range(5)),
+        provider.request("GET", "/items", params={"a": 1, "b": 2}),
+    )
+
+    assert len(provider.sent) == 1
+    assert all(response is responses[0] for response in responses)
+    assert provider.request_coalescer().coalesced == 5
+    assert len(provider.request_coalescer()) == 0
+
+
+@pytest.mark.asyncio
+async def test_distinct_requests_are_not_coalesced() -> None:
+    provider = CoalescingProvider(coalesce_requests=True)
+
+    await asyncio.gather(
+        provider.request("GET", "/items", params={"a": 1}),
+        provider.request("GET", "/items", params={"a": 2}),
+        provider.request("GET", "/other"),
+        provider.request("POST", "/items", json={"a": 1}),
+        provider.request("POST", "/items", json={"a": 1}),
+        provider.request("GET", "/items", params={"a": 1}, coalesce=False),
+    )
+
+    assert len(provider.sent) == 6
+
+
+@pytest.mark.asyncio
+async def test_coalescing_is_opt_in() -> None:
+    provider = CoalescingProvider()
+
+    await asyncio.gather(*(provider.request("GET", "/items") for _ in range(3)))
+    assert len(provider.sent) == 3
+
+    await asyncio.gather(
+        *(provider.request("GET", "/items", coalesce=True) for _ in range(3))
+    )
+    assert len(provider.sent) == 4
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_are_never_served_stale() -> None:
+    provider = CoalescingProvider(coalesce_requests=True)
+
+    await provider.request("GET", "/items")
+    await provider.request("GET", "/items")
+
+    assert len(provider.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call() -> None:
+    coalescer: RequestCoalescer[str] = RequestCoalescer()
+    release = asyncio.Event()
+
+    async def call() -> str:
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(coalescer.do("key", call))
+    follower = asyncio.create_task(coalescer.do("key", call))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == "done"
+    assert coalescer.calls == 1
@@ -0,0 +1,84 @@
+"""Tests for the shared, host-keyed transport pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from integrations import Integrations, TransportPool
+from integrations.providers.google_drive.google_drive_settings import (
+    GoogleDriveSettings,
+)
+from integrations.providers.google_sheets.google_sheets_settings import (
+    GoogleSheetsSettings,
+)
+
+
+def test_pool_reuses_transport_per_host() -> None:
+    pool = TransportPool()
+
+    pool.transport_for("https://www.googleapis.com/drive/v3")
+    pool.transport_for("https://www.googleapis.com/calendar/v3")
+    pool.transport_for("https://sheets.googleapis.com/v4/spreadsheets")
+
+    assert pool.hosts() == ("www.googleapis.com", "sheets.googleapis.com")
+
+
+@pytest.mark.asyncio
+async def test_google_providers_share_container_pool() -> None:
+    integrations = Integrations(
+        auto_configure=False,
+        google_drive=GoogleDriveSettings(token="token"),
+        google_sheets=GoogleSheetsSettings(token="token"),
+    )
+
+    assert integrations.google_drive.transport_pool is integrations.transport_pool
+    assert integrations.google_sheets.transport_pool is integrations.transport_pool
+
+    drive_client = integrations.google_drive.pooled_httpx_client()
+    integrations.google_drive.pooled_httpx_client(
+        base_url=integrations.google_drive.settings.upload_base_url
+    )
+    integrations.google_sheets.pooled_httpx_client()
+    assert integrations.transport_pool.hosts() == (
+        "www.googleapis.com",
+        "sheets.googleapis.com",
+    )
+
+    await integrations.google_drive.aclose()
+    assert drive_client.is_closed is True
+    assert "www.googleapis.com" in integrations.transport_pool
+
+    await integrations.aclose()
+    assert len(integrations.transport_pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_external_pool_is_left_open() -> None:
+    pool = TransportPool()
+    integrations = Integrations(
+        auto_configure=False,
+        transport_pool=pool,
+        google_sheets=GoogleSheetsSettings(token="token"),
+    )
+    integrations.google_sheets.pooled_httpx_client()
+
+    await integrations.aclose()
+
+    assert pool.hosts() == ("sheets.googleapis.com",)
+    await pool.aclose()
+
+
+def test_pool_keeps_transports_per_event_loop() -> None:
+    pool = TransportPool()
+
+    async def lookup() -> object:
+        transport = pool.transport_for("https://sheets.googleapis.com/v4")
+        return transport._transport  # type: ignore[attr-defined]
+
+    first = asyncio.run(lookup())
+    second = asyncio.run(lookup())
+
+    assert first is not second
+    assert pool.hosts() == ()